@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark du temps de demarrage de la CLI.
+
+Chaque cas est lance dans un interpreteur neuf (comme un appel depuis cron
+ou la completion shell) et la mediane des durees est affichee :
+- import src.main : chargement du point d'entree seul
+- commandes legeres : version, info, completion des noms de commandes
+- reference : import de tous les modules de commandes (cout evite par le
+  chargement paresseux)
+
+Usage :
+    python scripts/benchmark_cli_startup.py [--runs 10]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).parent.parent
+
+_RUN_MAIN = "import sys; sys.argv = ['cineorg', *sys.argv[1:]]; from src.main import main; main()"
+
+_CASES: list[tuple[str, list[str], dict[str, str]]] = [
+    ("import src.main", ["-c", "import src.main"], {}),
+    ("cineorg version", ["-c", _RUN_MAIN, "version"], {}),
+    ("cineorg info", ["-c", _RUN_MAIN, "info"], {}),
+    (
+        "completion",
+        ["-c", _RUN_MAIN],
+        {"_CINEORG_COMPLETE": "complete_bash", "COMP_WORDS": "cineorg en", "COMP_CWORD": "1"},
+    ),
+    (
+        "reference (tout importer)",
+        [
+            "-c",
+            "import importlib, src.adapters.cli.commands as c; "
+            "[importlib.import_module(e.module) for e in c.COMMANDS]; import src.container",
+        ],
+        {},
+    ),
+]
+
+
+def _median_seconds(args: list[str], env: dict[str, str], runs: int) -> float:
+    """Mediane des durees d'execution d'un interpreteur neuf."""
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args],
+            cwd=_ROOT,
+            env={**os.environ, **env},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'cas':<28} {'mediane (ms)':>13}")
+    for label, case_args, env in _CASES:
+        seconds = _median_seconds(case_args, env, args.runs)
+        print(f"{label:<28} {seconds * 1000:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark du scoring des candidats (unitaire vs groupe).
+
+Pour chaque requete, une liste de candidats comparable a une page de
+recherche TMDB (20 resultats, titres francais accentues, la plupart avec
+un titre original) est scoree :
+- unitaire : ancien score_results, titre recherche et candidat normalises
+  a chaque comparaison
+- groupe : MatcherService.score_results (requete normalisee une fois, un
+  appel rapidfuzz par requete)
+
+Les scores des deux chemins sont compares avant mesure.
+
+Usage :
+    python scripts/benchmark_matcher.py [--queries 2000] [--candidates 20]
+"""
+
+import argparse
+import random
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+# Ajouter le répertoire racine au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rapidfuzz import fuzz, utils
+
+from src.core.ports.api_clients import SearchResult
+from src.services.matcher import MatcherService, _combine_movie_score, _normalize_title
+from src.utils.helpers import normalize_accents
+
+_WORDS = [
+    "Le", "La", "Les", "L'", "Un", "Une", "des", "du", "de", "et", "The", "of",
+    "Évadés", "Seigneur", "anneaux", "Amélie", "Poulain", "Étoile", "Mystère",
+    "Château", "Forêt", "Rêve", "Dernière", "Nuit", "Été", "Hiver", "Guerre",
+    "Retour", "Vengeance", "Empire", "Cité", "Frères", "Héros", "Ombre", "Mémoire",
+    "Lord", "Rings", "Night", "Return", "War", "Dark", "Knight", "Love", "Story",
+    ":", "-", "II", "III", "2", "IV", "!",
+]
+
+
+def _title(rng: random.Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 7)))
+
+
+def _dataset(n_queries: int, n_candidates: int) -> list[tuple[str, int, list[SearchResult]]]:
+    """Requetes (titre, annee) et leurs candidats, reproductibles."""
+    rng = random.Random(42)
+    dataset = []
+    for _ in range(n_queries):
+        candidates = [
+            SearchResult(
+                id=str(i),
+                title=_title(rng),
+                original_title=_title(rng) if rng.random() < 0.8 else None,
+                year=rng.randint(1950, 2025),
+                source="tmdb",
+            )
+            for i in range(n_candidates)
+        ]
+        query = candidates[0].title if rng.random() < 0.5 else _title(rng)
+        dataset.append((query, rng.randint(1950, 2025), candidates))
+    return dataset
+
+
+def _legacy_title_score(query: str, candidate: str) -> float:
+    """Score de titre tel que calcule avant le scoring groupe."""
+    return fuzz.token_sort_ratio(
+        normalize_accents(query), normalize_accents(candidate), processor=utils.default_process
+    )
+
+
+def _legacy_score_results(
+    query: str, year: int, candidates: list[SearchResult]
+) -> list[SearchResult]:
+    """Ancien MatcherService.score_results (un score de titre par paire)."""
+    scored = []
+    for c in candidates:
+        title_score = _legacy_title_score(query, c.title)
+        if c.original_title:
+            title_score = max(title_score, _legacy_title_score(query, c.original_title))
+        score = _combine_movie_score(title_score, year, None, c.year, None)
+        scored.append(replace(c, score=score))
+    scored.sort(key=lambda r: r.score, reverse=True)
+    return scored
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--candidates", type=int, default=20)
+    args = parser.parse_args()
+
+    dataset = _dataset(args.queries, args.candidates)
+    matcher = MatcherService()
+
+    for query, year, candidates in dataset:
+        scored = matcher.score_results(candidates, query, year)
+        assert scored == _legacy_score_results(query, year, candidates), query
+
+    timings = {}
+    for name, run in (
+        ("unitaire", _legacy_score_results),
+        ("groupe", lambda q, y, c: matcher.score_results(c, q, y)),
+    ):
+        _normalize_title.cache_clear()
+        start = time.perf_counter()
+        for query, year, candidates in dataset:
+            run(query, year, candidates)
+        timings[name] = time.perf_counter() - start
+
+    print(f"{args.queries} requetes x {args.candidates} candidats (scores identiques)")
+    print(f"{'chemin':<10} {'temps (s)':>10}")
+    for name, elapsed in timings.items():
+        print(f"{name:<10} {elapsed:>10.3f}")
+    print(f"gain x{timings['unitaire'] / timings['groupe']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
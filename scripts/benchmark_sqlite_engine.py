@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark des profils d'engine SQLite (legacy vs tuned).
+
+Deux charges representatives, sur une base temporaire :
+- import : un commit par fichier (comme SQLModelVideoFileRepository.save),
+  depuis plusieurs threads (import + web concurrents)
+- navigation : sessions courtes paginees/filtrees sur movies depuis
+  plusieurs threads (pages bibliotheque servies par le pool web)
+
+Usage :
+    python scripts/benchmark_sqlite_engine.py [--files 2000] [--movies 5000]
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Ajouter le répertoire racine au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import func
+from sqlmodel import Session, SQLModel, select
+
+from src.infrastructure.persistence import models  # noqa: F401
+from src.infrastructure.persistence.database import ENGINE_PROFILES, create_sqlite_engine
+from src.infrastructure.persistence.models import MovieModel, VideoFileModel
+
+_GENRES = ["Action", "Drame", "Comédie", "Thriller", "Science-Fiction", "Animation"]
+
+
+def _bench_import(engine, n_files: int, threads: int) -> float:
+    """Insere n_files VideoFile, un commit par fichier."""
+    def insert(i: int) -> None:
+        with Session(engine) as session:
+            session.add(
+                VideoFileModel(
+                    path=f"/storage/Films/{i:06d}/Film {i} (2001).mkv",
+                    filename=f"Film {i} (2001).mkv",
+                    file_hash=f"{i:016x}",
+                    size_bytes=1_000_000 + i,
+                )
+            )
+            session.commit()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(insert, range(n_files)))
+    return time.perf_counter() - start
+
+
+def _populate_movies(engine, n_movies: int) -> None:
+    """Remplit la table movies en une transaction."""
+    rng = random.Random(42)
+    with Session(engine) as session:
+        for i in range(n_movies):
+            session.add(
+                MovieModel(
+                    title=f"Film {i:05d}",
+                    year=1950 + i % 75,
+                    genres_json=json.dumps(rng.sample(_GENRES, 2)),
+                    vote_average=rng.uniform(2, 9),
+                )
+            )
+        session.commit()
+
+
+def _bench_browse(engine, n_requests: int, threads: int) -> float:
+    """Pages de 24 films filtrees par genre, triees, avec total."""
+    def page(i: int) -> None:
+        genre = _GENRES[i % len(_GENRES)]
+        with Session(engine) as session:
+            condition = MovieModel.genres_json.contains(genre)
+            session.exec(
+                select(func.count()).select_from(MovieModel).where(condition)
+            ).one()
+            session.exec(
+                select(MovieModel)
+                .where(condition)
+                .order_by(MovieModel.title)
+                .offset((i % 20) * 24)
+                .limit(24)
+            ).all()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(page, range(n_requests)))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--movies", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"{'profil':<8} {'import (s)':>11} {'navigation (s)':>15}")
+    for name, profile in ENGINE_PROFILES.items():
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_sqlite_engine(f"sqlite:///{tmp}/bench.db", profile)
+            SQLModel.metadata.create_all(engine)
+
+            import_time = _bench_import(engine, args.files, args.threads)
+            _populate_movies(engine, args.movies)
+            browse_time = _bench_browse(engine, args.requests, args.threads)
+            engine.dispose()
+
+        print(f"{name:<8} {import_time:>11.2f} {browse_time:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
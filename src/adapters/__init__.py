@@ -16,9 +16,23 @@ Chaque adaptateur dépend de core/ mais core/ ne dépend jamais des adaptateurs.
 Cela permet de changer les implémentations sans affecter la logique métier.
 """
 
-from src.adapters.file_system import FileSystemAdapter
-from src.adapters.parsing.guessit_parser import GuessitFilenameParser
-from src.adapters.parsing.mediainfo_extractor import MediaInfoExtractor
+import importlib
+
+# Re-exports importes au premier acces : la CLI n'importe ainsi guessit et
+# pymediainfo que pour les commandes qui en ont besoin
+_EXPORTS = {
+    "FileSystemAdapter": "src.adapters.file_system",
+    "GuessitFilenameParser": "src.adapters.parsing.guessit_parser",
+    "MediaInfoExtractor": "src.adapters.parsing.mediainfo_extractor",
+}
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
+
 
 __all__ = [
     "FileSystemAdapter",
@@ -7,6 +7,7 @@ Ce module fournit les adaptateurs pour communiquer avec les API externes:
 
 Infrastructure partagee:
 - APICache: Cache persistant avec TTL differencies (recherche 24h, details 7j)
+- MetadataMirror / MirrorTransport: Miroir SQLite des reponses API, mode hors ligne
 - RateLimitError: Exception pour les erreurs 429
 - with_retry: Decorateur avec backoff exponentiel pour gerer le rate limiting
 
@@ -14,12 +15,16 @@ Les clients implementent IMediaAPIClient defini dans core/ports/api_clients.py.
 """
 
 from src.adapters.api.cache import APICache
+from src.adapters.api.mirror import MetadataMirror, MirrorMissError, MirrorTransport
 from src.adapters.api.retry import RateLimitError, request_with_retry, with_retry
 from src.adapters.api.tmdb_client import TMDBClient
 from src.adapters.api.tvdb_client import TVDBClient
 
 __all__ = [
     "APICache",
+    "MetadataMirror",
+    "MirrorMissError",
+    "MirrorTransport",
     "RateLimitError",
     "with_retry",
     "request_with_retry",
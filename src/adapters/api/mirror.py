@@ -0,0 +1,269 @@
+"""
+Miroir local des reponses TMDB/TVDB pour le rejeu et le matching en masse.
+
+Le retraitement (regenerate_pending, populate-movies, link-movies, repair)
+interroge sans cesse les API sur les memes titres ; le cache APICache ne
+les garde que 24h (recherches) a 7 jours (details). Le miroir conserve
+chaque reponse HTTP recue dans une base SQLite, sans expiration :
+
+- en ligne, une reponse plus recente que max_age est servie depuis le
+  miroir, les autres sont redemandees a l'API puis enregistrees
+  (max_age=0, defaut : le miroir ne fait qu'enregistrer) ; les
+  recherches et les "non trouve" (404) sont toujours redemandees, un
+  titre absent de l'API pouvant y apparaitre a tout moment ;
+- hors ligne, toute reponse connue est servie quel que soit son age et
+  une requete absente du miroir leve MirrorMissError, sans acces reseau.
+
+Le miroir se branche au niveau transport httpx (MirrorTransport) : les
+clients et leur parsing sont inchanges, et un miroir pre-rempli sert de
+serveur bouchon pour les tests et benchmarks.
+
+Usage:
+    mirror = MetadataMirror(".cache/api-mirror.db")
+    transport = MirrorTransport(mirror, max_age=30 * 86400, offline=True)
+    client = TMDBClient(api_key="xxx", cache=cache, transport=transport)
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlencode
+
+import httpx
+
+# Parametres d'authentification exclus des cles (jamais stockes)
+_SECRET_PARAMS = frozenset({"api_key"})
+
+# Statuts enregistres : succes et "non trouve" (reponse definitive de l'API)
+_MIRRORED_STATUSES = frozenset({200, 404})
+
+# Chemins jamais servis depuis le miroir en ligne (resultats evolutifs)
+_ONLINE_UNCACHED_SEGMENT = "/search/"
+
+# Champs secrets des reponses (JWT du login TVDB), masques avant stockage
+_SECRET_FIELDS = frozenset({"token"})
+_REDACTED = "redacted"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    content_type TEXT,
+    body BLOB NOT NULL,
+    fetched_at REAL NOT NULL
+)
+"""
+
+
+class MirrorMissError(httpx.TransportError):
+    """Requete absente du miroir en mode hors ligne."""
+
+
+class MirroredResponse:
+    """
+    Reponse enregistree dans le miroir.
+
+    Attributes:
+        status: Code HTTP de la reponse
+        content_type: En-tete Content-Type (ou None)
+        body: Corps brut de la reponse
+        fetched_at: Date de reception (timestamp)
+    """
+
+    __slots__ = ("status", "content_type", "body", "fetched_at")
+
+    def __init__(
+        self, status: int, content_type: Optional[str], body: bytes, fetched_at: float
+    ) -> None:
+        self.status = status
+        self.content_type = content_type
+        self.body = body
+        self.fetched_at = fetched_at
+
+
+def request_key(request: httpx.Request) -> str:
+    """
+    Cle d'une requete dans le miroir.
+
+    Methode, hote, chemin, parametres tries (hors cle API) et langue
+    demandee (TVDB choisit la langue par l'en-tete Accept-Language).
+    """
+    params = sorted(
+        (name, value)
+        for name, value in request.url.params.multi_items()
+        if name not in _SECRET_PARAMS
+    )
+    key = f"{request.method} {request.url.host}{request.url.path}"
+    if params:
+        key = f"{key}?{urlencode(params)}"
+    language = request.headers.get("Accept-Language")
+    if language:
+        key = f"{key}#{language}"
+    return key
+
+
+class MetadataMirror:
+    """
+    Stockage SQLite des reponses API (sans expiration).
+
+    Les acces sont serialises par un verrou : le miroir peut etre partage
+    entre les clients TMDB et TVDB et entre threads.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Ouvre (ou cree) le miroir.
+
+        Args:
+            path: Chemin du fichier SQLite (repertoire parent cree si absent)
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[MirroredResponse]:
+        """Retourne la reponse enregistree pour une cle, ou None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, content_type, body, fetched_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        return MirroredResponse(*row) if row else None
+
+    def put(
+        self,
+        key: str,
+        status: int,
+        body: bytes,
+        content_type: Optional[str] = None,
+        fetched_at: Optional[float] = None,
+    ) -> None:
+        """Enregistre (ou remplace) la reponse d'une cle."""
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, status, content_type, body, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (key, status, content_type, body, fetched_at),
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        """Ferme la connexion SQLite."""
+        with self._lock:
+            self._conn.close()
+
+
+class MirrorTransport(httpx.AsyncBaseTransport):
+    """
+    Transport httpx servant les reponses depuis le miroir.
+
+    Seules les requetes GET (hors recherches et Cache-Control: no-cache)
+    dont la reponse est un succes sont servies depuis le miroir en ligne ; les autres (login
+    TVDB) sont enregistrees pour pouvoir etre rejouees hors ligne. Le JWT
+    du login n'est pas stocke : hors ligne, aucune requete ne l'utilise.
+
+    Attributes:
+        mirror: Miroir partage
+        max_age: Age maximal (secondes) d'une reponse servie en ligne
+        offline: Mode hors ligne (aucun acces reseau)
+    """
+
+    def __init__(
+        self,
+        mirror: MetadataMirror,
+        max_age: float = 0,
+        offline: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        """
+        Initialise le transport.
+
+        Args:
+            mirror: Miroir ou lire et enregistrer les reponses
+            max_age: Age maximal en secondes d'une reponse servie en ligne
+                (0 = toujours redemander a l'API)
+            offline: Si True, ne repond que depuis le miroir
+            transport: Transport reseau sous-jacent (defaut: AsyncHTTPTransport)
+        """
+        self.mirror = mirror
+        self.max_age = max_age
+        self.offline = offline
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = request_key(request)
+        loop = asyncio.get_running_loop()
+
+        if self.offline or self._serves_online(request):
+            entry = await loop.run_in_executor(None, self.mirror.get, key)
+            if entry is not None and (
+                self.offline
+                or (entry.status == 200 and time.time() - entry.fetched_at < self.max_age)
+            ):
+                return _replay(request, entry)
+        if self.offline:
+            raise MirrorMissError(f"Hors ligne, reponse absente du miroir : {key}", request=request)
+
+        if self._transport is None:
+            self._transport = httpx.AsyncHTTPTransport()
+        response = await self._transport.handle_async_request(request)
+        if response.status_code not in _MIRRORED_STATUSES:
+            return response
+
+        body = await response.aread()
+        await response.aclose()
+        content_type = response.headers.get("Content-Type")
+        await loop.run_in_executor(
+            None, self.mirror.put, key, response.status_code, _redact(body), content_type
+        )
+        return _replay(request, MirroredResponse(response.status_code, content_type, body, 0))
+
+    def _serves_online(self, request: httpx.Request) -> bool:
+        """Vrai si la requete peut etre servie depuis le miroir en ligne."""
+        return (
+            self.max_age > 0
+            and request.method == "GET"
+            and _ONLINE_UNCACHED_SEGMENT not in request.url.path
+            and request.headers.get("Cache-Control") != "no-cache"
+        )
+
+    async def aclose(self) -> None:
+        # Le client HTTP peut etre recree apres close() : le transport
+        # reseau par defaut sera recree a la requete suivante
+        if self._transport is not None:
+            await self._transport.aclose()
+            self._transport = None
+
+
+def _redact(body: bytes) -> bytes:
+    """Masque les champs secrets (token) d'un corps JSON avant stockage."""
+    if not any(field.encode() in body for field in _SECRET_FIELDS):
+        return body
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body
+    if not isinstance(data, dict) or not _SECRET_FIELDS & data.keys():
+        return body
+    for field in _SECRET_FIELDS & data.keys():
+        data[field] = _REDACTED
+    return json.dumps(data).encode()
+
+
+def _replay(request: httpx.Request, entry: MirroredResponse) -> httpx.Response:
+    """Reconstruit une reponse httpx depuis une entree du miroir."""
+    headers = {"Content-Type": entry.content_type} if entry.content_type else {}
+    return httpx.Response(entry.status, headers=headers, content=entry.body, request=request)
@@ -5,6 +5,11 @@ Implemente l'interface IMediaAPIClient pour TMDB (The Movie Database).
 Utilise le cache persistant et le mecanisme de retry pour gerer
 le rate limiting.
 
+Les details d'un film ou d'une serie sont recuperes en une seule requete
+(append_to_response=credits,external_ids) : les IDs externes de la reponse
+sont gardes en memoire et en cache, get_external_ids() et
+get_tv_external_ids() les servent sans nouvel appel API.
+
 Usage:
     cache = APICache()
     client = TMDBClient(api_key="your_key", cache=cache)
@@ -22,6 +27,28 @@ from src.adapters.api.retry import request_with_retry
 from src.core.ports.api_clients import IMediaAPIClient, MediaDetails, SearchResult
 from src.utils.constants import TMDB_GENRE_MAPPING, TMDB_TV_GENRE_MAPPING
 
+# Sous-ressources ajoutees aux requetes de details (une requete par oeuvre)
+_APPENDED = "credits,external_ids"
+
+
+def _movie_external_ids(data: dict) -> dict[str, str | None]:
+    """Extrait les IDs externes d'un film (reponse external_ids)."""
+    return {
+        "imdb_id": data.get("imdb_id"),
+        "wikidata_id": data.get("wikidata_id"),
+        "facebook_id": data.get("facebook_id"),
+        "instagram_id": data.get("instagram_id"),
+        "twitter_id": data.get("twitter_id"),
+    }
+
+
+def _tv_external_ids(data: dict) -> dict[str, str | None]:
+    """Extrait les IDs externes d'une serie (reponse external_ids)."""
+    return {
+        "imdb_id": data.get("imdb_id"),
+        "tvdb_id": data.get("tvdb_id"),
+    }
+
 
 class TMDBClient(IMediaAPIClient):
     """
@@ -52,17 +79,27 @@ class TMDBClient(IMediaAPIClient):
     TMDB_BASE_URL = "https://api.themoviedb.org/3"
     TMDB_IMAGE_BASE_URL = "https://image.tmdb.org/t/p/w500"
 
-    def __init__(self, api_key: str, cache: APICache) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        cache: APICache,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
         """
         Initialise le client TMDB.
 
         Args:
             api_key: Cle API TMDB (Read Access Token v4)
             cache: Instance APICache pour le caching des resultats
+            transport: Transport httpx optionnel (ex: MirrorTransport pour le
+                miroir local et le mode hors ligne)
         """
         self._api_key = api_key
         self._cache = cache
+        self._transport = transport
         self._client: Optional[httpx.AsyncClient] = None
+        # IDs externes par cle de cache (tmdb:external_ids:{id}, ...)
+        self._external_ids: dict[str, dict[str, str | None]] = {}
 
     def _get_client(self) -> httpx.AsyncClient:
         """
@@ -93,6 +130,7 @@ class TMDBClient(IMediaAPIClient):
                 headers=headers,
                 params=params,
                 timeout=30.0,
+                transport=self._transport,
             )
         return self._client
 
@@ -190,14 +228,14 @@ class TMDBClient(IMediaAPIClient):
         if cached is not None:
             return cached
 
-        # Cache miss - make API request avec credits
+        # Cache miss - une seule requete pour details, credits et IDs externes
         client = self._get_client()
         try:
             response = await request_with_retry(
                 client,
                 "GET",
                 f"/movie/{media_id}",
-                params={"language": "fr-FR", "append_to_response": "credits"},
+                params={"language": "fr-FR", "append_to_response": _APPENDED},
             )
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -260,6 +298,10 @@ class TMDBClient(IMediaAPIClient):
 
         # Cache results
         await self._cache.set_details(cache_key, details)
+        if "external_ids" in data:
+            await self._store_external_ids(
+                f"tmdb:external_ids:{media_id}", _movie_external_ids(data["external_ids"])
+            )
 
         return details
 
@@ -341,7 +383,7 @@ class TMDBClient(IMediaAPIClient):
                 client,
                 "GET",
                 f"/tv/{tv_id}",
-                params={"language": "fr-FR", "append_to_response": "credits"},
+                params={"language": "fr-FR", "append_to_response": _APPENDED},
             )
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -393,6 +435,10 @@ class TMDBClient(IMediaAPIClient):
         )
 
         await self._cache.set_details(cache_key, details)
+        if "external_ids" in data:
+            await self._store_external_ids(
+                f"tmdb:tv_external_ids:{tv_id}", _tv_external_ids(data["external_ids"])
+            )
         return details
 
     async def find_by_imdb_id(self, imdb_id: str) -> Optional[MediaDetails]:
@@ -458,62 +504,80 @@ class TMDBClient(IMediaAPIClient):
         """
         Recupere les IDs externes (IMDb, Wikidata, etc.) pour un film.
 
+        Sert les IDs recus avec get_details() (memoire puis cache) ; sinon
+        interroge l'endpoint /movie/{id}/external_ids.
+
         Args:
             media_id: ID TMDB du film
 
         Returns:
             Dictionnaire avec les IDs externes, ou None si non trouve
         """
-        client = self._get_client()
-        try:
-            response = await request_with_retry(
-                client,
-                "GET",
-                f"/movie/{media_id}/external_ids",
-            )
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                return None
-            raise
+        cache_key = f"tmdb:external_ids:{media_id}"
+        cached = await self._cached_external_ids(cache_key)
+        if cached is not None:
+            return cached
 
-        data = response.json()
+        data = await self._fetch_external_ids(f"/movie/{media_id}/external_ids")
+        if data is None:
+            return None
 
-        return {
-            "imdb_id": data.get("imdb_id"),
-            "wikidata_id": data.get("wikidata_id"),
-            "facebook_id": data.get("facebook_id"),
-            "instagram_id": data.get("instagram_id"),
-            "twitter_id": data.get("twitter_id"),
-        }
+        external_ids = _movie_external_ids(data)
+        await self._store_external_ids(cache_key, external_ids)
+        return external_ids
 
     async def get_tv_external_ids(self, tv_id: str) -> Optional[dict[str, str | None]]:
         """
         Recupere les IDs externes (IMDb, etc.) pour une serie TV.
 
+        Sert les IDs recus avec get_tv_details() (memoire puis cache) ;
+        sinon interroge l'endpoint /tv/{id}/external_ids.
+
         Args:
             tv_id: ID TMDB de la serie TV
 
         Returns:
             Dictionnaire avec les IDs externes, ou None si non trouve
         """
+        cache_key = f"tmdb:tv_external_ids:{tv_id}"
+        cached = await self._cached_external_ids(cache_key)
+        if cached is not None:
+            return cached
+
+        data = await self._fetch_external_ids(f"/tv/{tv_id}/external_ids")
+        if data is None:
+            return None
+
+        external_ids = _tv_external_ids(data)
+        await self._store_external_ids(cache_key, external_ids)
+        return external_ids
+
+    async def _cached_external_ids(self, cache_key: str) -> Optional[dict[str, str | None]]:
+        """IDs externes deja recus (memoire puis cache disque), ou None."""
+        if cache_key in self._external_ids:
+            return self._external_ids[cache_key]
+        cached = await self._cache.get(cache_key)
+        if cached is not None:
+            self._external_ids[cache_key] = cached
+        return cached
+
+    async def _store_external_ids(
+        self, cache_key: str, external_ids: dict[str, str | None]
+    ) -> None:
+        """Garde les IDs externes en memoire et dans le cache disque (7 jours)."""
+        self._external_ids[cache_key] = external_ids
+        await self._cache.set(cache_key, external_ids, APICache.DETAILS_TTL)
+
+    async def _fetch_external_ids(self, path: str) -> Optional[dict]:
+        """Interroge un endpoint external_ids (None si 404)."""
         client = self._get_client()
         try:
-            response = await request_with_retry(
-                client,
-                "GET",
-                f"/tv/{tv_id}/external_ids",
-            )
+            response = await request_with_retry(client, "GET", path)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 return None
             raise
-
-        data = response.json()
-
-        return {
-            "imdb_id": data.get("imdb_id"),
-            "tvdb_id": data.get("tvdb_id"),
-        }
+        return response.json()
 
     async def close(self) -> None:
         """
@@ -5,10 +5,15 @@ Implemente IMediaAPIClient pour rechercher et recuperer les metadonnees
 des series TV depuis TVDB. Gere l'authentification JWT, le caching et
 le rate limiting automatiquement.
 
+Les episodes sont charges par saison (ou pour toute la serie) en un
+parcours pagine, puis servis depuis ce cache : enrichir une serie de dix
+saisons coute une douzaine de requetes au lieu d'une par episode.
+
 Note: Utilise l'API v3 (legacy) car plus compatible avec les cles existantes.
 Reference API: https://api.thetvdb.com/swagger
 """
 
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -44,19 +49,35 @@ class TVDBClient(IMediaAPIClient):
 
     BASE_URL = "https://api.thetvdb.com"
 
-    def __init__(self, api_key: str, cache: APICache) -> None:
+    # Delai avant qu'un episode absent d'une saison lue sur l'API ne
+    # provoque une nouvelle lecture (episode diffuse depuis)
+    SEASON_REFETCH_INTERVAL = 3600  # 1 heure
+
+    def __init__(
+        self,
+        api_key: str,
+        cache: APICache,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
         """
         Initialise le client TVDB.
 
         Args:
             api_key: Cle API TVDB (Project API Key depuis le compte TVDB)
             cache: Instance de APICache pour le caching des resultats
+            transport: Transport httpx optionnel (ex: MirrorTransport pour le
+                miroir local et le mode hors ligne)
         """
         self._api_key = api_key
         self._cache = cache
+        self._transport = transport
         self._token: Optional[str] = None
         self._token_expiry: Optional[datetime] = None
         self._client: Optional[httpx.AsyncClient] = None
+        # Saisons deja chargees : (series_id, saison) -> episodes
+        self._seasons: dict[tuple[str, int], list[EpisodeDetails]] = {}
+        # Date (time.monotonic) de la derniere lecture de chaque saison sur l'API
+        self._season_fetched_at: dict[tuple[str, int], float] = {}
 
     async def _get_client(self) -> httpx.AsyncClient:
         """
@@ -68,6 +89,7 @@ class TVDBClient(IMediaAPIClient):
             self._client = httpx.AsyncClient(
                 base_url=self.BASE_URL,
                 timeout=httpx.Timeout(30.0, connect=10.0),
+                transport=self._transport,
             )
         return self._client
 
@@ -336,11 +358,12 @@ class TVDBClient(IMediaAPIClient):
         """
         Recupere les details d'un episode specifique.
 
-        Privilegie le titre en francais, avec fallback sur l'anglais
-        si la traduction francaise n'existe pas.
-
-        Verifie le cache avant d'appeler l'API. Les details sont caches
-        pendant 7 jours.
+        L'episode est lu dans la saison complete (get_season_episodes) :
+        les episodes suivants de la meme saison ne coutent aucune requete.
+        Un episode absent (saison en cours de diffusion) provoque une
+        relecture de la saison sur l'API, sans cache memoire, disque ni
+        miroir, avant de retourner None : une fois si la saison venait du
+        cache, puis au plus toutes les SEASON_REFETCH_INTERVAL secondes.
 
         Args:
             series_id: ID TVDB de la serie
@@ -350,133 +373,197 @@ class TVDBClient(IMediaAPIClient):
         Returns:
             EpisodeDetails avec le titre de l'episode, ou None si non trouve
         """
-        # Cache-first: verifier le cache avant toute requete HTTP
-        cache_key = f"tvdb:episode:{series_id}:S{season:02d}E{episode:02d}"
-        cached = await self._cache.get(cache_key)
-        if cached is not None:
-            return cached
+        episodes = await self.get_season_episodes(series_id, season)
+        if not episodes:
+            return None
+        for details in episodes:
+            if details.episode_number == episode:
+                return details
+
+        fetched_at = self._season_fetched_at.get((series_id, season))
+        if fetched_at is not None and (
+            time.monotonic() - fetched_at < self.SEASON_REFETCH_INTERVAL
+        ):
+            return None
+        episodes = await self.get_season_episodes(series_id, season, refresh=True)
+        for details in episodes or []:
+            if details.episode_number == episode:
+                return details
+        return None
+
+    async def get_season_episodes(
+        self, series_id: str, season: int, refresh: bool = False
+    ) -> Optional[list[EpisodeDetails]]:
+        """
+        Recupere tous les episodes d'une saison en un parcours pagine.
+
+        Privilegie les titres en francais ; si des episodes n'ont pas de
+        titre francais, la saison est relue en anglais (une seule fois)
+        pour les completer.
+
+        Le resultat est garde en memoire pour la duree de vie du client et
+        cache 7 jours sur disque.
+
+        Args:
+            series_id: ID TVDB de la serie
+            season: Numero de saison
+            refresh: Si True, relit la saison sur l'API (caches ignores)
+
+        Returns:
+            Episodes de la saison, ou None si la saison n'existe pas (404)
+        """
+        key = (series_id, season)
+        if not refresh:
+            if key in self._seasons:
+                return self._seasons[key]
+
+            cache_key = f"tvdb:season:{series_id}:S{season:02d}"
+            cached = await self._cache.get(cache_key)
+            if cached is not None:
+                self._seasons[key] = cached
+                return cached
 
-        # Cache miss: obtenir le token et faire la requete
         await self._ensure_token()
         client = await self._get_client()
 
-        # Essayer d'abord en francais
-        ep_data = await self._fetch_episode(
-            client, series_id, season, episode, language="fr"
+        episodes = await self._fetch_episodes(
+            client,
+            f"/series/{series_id}/episodes/query",
+            {"airedSeason": str(season)},
+            refresh=refresh,
         )
+        if episodes is None:
+            return None
 
-        # Si pas de titre en francais, essayer en anglais
-        episode_title = ep_data.get("episodeName", "") if ep_data else ""
-        if not episode_title and ep_data:
-            ep_data_en = await self._fetch_episode(
-                client, series_id, season, episode, language="en"
-            )
-            if ep_data_en:
-                episode_title = ep_data_en.get("episodeName", "")
-                # Utiliser les donnees anglaises si meilleures
-                if episode_title:
-                    ep_data = ep_data_en
+        await self._store_season(series_id, season, episodes)
+        return episodes
+
+    async def get_series_episodes(
+        self, series_id: str
+    ) -> Optional[dict[int, list[EpisodeDetails]]]:
+        """
+        Recupere tous les episodes d'une serie en un parcours pagine.
+
+        Chaque saison est ensuite cachee comme par get_season_episodes :
+        a appeler avant de traiter de nombreux episodes d'une meme serie
+        (quelques requetes pour toute la serie au lieu d'une par saison).
+
+        Args:
+            series_id: ID TVDB de la serie
 
-        if not ep_data:
+        Returns:
+            Episodes par numero de saison, ou None si la serie n'existe pas
+        """
+        await self._ensure_token()
+        client = await self._get_client()
+
+        episodes = await self._fetch_episodes(client, f"/series/{series_id}/episodes", {})
+        if episodes is None:
             return None
 
-        details = EpisodeDetails(
-            id=str(ep_data.get("id", "")),
-            title=ep_data.get("episodeName", ""),
-            season_number=ep_data.get("airedSeason", season),
-            episode_number=ep_data.get("airedEpisodeNumber", episode),
-            overview=ep_data.get("overview"),
-            air_date=ep_data.get("firstAired"),
+        seasons: dict[int, list[EpisodeDetails]] = {}
+        for details in episodes:
+            seasons.setdefault(details.season_number, []).append(details)
+        for season, season_episodes in seasons.items():
+            await self._store_season(series_id, season, season_episodes)
+        return seasons
+
+    async def _store_season(
+        self, series_id: str, season: int, episodes: list[EpisodeDetails]
+    ) -> None:
+        """Garde les episodes d'une saison en memoire et dans le cache disque."""
+        self._seasons[(series_id, season)] = episodes
+        self._season_fetched_at[(series_id, season)] = time.monotonic()
+        await self._cache.set(
+            f"tvdb:season:{series_id}:S{season:02d}", episodes, APICache.DETAILS_TTL
         )
 
-        # Cacher les details (utilise set_details car meme duree de cache)
-        await self._cache.set_details(cache_key, details)
-        return details
-
-    async def _fetch_episode(
+    async def _fetch_episodes(
         self,
         client: httpx.AsyncClient,
-        series_id: str,
-        season: int,
-        episode: int,
-        language: str,
-    ) -> Optional[dict]:
+        path: str,
+        params: dict[str, str],
+        refresh: bool = False,
+    ) -> Optional[list[EpisodeDetails]]:
         """
-        Recupere les donnees brutes d'un episode depuis l'API.
+        Recupere des episodes en francais, completes en anglais si besoin.
 
         Args:
             client: Client HTTP
-            series_id: ID TVDB de la serie
-            season: Numero de saison
-            episode: Numero d'episode
-            language: Code langue (fr, en)
+            path: Endpoint pagine (/series/{id}/episodes[/query])
+            params: Parametres de filtre (ex: airedSeason)
+            refresh: Si True, le miroir local ne sert pas la reponse
 
         Returns:
-            Dictionnaire des donnees episode ou None
+            Liste d'EpisodeDetails, ou None si la ressource n'existe pas
         """
-        try:
-            response = await request_with_retry(
-                client,
-                "GET",
-                f"/series/{series_id}/episodes/query",
-                params={
-                    "airedSeason": str(season),
-                    "airedEpisode": str(episode),
-                },
-                headers=self._get_auth_headers(language=language),
-            )
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                return None
-            raise
-
-        data = response.json()
-        episodes = data.get("data", [])
-
-        if not episodes:
+        raw = await self._fetch_episode_pages(client, path, params, "fr", refresh)
+        if raw is None:
             return None
 
-        return episodes[0]
+        # Titres francais manquants : une relecture en anglais pour tous
+        if any(not ep.get("episodeName") for ep in raw):
+            raw_en = await self._fetch_episode_pages(client, path, params, "en", refresh)
+            english = {ep.get("id"): ep for ep in raw_en or []}
+            raw = [
+                english[ep.get("id")]
+                if not ep.get("episodeName")
+                and english.get(ep.get("id"), {}).get("episodeName")
+                else ep
+                for ep in raw
+            ]
+
+        return [
+            EpisodeDetails(
+                id=str(ep.get("id", "")),
+                title=ep.get("episodeName") or "",
+                season_number=ep.get("airedSeason"),
+                episode_number=ep.get("airedEpisodeNumber"),
+                overview=ep.get("overview"),
+                air_date=ep.get("firstAired"),
+            )
+            for ep in raw
+        ]
 
-    async def get_season_episode_count(
-        self, series_id: str, season: int
-    ) -> Optional[int]:
+    async def _fetch_episode_pages(
+        self,
+        client: httpx.AsyncClient,
+        path: str,
+        params: dict[str, str],
+        language: str,
+        refresh: bool = False,
+    ) -> Optional[list[dict]]:
         """
-        Retourne le nombre d'episodes d'une saison pour une serie.
-
-        Utilise l'endpoint /series/{id}/episodes/query avec pagination.
-        Le resultat est cache 7 jours via set_details.
+        Parcourt toutes les pages d'un endpoint d'episodes (100 par page).
 
         Args:
-            series_id: ID TVDB de la serie
-            season: Numero de saison
+            client: Client HTTP
+            path: Endpoint pagine
+            params: Parametres de filtre
+            language: Code langue (fr, en)
+            refresh: Si True, en-tete Cache-Control: no-cache (miroir ignore)
 
         Returns:
-            Nombre d'episodes, ou None si la saison n'existe pas (404)
+            Donnees brutes des episodes, ou None si 404
         """
-        cache_key = f"tvdb:season_count:{series_id}:S{season:02d}"
-        cached = await self._cache.get(cache_key)
-        if cached is not None:
-            return cached
-
-        await self._ensure_token()
-        client = await self._get_client()
-
-        total_count = 0
+        episodes: list[dict] = []
         page = 1
+        headers = self._get_auth_headers(language=language)
+        if refresh:
+            headers["Cache-Control"] = "no-cache"
 
         while True:
-            try:
-                params = {"airedSeason": str(season)}
-                if page > 1:
-                    params["page"] = str(page)
+            page_params = dict(params)
+            if page > 1:
+                page_params["page"] = str(page)
 
+            try:
                 response = await request_with_retry(
                     client,
                     "GET",
-                    f"/series/{series_id}/episodes/query",
-                    params=params,
-                    headers=self._get_auth_headers(),
+                    path,
+                    params=page_params,
+                    headers=headers,
                 )
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 404:
@@ -484,16 +571,44 @@ class TVDBClient(IMediaAPIClient):
                 raise
 
             data = response.json()
-            episodes = data.get("data", [])
-            total_count += len(episodes)
+            episodes.extend(data.get("data") or [])
 
             # Verifier s'il y a d'autres pages
-            links = data.get("links", {})
-            last_page = links.get("last", 1)
+            links = data.get("links") or {}
+            last_page = links.get("last") or 1
             if page >= last_page:
                 break
             page += 1
 
+        return episodes
+
+    async def get_season_episode_count(
+        self, series_id: str, season: int
+    ) -> Optional[int]:
+        """
+        Retourne le nombre d'episodes d'une saison pour une serie.
+
+        Compte les episodes de get_season_episodes (la saison reste en
+        cache pour les recherches d'episodes). Le resultat est cache 7 jours
+        via set_details.
+
+        Args:
+            series_id: ID TVDB de la serie
+            season: Numero de saison
+
+        Returns:
+            Nombre d'episodes, ou None si la saison n'existe pas (404)
+        """
+        cache_key = f"tvdb:season_count:{series_id}:S{season:02d}"
+        cached = await self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        episodes = await self.get_season_episodes(series_id, season)
+        if episodes is None:
+            return None
+
+        total_count = len(episodes)
         await self._cache.set_details(cache_key, total_count)
         return total_count
 
@@ -1,97 +1,179 @@
-"""Sous-package CLI commands - re-exporte les commandes publiques."""
+"""
+Sous-package CLI commands - registre et re-export des commandes publiques.
 
-from src.adapters.cli.commands.workflow_commands import (
-    MediaFilter,
-    process,
-    pending,
-)
-from src.adapters.cli.commands.validate_commands import (
-    validate_app,
-    validate_auto,
-    validate_manual,
-    validate_batch,
-    validate_file,
-)
-from src.adapters.cli.commands.import_commands import (
-    clean_titles,
-    enrich_episode_titles,
-    enrich_tech,
-    import_library,
-    enrich,
-    link_movies,
-    populate_movies,
-    populate_series,
-)
-from src.adapters.cli.commands.enrichment_commands import (
-    enrich_ratings,
-    enrich_imdb_ids,
-    enrich_series,
-    enrich_movies_credits,
-)
-from src.adapters.cli.commands.imdb_commands import (
-    imdb_app,
-    imdb_import,
-    imdb_sync,
-    imdb_stats,
-)
-from src.adapters.cli.commands.repair_command import (
-    repair_links,
-)
-from src.adapters.cli.commands.consolidate_command import (
-    consolidate,
-)
-from src.adapters.cli.commands.check_command import (
-    check,
-)
-from src.adapters.cli.commands.cleanup_command import (
-    cleanup,
-)
-from src.adapters.cli.commands.regroup_command import (
-    regroup,
-)
-from src.adapters.cli.commands.fix_bad_links_command import (
-    fix_bad_links,
-)
-from src.adapters.cli.commands.fix_symlinks_command import (
-    fix_symlinks,
+COMMANDS declare les commandes montees par src.main ; leur module n'est
+importe qu'a l'invocation (voir src.adapters.cli.lazy_commands). Les
+re-exports (from src.adapters.cli.commands import process) restent
+disponibles et importent le module concerne au premier acces.
+"""
+
+import importlib
+
+from src.adapters.cli.lazy_commands import LazyCommand
+
+_PACKAGE = "src.adapters.cli.commands"
+
+
+def _command(name: str, module: str, attribute: str, help: str) -> LazyCommand:
+    return LazyCommand(name, f"{_PACKAGE}.{module}", attribute, help)
+
+
+COMMANDS: tuple[LazyCommand, ...] = (
+    # workflow
+    _command(
+        "process", "workflow_commands", "process",
+        "Execute le workflow complet: scan -> matching -> validation -> transfert.",
+    ),
+    _command(
+        "pending", "workflow_commands", "pending",
+        "Affiche les fichiers en attente de validation.",
+    ),
+    # Note: "import" est un mot reserve Python, d'ou le nom de fonction
+    _command(
+        "import", "import_commands", "import_library",
+        "Importe une videotheque existante dans la base de donnees.",
+    ),
+    # maintenance
+    _command(
+        "enrich", "import_commands", "enrich",
+        "Enrichit les metadonnees des fichiers via API.",
+    ),
+    _command(
+        "populate-movies", "import_commands", "populate_movies",
+        "Cree/met a jour les films dans la table movies depuis les validations.",
+    ),
+    _command(
+        "populate-series", "import_commands", "populate_series",
+        "Peuple les tables series et episodes depuis les symlinks video.",
+    ),
+    _command(
+        "link-movies", "import_commands", "link_movies",
+        "Associe les films en base a leurs fichiers physiques via les symlinks video/.",
+    ),
+    _command(
+        "enrich-ratings", "enrichment_commands", "enrich_ratings",
+        "Enrichit les notes TMDB (vote_average, vote_count) pour les films sans notes.",
+    ),
+    _command(
+        "enrich-imdb-ids", "enrichment_commands", "enrich_imdb_ids",
+        "Recupere les imdb_id depuis TMDB pour les films sans cette information.",
+    ),
+    _command(
+        "enrich-series", "enrichment_commands", "enrich_series",
+        "Enrichit les series depuis TMDB (poster, notes, genres, createurs, acteurs).",
+    ),
+    _command(
+        "enrich-movies-credits", "enrichment_commands", "enrich_movies_credits",
+        "Enrichit les credits (realisateur, acteurs) des films depuis TMDB.",
+    ),
+    _command(
+        "repair-links", "repair_command", "repair_links",
+        "Detecte et repare les symlinks casses.",
+    ),
+    _command(
+        "consolidate", "consolidate_command", "consolidate",
+        "Detecte et rapatrie les fichiers stockes sur des volumes externes.",
+    ),
+    _command(
+        "check", "check_command", "check",
+        "Verifie l'integrite de la videotheque.",
+    ),
+    _command(
+        "cleanup", "cleanup_command", "cleanup",
+        "Nettoie et reorganise le repertoire video.",
+    ),
+    _command(
+        "regroup", "regroup_command", "regroup",
+        "Detecte les prefixes recurrents et regroupe les fichiers.",
+    ),
+    _command(
+        "fix-symlinks", "fix_symlinks_command", "fix_symlinks",
+        "Corrige les symlinks : convertit relatifs en absolus et relocalise les mal-placés.",
+    ),
+    _command(
+        "fix-bad-links", "fix_bad_links_command", "fix_bad_links",
+        "Corrige les symlinks de series mal lies (plusieurs episodes → meme fichier).",
+    ),
+    _command(
+        "watch", "watch_command", "watch",
+        "Surveille la videotheque et tient la base et les index a jour.",
+    ),
+    _command(
+        "clean-titles", "import_commands", "clean_titles",
+        "Nettoie les caractères Unicode invisibles dans les titres en base.",
+    ),
+    _command(
+        "rebuild-facets", "import_commands", "rebuild_facets",
+        "Recalcule les facettes de la bibliotheque (genres, personnes, resolution).",
+    ),
+    _command(
+        "enrich-tech", "import_commands", "enrich_tech",
+        "Extrait les métadonnées techniques (résolution, codecs) pour les films avec fichier.",
+    ),
+    _command(
+        "enrich-episode-titles", "import_commands", "enrich_episode_titles",
+        "Enrichit les titres d'épisodes manquants via l'API TVDB.",
+    ),
+    # sous-commandes
+    _command(
+        "validate", "validate_commands", "validate_app",
+        "Commandes de validation des fichiers video",
+    ),
+    _command(
+        "imdb", "imdb_commands", "imdb_app",
+        "Commandes de gestion des datasets IMDb",
+    ),
 )
 
-__all__ = [
+# Re-exports : nom public -> module du sous-package
+_EXPORTS = {
     # workflow
-    "MediaFilter",
-    "process",
-    "pending",
+    "MediaFilter": "workflow_commands",
+    "process": "workflow_commands",
+    "pending": "workflow_commands",
     # validate
-    "validate_app",
-    "validate_auto",
-    "validate_manual",
-    "validate_batch",
-    "validate_file",
+    "validate_app": "validate_commands",
+    "validate_auto": "validate_commands",
+    "validate_manual": "validate_commands",
+    "validate_batch": "validate_commands",
+    "validate_file": "validate_commands",
     # import
-    "import_library",
-    "enrich",
-    "link_movies",
-    "populate_movies",
-    "populate_series",
+    "import_library": "import_commands",
+    "enrich": "import_commands",
+    "link_movies": "import_commands",
+    "populate_movies": "import_commands",
+    "populate_series": "import_commands",
+    "clean_titles": "import_commands",
+    "rebuild_facets": "import_commands",
+    "enrich_tech": "import_commands",
+    "enrich_episode_titles": "import_commands",
     # enrichment
-    "enrich_ratings",
-    "enrich_imdb_ids",
-    "enrich_series",
-    "enrich_movies_credits",
+    "enrich_ratings": "enrichment_commands",
+    "enrich_imdb_ids": "enrichment_commands",
+    "enrich_series": "enrichment_commands",
+    "enrich_movies_credits": "enrichment_commands",
     # imdb
-    "imdb_app",
-    "imdb_import",
-    "imdb_sync",
-    "imdb_stats",
+    "imdb_app": "imdb_commands",
+    "imdb_import": "imdb_commands",
+    "imdb_sync": "imdb_commands",
+    "imdb_stats": "imdb_commands",
     # maintenance
-    "repair_links",
-    "consolidate",
-    "check",
-    "cleanup",
-    "regroup",
-    "fix_symlinks",
-    "fix_bad_links",
-    "clean_titles",
-    "enrich_tech",
-    "enrich_episode_titles",
-]
+    "repair_links": "repair_command",
+    "consolidate": "consolidate_command",
+    "check": "check_command",
+    "cleanup": "cleanup_command",
+    "regroup": "regroup_command",
+    "fix_symlinks": "fix_symlinks_command",
+    "fix_bad_links": "fix_bad_links_command",
+    "watch": "watch_command",
+}
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{_PACKAGE}.{module}"), name)
+
+
+__all__ = ["COMMANDS", *_EXPORTS]
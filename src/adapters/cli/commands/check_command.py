@@ -23,6 +23,14 @@ def check(
         bool,
         typer.Option("--verify-hash", help="Verifier les hash de fichiers (lent)"),
     ] = False,
+    stat_workers: Annotated[
+        int,
+        typer.Option(
+            "--stat-workers",
+            min=1,
+            help="Threads de verification des fichiers (utile sur un NAS)",
+        ),
+    ] = 1,
 ) -> None:
     """Verifie l'integrite de la videotheque."""
     container = Container()
@@ -33,6 +41,7 @@ def check(
     checker = container.integrity_checker(
         storage_dir=Path(config.storage_dir),
         video_dir=Path(config.video_dir),
+        stat_workers=stat_workers,
     )
 
     console.print("[bold cyan]Verification d'integrite[/bold cyan]\n")
@@ -2,11 +2,17 @@
 
 Detecte les symlinks de series dont plusieurs episodes pointent vers le meme
 fichier cible, puis recherche le bon fichier dans le storage pour chaque episode.
+
+Les cibles partagees sont lues dans l'index inverse des symlinks (reconcilie
+au prealable) et chaque serie du storage n'est parcourue qu'une fois (index
+(saison, episode) -> fichier) : le cout suit le nombre de liens, pas
+liens x fichiers.
 """
 
 import os
 import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Annotated, Optional
 
@@ -14,53 +20,129 @@ import typer
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 
 from src.adapters.cli.validation import console
+from src.adapters.file_system import read_symlink_entry
 from src.container import Container
+from src.services.integrity import walk_video_files
+from src.services.symlink_index import reconcile_symlink_index
 from src.utils.constants import VIDEO_EXTENSIONS
 
 # Pattern SxxExx dans un nom de fichier
 _SXXEXX_RE = re.compile(r"S(\d+)E(\d+)", re.IGNORECASE)
 
+# Episodes enchaines d'un fichier multi-episodes (S01E01E02)
+_CHAINED_EPISODES_RE = re.compile(r"S(\d+)((?:E\d+)+)", re.IGNORECASE)
+_EPISODE_RE = re.compile(r"E(\d+)", re.IGNORECASE)
+
+# Threads de resolution des symlinks (readlink + stat, I/O sur le NAS)
+DEFAULT_READLINK_WORKERS = 8
+
+
+def _collect_video_symlinks(video_dir: Path) -> list[str]:
+    """
+    Liste les symlinks video sous Films/ et Séries/ en un parcours os.scandir.
+
+    Les repertoires symlinks ne sont pas suivis (comme Path.rglob).
+    """
+    links: list[str] = []
+    stack = [
+        str(video_dir / name)
+        for name in ("Films", "Séries")
+        if (video_dir / name).exists()
+    ]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_symlink():
+                            if os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS:
+                                links.append(entry.path)
+                        elif entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return links
+
+
+def _resolve_link(symlink: str) -> str | None:
+    """Cible directe d'un symlink si elle existe, None sinon (lien casse)."""
+    try:
+        raw_target = os.readlink(symlink)
+    except OSError:
+        return None
+    target = raw_target if os.path.isabs(raw_target) else os.path.join(
+        os.path.dirname(symlink), raw_target
+    )
+    return target if os.path.exists(target) else None
+
 
 def _find_duplicate_targets(
     video_dir: Path,
+    workers: int = DEFAULT_READLINK_WORKERS,
+    symlink_index=None,  # ISymlinkIndexRepository
 ) -> dict[str, list[Path]]:
     """
     Trouve les symlinks partageant la meme cible physique.
 
-    Parcourt video_dir recursivement, groupe les symlinks par cible resolue,
-    et retourne seulement les groupes ayant plus d'un symlink.
+    Avec l'index inverse des symlinks, l'index est reconcilie (seuls les
+    repertoires modifies sont relus) et les cibles partagees sont lues par
+    une requete. Sinon, video_dir est parcouru une fois et les symlinks
+    resolus en parallele (readlink + existence de la cible, couteux sur un
+    montage reseau). Seuls les groupes de plus d'un symlink sont retournes.
 
     Returns:
         Dict {cible_resolue: [symlinks]} pour les cibles avec >= 2 symlinks.
     """
-    target_to_links: dict[str, list[Path]] = defaultdict(list)
+    if symlink_index is not None:
+        return _indexed_duplicate_targets(video_dir, workers, symlink_index)
 
-    for subdir_name in ("Films", "Séries"):
-        subdir = video_dir / subdir_name
-        if not subdir.exists():
-            continue
-        for symlink in subdir.rglob("*"):
-            if not symlink.is_symlink():
-                continue
-            if symlink.suffix.lower() not in VIDEO_EXTENSIONS:
-                continue
-            try:
-                # Lire la cible directe du symlink
-                raw_target = os.readlink(symlink)
-                if os.path.isabs(raw_target):
-                    target = raw_target
-                else:
-                    target = str(symlink.parent / raw_target)
-                # Verifier que la cible existe (on ne cherche que les liens non-casses)
-                if Path(target).exists():
-                    target_to_links[target].append(symlink)
-            except OSError:
-                continue
+    symlinks = sorted(_collect_video_symlinks(video_dir))
+    if workers <= 1 or len(symlinks) <= 1:
+        targets = map(_resolve_link, symlinks)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            targets = list(pool.map(_resolve_link, symlinks))
+
+    target_to_links: dict[str, list[Path]] = defaultdict(list)
+    for symlink, target in zip(symlinks, targets):
+        # On ne cherche que les liens non-casses
+        if target is not None:
+            target_to_links[target].append(Path(symlink))
 
     # Ne garder que les cibles avec plusieurs symlinks
     return {t: links for t, links in target_to_links.items() if len(links) > 1}
 
 
+def _indexed_duplicate_targets(
+    video_dir: Path, workers: int, symlink_index
+) -> dict[str, list[Path]]:
+    """
+    Cibles partagees lues dans l'index inverse (voir _find_duplicate_targets).
+
+    Les symlinks sont regroupes par inode : deux chemins vers le meme
+    fichier forment un seul groupe.
+    """
+    scopes = [video_dir / name for name in ("Films", "Séries")]
+    for subdir in scopes:
+        if subdir.exists():
+            reconcile_symlink_index(symlink_index, subdir, workers)
+
+    duplicates: dict[str, list[Path]] = {}
+    for target, links in symlink_index.shared_targets(video_dir).items():
+        links = [
+            link for link in links
+            if link.suffix.lower() in VIDEO_EXTENSIONS
+            and any(link.is_relative_to(subdir) for subdir in scopes)
+        ]
+        # Ne garder que les cibles avec plusieurs symlinks, non cassees
+        if len(links) > 1 and target.exists():
+            duplicates[str(target)] = links
+    return duplicates
+
+
 def _match_episode_id(filename: str, season: int, episode: int) -> bool:
     """
     Verifie si un nom de fichier correspond exactement a un numero d'episode.
@@ -78,18 +160,42 @@ def _match_episode_id(filename: str, season: int, episode: int) -> bool:
     return False
 
 
+def _index_series_episodes(series_storage_dir: Path) -> dict[tuple[int, int], Path]:
+    """
+    Indexe les fichiers video d'une serie du storage par (saison, episode).
+
+    Un seul parcours de l'arborescence (Saison XX/) ; un fichier multi-episodes
+    (S01E01E02 ou S01E01-S01E02) est indexe sous chacun de ses SxxExx. En cas
+    de doublon, le premier chemin dans l'ordre alphabetique est retenu.
+    """
+    index: dict[tuple[int, int], Path] = {}
+    if not series_storage_dir.exists():
+        return index
+    for path in sorted(walk_video_files(series_storage_dir, VIDEO_EXTENSIONS)):
+        name = os.path.basename(path).upper()
+        for m in _CHAINED_EPISODES_RE.finditer(name):
+            season = int(m.group(1))
+            for episode in _EPISODE_RE.findall(m.group(2)):
+                index.setdefault((season, int(episode)), Path(path))
+    return index
+
+
 def _find_correct_target_in_storage(
-    link: Path, series_storage_dir: Path
+    link: Path,
+    series_storage_dir: Path,
+    indexes: Optional[dict[Path, dict[tuple[int, int], Path]]] = None,
 ) -> Path | None:
     """
     Recherche le bon fichier cible pour un symlink dans le repertoire storage de la serie.
 
-    Extrait le SxxExx du nom du symlink et cherche un fichier correspondant
-    dans l'arborescence du storage (recursivement via les Saison XX/).
+    Extrait le SxxExx du nom du symlink et le cherche dans l'index
+    (saison, episode) de la serie, construit au premier appel puis reutilise
+    pour les autres episodes de la meme serie.
 
     Args:
         link: Symlink a corriger
         series_storage_dir: Repertoire racine de la serie dans le storage
+        indexes: Index deja construits par serie (complete si absent)
 
     Returns:
         Chemin du fichier cible correct ou None si introuvable.
@@ -101,18 +207,13 @@ def _find_correct_target_in_storage(
     season = int(match.group(1))
     episode = int(match.group(2))
 
-    if not series_storage_dir.exists():
-        return None
-
-    for candidate in series_storage_dir.rglob("*"):
-        if not candidate.is_file() or candidate.is_symlink():
-            continue
-        if candidate.suffix.lower() not in VIDEO_EXTENSIONS:
-            continue
-        if _match_episode_id(candidate.name, season, episode):
-            return candidate
+    if indexes is None:
+        indexes = {}
+    index = indexes.get(series_storage_dir)
+    if index is None:
+        index = indexes[series_storage_dir] = _index_series_episodes(series_storage_dir)
 
-    return None
+    return index.get((season, episode))
 
 
 def _get_series_storage_dir(target_path: Path) -> Path | None:
@@ -162,6 +263,8 @@ def fix_bad_links(
     """
     container = Container()
     config = container.config()
+    container.database.init()
+    symlink_index = container.symlink_index_repository()
     video_dir = scan_dir or Path(config.video_dir)
 
     if not video_dir.exists():
@@ -172,7 +275,7 @@ def fix_bad_links(
     console.print("[bold]Phase 1 : Detection des symlinks partageant la meme cible[/bold]")
 
     with console.status("[cyan]Scan des symlinks..."):
-        duplicates = _find_duplicate_targets(video_dir)
+        duplicates = _find_duplicate_targets(video_dir, symlink_index=symlink_index)
 
     if not duplicates:
         console.print("[green]Aucun symlink duplique detecte.[/green]")
@@ -190,6 +293,7 @@ def fix_bad_links(
     mode_label = "[dim](dry-run)[/dim] " if dry_run else ""
     console.print(f"{mode_label}[bold]Phase 2 : Correction des symlinks[/bold]")
 
+    episode_indexes: dict[Path, dict[tuple[int, int], Path]] = {}
     fixed = 0
     already_correct = 0
     not_found = 0
@@ -235,7 +339,9 @@ def fix_bad_links(
                     continue
 
                 # Chercher le bon fichier dans le storage
-                correct_target = _find_correct_target_in_storage(link, series_dir)
+                correct_target = _find_correct_target_in_storage(
+                    link, series_dir, episode_indexes
+                )
                 if not correct_target:
                     not_found += 1
                     console.print(
@@ -256,6 +362,9 @@ def fix_bad_links(
                     try:
                         link.unlink()
                         link.symlink_to(correct_target)
+                        entry = read_symlink_entry(link)
+                        if entry is not None:
+                            symlink_index.record(entry)
                         fixed += 1
                         console.print(
                             f"  [green]Corrige[/green] : {link.name} → {correct_target.name}"
@@ -36,6 +36,23 @@ def import_library(
             help="Import inverse: scanne les symlinks et resout leurs cibles",
         ),
     ] = False,
+    bulk: Annotated[
+        bool,
+        typer.Option(
+            "--bulk",
+            help="Import en masse: hash en parallele et ecritures BDD par lots",
+        ),
+    ] = False,
+    workers: Annotated[
+        int,
+        typer.Option("--workers", min=1, help="Threads de hash en mode --bulk"),
+    ] = 4,
+    batch_size: Annotated[
+        int,
+        typer.Option(
+            "--batch-size", min=1, help="Lignes par transaction en mode --bulk"
+        ),
+    ] = 500,
 ) -> None:
     """
     Importe une videotheque existante dans la base de donnees.
@@ -46,13 +63,26 @@ def import_library(
 
     - Mode --from-symlinks: scanne les symlinks dans video_dir et resout leurs cibles.
       Enregistre a la fois le chemin du symlink ET le chemin du fichier physique.
+
+    L'option --bulk accelere l'import initial d'une grosse videotheque
+    (memes decisions, hash paralleles, transactions par lots).
     """
-    asyncio.run(_import_library_async(source_dir, dry_run, from_symlinks))
+    asyncio.run(
+        _import_library_async(
+            source_dir, dry_run, from_symlinks, bulk, workers, batch_size
+        )
+    )
 
 
 @with_container()
 async def _import_library_async(
-    container, source_dir: Optional[Path], dry_run: bool, from_symlinks: bool
+    container,
+    source_dir: Optional[Path],
+    dry_run: bool,
+    from_symlinks: bool,
+    bulk: bool = False,
+    workers: int = 4,
+    batch_size: int = 500,
 ) -> None:
     """Implementation async de la commande import."""
     from src.services.importer import ImportDecision
@@ -91,12 +121,22 @@ async def _import_library_async(
         console.print(
             "[dim]Les symlinks seront resolus vers leurs fichiers physiques cibles[/dim]\n"
         )
-        scan_generator = importer.scan_from_symlinks(source_dir)
+        if bulk:
+            scan_generator = importer.bulk_scan_from_symlinks(
+                source_dir, workers=workers, batch_size=batch_size
+            )
+        else:
+            scan_generator = importer.scan_from_symlinks(source_dir)
     else:
         console.print(
             f"[bold cyan]Import de la videotheque[/bold cyan]: {source_dir}\n"
         )
-        scan_generator = importer.scan_library(source_dir)
+        if bulk:
+            scan_generator = importer.bulk_scan_library(
+                source_dir, workers=workers, batch_size=batch_size
+            )
+        else:
+            scan_generator = importer.scan_library(source_dir)
 
     with Progress(
         SpinnerColumn(),
@@ -357,7 +397,11 @@ def link_movies(
         typer.Option("--dry-run", help="Simule sans modifier la base"),
     ] = False,
 ) -> None:
-    """Associe les films en base a leurs fichiers physiques via les symlinks video/."""
+    """Associe les films en base a leurs fichiers physiques via les symlinks video/.
+
+    Reconstruit aussi l'index des symlinks de films (movie_links) utilise
+    par les fiches detail pour retrouver les fichiers.
+    """
     asyncio.run(_link_movies_async(dry_run))
 
 
@@ -372,6 +416,7 @@ async def _link_movies_async(container, dry_run: bool) -> None:
     config = container.config()
     movie_repo = container.movie_repository()
     session = movie_repo._session
+    movie_links = container.movie_link_repository()
 
     video_films_dir = Path(config.video_dir) / "Films"
     if not video_films_dir.exists():
@@ -398,6 +443,7 @@ async def _link_movies_async(container, dry_run: bool) -> None:
         already = 0
         not_found = 0
         no_target = 0
+        indexed = 0
 
         with Progress(
             SpinnerColumn(),
@@ -431,6 +477,9 @@ async def _link_movies_async(container, dry_run: bool) -> None:
 
                 file_path = str(target)
 
+                if not dry_run and movie_links.record(symlink, target):
+                    indexed += 1
+
                 # Chercher le film en base (titre ou titre original + annee)
                 results = session.exec(
                     select(MovieModel).where(
@@ -530,6 +579,8 @@ async def _link_movies_async(container, dry_run: bool) -> None:
             f"  [green]{storage_linked}[/green] film(s) associé(s) via storage"
         )
     console.print(f"  [yellow]{already}[/yellow] déjà associé(s)")
+    if indexed > 0:
+        console.print(f"  [dim]{indexed}[/dim] symlink(s) indexé(s)")
     if not_found > 0:
         console.print(f"  [dim]{not_found}[/dim] non trouvé(s) en base")
     if no_target > 0:
@@ -873,6 +924,18 @@ def clean_titles() -> None:
     session.close()
 
 
+def rebuild_facets() -> None:
+    """Recalcule les facettes de la bibliotheque (genres, personnes, resolution)."""
+    from src.infrastructure.persistence import facets
+    from src.infrastructure.persistence.database import get_engine
+
+    with console.status("Recalcul des facettes..."):
+        with get_engine().begin() as conn:
+            count = facets.rebuild_facets(conn)
+
+    console.print(f"[green]✓[/green] Facettes recalculées pour {count} films et séries")
+
+
 def enrich_tech(
     dry_run: Annotated[
         bool,
@@ -1074,6 +1137,14 @@ async def _enrich_episode_titles_async(
                     description=f"[cyan]{series_title or f'Série {series_id}'}",
                 )
 
+                # Plusieurs saisons concernees : toute la serie en un parcours
+                # pagine, les episodes sont ensuite lus dans le cache
+                if len({ep.season_number for ep, _ in eps_list}) > 1:
+                    try:
+                        await tvdb_client.get_series_episodes(str(tvdb_id))
+                    except Exception:
+                        pass  # Repli sur le chargement saison par saison
+
                 for ep, _ in eps_list:
                     try:
                         details = await tvdb_client.get_episode_details(
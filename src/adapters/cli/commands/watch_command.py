@@ -0,0 +1,156 @@
+"""Commande CLI watch : surveillance continue de la videotheque.
+
+Tient la base et les index a jour au fil des modifications (inotify, ou
+polling si inotify est indisponible ou pour un montage reseau) et traite
+les nouveaux telechargements (scan -> matching -> auto-validation) une
+fois le delai de calme ecoule. Les fichiers restant en attente de
+validation se traitent ensuite comme d'habitude (cineorg validate, web).
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+from loguru import logger
+
+from src.adapters.cli.validation import console
+from src.adapters.file_watcher import PollingWatcher, create_watcher
+from src.container import Container
+from src.services.symlink_index import reconcile_symlink_index
+from src.services.watch import WatchService
+from src.services.workflow.pending_factory import create_pending_validation
+
+
+async def _process_downloads_async(container: Container, paths: list[Path]) -> None:
+    """Scan, matching et auto-validation des nouveaux telechargements."""
+    scanner = container.scanner_service()
+    matcher = container.matcher_service()
+    tmdb_client = container.tmdb_client()
+    tvdb_client = container.tvdb_client()
+    video_file_repo = container.video_file_repository()
+    pending_repo = container.pending_validation_repository()
+    validation_service = container.validation_service()
+
+    for path in paths:
+        if video_file_repo.get_by_path(path) is not None:
+            continue  # Deja traite (workflow lance en parallele)
+        result = scanner.scan_file(path)
+        if result is None:
+            continue
+        video_file, pending = await create_pending_validation(
+            result, matcher, tmdb_client, tvdb_client
+        )
+        pending.video_file = video_file_repo.save(video_file)
+        pending = pending_repo.save(pending)
+
+        validation = await validation_service.process_auto_validation(pending)
+        status = "auto-valide" if validation.auto_validated else "en attente de validation"
+        console.print(f"[green]Nouveau:[/green] {path.name} ({status})")
+
+
+def _process_downloads(runner: asyncio.Runner, container: Container, paths: list[Path]) -> None:
+    """
+    Traite un lot de telechargements dans la boucle du daemon.
+
+    Une seule boucle pour toute la surveillance : les clients TMDB/TVDB
+    (singletons du container) gardent leur httpx.AsyncClient d'un lot a
+    l'autre, lie a la boucle qui l'a cree.
+    """
+    try:
+        runner.run(_process_downloads_async(container, paths))
+    except Exception as e:
+        logger.error(f"Traitement des telechargements interrompu: {e}")
+
+
+async def _close_api_clients(container: Container) -> None:
+    """Ferme les clients API dans la boucle du daemon, a l'arret."""
+    await container.tmdb_client().close()
+    await container.tvdb_client().close()
+
+
+def watch(
+    polling: Annotated[
+        bool,
+        typer.Option("--polling", help="Surveillance par polling (sans inotify, montages reseau)"),
+    ] = False,
+    interval: Annotated[
+        Optional[float],
+        typer.Option("--interval", min=0.1, help="Intervalle du polling en secondes"),
+    ] = None,
+    quiet_period: Annotated[
+        Optional[int],
+        typer.Option(
+            "--quiet-period",
+            min=1,
+            help="Secondes sans activite avant de traiter les telechargements",
+        ),
+    ] = None,
+    no_process: Annotated[
+        bool,
+        typer.Option("--no-process", help="Ne pas traiter les nouveaux telechargements"),
+    ] = False,
+) -> None:
+    """
+    Surveille la videotheque et tient la base et les index a jour.
+
+    Exemples:
+      cineorg watch                  # inotify, traitement des telechargements
+      cineorg watch --polling        # NAS / montage reseau
+      cineorg watch --no-process     # index et base seulement
+    """
+    container = Container()
+    config = container.config()
+    container.database.init()
+
+    video_dir = Path(config.video_dir).resolve()
+    storage_dir = Path(config.storage_dir).resolve()
+    downloads_dir = Path(config.downloads_dir).resolve()
+    symlink_index = container.symlink_index_repository()
+
+    with console.status("[cyan]Reconciliation de l'index des symlinks..."):
+        stats = reconcile_symlink_index(symlink_index, video_dir)
+    console.print(
+        f"Index des symlinks: {stats.directories} repertoire(s), "
+        f"{stats.rescanned} relu(s)"
+    )
+
+    runner = asyncio.Runner()
+    service = WatchService(
+        video_dir=video_dir,
+        storage_dir=storage_dir,
+        downloads_dir=downloads_dir,
+        symlink_index=symlink_index,
+        file_system=container.file_system(),
+        video_file_repo=container.video_file_repository(),
+        movie_link_repo=container.movie_link_repository(),
+        quiet_period=quiet_period or config.watch_quiet_period_seconds,
+        on_downloads_ready=(
+            None if no_process
+            else lambda paths: _process_downloads(runner, container, paths)
+        ),
+    )
+
+    roots = [video_dir, storage_dir, downloads_dir]
+    watcher = create_watcher(
+        roots, polling=polling, interval=interval or config.watch_poll_interval_seconds
+    )
+    mode = "polling" if isinstance(watcher, PollingWatcher) else "inotify"
+    console.print(f"[bold cyan]Surveillance ({mode})[/bold cyan] - Ctrl+C pour arreter")
+    for root in roots:
+        console.print(f"  {root}")
+
+    try:
+        with watcher:
+            service.run(watcher)
+    except KeyboardInterrupt:
+        pending = service.pending_downloads
+        if pending:
+            console.print(
+                f"[yellow]{len(pending)} telechargement(s) non traite(s) "
+                "(cineorg process)[/yellow]"
+            )
+        console.print("Surveillance arretee.")
+    finally:
+        with runner:
+            runner.run(_close_api_clients(container))
@@ -0,0 +1,117 @@
+"""
+Chargement paresseux des commandes CLI.
+
+Importer un module de commandes entraine guessit, pymediainfo, sqlmodel,
+httpx, rich et le container DI. Plutot que de tout importer au demarrage,
+les commandes sont declarees dans un registre (nom, module, attribut, aide
+courte) et leur module n'est importe que lorsqu'elles sont invoquees.
+
+Ce module fournit :
+- LazyCommand : entree du registre
+- load_command : import d'une commande et conversion en commande Click
+- LazyTyperGroup : groupe Typer resolvant les commandes du registre a la
+  demande ; la completion shell des noms de commandes et les suggestions
+  de fautes de frappe n'importent aucun module de commandes
+"""
+
+import importlib
+from difflib import get_close_matches
+from typing import NamedTuple, Optional
+
+import click
+import typer
+from click.shell_completion import CompletionItem
+from click.utils import make_default_short_help
+from typer.core import TyperGroup
+
+
+class LazyCommand(NamedTuple):
+    """
+    Commande declaree dans le registre.
+
+    Attributs:
+        name: Nom de la commande en ligne de commande.
+        module: Module a importer a l'invocation.
+        attribute: Fonction de commande ou application Typer du module.
+        help: Aide courte (liste des commandes, completion shell).
+    """
+
+    name: str
+    module: str
+    attribute: str
+    help: str
+
+
+def load_command(entry: LazyCommand) -> click.Command:
+    """
+    Importe une commande du registre et la convertit en commande Click.
+
+    Une application Typer (sous-commandes) devient un groupe, une fonction
+    une commande simple, comme avec app.add_typer() et app.command().
+    """
+    target = getattr(importlib.import_module(entry.module), entry.attribute)
+    if isinstance(target, typer.Typer):
+        command = typer.main.get_command(target)
+    else:
+        single = typer.Typer()
+        single.command(name=entry.name)(target)
+        command = typer.main.get_command(single)
+    command.name = entry.name
+    return command
+
+
+class LazyTyperGroup(TyperGroup):
+    """
+    Groupe Typer dont les commandes du registre sont importees a la demande.
+
+    Les sous-classes renseignent lazy_commands ; les commandes declarees
+    directement sur l'application Typer restent chargees normalement.
+    """
+
+    lazy_commands: tuple[LazyCommand, ...] = ()
+
+    def _lazy_entry(self, name: str) -> Optional[LazyCommand]:
+        for entry in self.lazy_commands:
+            if entry.name == name:
+                return entry
+        return None
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(set(self.commands) | {entry.name for entry in self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = self.commands.get(cmd_name)
+        if command is None:
+            entry = self._lazy_entry(cmd_name)
+            if entry is not None:
+                command = load_command(entry)
+                self.add_command(command, cmd_name)
+        return command
+
+    def resolve_command(self, ctx: click.Context, args: list[str]):
+        try:
+            return super().resolve_command(ctx, args)
+        except click.UsageError as e:
+            # Suggestions sur toutes les commandes, chargees ou non
+            if self.suggest_commands and args and "Did you mean" not in e.message:
+                matches = get_close_matches(args[0], self.list_commands(ctx))
+                if matches:
+                    suggestions = ", ".join(f"{m!r}" for m in matches)
+                    e.message = f"{e.message.rstrip('.')}. Did you mean {suggestions}?"
+            raise
+
+    def shell_complete(self, ctx: click.Context, incomplete: str) -> list[CompletionItem]:
+        """Complete les noms de commandes depuis le registre (sans import)."""
+        helps = {entry.name: entry.help for entry in self.lazy_commands}
+        helps.update(
+            (name, command.get_short_help_str())
+            for name, command in self.commands.items()
+            if not command.hidden
+        )
+        results = [
+            CompletionItem(name, help=make_default_short_help(helps[name]))
+            for name in sorted(helps)
+            if name.startswith(incomplete)
+        ]
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
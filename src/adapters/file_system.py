@@ -12,6 +12,9 @@ import uuid
 from pathlib import Path
 from typing import Iterator, Optional
 
+from loguru import logger
+
+from src.core.entities.video import SymlinkTarget
 from src.core.ports.file_system import IFileSystem, ISymlinkManager
 from src.core.value_objects import MediaInfo
 
@@ -29,14 +32,49 @@ IGNORED_PATTERNS: frozenset[str] = frozenset({
 HASH_CHUNK_SIZE: int = 10 * 1024 * 1024
 
 
+def read_symlink_entry(link: str | Path) -> Optional[SymlinkTarget]:
+    """
+    Lit un symlink pour l'index inverse : cible (readlink) et inode pointe.
+
+    La cible relative est rendue absolue sans resoudre les repertoires
+    intermediaires. Un lien casse est indexe sans inode.
+
+    Returns:
+        SymlinkTarget, ou None si le chemin n'est pas un symlink lisible
+    """
+    try:
+        raw_target = os.readlink(link)
+    except OSError:
+        return None
+    target = os.path.normpath(os.path.join(os.path.dirname(link), raw_target))
+    try:
+        st = os.stat(target)
+        device, inode = st.st_dev, st.st_ino
+    except OSError:
+        device = inode = None
+    return SymlinkTarget(Path(link), Path(target), device, inode)
+
+
 class FileSystemAdapter(IFileSystem, ISymlinkManager):
     """
     Implementation de IFileSystem et ISymlinkManager pour le systeme de fichiers reel.
 
     Fournit les operations basiques sur les fichiers (exists, move, copy, delete)
     ainsi que des methodes utilitaires pour le scan de fichiers video.
+
+    Si un index inverse des symlinks est fourni, create_symlink et
+    remove_symlink le tiennent a jour.
     """
 
+    def __init__(self, symlink_index=None) -> None:  # ISymlinkIndexRepository
+        """
+        Initialise l'adaptateur.
+
+        Args:
+            symlink_index: Index inverse des symlinks (optionnel)
+        """
+        self._symlink_index = symlink_index
+
     def exists(self, path: Path) -> bool:
         """Verifie si un chemin existe."""
         return path.exists()
@@ -169,19 +207,34 @@ class FileSystemAdapter(IFileSystem, ISymlinkManager):
         try:
             link.parent.mkdir(parents=True, exist_ok=True)
             link.symlink_to(target.resolve())
-            return True
         except OSError:
             return False
+        if self._symlink_index is not None:
+            entry = read_symlink_entry(link)
+            if entry is not None:
+                self._update_index(self._symlink_index.record, entry)
+        return True
 
     def remove_symlink(self, link: Path) -> bool:
         """Supprime un lien symbolique."""
         try:
-            if link.is_symlink():
-                link.unlink()
-                return True
-            return False
+            if not link.is_symlink():
+                return False
+            link.unlink()
         except OSError:
             return False
+        if self._symlink_index is not None:
+            self._update_index(self._symlink_index.remove, link)
+        return True
+
+    @staticmethod
+    def _update_index(operation, argument) -> None:
+        """Met a jour l'index inverse ; un echec ne fait pas echouer l'operation."""
+        try:
+            operation(argument)
+        except Exception as e:
+            # La prochaine reconciliation relira le repertoire (mtime modifie)
+            logger.warning(f"Index des symlinks non mis a jour: {e}")
 
     def is_symlink(self, path: Path) -> bool:
         """Verifie si un chemin est un lien symbolique."""
@@ -0,0 +1,413 @@
+"""
+Surveillance des repertoires (creations, deplacements, suppressions).
+
+Deux implementations de la meme interface :
+- InotifyWatcher : inotify Linux via ctypes (sans dependance), une
+  surveillance par repertoire, ajoutee au fil des creations de dossiers ;
+  les deplacements sont reconstitues par le cookie IN_MOVED_FROM/IN_MOVED_TO
+- PollingWatcher : comparaison d'instantanes (scandir) a intervalle fixe,
+  pour les systemes sans inotify ou les montages reseau (NFS/SMB ne
+  remontent pas les modifications faites par d'autres machines) ;
+  les deplacements sont reconnus par l'inode
+
+Usage:
+    with create_watcher([downloads, storage, video]) as watcher:
+        while True:
+            for event in watcher.read_events(timeout=1.0):
+                ...
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from loguru import logger
+
+# Types d'evenements
+CREATED = "created"
+DELETED = "deleted"
+MOVED = "moved"
+
+# Masques inotify (linux/inotify.h)
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_DONT_FOLLOW = 0x02000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = os.O_CLOEXEC
+
+_WATCH_MASK = (
+    _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+    | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR | _IN_DONT_FOLLOW
+)
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+class FileEvent(NamedTuple):
+    """
+    Evenement sur un fichier ou un repertoire surveille.
+
+    Attributes:
+        kind: CREATED, DELETED ou MOVED
+        path: Chemin concerne (source pour un deplacement)
+        dest: Destination d'un deplacement (None sinon)
+        is_dir: True si l'element est un repertoire
+    """
+
+    kind: str
+    path: Path
+    dest: Optional[Path] = None
+    is_dir: bool = False
+
+
+class WatcherOverflow(Exception):
+    """Evenements perdus (file inotify pleine) : un rescan complet est necessaire."""
+
+
+def _walk_dirs(root: Path) -> list[str]:
+    """Repertoires (root compris) d'une arborescence, sans suivre les symlinks."""
+    found = []
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        found.append(current)
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return found
+
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1  # noqa: B018 - verifie la presence du symbole
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+def inotify_available() -> bool:
+    """Vrai si inotify est utilisable (Linux)."""
+    return _load_libc() is not None
+
+
+class InotifyWatcher:
+    """
+    Surveillance recursive par inotify.
+
+    Les sous-repertoires crees ou deplaces dans l'arborescence sont
+    surveilles a leur tour ; les fichiers deja presents dans un dossier
+    cree (copie d'un dossier complet) sont signales comme crees.
+    """
+
+    def __init__(self, roots: list[Path]) -> None:
+        """
+        Initialise la surveillance.
+
+        Args:
+            roots: Repertoires a surveiller (recursivement)
+
+        Raises:
+            OSError: Si inotify n'est pas disponible
+        """
+        self._libc = _load_libc()
+        if self._libc is None:
+            raise OSError("inotify indisponible sur ce systeme")
+        self._fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+        self._paths: dict[int, str] = {}
+        self._watches: dict[str, int] = {}
+        for root in roots:
+            if root.exists():
+                for directory in _walk_dirs(root):
+                    self._add_watch(directory)
+
+    def _add_watch(self, directory: str) -> None:
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(directory), _WATCH_MASK
+        )
+        if wd < 0:
+            logger.debug(f"Surveillance impossible: {directory} (errno {ctypes.get_errno()})")
+            return
+        self._paths[wd] = directory
+        self._watches[directory] = wd
+
+    def _forget_tree(self, directory: str) -> None:
+        """Oublie les surveillances d'une arborescence deplacee ou supprimee."""
+        prefix = directory + os.sep
+        for path in [p for p in self._watches if p == directory or p.startswith(prefix)]:
+            self._paths.pop(self._watches.pop(path), None)
+
+    def _watch_new_tree(self, directory: str) -> list[FileEvent]:
+        """Surveille un dossier apparu ; signale les fichiers qu'il contient deja."""
+        events = []
+        for sub in _walk_dirs(Path(directory)):
+            self._add_watch(sub)
+            try:
+                with os.scandir(sub) as entries:
+                    for entry in entries:
+                        if not entry.is_dir(follow_symlinks=False):
+                            events.append(FileEvent(CREATED, Path(entry.path)))
+            except OSError:
+                continue
+        return events
+
+    def _read_raw(self) -> list[tuple[int, int, int, str]]:
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        raw = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            raw.append((wd, mask, cookie, os.fsdecode(name)))
+        return raw
+
+    def read_events(self, timeout: float = 1.0) -> list[FileEvent]:
+        """
+        Attend et retourne les evenements disponibles.
+
+        Args:
+            timeout: Attente maximale en secondes
+
+        Returns:
+            Evenements dans l'ordre de reception (liste vide si aucun)
+
+        Raises:
+            WatcherOverflow: Si des evenements ont ete perdus
+        """
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return []
+        raw = self._read_raw()
+        # Laisser arriver la moitie IN_MOVED_TO d'un deplacement
+        if any(mask & _IN_MOVED_FROM for _, mask, _, _ in raw):
+            time.sleep(0.01)
+            raw.extend(self._read_raw())
+
+        events: list[FileEvent] = []
+        moves: dict[int, int] = {}  # cookie -> position dans events
+        overflow = False
+        for wd, mask, cookie, name in raw:
+            if mask & _IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            if mask & _IN_IGNORED:
+                directory = self._paths.pop(wd, None)
+                if directory is not None and self._watches.get(directory) == wd:
+                    del self._watches[directory]
+                continue
+            directory = self._paths.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, name)
+            is_dir = bool(mask & _IN_ISDIR)
+
+            if mask & _IN_CREATE:
+                events.append(FileEvent(CREATED, Path(path), is_dir=is_dir))
+                if is_dir:
+                    events.extend(self._watch_new_tree(path))
+            elif mask & _IN_DELETE:
+                events.append(FileEvent(DELETED, Path(path), is_dir=is_dir))
+            elif mask & _IN_MOVED_FROM:
+                moves[cookie] = len(events)
+                # Deplacement hors de l'arborescence si aucun IN_MOVED_TO
+                events.append(FileEvent(DELETED, Path(path), is_dir=is_dir))
+                if is_dir:
+                    self._forget_tree(path)
+            elif mask & _IN_MOVED_TO:
+                index = moves.pop(cookie, None)
+                if index is not None:
+                    source = events[index].path
+                    events[index] = FileEvent(MOVED, source, Path(path), is_dir)
+                else:
+                    events.append(FileEvent(CREATED, Path(path), is_dir=is_dir))
+                if is_dir:
+                    new_events = self._watch_new_tree(path)
+                    if index is None:
+                        events.extend(new_events)
+
+        if overflow:
+            raise WatcherOverflow("file d'evenements inotify pleine")
+        return events
+
+    def close(self) -> None:
+        """Ferme le descripteur inotify."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __enter__(self) -> "InotifyWatcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _snapshot(roots: list[Path]) -> dict[str, tuple[int, int, bool]]:
+    """Instantane {chemin: (peripherique, inode, est_repertoire)} des arborescences."""
+    snapshot: dict[str, tuple[int, int, bool]] = {}
+    for root in roots:
+        stack = [str(root)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            st = entry.stat(follow_symlinks=False)
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        snapshot[entry.path] = (st.st_dev, st.st_ino, is_dir)
+                        if is_dir:
+                            stack.append(entry.path)
+            except OSError:
+                continue
+    return snapshot
+
+
+def diff_snapshots(
+    before: dict[str, tuple[int, int, bool]],
+    after: dict[str, tuple[int, int, bool]],
+) -> list[FileEvent]:
+    """
+    Evenements entre deux instantanes.
+
+    Un element disparu dont l'inode reapparait ailleurs est un deplacement ;
+    le contenu d'un repertoire deplace n'est pas signale separement. Un
+    inode libere puis reutilise entre deux passes peut faire passer une
+    suppression suivie d'une creation pour un deplacement.
+    """
+    removed = {p: before[p] for p in before.keys() - after.keys()}
+    added = {p: after[p] for p in after.keys() - before.keys()}
+    by_identity = {(dev, ino): path for path, (dev, ino, _) in added.items()}
+
+    events: list[FileEvent] = []
+    moved_dirs: list[tuple[str, str]] = []
+    for path in sorted(removed):
+        dev, ino, is_dir = removed[path]
+        if any(path.startswith(src + os.sep) for src, _ in moved_dirs):
+            added.pop(by_identity.pop((dev, ino), ""), None)
+            continue
+        dest = by_identity.pop((dev, ino), None)
+        if dest is not None:
+            added.pop(dest)
+            events.append(FileEvent(MOVED, Path(path), Path(dest), is_dir))
+            if is_dir:
+                moved_dirs.append((path, dest))
+        else:
+            events.append(FileEvent(DELETED, Path(path), is_dir=is_dir))
+    for path in sorted(added):
+        if any(path.startswith(dst + os.sep) for _, dst in moved_dirs):
+            continue
+        events.append(FileEvent(CREATED, Path(path), is_dir=added[path][2]))
+    return events
+
+
+class PollingWatcher:
+    """
+    Surveillance par comparaison d'instantanes a intervalle fixe.
+
+    Chaque passe parcourt les arborescences (un stat par element) : plus
+    couteux qu'inotify, mais fonctionne partout, y compris sur un montage
+    reseau modifie par une autre machine.
+    """
+
+    def __init__(self, roots: list[Path], interval: float = 5.0) -> None:
+        """
+        Initialise la surveillance.
+
+        Args:
+            roots: Repertoires a surveiller (recursivement)
+            interval: Intervalle entre deux instantanes (secondes)
+        """
+        self._roots = [root for root in roots if root.exists()]
+        self._interval = interval
+        self._snapshot = _snapshot(self._roots)
+        self._next = time.monotonic() + interval
+
+    def read_events(self, timeout: float = 1.0) -> list[FileEvent]:
+        """Attend au plus timeout secondes la prochaine passe et retourne ses evenements."""
+        wait = self._next - time.monotonic()
+        if wait > timeout:
+            time.sleep(timeout)
+            return []
+        if wait > 0:
+            time.sleep(wait)
+        self._next = time.monotonic() + self._interval
+        snapshot = _snapshot(self._roots)
+        events = diff_snapshots(self._snapshot, snapshot)
+        self._snapshot = snapshot
+        return events
+
+    def close(self) -> None:
+        self._snapshot = {}
+
+    def __enter__(self) -> "PollingWatcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def create_watcher(roots: list[Path], polling: bool = False, interval: float = 5.0):
+    """
+    Cree la surveillance la plus adaptee.
+
+    Args:
+        roots: Repertoires a surveiller
+        polling: Force le mode polling
+        interval: Intervalle du mode polling (secondes)
+
+    Returns:
+        InotifyWatcher si disponible (et polling=False), PollingWatcher sinon
+    """
+    if not polling and inotify_available():
+        try:
+            return InotifyWatcher(roots)
+        except OSError as e:
+            logger.warning(f"inotify indisponible ({e}), surveillance par polling")
+    return PollingWatcher(roots, interval)
+
+
+__all__ = [
+    "CREATED",
+    "DELETED",
+    "MOVED",
+    "FileEvent",
+    "InotifyWatcher",
+    "PollingWatcher",
+    "WatcherOverflow",
+    "create_watcher",
+    "diff_snapshots",
+    "inotify_available",
+]
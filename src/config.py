@@ -8,7 +8,7 @@ Les clés API (TMDB, TVDB) sont optionnelles - les fonctionnalités sont désact
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -43,16 +43,36 @@ class Settings(BaseSettings):
 
     # Base de données
     database_url: str = Field(default="sqlite:///cineorg.db")
+    database_profile: Literal["tuned", "legacy"] = Field(default="tuned")
 
     # Clés API (OPTIONNELLES - fonctionnalités API désactivées si non définies)
     tmdb_api_key: Optional[str] = Field(default=None)
     tvdb_api_key: Optional[str] = Field(default=None)
 
+    # Miroir local des réponses API (âge max en jours d'une réponse servie
+    # sans appel API, 0 = enregistrement seul ; recherches et 404 toujours
+    # redemandées en ligne ; hors ligne : miroir seul)
+    api_mirror_max_age_days: int = Field(default=0, ge=0)
+    api_offline: bool = Field(default=False)
+
     # Traitement
     min_file_size_mb: int = Field(default=100, ge=1)
     max_files_per_subdir: int = Field(default=50, ge=1)
     match_score_threshold: int = Field(default=85, ge=0, le=100)
 
+    # Serveur web (pool de threads des handlers, seuil des requêtes lentes,
+    # pool dédié aux tâches de fond : scans, workflow, transferts,
+    # nombre de pages rendues gardées en cache, 0 = désactivé)
+    web_worker_threads: int = Field(default=16, ge=1)
+    web_slow_request_ms: int = Field(default=500, ge=1)
+    web_job_workers: int = Field(default=4, ge=1)
+    web_page_cache_size: int = Field(default=256, ge=0)
+
+    # Surveillance (cineorg watch) : délai sans activité avant de traiter
+    # les nouveaux téléchargements, intervalle du mode polling
+    watch_quiet_period_seconds: int = Field(default=120, ge=1)
+    watch_poll_interval_seconds: float = Field(default=5.0, gt=0)
+
     # Logging (fichier + stderr, rotation 10MB, 5 fichiers de rétention)
     log_level: str = Field(default="INFO")
     log_file: Path = Field(default=Path("logs/cineorg.log"))
@@ -70,6 +90,11 @@ class Settings(BaseSettings):
         """Vérifie si l'API TMDB est configurée."""
         return self.tmdb_api_key is not None
 
+    @property
+    def api_mirror_max_age_seconds(self) -> int:
+        """Âge maximal (secondes) d'une réponse du miroir servie en ligne."""
+        return self.api_mirror_max_age_days * 24 * 60 * 60
+
     @property
     def tvdb_enabled(self) -> bool:
         """Vérifie si l'API TVDB est configurée."""
@@ -8,6 +8,7 @@ Inclut les repositories SQLModel et les services de persistance.
 from dependency_injector import containers, providers
 
 from .adapters.api.cache import APICache
+from .adapters.api.mirror import MetadataMirror, MirrorTransport
 from .adapters.api.tmdb_client import TMDBClient
 from .adapters.api.tvdb_client import TVDBClient
 from .adapters.file_system import FileSystemAdapter
@@ -21,6 +22,8 @@ from .infrastructure.persistence.repositories import (
     SQLModelEpisodeRepository,
     SQLModelVideoFileRepository,
     SQLModelPendingValidationRepository,
+    SQLModelMovieLinkRepository,
+    SQLModelSymlinkIndexRepository,
 )
 from .infrastructure.persistence.hash_service import compute_file_hash
 from .services.enricher import EnricherService
@@ -31,6 +34,7 @@ from .services.repair import RepairService
 from .services.matcher import MatcherService
 from .services.scanner import ScannerService
 from .services.renamer import RenamerService
+from .services.directory_cache import DirectoryCache
 from .services.organizer import OrganizerService
 from .services.quality_scorer import QualityScorerService
 from .services.transferer import TransfererService
@@ -66,8 +70,15 @@ class Container(containers.DeclarativeContainer):
     # Session factory - nouvelle session a chaque appel
     session = providers.Factory(lambda: next(get_session()))
 
+    # Index inverse des symlinks (cible -> symlinks) - Singleton : une
+    # session par operation, partage par l'adaptateur filesystem
+    symlink_index_repository = providers.Singleton(SQLModelSymlinkIndexRepository)
+
     # Adapters - implementations concretes des ports
-    file_system = providers.Singleton(FileSystemAdapter)
+    file_system = providers.Singleton(
+        FileSystemAdapter,
+        symlink_index=symlink_index_repository,
+    )
     filename_parser = providers.Singleton(GuessitFilenameParser)
     media_info_extractor = providers.Singleton(MediaInfoExtractor)
 
@@ -101,10 +112,16 @@ class Container(containers.DeclarativeContainer):
         SQLModelPendingValidationRepository,
         session=session,
     )
+    movie_link_repository = providers.Factory(
+        SQLModelMovieLinkRepository,
+        session=session,
+    )
 
     # Services de renommage et organisation (stateless - Singletons)
     renamer_service = providers.Singleton(RenamerService)
-    organizer_service = providers.Singleton(OrganizerService)
+    # Cache des listings de repertoires partage organizer / transferer
+    directory_cache = providers.Singleton(DirectoryCache)
+    organizer_service = providers.Singleton(OrganizerService, cache=directory_cache)
     quality_scorer_service = providers.Singleton(QualityScorerService)
 
     # Service de transfert - Factory car depend des paths de configuration
@@ -114,6 +131,8 @@ class Container(containers.DeclarativeContainer):
         TransfererService,
         file_system=file_system,
         symlink_manager=file_system,  # FileSystemAdapter implemente les deux interfaces
+        dir_cache=directory_cache,
+        movie_links=movie_link_repository,
     )
 
     # Cache API - Singleton pour partage entre clients
@@ -122,6 +141,20 @@ class Container(containers.DeclarativeContainer):
         cache_dir=".cache/api",
     )
 
+    # Miroir local des reponses API (SQLite, sans expiration) - Singleton
+    # partage ; chaque client a son propre transport (ferme avec le client)
+    api_mirror = providers.Singleton(
+        MetadataMirror,
+        path=".cache/api-mirror.db",
+    )
+
+    api_transport = providers.Factory(
+        MirrorTransport,
+        mirror=api_mirror,
+        max_age=config.provided.api_mirror_max_age_seconds,
+        offline=config.provided.api_offline,
+    )
+
     # Clients API - Singleton avec api_key depuis config
     # Si api_key est None/vide, le client sera cree mais ValidationService
     # gere ce cas en verifiant client._api_key avant utilisation
@@ -129,12 +162,14 @@ class Container(containers.DeclarativeContainer):
         TMDBClient,
         api_key=config.provided.tmdb_api_key,
         cache=api_cache,
+        transport=api_transport,
     )
 
     tvdb_client = providers.Singleton(
         TVDBClient,
         api_key=config.provided.tvdb_api_key,
         cache=api_cache,
+        transport=api_transport,
     )
 
     # Service de scoring (stateless - Singleton)
@@ -177,6 +212,7 @@ class Container(containers.DeclarativeContainer):
         IntegrityChecker,
         file_system=file_system,
         video_file_repo=video_file_repository,
+        symlink_index=symlink_index_repository,
     )
 
     # Service de reparation - Factory
@@ -196,6 +232,8 @@ class Container(containers.DeclarativeContainer):
         movie_repo=movie_repository,
         series_repo=series_repository,
         episode_repo=episode_repository,
+        movie_link_repo=movie_link_repository,
+        symlink_index=symlink_index_repository,
     )
 
     # Service de workflow - Factory pour nouvelle instance a chaque execution
@@ -7,18 +7,28 @@ Elles encapsulent les règles métier et le comportement.
 Exports :
 - VideoFile : Représente un fichier vidéo avec ses métadonnées
 - PendingValidation : Un fichier vidéo en attente de validation utilisateur
+- MovieLink : Symlink d'un film indexé par titre et année
+- SymlinkTarget : Entrée de l'index inverse des symlinks (cible → symlinks)
 - Movie : Métadonnées d'un film depuis TMDB
 - Series : Métadonnées d'une série TV depuis TVDB
 - Episode : Épisode individuel d'une série
 """
 
-from src.core.entities.video import VideoFile, PendingValidation, ValidationStatus
+from src.core.entities.video import (
+    MovieLink,
+    PendingValidation,
+    SymlinkTarget,
+    ValidationStatus,
+    VideoFile,
+)
 from src.core.entities.media import Movie, Series, Episode
 
 __all__ = [
     "VideoFile",
     "PendingValidation",
     "ValidationStatus",
+    "MovieLink",
+    "SymlinkTarget",
     "Movie",
     "Series",
     "Episode",
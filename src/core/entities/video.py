@@ -53,6 +53,42 @@ class VideoFile:
     updated_at: Optional[datetime] = None
 
 
+@dataclass(frozen=True)
+class MovieLink:
+    """
+    Symlink d'un film dans video/Films, indexé par titre et année.
+
+    Attributs :
+        symlink_path : Chemin du symlink (video)
+        target_path : Chemin du fichier physique pointé (storage), si connu
+        title : Titre extrait du nom du symlink ("Titre (Année) ...")
+        year : Année extraite du nom du symlink
+    """
+
+    symlink_path: Path
+    target_path: Optional[Path]
+    title: str
+    year: int
+
+
+@dataclass(frozen=True)
+class SymlinkTarget:
+    """
+    Entrée de l'index inverse des symlinks (fichier physique → symlinks).
+
+    Attributs :
+        symlink_path : Chemin du symlink (video)
+        target_path : Cible lue par readlink, rendue absolue
+        target_device : Périphérique du fichier pointé (None si lien cassé)
+        target_inode : Inode du fichier pointé (None si lien cassé)
+    """
+
+    symlink_path: Path
+    target_path: Path
+    target_device: Optional[int] = None
+    target_inode: Optional[int] = None
+
+
 @dataclass
 class PendingValidation:
     """
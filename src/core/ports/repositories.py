@@ -10,7 +10,7 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Optional
 
-from src.core.entities.video import PendingValidation, VideoFile
+from src.core.entities.video import MovieLink, PendingValidation, SymlinkTarget, VideoFile
 from src.core.entities.media import Movie, Series, Episode
 
 
@@ -61,6 +61,17 @@ class IVideoFileRepository(ABC):
         """Met à jour le chemin du symlink. Retourne True si mis à jour."""
         ...
 
+    @abstractmethod
+    def relocate(self, old_path: Path, new_path: Path) -> int:
+        """
+        Reporte le déplacement d'un fichier ou d'un répertoire du storage.
+
+        Les chemins physiques égaux à old_path ou situés dessous (fichiers
+        vidéo, films, épisodes) sont réécrits sous new_path. Retourne le
+        nombre de lignes mises à jour.
+        """
+        ...
+
 
 class IMovieRepository(ABC):
     """
@@ -164,3 +175,94 @@ class IEpisodeRepository(ABC):
     def save(self, episode: Episode) -> Episode:
         """Sauvegarde un épisode (insertion ou mise à jour)."""
         ...
+
+
+class IMovieLinkRepository(ABC):
+    """
+    Interface de l'index des symlinks de films (titre, année → fichier).
+
+    Maintenu par les opérations qui créent, déplacent ou suppriment des
+    symlinks dans video/Films (transfert, link-movies, cleanup), il permet
+    de retrouver le fichier d'un film sans parcourir l'arborescence.
+    """
+
+    @abstractmethod
+    def record(self, symlink_path: Path, target_path: Optional[Path] = None) -> bool:
+        """Indexe un symlink. Retourne False si son nom n'est pas "Titre (Année)"."""
+        ...
+
+    @abstractmethod
+    def remove(self, symlink_path: Path) -> bool:
+        """Retire un symlink de l'index. Retourne True s'il était indexé."""
+        ...
+
+    @abstractmethod
+    def move(self, old_path: Path, new_path: Path) -> bool:
+        """Met à jour le chemin d'un symlink déplacé (cible conservée)."""
+        ...
+
+    @abstractmethod
+    def find(self, title: str, year: int) -> Optional[MovieLink]:
+        """Recherche le symlink d'un film par titre et année."""
+        ...
+
+
+class ISymlinkIndexRepository(ABC):
+    """
+    Interface de l'index inverse des symlinks de video/ (fichier → symlinks).
+
+    Tenu à jour par FileSystemAdapter (création et suppression de symlinks)
+    et vérifié par une réconciliation qui ne relit que les répertoires
+    modifiés (voir src.services.symlink_index).
+    """
+
+    @abstractmethod
+    def record(self, entry: SymlinkTarget) -> None:
+        """Indexe (ou met à jour) un symlink."""
+        ...
+
+    @abstractmethod
+    def remove(self, symlink_path: Path) -> bool:
+        """Retire un symlink de l'index. Retourne True s'il était indexé."""
+        ...
+
+    @abstractmethod
+    def links_to(
+        self,
+        target_path: Path,
+        device: Optional[int] = None,
+        inode: Optional[int] = None,
+    ) -> list[Path]:
+        """Symlinks pointant vers un fichier (par chemin ou par inode)."""
+        ...
+
+    @abstractmethod
+    def entries(self, root: Path) -> list[SymlinkTarget]:
+        """Symlinks indexés sous un répertoire."""
+        ...
+
+    @abstractmethod
+    def links_under(self, target_root: Path) -> list[SymlinkTarget]:
+        """Symlinks dont la cible est target_root ou un chemin sous ce répertoire."""
+        ...
+
+    @abstractmethod
+    def shared_targets(self, root: Path) -> dict[Path, list[Path]]:
+        """Fichiers (même inode) pointés par plusieurs symlinks sous un répertoire."""
+        ...
+
+    @abstractmethod
+    def directory_states(self, root: Path) -> dict[str, tuple[int, int]]:
+        """État des répertoires vus par la dernière réconciliation (mtime, date)."""
+        ...
+
+    @abstractmethod
+    def apply_scan(
+        self,
+        scanned: dict[str, tuple[int, list[SymlinkTarget]]],
+        removed_dirs: list[str],
+        scanned_at_ns: int,
+        rebuild_root: Optional[Path] = None,
+    ) -> None:
+        """Remplace les symlinks des répertoires relus et oublie les disparus."""
+        ...
@@ -5,6 +5,9 @@ Ce module fournit l'infrastructure de stockage utilisant SQLModel (SQLAlchemy).
 Il contient :
 
 - database.py : Configuration de l'engine SQLite, session factory, initialisation
+- migrations.py : Migrations versionnees du schema (colonnes, index)
+- library_stats.py : Compteurs materialises des tableaux de bord (triggers)
+- facets.py : Tables de facettes (genres, personnes, resolution) et listeners ORM
 - models.py : Modeles SQLModel representant les tables de la base de donnees
 - hash_service.py : Service de calcul de hash XXHash par echantillons
 - repositories/ : Implementations SQLModel des ports repository
@@ -31,6 +34,7 @@ from src.infrastructure.persistence.database import (
     get_session,
     init_db,
 )
+from src.infrastructure.persistence import facets  # noqa: F401 - listeners ORM
 from src.infrastructure.persistence.hash_service import compute_file_hash
 from src.infrastructure.persistence.models import (
     EpisodeModel,
@@ -46,6 +50,8 @@ from src.infrastructure.persistence.repositories import (
     SQLModelEpisodeRepository,
     SQLModelVideoFileRepository,
     SQLModelPendingValidationRepository,
+    SQLModelMovieLinkRepository,
+    SQLModelSymlinkIndexRepository,
 )
 
 __all__ = [
@@ -68,4 +74,6 @@ __all__ = [
     "SQLModelEpisodeRepository",
     "SQLModelVideoFileRepository",
     "SQLModelPendingValidationRepository",
+    "SQLModelMovieLinkRepository",
+    "SQLModelSymlinkIndexRepository",
 ]
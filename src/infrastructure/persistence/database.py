@@ -4,28 +4,152 @@ Configuration de la base de donnees SQLite pour CineOrg.
 Ce module fournit :
 - Engine SQLite avec configuration optimisee pour multi-thread
 - Session factory avec context manager
-- Fonction d'initialisation des tables
+- Fonction d'initialisation du schema (migrations versionnees)
 
 La base de donnees est configuree via CINEORG_DATABASE_URL (defaut: sqlite:///cineorg.db).
+Le profil de l'engine (PRAGMAs + pool) via CINEORG_DATABASE_PROFILE :
+- "tuned" (defaut) : WAL, busy_timeout, synchronous=NORMAL, cache et mmap
+  etendus, pool de connexions reutilisees entre threads
+- "legacy" : une connexion par session, PRAGMAs SQLite par defaut
 """
 
 from collections.abc import Generator
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-from sqlmodel import Session, SQLModel, create_engine
-from sqlalchemy import Engine
-from sqlalchemy.pool import NullPool
+from sqlmodel import Session, create_engine
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import NullPool, QueuePool, StaticPool
 
 # Engine global - initialise lors du premier appel a get_engine()
 _engine: Optional[Engine] = None
 
 
+@dataclass(frozen=True)
+class EngineProfile:
+    """
+    Profil de l'engine SQLite : PRAGMAs appliques a chaque connexion et pool.
+
+    Attributs:
+        journal_mode: Mode de journal (WAL : lectures concurrentes d'une ecriture).
+        synchronous: Niveau de fsync (NORMAL suffit en WAL).
+        busy_timeout_ms: Attente d'un verrou avant "database is locked".
+        cache_size_kib: Cache de pages par connexion (KiB).
+        mmap_size: Taille de la projection memoire du fichier (octets).
+        temp_store: Stockage des tables temporaires (MEMORY).
+        pool_size: Connexions conservees (0 = une connexion par session).
+        max_overflow: Connexions supplementaires temporaires (-1 = sans limite :
+            une session non fermee ne doit jamais bloquer les autres threads).
+        pool_timeout: Attente d'une connexion libre (secondes).
+    """
+
+    journal_mode: Optional[str] = "WAL"
+    synchronous: Optional[str] = "NORMAL"
+    busy_timeout_ms: Optional[int] = 5000
+    cache_size_kib: Optional[int] = 65536
+    mmap_size: Optional[int] = 268_435_456
+    temp_store: Optional[str] = "MEMORY"
+    pool_size: int = 8
+    max_overflow: int = -1
+    pool_timeout: float = 30.0
+
+    def pragmas(self) -> list[str]:
+        """Instructions PRAGMA a executer sur chaque nouvelle connexion."""
+        statements = []
+        if self.journal_mode:
+            statements.append(f"PRAGMA journal_mode={self.journal_mode}")
+        if self.synchronous:
+            statements.append(f"PRAGMA synchronous={self.synchronous}")
+        if self.busy_timeout_ms is not None:
+            statements.append(f"PRAGMA busy_timeout={self.busy_timeout_ms}")
+        if self.cache_size_kib is not None:
+            # Valeur negative = taille en KiB (et non en pages)
+            statements.append(f"PRAGMA cache_size=-{self.cache_size_kib}")
+        if self.mmap_size is not None:
+            statements.append(f"PRAGMA mmap_size={self.mmap_size}")
+        if self.temp_store:
+            statements.append(f"PRAGMA temp_store={self.temp_store}")
+        return statements
+
+
+ENGINE_PROFILES: dict[str, EngineProfile] = {
+    "tuned": EngineProfile(),
+    # Comportement historique : NullPool, aucun PRAGMA (reference de benchmark)
+    "legacy": EngineProfile(
+        journal_mode=None,
+        synchronous=None,
+        busy_timeout_ms=None,
+        cache_size_kib=None,
+        mmap_size=None,
+        temp_store=None,
+        pool_size=0,
+    ),
+}
+
+
+def create_sqlite_engine(db_url: str, profile: EngineProfile) -> Engine:
+    """
+    Cree un engine SQLite configure selon un profil.
+
+    Les PRAGMAs sont appliques a l'ouverture de chaque connexion physique
+    (les connexions du pool les conservent). Une base en memoire utilise
+    une connexion unique partagee, seule facon de conserver son contenu.
+
+    Args:
+        db_url: URL SQLAlchemy de la base.
+        profile: Profil de PRAGMAs et de pool.
+
+    Returns:
+        Engine SQLAlchemy.
+    """
+    in_memory = db_url in ("sqlite://", "sqlite:///:memory:")
+    pool_kwargs: dict = {}
+    if in_memory:
+        pool_kwargs["poolclass"] = StaticPool
+    elif profile.pool_size <= 0:
+        pool_kwargs["poolclass"] = NullPool
+    else:
+        pool_kwargs.update(
+            poolclass=QueuePool,
+            pool_size=profile.pool_size,
+            max_overflow=profile.max_overflow,
+            pool_timeout=profile.pool_timeout,
+        )
+
+    engine = create_engine(
+        db_url,
+        echo=False,
+        connect_args={"check_same_thread": False},
+        **pool_kwargs,
+    )
+
+    statements = profile.pragmas()
+    if in_memory:
+        # WAL et mmap n'ont pas de sens sans fichier
+        statements = [
+            s for s in statements
+            if not s.startswith(("PRAGMA journal_mode", "PRAGMA mmap_size"))
+        ]
+    if statements:
+        @event.listens_for(engine, "connect")
+        def _apply_pragmas(dbapi_connection, _connection_record) -> None:
+            cursor = dbapi_connection.cursor()
+            try:
+                for statement in statements:
+                    cursor.execute(statement)
+            finally:
+                cursor.close()
+
+    return engine
+
+
 def get_engine() -> Engine:
     """
     Retourne l'engine SQLite, en le creant si necessaire.
 
-    Utilise la configuration de l'application pour le chemin de la BDD.
+    Utilise la configuration de l'application pour le chemin de la BDD
+    et le profil de l'engine.
     """
     global _engine
     if _engine is None:
@@ -38,17 +162,11 @@ def get_engine() -> Engine:
             db_path = Path(db_url.replace("sqlite:///", ""))
             db_path.parent.mkdir(exist_ok=True, parents=True)
 
-        _engine = create_engine(
-            db_url,
-            echo=False,
-            connect_args={"check_same_thread": False},
-            poolclass=NullPool,
-        )
+        profile = ENGINE_PROFILES[settings.database_profile]
+        _engine = create_sqlite_engine(db_url, profile)
     return _engine
 
 
-
-
 def get_session() -> Generator[Session, None, None]:
     """
     Generateur de session SQLModel.
@@ -73,159 +191,17 @@ def get_session() -> Generator[Session, None, None]:
 
 def init_db() -> None:
     """
-    Initialise la base de donnees en creant toutes les tables.
+    Initialise la base de donnees : tables, colonnes et index.
 
     Cette fonction importe les modeles pour enregistrer leurs metadonnees
-    dans SQLModel.metadata, puis cree les tables correspondantes si elles
-    n'existent pas deja.
+    dans SQLModel.metadata, puis applique les migrations versionnees
+    (voir migrations.py). Si le schema est a jour, seule sa version est lue.
 
     Doit etre appelee une fois au demarrage de l'application.
     """
     # Import des modeles pour enregistrer leurs metadonnees
     # L'import est fait ici pour eviter les imports circulaires
     from src.infrastructure.persistence import models  # noqa: F401
+    from src.infrastructure.persistence.migrations import run_migrations
 
-    # Creation des tables
-    SQLModel.metadata.create_all(get_engine())
-
-    # Migrations automatiques
-    _run_migrations()
-
-
-def _run_migrations() -> None:
-    """
-    Execute les migrations de schema necessaires.
-
-    Verifie et ajoute les colonnes manquantes dans les tables existantes.
-    SQLModel.metadata.create_all() ne modifie pas les tables existantes,
-    donc cette fonction est necessaire pour les mises a jour de schema.
-    """
-    from sqlalchemy import text
-
-    engine = get_engine()
-
-    with engine.connect() as conn:
-        # Migration 1: Ajouter symlink_path a video_files si manquante
-        result = conn.execute(text("PRAGMA table_info(video_files)"))
-        columns = [row[1] for row in result.fetchall()]
-
-        if "symlink_path" not in columns:
-            conn.execute(
-                text("ALTER TABLE video_files ADD COLUMN symlink_path VARCHAR")
-            )
-            conn.commit()
-
-        # Migration 2: Ajouter vote_average et vote_count a movies si manquantes
-        result = conn.execute(text("PRAGMA table_info(movies)"))
-        movie_columns = [row[1] for row in result.fetchall()]
-
-        if "vote_average" not in movie_columns:
-            conn.execute(
-                text("ALTER TABLE movies ADD COLUMN vote_average REAL")
-            )
-            conn.commit()
-
-        if "vote_count" not in movie_columns:
-            conn.execute(
-                text("ALTER TABLE movies ADD COLUMN vote_count INTEGER")
-            )
-            conn.commit()
-
-        # Migration 3: Ajouter vote_average et vote_count a series si manquantes
-        result = conn.execute(text("PRAGMA table_info(series)"))
-        series_columns = [row[1] for row in result.fetchall()]
-
-        if "vote_average" not in series_columns:
-            conn.execute(
-                text("ALTER TABLE series ADD COLUMN vote_average REAL")
-            )
-            conn.commit()
-
-        if "vote_count" not in series_columns:
-            conn.execute(
-                text("ALTER TABLE series ADD COLUMN vote_count INTEGER")
-            )
-            conn.commit()
-
-        # Migration 4: Ajouter imdb_rating et imdb_votes a movies si manquantes
-        result = conn.execute(text("PRAGMA table_info(movies)"))
-        movie_columns = [row[1] for row in result.fetchall()]
-
-        if "imdb_rating" not in movie_columns:
-            conn.execute(
-                text("ALTER TABLE movies ADD COLUMN imdb_rating REAL")
-            )
-            conn.commit()
-
-        if "imdb_votes" not in movie_columns:
-            conn.execute(
-                text("ALTER TABLE movies ADD COLUMN imdb_votes INTEGER")
-            )
-            conn.commit()
-
-        # Migration 5: Ajouter imdb_rating et imdb_votes a series si manquantes
-        result = conn.execute(text("PRAGMA table_info(series)"))
-        series_columns = [row[1] for row in result.fetchall()]
-
-        if "imdb_rating" not in series_columns:
-            conn.execute(
-                text("ALTER TABLE series ADD COLUMN imdb_rating REAL")
-            )
-            conn.commit()
-
-        if "imdb_votes" not in series_columns:
-            conn.execute(
-                text("ALTER TABLE series ADD COLUMN imdb_votes INTEGER")
-            )
-            conn.commit()
-
-        # Migration 6: Ajouter tmdb_id a series si manquante
-        result = conn.execute(text("PRAGMA table_info(series)"))
-        series_columns = [row[1] for row in result.fetchall()]
-
-        if "tmdb_id" not in series_columns:
-            conn.execute(
-                text("ALTER TABLE series ADD COLUMN tmdb_id INTEGER")
-            )
-            conn.execute(
-                text("CREATE INDEX IF NOT EXISTS ix_series_tmdb_id ON series(tmdb_id)")
-            )
-            conn.commit()
-
-        # Migration 7: Ajouter watched et personal_rating a movies si manquantes
-        result = conn.execute(text("PRAGMA table_info(movies)"))
-        movie_columns = [row[1] for row in result.fetchall()]
-
-        if "watched" not in movie_columns:
-            conn.execute(
-                text("ALTER TABLE movies ADD COLUMN watched BOOLEAN DEFAULT 0")
-            )
-            conn.execute(
-                text("CREATE INDEX IF NOT EXISTS ix_movies_watched ON movies(watched)")
-            )
-            conn.commit()
-
-        if "personal_rating" not in movie_columns:
-            conn.execute(
-                text("ALTER TABLE movies ADD COLUMN personal_rating INTEGER")
-            )
-            conn.commit()
-
-        # Migration 8: Ajouter watched et personal_rating a series si manquantes
-        result = conn.execute(text("PRAGMA table_info(series)"))
-        series_columns = [row[1] for row in result.fetchall()]
-
-        if "watched" not in series_columns:
-            conn.execute(
-                text("ALTER TABLE series ADD COLUMN watched BOOLEAN DEFAULT 0")
-            )
-            conn.execute(
-                text("CREATE INDEX IF NOT EXISTS ix_series_watched ON series(watched)")
-            )
-            conn.commit()
-
-        if "personal_rating" not in series_columns:
-            conn.execute(
-                text("ALTER TABLE series ADD COLUMN personal_rating INTEGER")
-            )
-            conn.commit()
+    run_migrations(get_engine())
@@ -0,0 +1,219 @@
+"""
+Tables de facettes de la bibliotheque (genres, personnes, resolution).
+
+Les filtres de navigation portaient sur des colonnes texte (genres_json,
+cast_json, director) via LIKE, et la resolution etait convertie en libelle
+cote Python : aucun index utilisable. Ce module maintient des donnees
+normalisees, indexees :
+- movie_genre / series_genre : un genre par ligne
+- person / credit : personnes et participations (realisateur, acteur)
+- movies.resolution_label : libelle stocke ("4K", "1080p", "720p", "SD")
+
+Les listeners ORM synchronisent ces donnees a chaque insertion, mise a jour
+ou suppression d'un MovieModel/SeriesModel (repositories comme ecritures
+directes via la session). rebuild_facets() recalcule tout (migration,
+commande rebuild-facets).
+"""
+
+import json
+from typing import Optional
+
+from sqlalchemy import Connection, delete, event, insert, inspect, select, text
+
+from src.core.value_objects.media_info import Resolution
+from src.infrastructure.persistence.models import (
+    CreditModel,
+    MovieGenreModel,
+    MovieModel,
+    PersonModel,
+    SeriesGenreModel,
+    SeriesModel,
+)
+
+# Colonnes sources des facettes : une modification declenche la resynchro
+_FACET_FIELDS = ("genres_json", "director", "cast_json")
+
+_GENRE_TABLES = {
+    "movie": (MovieGenreModel.__table__, "movie_id"),
+    "series": (SeriesGenreModel.__table__, "series_id"),
+}
+
+
+def resolution_label(resolution: Optional[str]) -> str:
+    """Convertit '1920x1080' en '1080p' via Resolution.label."""
+    if not resolution or "x" not in resolution:
+        return resolution or ""
+    try:
+        w, h = resolution.split("x")
+        return Resolution(width=int(w), height=int(h)).label
+    except (ValueError, TypeError):
+        return resolution
+
+
+def _json_list(value: Optional[str]) -> list[str]:
+    """Liste de chaines depuis une colonne JSON (vide si invalide)."""
+    if not value:
+        return []
+    try:
+        items = json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return []
+    return [str(item) for item in items if item] if isinstance(items, list) else []
+
+
+def _credits(director: Optional[str], cast_json: Optional[str]) -> set[tuple[str, str]]:
+    """
+    Participations (nom, role) d'une oeuvre.
+
+    Le champ director est conserve tel quel (createurs de series "A, B"),
+    comme le lien de la fiche detail qui le transmet entier au filtre.
+    """
+    credits = {(name, "actor") for name in _json_list(cast_json)}
+    if director:
+        credits.add((director, "director"))
+    return credits
+
+
+def _person_ids(conn: Connection, names: set[str]) -> dict[str, int]:
+    """Identifiants des personnes, crees si necessaire."""
+    if not names:
+        return {}
+    for name in names:
+        conn.execute(
+            text("INSERT OR IGNORE INTO person (name) VALUES (:name)"), {"name": name}
+        )
+    person = PersonModel.__table__
+    rows = conn.execute(
+        select(person.c.name, person.c.id).where(person.c.name.in_(names))
+    ).all()
+    return dict(rows)
+
+
+def clear_facets(conn: Connection, entity_type: str, entity_id: int) -> None:
+    """Supprime les genres et participations d'une oeuvre."""
+    genre_table, id_column = _GENRE_TABLES[entity_type]
+    conn.execute(delete(genre_table).where(genre_table.c[id_column] == entity_id))
+    credit = CreditModel.__table__
+    conn.execute(
+        delete(credit).where(
+            credit.c.entity_type == entity_type, credit.c.entity_id == entity_id
+        )
+    )
+
+
+def sync_facets(
+    conn: Connection,
+    entity_type: str,
+    entity_id: int,
+    genres_json: Optional[str],
+    director: Optional[str],
+    cast_json: Optional[str],
+) -> None:
+    """
+    Remplace les genres et participations d'une oeuvre.
+
+    Args:
+        conn: Connexion (celle du flush ORM ou d'une migration).
+        entity_type: "movie" ou "series".
+        entity_id: Identifiant du film ou de la serie.
+        genres_json, director, cast_json: Colonnes sources.
+    """
+    clear_facets(conn, entity_type, entity_id)
+
+    genres = set(_json_list(genres_json))
+    if genres:
+        genre_table, id_column = _GENRE_TABLES[entity_type]
+        conn.execute(
+            insert(genre_table),
+            [{id_column: entity_id, "genre": genre} for genre in genres],
+        )
+
+    credits = _credits(director, cast_json)
+    if credits:
+        ids = _person_ids(conn, {name for name, _ in credits})
+        conn.execute(
+            insert(CreditModel.__table__),
+            [
+                {
+                    "person_id": ids[name],
+                    "entity_type": entity_type,
+                    "entity_id": entity_id,
+                    "role": role,
+                }
+                for name, role in credits
+            ],
+        )
+
+
+def rebuild_facets(conn: Connection) -> int:
+    """
+    Recalcule toutes les facettes depuis movies et series.
+
+    Returns:
+        Nombre d'oeuvres traitees.
+    """
+    for table in (CreditModel, PersonModel, MovieGenreModel, SeriesGenreModel):
+        conn.execute(delete(table.__table__))
+
+    movies = MovieModel.__table__
+    for movie_id, resolution in conn.execute(
+        select(movies.c.id, movies.c.resolution).where(movies.c.resolution.is_not(None))
+    ).all():
+        conn.execute(
+            movies.update()
+            .where(movies.c.id == movie_id)
+            .values(resolution_label=resolution_label(resolution) or None)
+        )
+
+    count = 0
+    for entity_type, model in (("movie", MovieModel), ("series", SeriesModel)):
+        table = model.__table__
+        rows = conn.execute(
+            select(table.c.id, table.c.genres_json, table.c.director, table.c.cast_json)
+        ).all()
+        for row in rows:
+            sync_facets(conn, entity_type, *row)
+        count += len(rows)
+    return count
+
+
+# --- Listeners ORM ---
+
+
+def _facets_changed(target) -> bool:
+    """Indique si une colonne source des facettes a ete modifiee."""
+    attrs = inspect(target).attrs
+    return any(attrs[name].history.has_changes() for name in _FACET_FIELDS)
+
+
+@event.listens_for(MovieModel, "before_insert")
+@event.listens_for(MovieModel, "before_update")
+def _set_resolution_label(_mapper, _connection, target: MovieModel) -> None:
+    target.resolution_label = resolution_label(target.resolution) or None
+
+
+def _register(model, entity_type: str) -> None:
+    """Branche la synchronisation des facettes sur un modele."""
+
+    @event.listens_for(model, "after_insert")
+    def _after_insert(_mapper, connection, target) -> None:
+        sync_facets(
+            connection, entity_type, target.id,
+            target.genres_json, target.director, target.cast_json,
+        )
+
+    @event.listens_for(model, "after_update")
+    def _after_update(_mapper, connection, target) -> None:
+        if _facets_changed(target):
+            sync_facets(
+                connection, entity_type, target.id,
+                target.genres_json, target.director, target.cast_json,
+            )
+
+    @event.listens_for(model, "after_delete")
+    def _after_delete(_mapper, connection, target) -> None:
+        clear_facets(connection, entity_type, target.id)
+
+
+_register(MovieModel, "movie")
+_register(SeriesModel, "series")
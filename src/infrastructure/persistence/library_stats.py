@@ -0,0 +1,237 @@
+"""
+Statistiques materialisees de la videotheque.
+
+Les tableaux de bord (accueil, qualite) affichent des compteurs : nombre de
+films/series/episodes, validations en attente, couverture des metadonnees.
+Plutot que de recompter les tables a chaque affichage, ces compteurs sont
+stockes dans library_stats et maintenus par des triggers SQLite : chaque
+insertion, mise a jour ou suppression d'une ligne ajuste les compteurs
+concernes dans la meme transaction. Les repositories, les imports en masse
+et les routes web qui ecrivent directement via la session sont tous couverts.
+
+La lecture coute une requete, quelle que soit la taille de la videotheque.
+
+La meme table porte le compteur de generation de la videotheque
+(library.generation), incremente par trigger a chaque ecriture sur les
+donnees affichees par l'interface web. Les pages mises en cache cote
+serveur (et leurs ETag) sont valides tant que la generation ne change pas.
+Basculer "vu" ou la note personnelle ne l'incremente pas : ces ecritures
+passent par le web, qui invalide lui-meme les seules entrees concernees.
+"""
+
+from typing import NamedTuple, Optional
+
+from sqlalchemy import Connection, text
+from sqlmodel import Session, select
+
+from src.infrastructure.persistence.models import LibraryStatModel
+
+
+class StatCounter(NamedTuple):
+    """
+    Definition d'un compteur.
+
+    Attributs:
+        name: Nom du compteur (cle library_stats = "<table>.<name>").
+        column: Colonne testee (None = compte toutes les lignes).
+        condition: Condition SQL sur la colonne ({col} = colonne qualifiee).
+    """
+
+    name: str
+    column: Optional[str]
+    condition: str
+
+
+_FILLED = "{col} IS NOT NULL AND {col} != ''"
+_POSITIVE = "{col} > 0"
+
+
+def _total() -> StatCounter:
+    return StatCounter("total", None, "1")
+
+
+def _filled(column: str) -> StatCounter:
+    return StatCounter(column, column, _FILLED)
+
+
+def _positive(column: str) -> StatCounter:
+    return StatCounter(column, column, _POSITIVE)
+
+
+STAT_COUNTERS: dict[str, list[StatCounter]] = {
+    "movies": [
+        _total(),
+        _filled("poster_path"),
+        _filled("imdb_id"),
+        _filled("director"),
+        _filled("cast_json"),
+        _filled("file_path"),
+        _filled("resolution"),
+        _filled("overview"),
+        _positive("vote_average"),
+        _positive("imdb_rating"),
+    ],
+    "series": [
+        _total(),
+        _filled("poster_path"),
+        _filled("tmdb_id"),
+        _filled("tvdb_id"),
+        _filled("overview"),
+        _filled("director"),
+        _filled("cast_json"),
+    ],
+    "episodes": [
+        _total(),
+        _filled("file_path"),
+        _filled("resolution"),
+    ],
+    "pending_validations": [
+        _total(),
+        StatCounter("pending", "validation_status", "{col} = 'pending'"),
+    ],
+}
+
+
+GENERATION_KEY = "library.generation"
+
+# Tables dont le contenu est affiche par les pages mises en cache
+GENERATION_TABLES = (
+    "movies",
+    "series",
+    "episodes",
+    "video_files",
+    "movie_links",
+    "confirmed_associations",
+)
+
+# Colonnes modifiees depuis le web, invalidees entree par entree
+_PERSONAL_COLUMNS = frozenset({"watched", "personal_rating"})
+
+
+def _key(table: str, counter: StatCounter) -> str:
+    return f"{table}.{counter.name}"
+
+
+def _predicate(counter: StatCounter, row: str) -> str:
+    """Expression 0/1 du compteur pour une ligne (NEW, OLD ou la table)."""
+    col = f"{row}.{counter.column}" if counter.column else ""
+    return f"COALESCE(({counter.condition.format(col=col)}), 0)"
+
+
+def _delta_case(table: str, counters: list[StatCounter], row: str) -> str:
+    """CASE donnant la contribution d'une ligne a chaque compteur."""
+    branches = " ".join(
+        f"WHEN '{_key(table, c)}' THEN {_predicate(c, row)}" for c in counters
+    )
+    return f"CASE key {branches} ELSE 0 END"
+
+
+def install_stats_triggers(conn: Connection) -> None:
+    """
+    (Re)cree les triggers de maintenance des compteurs.
+
+    Un trigger par table et par operation ; la mise a jour ne se declenche
+    que si une colonne comptee change (basculer "vu" ne coute rien).
+    """
+    for table, counters in STAT_COUNTERS.items():
+        keys = ", ".join(f"'{_key(table, c)}'" for c in counters)
+        columns = ", ".join(sorted({c.column for c in counters if c.column}))
+        bodies = {
+            "insert": ("INSERT", f"value + {_delta_case(table, counters, 'NEW')}"),
+            "delete": ("DELETE", f"value - {_delta_case(table, counters, 'OLD')}"),
+            "update": (
+                f"UPDATE OF {columns}",
+                f"value + {_delta_case(table, counters, 'NEW')}"
+                f" - {_delta_case(table, counters, 'OLD')}",
+            ),
+        }
+        for suffix, (event, expression) in bodies.items():
+            name = f"trg_library_stats_{table}_{suffix}"
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+            conn.execute(
+                text(
+                    f"CREATE TRIGGER {name} AFTER {event} ON {table} "
+                    f"BEGIN UPDATE library_stats SET value = {expression} "
+                    f"WHERE key IN ({keys}); END"
+                )
+            )
+
+
+def install_generation_triggers(conn: Connection) -> None:
+    """
+    (Re)cree les triggers du compteur de generation.
+
+    La mise a jour ne se declenche que si une colonne autre que "vu" ou la
+    note personnelle change. Les colonnes sont lues dans la base : une
+    colonne ajoutee par une migration ulterieure impose de rappeler cette
+    fonction.
+    """
+    conn.execute(
+        text("INSERT OR IGNORE INTO library_stats (key, value) VALUES (:key, 0)"),
+        {"key": GENERATION_KEY},
+    )
+    bump = f"UPDATE library_stats SET value = value + 1 WHERE key = '{GENERATION_KEY}'"
+    for table in GENERATION_TABLES:
+        columns = sorted(
+            row[1]
+            for row in conn.execute(text(f"PRAGMA table_info({table})"))
+            if row[1] not in _PERSONAL_COLUMNS
+        )
+        events = {
+            "insert": "INSERT",
+            "delete": "DELETE",
+            "update": f"UPDATE OF {', '.join(columns)}",
+        }
+        for suffix, event in events.items():
+            name = f"trg_library_generation_{table}_{suffix}"
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+            conn.execute(
+                text(f"CREATE TRIGGER {name} AFTER {event} ON {table} BEGIN {bump}; END")
+            )
+
+
+def rebuild_library_stats(conn: Connection) -> None:
+    """
+    Recalcule tous les compteurs depuis les tables (une requete par table).
+
+    Utilise a l'installation des triggers (migration) ; en fonctionnement
+    normal les triggers tiennent les compteurs a jour.
+    """
+    for table, counters in STAT_COUNTERS.items():
+        sums = ", ".join(f"SUM({_predicate(c, table)})" for c in counters)
+        row = conn.execute(text(f"SELECT {sums} FROM {table}")).one()
+        for counter, value in zip(counters, row):
+            conn.execute(
+                text(
+                    "INSERT OR REPLACE INTO library_stats (key, value) "
+                    "VALUES (:key, :value)"
+                ),
+                {"key": _key(table, counter), "value": value or 0},
+            )
+
+
+def read_library_stats(session: Session) -> dict[str, int]:
+    """
+    Lit tous les compteurs en une requete.
+
+    Returns:
+        Dictionnaire cle -> valeur (ex: {"movies.total": 1200, ...}).
+        Les compteurs absents valent 0.
+    """
+    stats = {
+        _key(table, c): 0 for table, counters in STAT_COUNTERS.items() for c in counters
+    }
+    for stat in session.exec(select(LibraryStatModel)).all():
+        stats[stat.key] = stat.value
+    return stats
+
+
+def read_library_generation(session: Session) -> int:
+    """
+    Lit le compteur de generation (une requete sur la cle primaire).
+
+    Returns:
+        La generation courante (0 si les triggers ne sont pas installes).
+    """
+    stat = session.get(LibraryStatModel, GENERATION_KEY)
+    return stat.value if stat else 0
@@ -0,0 +1,296 @@
+"""
+Migrations versionnees du schema SQLite.
+
+La version du schema est stockee dans la table schema_version (une ligne).
+Au demarrage, init_db() lit cette version : si elle est a jour, aucune
+introspection n'est faite. Sinon les etapes manquantes sont appliquees dans
+l'ordre, chacune dans sa transaction, puis la version est enregistree.
+
+Chaque etape est idempotente : une base anterieure au versionnement
+(version 0, colonnes deja ajoutees par l'ancien code) peut rejouer toutes
+les etapes sans erreur.
+
+Ajouter une colonne, une table ou un index aux modeles impose d'ajouter une
+etape a MIGRATIONS (create_all n'est execute que lors d'une migration).
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from loguru import logger
+from sqlalchemy import Connection, Engine, text
+from sqlmodel import SQLModel
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    Etape de migration du schema.
+
+    Attributs:
+        version: Version atteinte apres l'etape (croissante, sans trou).
+        description: Resume lisible de l'etape.
+        apply: Fonction appliquant l'etape sur une connexion (idempotente).
+    """
+
+    version: int
+    description: str
+    apply: Callable[[Connection], None]
+
+
+def _table_columns(conn: Connection, table: str) -> set[str]:
+    """Retourne les noms de colonnes d'une table."""
+    return {row[1] for row in conn.execute(text(f"PRAGMA table_info({table})"))}
+
+
+def _add_missing_columns(conn: Connection, table: str, columns: dict[str, str]) -> None:
+    """
+    Ajoute les colonnes absentes d'une table (une seule introspection).
+
+    Args:
+        conn: Connexion ouverte.
+        table: Nom de la table.
+        columns: Nom de colonne -> type SQL (avec DEFAULT eventuel).
+    """
+    existing = _table_columns(conn, table)
+    for name, ddl in columns.items():
+        if name not in existing:
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}"))
+
+
+def _legacy_columns(conn: Connection) -> None:
+    """Colonnes ajoutees avant le versionnement du schema."""
+    _add_missing_columns(conn, "video_files", {"symlink_path": "VARCHAR"})
+    _add_missing_columns(
+        conn,
+        "movies",
+        {
+            "vote_average": "REAL",
+            "vote_count": "INTEGER",
+            "imdb_rating": "REAL",
+            "imdb_votes": "INTEGER",
+            "watched": "BOOLEAN DEFAULT 0",
+            "personal_rating": "INTEGER",
+        },
+    )
+    _add_missing_columns(
+        conn,
+        "series",
+        {
+            "vote_average": "REAL",
+            "vote_count": "INTEGER",
+            "imdb_rating": "REAL",
+            "imdb_votes": "INTEGER",
+            "tmdb_id": "INTEGER",
+            "watched": "BOOLEAN DEFAULT 0",
+            "personal_rating": "INTEGER",
+        },
+    )
+
+
+def _declared_indexes(conn: Connection) -> None:
+    """
+    Cree les index declares par les modeles et absents de la base.
+
+    create_all ne touche pas aux tables existantes : les index ajoutes aux
+    modeles apres coup (tri par annee/note, statut des validations,
+    episodes par saison) doivent etre crees explicitement.
+    """
+    for table in SQLModel.metadata.sorted_tables:
+        columns = _table_columns(conn, table.name)
+        for index in table.indexes:
+            # Colonne ajoutee par une etape ulterieure : index cree par elle
+            if all(column.name in columns for column in index.columns):
+                index.create(conn, checkfirst=True)
+
+
+def _library_stats(conn: Connection) -> None:
+    """Triggers des compteurs materialises et calcul initial."""
+    from src.infrastructure.persistence.library_stats import (
+        install_stats_triggers,
+        rebuild_library_stats,
+    )
+
+    install_stats_triggers(conn)
+    rebuild_library_stats(conn)
+
+
+def _facets(conn: Connection) -> None:
+    """Colonne resolution_label, index des facettes et calcul initial."""
+    from src.infrastructure.persistence.facets import rebuild_facets
+
+    _add_missing_columns(conn, "movies", {"resolution_label": "VARCHAR"})
+    _declared_indexes(conn)
+    rebuild_facets(conn)
+
+
+def _library_generation(conn: Connection) -> None:
+    """Compteur de generation de la videotheque (cache des pages web)."""
+    from src.infrastructure.persistence.library_stats import (
+        install_generation_triggers,
+    )
+
+    install_generation_triggers(conn)
+
+
+def _movie_links(conn: Connection) -> None:
+    """
+    Table movie_links et remplissage initial depuis video/Films.
+
+    Sans ce remplissage, les films sans file_path d'une videotheque
+    existante perdraient leur fichier (fiche detail, lecture) jusqu'au
+    prochain link-movies. Un parcours os.scandir, sans resolution des
+    symlinks (readlink seulement).
+    """
+    import os
+
+    from src.config import Settings
+    from src.infrastructure.persistence.repositories.movie_link_repository import (
+        normalize_link_title,
+        parse_link_name,
+    )
+
+    _declared_indexes(conn)
+    try:
+        films_dir = str(Settings().video_dir / "Films")
+    except Exception:
+        return
+
+    rows = []
+    stack = [films_dir]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_symlink():
+                            parsed = parse_link_name(entry.name)
+                            if parsed is None:
+                                continue
+                            target = os.path.normpath(
+                                os.path.join(current, os.readlink(entry.path))
+                            )
+                            title, year = parsed
+                            rows.append({
+                                "symlink_path": entry.path,
+                                "target_path": target,
+                                "title": title,
+                                "normalized_title": normalize_link_title(title),
+                                "year": year,
+                            })
+                        elif entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+    if rows:
+        conn.execute(
+            text(
+                "INSERT OR IGNORE INTO movie_links "
+                "(symlink_path, target_path, title, normalized_title, year) "
+                "VALUES (:symlink_path, :target_path, :title, :normalized_title, :year)"
+            ),
+            rows,
+        )
+        logger.info(f"Index des symlinks de films: {len(rows)} symlink(s) indexe(s)")
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(1, "Colonnes anterieures au versionnement", _legacy_columns),
+    Migration(2, "Index des requetes frequentes", _declared_indexes),
+    Migration(3, "Statistiques materialisees de la videotheque", _library_stats),
+    Migration(4, "Tables de facettes (genres, personnes, resolution)", _facets),
+    Migration(5, "Index des symlinks de films (movie_links)", _movie_links),
+    Migration(6, "Taches de fond de l'interface web (jobs)", _declared_indexes),
+    Migration(7, "Compteur de generation de la videotheque", _library_generation),
+    Migration(8, "Cache du scan des associations suspectes", _declared_indexes),
+    Migration(9, "Index inverse des symlinks (symlink_targets)", _declared_indexes),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def get_schema_version(conn: Connection) -> int:
+    """
+    Retourne la version du schema (0 si la base n'est pas versionnee).
+
+    Une seule requete : la table schema_version est creee si absente.
+    """
+    conn.execute(
+        text("CREATE TABLE IF NOT EXISTS schema_version (version INTEGER NOT NULL)")
+    )
+    version = conn.execute(text("SELECT MAX(version) FROM schema_version")).scalar()
+    return version or 0
+
+
+def _set_schema_version(conn: Connection, version: int) -> None:
+    """Enregistre la version atteinte."""
+    conn.execute(text("DELETE FROM schema_version"))
+    conn.execute(
+        text("INSERT INTO schema_version (version) VALUES (:version)"),
+        {"version": version},
+    )
+
+
+def missing_indexes(conn: Connection) -> list[str]:
+    """
+    Liste les index declares par les modeles absents de la base.
+
+    Returns:
+        Noms des index manquants (liste vide si le schema est complet).
+    """
+    existing = {
+        row[0]
+        for row in conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'index'")
+        )
+    }
+    return sorted(
+        index.name
+        for table in SQLModel.metadata.sorted_tables
+        for index in table.indexes
+        if index.name not in existing
+    )
+
+
+def run_migrations(engine: Engine) -> int:
+    """
+    Met le schema a jour jusqu'a LATEST_VERSION.
+
+    Si la base est a jour, seule la version est lue. Sinon les tables
+    manquantes sont creees, les etapes en retard appliquees (une
+    transaction par etape) et les index verifies.
+
+    Args:
+        engine: Engine de la base a migrer.
+
+    Returns:
+        Nombre d'etapes appliquees.
+
+    Raises:
+        RuntimeError: Si des index declares restent absents apres migration.
+    """
+    with engine.begin() as conn:
+        current = get_schema_version(conn)
+    if current >= LATEST_VERSION:
+        return 0
+
+    SQLModel.metadata.create_all(engine)
+
+    pending = [m for m in MIGRATIONS if m.version > current]
+    for migration in pending:
+        with engine.begin() as conn:
+            migration.apply(conn)
+            _set_schema_version(conn, migration.version)
+        logger.info(
+            f"Migration du schema v{migration.version} : {migration.description}"
+        )
+
+    with engine.connect() as conn:
+        missing = missing_indexes(conn)
+    if missing:
+        raise RuntimeError(f"Index manquants apres migration : {', '.join(missing)}")
+    return len(pending)
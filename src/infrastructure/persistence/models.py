@@ -41,7 +41,7 @@ class MovieModel(SQLModel, table=True):
     imdb_id: str | None = Field(default=None, index=True)
     title: str = Field(index=True)
     original_title: str | None = None
-    year: int | None = None
+    year: int | None = Field(default=None, index=True)
     genres_json: str | None = None  # JSON: ["Action", "Science-Fiction"]
     duration_seconds: int | None = None
     overview: str | None = None
@@ -51,9 +51,10 @@ class MovieModel(SQLModel, table=True):
     codec_video: str | None = None
     codec_audio: str | None = None
     resolution: str | None = None  # ex: "1920x1080"
+    resolution_label: str | None = Field(default=None, index=True)  # ex: "1080p" (calcule)
     languages_json: str | None = None  # JSON: ["fr", "en"]
     file_size_bytes: int | None = None
-    vote_average: float | None = None  # Note moyenne TMDB (0-10)
+    vote_average: float | None = Field(default=None, index=True)  # Note moyenne TMDB (0-10)
     vote_count: int | None = None  # Nombre de votes sur TMDB
     imdb_rating: float | None = None  # Note moyenne IMDb (0-10)
     imdb_votes: int | None = None  # Nombre de votes sur IMDb
@@ -116,11 +117,11 @@ class SeriesModel(SQLModel, table=True):
     imdb_id: str | None = Field(default=None, index=True)
     title: str = Field(index=True)
     original_title: str | None = None
-    year: int | None = None
+    year: int | None = Field(default=None, index=True)
     genres_json: str | None = None
     overview: str | None = None
     poster_path: str | None = None
-    vote_average: float | None = None  # Note moyenne (0-10)
+    vote_average: float | None = Field(default=None, index=True)  # Note moyenne (0-10)
     vote_count: int | None = None  # Nombre de votes
     imdb_rating: float | None = None  # Note moyenne IMDb (0-10)
     imdb_votes: int | None = None  # Nombre de votes sur IMDb
@@ -246,6 +247,9 @@ class PendingValidationModel(SQLModel, table=True):
     """
 
     __tablename__ = "pending_validations"
+    __table_args__ = (
+        Index("ix_pending_validations_status_auto", "validation_status", "auto_validated"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     video_file_id: int = Field(foreign_key="video_files.id", index=True)
@@ -328,3 +332,176 @@ class ConfirmedAssociationModel(SQLModel, table=True):
     entity_type: str  # "movie" | "series"
     entity_id: int = Field(index=True)
     confirmed_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class AssociationCheckModel(SQLModel, table=True):
+    """
+    Dernier resultat du scan des associations suspectes, par entite.
+
+    L'empreinte couvre tout ce que les heuristiques evaluent (fichier et
+    sa date de modification, ID TMDB, titre, annee, duree) : un scan ne
+    reevalue que les entites dont l'empreinte a change.
+    """
+
+    __tablename__ = "association_checks"
+    __table_args__ = (
+        Index("ix_association_checks_entity", "entity_type", "entity_id", unique=True),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    entity_type: str  # "movie" | "series"
+    entity_id: int
+    fingerprint: str
+    result_json: str | None = None  # SuspiciousAssociation, None = aucune anomalie
+    checked_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class LibraryStatModel(SQLModel, table=True):
+    """
+    Compteurs materialises de la videotheque (tableaux de bord).
+
+    Maintenus par des triggers SQLite (voir library_stats.py) : chaque
+    ecriture sur movies/series/episodes/pending_validations ajuste les
+    compteurs concernes, quelle que soit la voie d'ecriture. La cle
+    "library.generation" compte les ecritures (cache des pages web).
+    """
+
+    __tablename__ = "library_stats"
+
+    key: str = Field(primary_key=True)  # ex: "movies.total", "movies.poster_path"
+    value: int = 0
+
+
+class MovieGenreModel(SQLModel, table=True):
+    """
+    Genre d'un film (table de facettes, derivee de movies.genres_json).
+
+    Maintenue a chaque ecriture ORM d'un film (voir facets.py).
+    """
+
+    __tablename__ = "movie_genre"
+
+    movie_id: int = Field(foreign_key="movies.id", primary_key=True)
+    genre: str = Field(primary_key=True, index=True)
+
+
+class SeriesGenreModel(SQLModel, table=True):
+    """
+    Genre d'une serie (table de facettes, derivee de series.genres_json).
+    """
+
+    __tablename__ = "series_genre"
+
+    series_id: int = Field(foreign_key="series.id", primary_key=True)
+    genre: str = Field(primary_key=True, index=True)
+
+
+class PersonModel(SQLModel, table=True):
+    """
+    Personne citee au generique (realisateur, createur, acteur).
+    """
+
+    __tablename__ = "person"
+
+    id: int | None = Field(default=None, primary_key=True)
+    name: str = Field(unique=True, index=True)
+
+
+class CreditModel(SQLModel, table=True):
+    """
+    Participation d'une personne a un film ou une serie.
+
+    Derivee de director et cast_json (voir facets.py).
+    """
+
+    __tablename__ = "credit"
+    __table_args__ = (
+        Index("ix_credit_entity", "entity_type", "entity_id"),
+    )
+
+    person_id: int = Field(foreign_key="person.id", primary_key=True)
+    entity_type: str = Field(primary_key=True)  # "movie" | "series"
+    entity_id: int = Field(primary_key=True)
+    role: str = Field(primary_key=True)  # "director" | "actor"
+
+
+class MovieLinkModel(SQLModel, table=True):
+    """
+    Index des symlinks de films dans video/Films (titre, annee → fichier).
+
+    Evite de parcourir l'arborescence video/Films pour retrouver le fichier
+    d'un film sans file_path (fiche detail, lecture).
+    """
+
+    __tablename__ = "movie_links"
+    __table_args__ = (
+        Index("ix_movie_links_title_year", "normalized_title", "year"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    symlink_path: str = Field(unique=True, index=True)
+    target_path: str | None = None
+    title: str
+    normalized_title: str
+    year: int
+
+
+class SymlinkTargetModel(SQLModel, table=True):
+    """
+    Index inverse des symlinks de video/ (fichier physique → symlinks).
+
+    La cible est celle lue par readlink (rendue absolue), avec le peripherique
+    et l'inode du fichier pointe au moment de l'indexation : "quels symlinks
+    pointent vers ce fichier" devient une requete indexee au lieu d'une
+    resolution de toute l'arborescence video/.
+    """
+
+    __tablename__ = "symlink_targets"
+    __table_args__ = (
+        Index("ix_symlink_targets_inode", "target_device", "target_inode"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    symlink_path: str = Field(unique=True, index=True)
+    directory: str = Field(index=True)
+    target_path: str = Field(index=True)
+    target_device: int | None = None
+    target_inode: int | None = None
+
+
+class SymlinkDirModel(SQLModel, table=True):
+    """
+    Repertoires de video/ vus par la derniere reconciliation de l'index inverse.
+
+    Creer ou supprimer un symlink modifie le mtime de son repertoire : un
+    repertoire dont le mtime n'a pas change n'est pas relu.
+    """
+
+    __tablename__ = "symlink_dirs"
+
+    path: str = Field(primary_key=True)
+    mtime_ns: int
+    scanned_at_ns: int
+
+
+class JobModel(SQLModel, table=True):
+    """
+    Tache de fond de l'interface web (workflow, transfert, scans).
+
+    Conserve l'etat, la derniere progression et le resultat : une
+    reconnexion ou un redemarrage du serveur retrouve le resultat sans
+    relancer le traitement.
+    """
+
+    __tablename__ = "jobs"
+    __table_args__ = (Index("ix_jobs_kind_created", "kind", "created_at"),)
+
+    id: str = Field(primary_key=True)
+    kind: str
+    status: str = Field(default="running")  # running, complete, error, interrupted
+    params_json: str | None = None
+    progress_json: str | None = None
+    result_json: str | None = None
+    error: str | None = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -26,6 +26,12 @@ from src.infrastructure.persistence.repositories.video_file_repository import (
 from src.infrastructure.persistence.repositories.pending_validation_repository import (
     SQLModelPendingValidationRepository,
 )
+from src.infrastructure.persistence.repositories.movie_link_repository import (
+    SQLModelMovieLinkRepository,
+)
+from src.infrastructure.persistence.repositories.symlink_index_repository import (
+    SQLModelSymlinkIndexRepository,
+)
 
 __all__ = [
     "SQLModelMovieRepository",
@@ -33,4 +39,6 @@ __all__ = [
     "SQLModelEpisodeRepository",
     "SQLModelVideoFileRepository",
     "SQLModelPendingValidationRepository",
+    "SQLModelMovieLinkRepository",
+    "SQLModelSymlinkIndexRepository",
 ]
@@ -0,0 +1,162 @@
+"""
+Implementation SQLModel de l'index des symlinks de films.
+
+Implemente l'interface IMovieLinkRepository : chaque symlink de video/Films
+est indexe par titre normalise et annee (extraits de son nom), avec le
+chemin physique pointe. Les fiches detail resolvent ainsi le fichier d'un
+film par une requete indexee au lieu d'un rglob de l'arborescence.
+"""
+
+import re
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import delete, update
+from sqlmodel import Session, select
+
+from src.core.entities.video import MovieLink
+from src.core.ports.repositories import IMovieLinkRepository
+from src.infrastructure.persistence.models import MovieLinkModel
+
+# Meme format que les symlinks crees par link-movies : "Titre (Annee) ..."
+_LINK_NAME_RE = re.compile(r"^(.+?)\s*\((\d{4})\)")
+
+
+def normalize_link_title(title: str) -> str:
+    """Retire les caracteres speciaux pour comparaison (minuscules, alphanumerique)."""
+    return "".join(c.lower() for c in title if c.isalnum() or c == " ").strip()
+
+
+def parse_link_name(name: str) -> Optional[tuple[str, int]]:
+    """
+    Extrait (titre, annee) d'un nom de symlink.
+
+    Retourne :
+        Le couple (titre, annee), ou None si le nom ne suit pas le format
+    """
+    match = _LINK_NAME_RE.match(name)
+    if not match:
+        return None
+    return match.group(1).strip(), int(match.group(2))
+
+
+class SQLModelMovieLinkRepository(IMovieLinkRepository):
+    """
+    Repository SQLModel de l'index des symlinks de films.
+
+    Les ecritures sont commitees immediatement : l'index est mis a jour
+    au fil des operations sur le systeme de fichiers.
+    """
+
+    def __init__(self, session: Session) -> None:
+        """
+        Initialise le repository avec une session SQLModel.
+
+        Args :
+            session : Session SQLModel active pour les operations DB
+        """
+        self._session = session
+
+    def _to_entity(self, model: MovieLinkModel) -> MovieLink:
+        """Convertit un modele DB en entite domaine."""
+        return MovieLink(
+            symlink_path=Path(model.symlink_path),
+            target_path=Path(model.target_path) if model.target_path else None,
+            title=model.title,
+            year=model.year,
+        )
+
+    def record(self, symlink_path: Path, target_path: Optional[Path] = None) -> bool:
+        """
+        Indexe (ou met a jour) un symlink.
+
+        Args :
+            symlink_path : Chemin du symlink dans video/Films
+            target_path : Fichier physique pointe, si connu
+
+        Retourne :
+            False si le nom du symlink n'est pas au format "Titre (Annee)"
+        """
+        parsed = parse_link_name(symlink_path.name)
+        if parsed is None:
+            return False
+        title, year = parsed
+
+        model = self._session.exec(
+            select(MovieLinkModel).where(MovieLinkModel.symlink_path == str(symlink_path))
+        ).first()
+        if model is None:
+            model = MovieLinkModel(symlink_path=str(symlink_path))
+        model.target_path = str(target_path) if target_path else None
+        model.title = title
+        model.normalized_title = normalize_link_title(title)
+        model.year = year
+        self._session.add(model)
+        self._session.commit()
+        return True
+
+    def remove(self, symlink_path: Path) -> bool:
+        """
+        Retire un symlink de l'index.
+
+        Retourne :
+            True si le symlink etait indexe
+        """
+        result = self._session.exec(
+            delete(MovieLinkModel).where(MovieLinkModel.symlink_path == str(symlink_path))
+        )
+        self._session.commit()
+        return result.rowcount > 0
+
+    def move(self, old_path: Path, new_path: Path) -> bool:
+        """
+        Met a jour le chemin d'un symlink deplace.
+
+        La cible est conservee ; si le nouveau nom change le titre ou
+        l'annee, l'entree est reindexee.
+
+        Retourne :
+            True si le symlink etait indexe
+        """
+        parsed = parse_link_name(new_path.name)
+        if parsed is None:
+            return self.remove(old_path)
+        title, year = parsed
+
+        # Une entree deja presente au nouveau chemin serait en doublon
+        self._session.exec(
+            delete(MovieLinkModel).where(MovieLinkModel.symlink_path == str(new_path))
+        )
+        result = self._session.exec(
+            update(MovieLinkModel)
+            .where(MovieLinkModel.symlink_path == str(old_path))
+            .values(
+                symlink_path=str(new_path),
+                title=title,
+                normalized_title=normalize_link_title(title),
+                year=year,
+            )
+        )
+        self._session.commit()
+        return result.rowcount > 0
+
+    def find(self, title: str, year: int) -> Optional[MovieLink]:
+        """
+        Recherche le symlink d'un film par titre et annee.
+
+        Args :
+            title : Titre du film (normalise avant comparaison)
+            year : Annee de sortie
+
+        Retourne :
+            Le premier symlink indexe correspondant, ou None
+        """
+        model = self._session.exec(
+            select(MovieLinkModel)
+            .where(
+                MovieLinkModel.normalized_title == normalize_link_title(title),
+                MovieLinkModel.year == year,
+            )
+            .order_by(MovieLinkModel.id)
+        ).first()
+        return self._to_entity(model) if model else None
@@ -0,0 +1,259 @@
+"""
+Implementation SQLModel de l'index inverse des symlinks (fichier -> symlinks).
+
+Implemente l'interface ISymlinkIndexRepository : chaque symlink de video/
+est indexe avec sa cible (readlink rendu absolu) et l'inode du fichier
+pointe. La detection des doublons, des liens casses ou des symlinks d'un
+fichier devient une requete au lieu d'un resolve() de toute l'arborescence.
+"""
+
+from pathlib import Path
+from typing import Callable, Optional
+
+from sqlalchemy import case, delete, func, or_
+from sqlmodel import Session, select
+
+from src.core.entities.video import SymlinkTarget
+from src.core.ports.repositories import ISymlinkIndexRepository
+from src.infrastructure.persistence.models import SymlinkDirModel, SymlinkTargetModel
+
+
+def _under(column, root: Path):
+    """
+    Condition "chemin sous root" exploitant l'index de la colonne.
+
+    Intervalle [root/, root0[ ('0' suit '/' en ASCII) plutot qu'un LIKE,
+    sensible aux caracteres % et _ des noms de fichiers.
+    """
+    prefix = str(root).rstrip("/")
+    return (column >= f"{prefix}/") & (column < f"{prefix}0")
+
+
+def _default_session_factory() -> Session:
+    from src.infrastructure.persistence.database import get_engine
+
+    return Session(get_engine())
+
+
+class SQLModelSymlinkIndexRepository(ISymlinkIndexRepository):
+    """
+    Repository SQLModel de l'index inverse des symlinks.
+
+    Contrairement aux autres repositories, il ouvre une session par
+    operation : il est partage par l'adaptateur FileSystemAdapter
+    (singleton), appele depuis plusieurs threads du serveur web.
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None) -> None:
+        """
+        Initialise le repository.
+
+        Args :
+            session_factory : Fabrique de sessions (defaut : engine de l'application)
+        """
+        self._session_factory = session_factory or _default_session_factory
+
+    @staticmethod
+    def _to_entity(model: SymlinkTargetModel) -> SymlinkTarget:
+        """Convertit un modele DB en entite domaine."""
+        return SymlinkTarget(
+            symlink_path=Path(model.symlink_path),
+            target_path=Path(model.target_path),
+            target_device=model.target_device,
+            target_inode=model.target_inode,
+        )
+
+    @staticmethod
+    def _to_model(entry: SymlinkTarget) -> SymlinkTargetModel:
+        return SymlinkTargetModel(
+            symlink_path=str(entry.symlink_path),
+            directory=str(entry.symlink_path.parent),
+            target_path=str(entry.target_path),
+            target_device=entry.target_device,
+            target_inode=entry.target_inode,
+        )
+
+    def record(self, entry: SymlinkTarget) -> None:
+        """Indexe (ou met a jour) un symlink."""
+        with self._session_factory() as session:
+            session.exec(
+                delete(SymlinkTargetModel).where(
+                    SymlinkTargetModel.symlink_path == str(entry.symlink_path)
+                )
+            )
+            session.add(self._to_model(entry))
+            session.commit()
+
+    def remove(self, symlink_path: Path) -> bool:
+        """
+        Retire un symlink de l'index.
+
+        Retourne :
+            True si le symlink etait indexe
+        """
+        with self._session_factory() as session:
+            result = session.exec(
+                delete(SymlinkTargetModel).where(
+                    SymlinkTargetModel.symlink_path == str(symlink_path)
+                )
+            )
+            session.commit()
+            return result.rowcount > 0
+
+    def links_to(
+        self,
+        target_path: Path,
+        device: Optional[int] = None,
+        inode: Optional[int] = None,
+    ) -> list[Path]:
+        """
+        Symlinks pointant vers un fichier.
+
+        Args :
+            target_path : Chemin du fichier physique
+            device, inode : Identite du fichier (retrouve aussi les symlinks
+                pointant vers un autre chemin du meme fichier)
+
+        Retourne :
+            Chemins des symlinks, tries
+        """
+        condition = SymlinkTargetModel.target_path == str(target_path)
+        if device is not None and inode is not None:
+            condition = or_(
+                condition,
+                (SymlinkTargetModel.target_device == device)
+                & (SymlinkTargetModel.target_inode == inode),
+            )
+        with self._session_factory() as session:
+            paths = session.exec(
+                select(SymlinkTargetModel.symlink_path).where(condition)
+            ).all()
+        return sorted(Path(p) for p in paths)
+
+    def entries(self, root: Path) -> list[SymlinkTarget]:
+        """Symlinks indexes sous un repertoire, tries par chemin."""
+        with self._session_factory() as session:
+            models = session.exec(
+                select(SymlinkTargetModel)
+                .where(_under(SymlinkTargetModel.symlink_path, root))
+                .order_by(SymlinkTargetModel.symlink_path)
+            ).all()
+            return [self._to_entity(m) for m in models]
+
+    def links_under(self, target_root: Path) -> list[SymlinkTarget]:
+        """
+        Symlinks pointant vers target_root ou vers un chemin sous ce repertoire.
+
+        Retrouve les symlinks a reprendre apres le deplacement d'un fichier
+        ou d'un dossier du storage.
+        """
+        root_str = str(target_root).rstrip("/")
+        with self._session_factory() as session:
+            models = session.exec(
+                select(SymlinkTargetModel)
+                .where(
+                    or_(
+                        SymlinkTargetModel.target_path == root_str,
+                        _under(SymlinkTargetModel.target_path, target_root),
+                    )
+                )
+                .order_by(SymlinkTargetModel.symlink_path)
+            ).all()
+            return [self._to_entity(m) for m in models]
+
+    def shared_targets(self, root: Path) -> dict[Path, list[Path]]:
+        """
+        Fichiers pointes par plusieurs symlinks sous un repertoire.
+
+        Les symlinks sont regroupes par fichier physique (peripherique,
+        inode) quand l'inode est connu, par chemin cible sinon : deux
+        chemins differents vers le meme fichier (montage, dossier lie)
+        forment un seul groupe.
+
+        Retourne :
+            Dict {cible (plus petit chemin du groupe): [symlinks tries]}
+        """
+        scope = _under(SymlinkTargetModel.symlink_path, root)
+        # Chemins cibles absolus : jamais confondus avec "device:inode"
+        identity = case(
+            (
+                SymlinkTargetModel.target_inode.is_not(None),
+                func.printf(
+                    "%d:%d", SymlinkTargetModel.target_device, SymlinkTargetModel.target_inode
+                ),
+            ),
+            else_=SymlinkTargetModel.target_path,
+        )
+        with self._session_factory() as session:
+            shared = (
+                select(identity).where(scope).group_by(identity).having(func.count() > 1)
+            )
+            rows = session.exec(
+                select(identity, SymlinkTargetModel.target_path, SymlinkTargetModel.symlink_path)
+                .where(scope, identity.in_(shared))
+                .order_by(identity, SymlinkTargetModel.symlink_path)
+            ).all()
+
+        groups: dict[str, tuple[list[str], list[Path]]] = {}
+        for key, target, link in rows:
+            targets, links = groups.setdefault(key, ([], []))
+            targets.append(target)
+            links.append(Path(link))
+        return {Path(min(targets)): links for targets, links in groups.values()}
+
+    def directory_states(self, root: Path) -> dict[str, tuple[int, int]]:
+        """
+        Repertoires vus par la derniere reconciliation sous root (root inclus).
+
+        Retourne :
+            Dict {repertoire: (mtime_ns, scanned_at_ns)}
+        """
+        root_str = str(root).rstrip("/")
+        with self._session_factory() as session:
+            rows = session.exec(
+                select(SymlinkDirModel).where(
+                    or_(SymlinkDirModel.path == root_str, _under(SymlinkDirModel.path, root))
+                )
+            ).all()
+            return {row.path: (row.mtime_ns, row.scanned_at_ns) for row in rows}
+
+    def apply_scan(
+        self,
+        scanned: dict[str, tuple[int, list[SymlinkTarget]]],
+        removed_dirs: list[str],
+        scanned_at_ns: int,
+        rebuild_root: Optional[Path] = None,
+    ) -> None:
+        """
+        Enregistre le resultat d'une reconciliation (une transaction).
+
+        Args :
+            scanned : {repertoire relu: (mtime_ns, symlinks qu'il contient)}
+            removed_dirs : Repertoires disparus (symlinks oublies)
+            scanned_at_ns : Date de la reconciliation
+            rebuild_root : Reconstruction : toutes les entrees sous ce
+                repertoire sont d'abord effacees
+        """
+        stale = [*scanned, *removed_dirs]
+        with self._session_factory() as session:
+            if rebuild_root is not None:
+                session.exec(
+                    delete(SymlinkTargetModel).where(
+                        _under(SymlinkTargetModel.symlink_path, rebuild_root)
+                    )
+                )
+            # Lots bornes par la limite de variables SQLite
+            for start in range(0, len(stale), 500):
+                chunk = stale[start:start + 500]
+                session.exec(
+                    delete(SymlinkTargetModel).where(SymlinkTargetModel.directory.in_(chunk))
+                )
+                session.exec(delete(SymlinkDirModel).where(SymlinkDirModel.path.in_(chunk)))
+            for directory, (mtime_ns, links) in scanned.items():
+                session.add(
+                    SymlinkDirModel(
+                        path=directory, mtime_ns=mtime_ns, scanned_at_ns=scanned_at_ns
+                    )
+                )
+                session.add_all(self._to_model(entry) for entry in links)
+            session.commit()
@@ -6,15 +6,22 @@ dans la base de donnees SQLite via SQLModel.
 """
 
 import json
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from sqlalchemy import String, bindparam, func, insert, literal, or_, update
 from sqlmodel import Session, select
 
 from src.core.entities.video import PendingValidation, ValidationStatus, VideoFile
 from src.core.ports.repositories import IVideoFileRepository
 from src.core.value_objects import MediaInfo, Resolution, VideoCodec, AudioCodec, Language
-from src.infrastructure.persistence.models import PendingValidationModel, VideoFileModel
+from src.infrastructure.persistence.models import (
+    EpisodeModel,
+    MovieModel,
+    PendingValidationModel,
+    VideoFileModel,
+)
 
 
 class SQLModelVideoFileRepository(IVideoFileRepository):
@@ -237,6 +244,179 @@ class SQLModelVideoFileRepository(IVideoFileRepository):
             return True
         return False
 
+    def relocate(self, old_path: Path, new_path: Path) -> int:
+        """
+        Reporte le deplacement d'un fichier ou d'un repertoire du storage.
+
+        Reecrit en une transaction les chemins physiques egaux a old_path
+        ou situes dessous : video_files.path, movies.file_path et
+        episodes.file_path.
+
+        Args :
+            old_path : Ancien chemin (fichier ou repertoire)
+            new_path : Nouveau chemin
+
+        Retourne :
+            Le nombre de lignes mises a jour
+        """
+        old = str(old_path).rstrip("/")
+        new = str(new_path).rstrip("/")
+        updated = 0
+        for column in (VideoFileModel.path, MovieModel.file_path, EpisodeModel.file_path):
+            # Intervalle [old/, old0[ plutot qu'un LIKE (caracteres % et _)
+            condition = or_(
+                column == old,
+                (column >= f"{old}/") & (column < f"{old}0"),
+            )
+            result = self._session.exec(
+                update(column.class_)
+                .where(condition)
+                .values({column.key: literal(new, String) + func.substr(column, len(old) + 1)})
+            )
+            updated += result.rowcount
+        self._session.commit()
+        return updated
+
+    def load_import_index(self) -> tuple[dict[str, VideoFile], dict[str, int]]:
+        """
+        Charge en une seule requete les index utilises par l'import en masse.
+
+        Retourne :
+            Tuple (hash -> VideoFile partiel (id, path, symlink_path),
+            path -> id)
+        """
+        statement = select(
+            VideoFileModel.id,
+            VideoFileModel.path,
+            VideoFileModel.symlink_path,
+            VideoFileModel.file_hash,
+        )
+        by_hash: dict[str, VideoFile] = {}
+        by_path: dict[str, int] = {}
+        for model_id, path, symlink_path, file_hash in self._session.exec(statement):
+            if path:
+                by_path[path] = model_id
+            if file_hash and file_hash not in by_hash:
+                by_hash[file_hash] = VideoFile(
+                    id=str(model_id),
+                    path=Path(path) if path else None,
+                    symlink_path=Path(symlink_path) if symlink_path else None,
+                )
+        return by_hash, by_path
+
+    def bulk_import(
+        self,
+        new_files: list[VideoFile],
+        moved_files: list[VideoFile],
+        modified_files: list[VideoFile],
+    ) -> list[int]:
+        """
+        Ecrit un lot d'import en une seule transaction (executemany).
+
+        Les nouveaux fichiers recoivent leur ID (entite modifiee en place).
+
+        Args :
+            new_files : Fichiers a inserer (sans id)
+            moved_files : Fichiers connus dont path/symlink_path change
+            modified_files : Fichiers connus (par path) dont le contenu a change
+
+        Retourne :
+            IDs des fichiers ayant recu une nouvelle validation en attente
+            (nouveaux fichiers et fichiers modifies)
+        """
+        table = VideoFileModel.__table__
+        now = datetime.utcnow()
+        try:
+            if new_files:
+                rows = []
+                for entity in new_files:
+                    row = self._to_model(entity).model_dump(exclude={"id"})
+                    row["created_at"] = now
+                    row["updated_at"] = now
+                    rows.append(row)
+                self._session.execute(insert(table), rows)
+
+            if moved_files:
+                self._session.execute(
+                    update(table)
+                    .where(table.c.id == bindparam("_id"))
+                    .values(
+                        path=bindparam("_path"),
+                        symlink_path=bindparam("_symlink_path"),
+                        updated_at=now,
+                    ),
+                    [
+                        {
+                            "_id": int(vf.id),
+                            "_path": str(vf.path),
+                            "_symlink_path": str(vf.symlink_path)
+                            if vf.symlink_path
+                            else None,
+                        }
+                        for vf in moved_files
+                    ],
+                )
+
+            if modified_files:
+                columns = (
+                    "filename", "size_bytes", "file_hash", "codec_video",
+                    "codec_audio", "resolution_width", "resolution_height",
+                    "duration_seconds", "languages_json",
+                )
+                self._session.execute(
+                    update(table)
+                    .where(table.c.id == bindparam("_id"))
+                    .values(
+                        updated_at=now,
+                        **{col: bindparam(f"_{col}") for col in columns},
+                    ),
+                    [self._bulk_update_params(vf, columns) for vf in modified_files],
+                )
+
+            # Recuperer les IDs generes par path (SQLite n'a pas de RETURNING
+            # en executemany) : requete limitee aux paths du lot, par tranches
+            # bornees par la limite de variables SQLite
+            pending_ids = [int(vf.id) for vf in modified_files]
+            if new_files:
+                paths = [str(vf.path) for vf in new_files]
+                ids_by_path: dict[str, int] = {}
+                for start in range(0, len(paths), 500):
+                    statement = select(VideoFileModel.id, VideoFileModel.path).where(
+                        VideoFileModel.path.in_(paths[start:start + 500])  # type: ignore[union-attr]
+                    )
+                    for model_id, path in self._session.exec(statement).all():
+                        ids_by_path[path] = model_id
+                for entity in new_files:
+                    model_id = ids_by_path[str(entity.path)]
+                    entity.id = str(model_id)
+                    pending_ids.append(model_id)
+
+            if pending_ids:
+                self._session.execute(
+                    insert(PendingValidationModel.__table__),
+                    [
+                        {
+                            "video_file_id": vf_id,
+                            "auto_validated": False,
+                            "validation_status": "pending",
+                            "created_at": now,
+                        }
+                        for vf_id in pending_ids
+                    ],
+                )
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
+        return pending_ids
+
+    def _bulk_update_params(self, entity: VideoFile, columns: tuple[str, ...]) -> dict:
+        """Construit les parametres d'un UPDATE executemany (cles prefixees _)."""
+        values = self._to_model(entity).model_dump(include=set(columns))
+        params = {f"_{col}": value for col, value in values.items()}
+        params["_id"] = int(entity.id)
+        return params
+
     def list_pending(self) -> list[PendingValidation]:
         """Liste tous les fichiers video avec une validation en attente."""
         statement = select(PendingValidationModel).where(
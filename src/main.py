@@ -1,55 +1,62 @@
 """
 Point d'entrée CLI de CineOrg.
 
-Initialise le container DI, configure le logging et fournit les commandes CLI.
+Configure le logging et fournit les commandes CLI. Les modules de commandes
+et le container DI ne sont importes que par les commandes qui les utilisent :
+"cineorg version", la completion shell ou "cineorg info" demarrent sans
+charger guessit, pymediainfo, sqlmodel ni httpx.
 """
 
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, Optional
 
 import typer
 from loguru import logger
 
-from .adapters.cli.commands import (
-    check,
-    cleanup,
-    consolidate,
-    enrich,
-    enrich_imdb_ids,
-    enrich_movies_credits,
-    enrich_ratings,
-    enrich_series,
-    fix_bad_links,
-    fix_symlinks,
-    imdb_app,
-    clean_titles,
-    enrich_episode_titles,
-    enrich_tech,
-    import_library,
-    link_movies,
-    pending,
-    populate_movies,
-    populate_series,
-    process,
-    regroup,
-    repair_links,
-    validate_app,
-)
+from .adapters.cli.commands import COMMANDS
+from .adapters.cli.lazy_commands import LazyTyperGroup
 from .config import Settings
-from .container import Container
 from .logging_config import configure_logging
 
+if TYPE_CHECKING:
+    from .container import Container
+
+
+class CineOrgGroup(LazyTyperGroup):
+    """Groupe racine : commandes du registre importees a l'invocation."""
+
+    lazy_commands = COMMANDS
+
+
 app = typer.Typer(
     name="cineorg",
     help="Application de gestion de vidéothèque",
+    cls=CineOrgGroup,
 )
-container = Container()
 
-# Etat global pour les options de verbosite
-state = {"verbose": 0, "quiet": False}
+# Container DI construit au premier besoin (voir get_container)
+_container: Optional["Container"] = None
+
+# Commandes sans acces a la base (le serveur web l'initialise lui-meme)
+_NO_DATABASE_COMMANDS = frozenset({"info", "version", "serve"})
+
+# Etat global pour les options de verbosite ; init_database est active par
+# main() (les tests invoquent l'application sans initialiser la base)
+state = {"verbose": 0, "quiet": False, "init_database": False}
+
+
+def get_container() -> "Container":
+    """Retourne le container DI, construit au premier appel."""
+    global _container
+    if _container is None:
+        from .container import Container
+
+        _container = Container()
+    return _container
 
 
 @app.callback()
 def main_callback(
+    ctx: typer.Context,
     verbose: Annotated[
         int,
         typer.Option(
@@ -67,43 +74,20 @@ def main_callback(
     else:
         state["verbose"] = verbose
 
+    # Initialise la base de données (crée les tables si nécessaire)
+    if state["init_database"] and ctx.invoked_subcommand not in _NO_DATABASE_COMMANDS:
+        from .infrastructure.persistence.database import init_db
 
-# Monter les commandes depuis commands.py
-app.command()(process)
-app.command()(pending)
-# Note: "import" est un mot reserve Python, donc on utilise name= explicitement
-app.command(name="import")(import_library)
-
-# Commandes de maintenance
-app.command()(enrich)
-app.command(name="populate-movies")(populate_movies)
-app.command(name="populate-series")(populate_series)
-app.command(name="link-movies")(link_movies)
-app.command(name="enrich-ratings")(enrich_ratings)
-app.command(name="enrich-imdb-ids")(enrich_imdb_ids)
-app.command(name="enrich-series")(enrich_series)
-app.command(name="enrich-movies-credits")(enrich_movies_credits)
-app.command(name="repair-links")(repair_links)
-app.command()(consolidate)
-app.command()(check)
-app.command()(cleanup)
-app.command()(regroup)
-app.command(name="fix-symlinks")(fix_symlinks)
-app.command(name="fix-bad-links")(fix_bad_links)
-app.command(name="clean-titles")(clean_titles)
-app.command(name="enrich-tech")(enrich_tech)
-app.command(name="enrich-episode-titles")(enrich_episode_titles)
-
-# Monter validate_app comme sous-commande
-app.add_typer(validate_app, name="validate")
-
-# Monter imdb_app comme sous-commande
-app.add_typer(imdb_app, name="imdb")
+        init_db()
+
+
+# Les commandes de src.adapters.cli.commands (process, import, validate, imdb,
+# maintenance...) sont declarees dans COMMANDS et montees par CineOrgGroup
 
 
 def get_config() -> Settings:
-    """Récupère les paramètres de l'application depuis le container DI."""
-    return container.config()
+    """Récupère les paramètres de l'application (sans construire le container)."""
+    return Settings()
 
 
 @app.command()
@@ -129,7 +113,7 @@ def version() -> None:
 @app.command()
 def scan() -> None:
     """Scanne les repertoires de telechargements."""
-    scanner = container.scanner_service()
+    scanner = get_container().scanner_service()
 
     count = 0
     for result in scanner.scan_downloads():
@@ -175,7 +159,7 @@ def serve(
 def main() -> None:
     """Point d'entrée de l'application."""
     # Charge la configuration et configure le logging
-    settings = container.config()
+    settings = Settings()
     configure_logging(
         log_level=settings.log_level,
         log_file=settings.log_file,
@@ -183,8 +167,9 @@ def main() -> None:
         retention_count=settings.log_retention_count,
     )
 
-    # Initialise la base de données (crée les tables si nécessaire)
-    container.database.init()
+    # Base initialisée par le callback, seulement pour les commandes qui
+    # l'utilisent (ni pour --help, ni pour la complétion shell)
+    state["init_database"] = True
 
     logger.info("Démarrage de CineOrg", version="0.1.0")
 
@@ -4,19 +4,33 @@ Service de détection automatique d'associations TMDB potentiellement erronées.
 Analyse les films et séries en comparant les métadonnées TMDB (titre, année,
 durée) avec les informations extraites des noms de fichiers via guessit.
 Chaque entité reçoit un score de confiance (0-100). Score < 60 = suspect.
+
+Le scan est incrémental : le résultat de chaque entité est conservé avec
+une empreinte de ce qu'évaluent les heuristiques (table association_checks).
+Seules les entités dont le fichier, l'ID TMDB ou les métadonnées ont changé
+sont réévaluées ; le parsing guessit et l'extraction mediainfo de celles-ci
+sont répartis sur un pool de threads. Les premiers épisodes de toutes les
+séries sont chargés en une requête.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
 from pathlib import Path
 
 from loguru import logger
+from sqlalchemy import func
 from sqlmodel import Session, select
 
 from src.adapters.parsing.guessit_parser import GuessitFilenameParser
 from src.infrastructure.persistence.models import (
+    AssociationCheckModel,
     ConfirmedAssociationModel,
     EpisodeModel,
     MovieModel,
@@ -46,6 +60,13 @@ SUSPECT_THRESHOLD = 60
 # Callback de progression : (current, total, label)
 ProgressCallback = Callable[[int, int, str], None]
 
+# Threads de parsing (guessit) et d'extraction de durée (mediainfo)
+DEFAULT_SCAN_WORKERS = 4
+
+# Version des heuristiques, incluse dans les empreintes : la modifier
+# invalide les résultats conservés
+_CHECK_VERSION = 1
+
 _parser = GuessitFilenameParser()
 
 
@@ -69,8 +90,16 @@ class AssociationChecker:
         self,
         on_progress: ProgressCallback | None = None,
         limit: int | None = None,
+        workers: int = DEFAULT_SCAN_WORKERS,
     ) -> list[SuspiciousAssociation]:
-        """Scanne films et séries et retourne les associations suspectes."""
+        """
+        Scanne films et séries et retourne les associations suspectes.
+
+        Args:
+            on_progress: Callback de progression (current, total, label).
+            limit: Nombre maximal de films et de séries analysés.
+            workers: Threads d'analyse des entités modifiées.
+        """
         results: list[SuspiciousAssociation] = []
 
         # Charger les associations déjà confirmées
@@ -93,35 +122,61 @@ class AssociationChecker:
             movie_query = movie_query.limit(limit)
             series_query = series_query.limit(limit)
 
-        movies = self._session.exec(movie_query).all()
-        all_series = self._session.exec(series_query).all()
+        movies = [
+            m for m in self._session.exec(movie_query).all()
+            if ("movie", m.id) not in confirmed_set
+        ]
+        all_series = [
+            s for s in self._session.exec(series_query).all()
+            if ("series", s.id) not in confirmed_set
+        ]
+        first_episodes = self._get_first_episodes()
+        previous = {
+            (c.entity_type, c.entity_id): c
+            for c in self._session.exec(select(AssociationCheckModel)).all()
+        }
 
         total = len(movies) + len(all_series)
-
-        # --- Films ---
-        logger.info(f"Scan de {len(movies)} films pour associations suspectes")
-        for i, movie in enumerate(movies):
-            if on_progress and i % 50 == 0:
-                on_progress(i, total, f"Analyse film {i + 1}/{len(movies)}")
-            if ("movie", movie.id) in confirmed_set:
-                continue
-            result = self._check_movie(movie)
-            if result is not None and result.confidence_score < SUSPECT_THRESHOLD:
-                results.append(result)
-
-        # --- Séries ---
-        logger.info(f"Scan de {len(all_series)} séries pour associations suspectes")
-        offset = len(movies)
-        for i, series in enumerate(all_series):
-            if on_progress and i % 20 == 0:
-                on_progress(
-                    offset + i, total, f"Analyse série {i + 1}/{len(all_series)}"
-                )
-            if ("series", series.id) in confirmed_set:
-                continue
-            result = self._check_series(series)
-            if result is not None and result.confidence_score < SUSPECT_THRESHOLD:
-                results.append(result)
+        tasks: list[tuple[str, MovieModel | SeriesModel, EpisodeModel | None]] = [
+            ("movie", movie, None) for movie in movies
+        ] + [
+            ("series", series, first_episodes.get(series.id))  # type: ignore[arg-type]
+            for series in all_series
+        ]
+
+        def run(task) -> tuple[str, SuspiciousAssociation | None, bool]:
+            """Évalue une entité, sauf si son empreinte est inchangée."""
+            entity_type, entity, episode = task
+            if entity_type == "movie":
+                fingerprint = _movie_fingerprint(entity)
+            else:
+                fingerprint = _series_fingerprint(entity, episode)
+            cached = previous.get((entity_type, entity.id))
+            if cached is not None and cached.fingerprint == fingerprint:
+                return fingerprint, _decode_result(cached.result_json), False
+            if entity_type == "movie":
+                return fingerprint, self._check_movie(entity), True
+            return fingerprint, self._check_series_episode(entity, episode), True
+
+        logger.info(
+            f"Scan de {len(movies)} films et {len(all_series)} séries "
+            "pour associations suspectes"
+        )
+        checked: dict[tuple[str, int], tuple[str, SuspiciousAssociation | None]] = {}
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for i, (task, (fingerprint, result, changed)) in enumerate(
+                zip(tasks, pool.map(run, tasks))
+            ):
+                if on_progress and i % 50 == 0:
+                    on_progress(i, total, _progress_label(i, len(movies), len(all_series)))
+                if changed:
+                    checked[(task[0], task[1].id)] = (fingerprint, result)
+                if result is not None and result.confidence_score < SUSPECT_THRESHOLD:
+                    results.append(result)
+
+        scanned = {(entity_type, entity.id) for entity_type, entity, _ in tasks}
+        self._save_checks(checked, previous, scanned, prune=limit is None)
+        logger.info(f"{len(checked)}/{total} entités réévaluées")
 
         # Signal de fin
         if on_progress:
@@ -132,6 +187,29 @@ class AssociationChecker:
         logger.info(f"{len(results)} associations suspectes détectées")
         return results
 
+    def _save_checks(
+        self,
+        checked: dict[tuple[str, int], tuple[str, SuspiciousAssociation | None]],
+        previous: dict[tuple[str, int], AssociationCheckModel],
+        scanned: set[tuple[str, int]],
+        prune: bool,
+    ) -> None:
+        """Enregistre les résultats réévalués (et retire les entités disparues)."""
+        now = datetime.utcnow()
+        for (entity_type, entity_id), (fingerprint, result) in checked.items():
+            row = previous.get((entity_type, entity_id)) or AssociationCheckModel(
+                entity_type=entity_type, entity_id=entity_id, fingerprint=fingerprint
+            )
+            row.fingerprint = fingerprint
+            row.result_json = json.dumps(asdict(result)) if result is not None else None
+            row.checked_at = now
+            self._session.add(row)
+        if prune:
+            for key, row in previous.items():
+                if key not in scanned:
+                    self._session.delete(row)
+        self._session.commit()
+
     # ------------------------------------------------------------------
     # Heuristiques Films
     # ------------------------------------------------------------------
@@ -221,7 +299,12 @@ class AssociationChecker:
 
     def _check_series(self, series: SeriesModel) -> SuspiciousAssociation | None:
         """Évalue la confiance d'une association série."""
-        episode = self._get_first_episode(series)
+        return self._check_series_episode(series, self._get_first_episode(series))
+
+    def _check_series_episode(
+        self, series: SeriesModel, episode: EpisodeModel | None
+    ) -> SuspiciousAssociation | None:
+        """Évalue une association série à partir de son premier épisode."""
         if episode is None or not episode.file_path:
             return None
 
@@ -331,6 +414,28 @@ class AssociationChecker:
             .limit(1)
         ).first()
 
+    def _get_first_episodes(self) -> dict[int, EpisodeModel]:
+        """Premier épisode avec file_path de chaque série (une requête)."""
+        ranked = (
+            select(
+                EpisodeModel.id,
+                func.row_number()
+                .over(
+                    partition_by=EpisodeModel.series_id,
+                    order_by=(EpisodeModel.season_number, EpisodeModel.episode_number),
+                )
+                .label("rank"),
+            )
+            .where(EpisodeModel.file_path.is_not(None))  # type: ignore[union-attr]
+            .subquery()
+        )
+        episodes = self._session.exec(
+            select(EpisodeModel)
+            .join(ranked, ranked.c.id == EpisodeModel.id)
+            .where(ranked.c.rank == 1)
+        ).all()
+        return {episode.series_id: episode for episode in episodes}
+
     def _parse_filename(self, file_path: str) -> tuple[str | None, int | None]:
         """Extrait titre et année du nom de fichier via guessit."""
         try:
@@ -365,3 +470,59 @@ class AssociationChecker:
             return None
         except Exception:
             return None
+
+
+def _movie_fingerprint(movie: MovieModel) -> str:
+    """Empreinte d'un film : métadonnées TMDB, chemin et état du fichier."""
+    return _fingerprint(
+        movie.tmdb_id,
+        movie.title,
+        movie.original_title,
+        movie.year,
+        movie.duration_seconds,
+        movie.poster_path,
+        movie.file_path,
+        _file_signature(movie.file_path),
+    )
+
+
+def _series_fingerprint(series: SeriesModel, episode: EpisodeModel | None) -> str:
+    """Empreinte d'une série : métadonnées TMDB et chemin du premier épisode."""
+    return _fingerprint(
+        series.tmdb_id,
+        series.title,
+        series.original_title,
+        series.year,
+        series.poster_path,
+        episode.file_path if episode else None,
+    )
+
+
+def _fingerprint(*values: object) -> str:
+    """Empreinte des données évaluées par les heuristiques."""
+    data = repr((_CHECK_VERSION, *values)).encode()
+    return hashlib.blake2b(data, digest_size=12).hexdigest()
+
+
+def _file_signature(file_path: str | None) -> tuple[int, int] | None:
+    """Taille et date de modification du fichier (symlink suivi), ou None."""
+    if not file_path:
+        return None
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _decode_result(result_json: str | None) -> SuspiciousAssociation | None:
+    """Relit un résultat conservé dans association_checks."""
+    if result_json is None:
+        return None
+    return SuspiciousAssociation(**json.loads(result_json))
+
+
+def _progress_label(index: int, n_movies: int, n_series: int) -> str:
+    if index < n_movies:
+        return f"Analyse film {index + 1}/{n_movies}"
+    return f"Analyse série {index - n_movies + 1}/{n_series}"
@@ -16,6 +16,7 @@ from sqlmodel import select
 from src.core.entities.media import Movie, Series
 from src.core.entities.video import VideoFile
 from src.infrastructure.persistence.models import MovieModel, EpisodeModel, SeriesModel
+from src.services.directory_cache import DirectoryCache
 
 from .dataclasses import (
     MANAGED_SUBDIRS,
@@ -234,7 +235,9 @@ def _find_expected_dir(
     return None
 
 
-def scan_duplicate_symlinks(video_dir: Path) -> list[DuplicateSymlink]:
+def scan_duplicate_symlinks(
+    video_dir: Path, symlink_index: Any = None
+) -> list[DuplicateSymlink]:
     """
     Detecte les symlinks dupliques dans le meme repertoire.
 
@@ -244,6 +247,10 @@ def scan_duplicate_symlinks(video_dir: Path) -> list[DuplicateSymlink]:
 
     Args:
         video_dir: Repertoire video a scanner.
+        symlink_index: Index inverse des symlinks (optionnel). S'il est
+            fourni, il est reconcilie puis les groupes sont formes depuis
+            l'index (par inode du fichier pointe), sans resoudre chaque
+            symlink ; seules les cibles des groupes sont verifiees sur disque.
 
     Returns:
         Liste de DuplicateSymlink pour chaque groupe de doublons.
@@ -251,16 +258,33 @@ def scan_duplicate_symlinks(video_dir: Path) -> list[DuplicateSymlink]:
     # Grouper les symlinks valides par (repertoire, cible resolue)
     groups: dict[tuple[Path, Path], list[Path]] = defaultdict(list)
 
-    for path in iter_managed_paths(video_dir):
-        if not path.is_symlink():
-            continue
-        try:
-            resolved = path.resolve()
-            if not resolved.exists():
+    if symlink_index is not None:
+        from src.services.symlink_index import reconcile_symlink_index
+
+        for subdir_name in MANAGED_SUBDIRS:
+            subdir = video_dir / subdir_name
+            if not subdir.exists():
                 continue
-        except OSError:
-            continue
-        groups[(path.parent, resolved)].append(path)
+            reconcile_symlink_index(symlink_index, subdir)
+            # Fichiers partages (par inode), puis groupes par repertoire
+            for target, links in symlink_index.shared_targets(subdir).items():
+                for link in links:
+                    groups[(link.parent, target)].append(link)
+        groups = {
+            key: links for key, links in groups.items()
+            if len(links) > 1 and key[1].exists()
+        }
+    else:
+        for path in iter_managed_paths(video_dir):
+            if not path.is_symlink():
+                continue
+            try:
+                resolved = path.resolve()
+                if not resolved.exists():
+                    continue
+            except OSError:
+                continue
+            groups[(path.parent, resolved)].append(path)
 
     # Pour chaque groupe >= 2, determiner keep/remove
     result = []
@@ -300,6 +324,8 @@ def scan_oversized_dirs(
         Liste de SubdivisionPlan pour chaque repertoire surcharge.
     """
     plans = []
+    # Listings partages entre les plans (repertoires freres relus sinon)
+    cache = DirectoryCache(ttl=None)
 
     for dirpath in iter_managed_paths(video_dir):
         if not dirpath.is_dir():
@@ -307,20 +333,20 @@ def scan_oversized_dirs(
 
         # Compter tous les elements directs (symlinks et repertoires)
         items = [
-            item for item in dirpath.iterdir()
-            if item.is_symlink() or item.is_dir()
+            item for item in cache.entries(dirpath)
+            if item.is_symlink or item.is_dir
         ]
 
         if not items:
             continue
 
         # Ignorer les repertoires d'episodes sous Series/
-        has_only_symlinks = all(item.is_symlink() for item in items)
+        has_only_symlinks = all(item.is_symlink for item in items)
         if has_only_symlinks and _is_under_series(dirpath, video_dir):
             continue
 
         if len(items) > max_per_dir:
-            plan = calculate_subdivision_ranges(dirpath, max_per_dir)
+            plan = calculate_subdivision_ranges(dirpath, max_per_dir, cache)
             plans.append(plan)
 
     _refine_plans_destinations(plans)
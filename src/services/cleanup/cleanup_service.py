@@ -52,6 +52,8 @@ class CleanupService:
         movie_repo: Any,
         series_repo: Any,
         episode_repo: Any,
+        movie_link_repo: Any = None,
+        symlink_index: Any = None,
     ) -> None:
         """
         Initialise le service de cleanup.
@@ -63,6 +65,10 @@ class CleanupService:
             movie_repo: Repository des films
             series_repo: Repository des series
             episode_repo: Repository des episodes
+            movie_link_repo: Index des symlinks de films, tenu a jour par
+                les corrections (optionnel)
+            symlink_index: Index inverse des symlinks, utilise pour la
+                detection des doublons (optionnel)
         """
         self._repair_service = repair_service
         self._organizer_service = organizer_service
@@ -70,6 +76,8 @@ class CleanupService:
         self._movie_repo = movie_repo
         self._series_repo = series_repo
         self._episode_repo = episode_repo
+        self._movie_link_repo = movie_link_repo
+        self._symlink_index = symlink_index
 
     def analyze(self, video_dir: Path, max_per_dir: int = 50) -> CleanupReport:
         """
@@ -140,7 +148,7 @@ class CleanupService:
         )
 
     def _scan_duplicate_symlinks(self, video_dir: Path):
-        return scan_duplicate_symlinks(video_dir)
+        return scan_duplicate_symlinks(video_dir, self._symlink_index)
 
     def _scan_oversized_dirs(self, video_dir: Path, max_per_dir: int = 50):
         return scan_oversized_dirs(video_dir, max_per_dir)
@@ -157,27 +165,33 @@ class CleanupService:
     def repair_broken_symlinks(
         self, broken: list[BrokenSymlinkInfo], min_score: float = 90.0
     ) -> CleanupResult:
-        return repair_broken_symlinks(broken, self._repair_service, min_score)
+        return repair_broken_symlinks(
+            broken, self._repair_service, min_score, self._movie_link_repo
+        )
 
     def delete_broken_symlinks(
         self, broken: list[BrokenSymlinkInfo]
     ) -> CleanupResult:
-        return delete_broken_symlinks(broken)
+        return delete_broken_symlinks(broken, self._movie_link_repo)
 
     def fix_misplaced_symlinks(
         self, misplaced: list[MisplacedSymlink]
     ) -> CleanupResult:
-        return fix_misplaced_symlinks(misplaced, self._video_file_repo)
+        return fix_misplaced_symlinks(
+            misplaced, self._video_file_repo, self._movie_link_repo
+        )
 
     def fix_duplicate_symlinks(
         self, duplicates: list[DuplicateSymlink]
     ) -> CleanupResult:
-        return fix_duplicate_symlinks(duplicates)
+        return fix_duplicate_symlinks(duplicates, self._movie_link_repo)
 
     def subdivide_oversized_dirs(
         self, plans: list[SubdivisionPlan]
     ) -> CleanupResult:
-        return subdivide_oversized_dirs(plans, self._video_file_repo)
+        return subdivide_oversized_dirs(
+            plans, self._video_file_repo, self._movie_link_repo
+        )
 
     def clean_empty_dirs(self, empty_dirs: list[Path]) -> CleanupResult:
         return clean_empty_dirs(empty_dirs)
@@ -8,6 +8,8 @@ suppression, deplacement, subdivision et nettoyage de repertoires.
 from pathlib import Path
 from typing import Any
 
+from src.services.directory_cache import DirectoryCache
+
 from .dataclasses import (
     BrokenSymlinkInfo,
     CleanupResult,
@@ -18,10 +20,16 @@ from .dataclasses import (
 from .subdivision_algorithm import _refine_out_of_range_dest
 
 
+def _is_movie_link(path: Path) -> bool:
+    """Indique si un symlink releve de l'index des films (video/Films)."""
+    return "Films" in path.parts
+
+
 def repair_broken_symlinks(
     broken: list[BrokenSymlinkInfo],
     repair_service: Any,
     min_score: float = 90.0,
+    movie_link_repo: Any = None,
 ) -> CleanupResult:
     """
     Repare les symlinks casses ayant un candidat avec score suffisant.
@@ -30,6 +38,7 @@ def repair_broken_symlinks(
         broken: Liste des symlinks casses a reparer.
         repair_service: Service de reparation des symlinks.
         min_score: Score minimum pour auto-reparation.
+        movie_link_repo: Index des symlinks de films (optionnel).
 
     Returns:
         CleanupResult avec les compteurs de reparation.
@@ -46,6 +55,8 @@ def repair_broken_symlinks(
             )
             if success:
                 result.repaired_symlinks += 1
+                if movie_link_repo is not None and _is_movie_link(info.symlink_path):
+                    movie_link_repo.record(info.symlink_path, info.best_candidate)
             else:
                 result.failed_repairs += 1
         except Exception as e:
@@ -57,12 +68,14 @@ def repair_broken_symlinks(
 
 def delete_broken_symlinks(
     broken: list[BrokenSymlinkInfo],
+    movie_link_repo: Any = None,
 ) -> CleanupResult:
     """
     Supprime les symlinks casses irreparables.
 
     Args:
         broken: Liste des symlinks casses a supprimer.
+        movie_link_repo: Index des symlinks de films (optionnel).
 
     Returns:
         CleanupResult avec le nombre de symlinks supprimes.
@@ -73,6 +86,8 @@ def delete_broken_symlinks(
         try:
             info.symlink_path.unlink()
             result.broken_symlinks_deleted += 1
+            if movie_link_repo is not None:
+                movie_link_repo.remove(info.symlink_path)
         except FileNotFoundError:
             result.errors.append(f"Symlink deja absent {info.symlink_path}")
         except Exception as e:
@@ -84,6 +99,7 @@ def delete_broken_symlinks(
 def fix_misplaced_symlinks(
     misplaced: list[MisplacedSymlink],
     video_file_repo: Any,
+    movie_link_repo: Any = None,
 ) -> CleanupResult:
     """
     Deplace les symlinks mal places vers le bon repertoire.
@@ -91,6 +107,7 @@ def fix_misplaced_symlinks(
     Args:
         misplaced: Liste des symlinks a deplacer.
         video_file_repo: Repository des fichiers video.
+        movie_link_repo: Index des symlinks de films (optionnel).
 
     Returns:
         CleanupResult avec le nombre de symlinks deplaces.
@@ -103,6 +120,8 @@ def fix_misplaced_symlinks(
             new_path = info.expected_dir / info.symlink_path.name
             info.symlink_path.rename(new_path)
             video_file_repo.update_symlink_path(info.symlink_path, new_path)
+            if movie_link_repo is not None:
+                movie_link_repo.move(info.symlink_path, new_path)
             result.moved_symlinks += 1
         except Exception as e:
             result.errors.append(f"Deplacement echoue {info.symlink_path}: {e}")
@@ -112,12 +131,14 @@ def fix_misplaced_symlinks(
 
 def fix_duplicate_symlinks(
     duplicates: list[DuplicateSymlink],
+    movie_link_repo: Any = None,
 ) -> CleanupResult:
     """
     Supprime les symlinks dupliques en ne gardant que le plus complet.
 
     Args:
         duplicates: Liste des groupes de symlinks dupliques.
+        movie_link_repo: Index des symlinks de films (optionnel).
 
     Returns:
         CleanupResult avec le nombre de symlinks supprimes.
@@ -129,6 +150,8 @@ def fix_duplicate_symlinks(
             try:
                 link.unlink()
                 result.duplicate_symlinks_removed += 1
+                if movie_link_repo is not None:
+                    movie_link_repo.remove(link)
             except FileNotFoundError:
                 result.errors.append(f"Symlink deja absent {link}")
             except Exception as e:
@@ -140,6 +163,7 @@ def fix_duplicate_symlinks(
 def subdivide_oversized_dirs(
     plans: list[SubdivisionPlan],
     video_file_repo: Any,
+    movie_link_repo: Any = None,
 ) -> CleanupResult:
     """
     Subdivise les repertoires surcharges selon les plans fournis.
@@ -152,6 +176,7 @@ def subdivide_oversized_dirs(
     Args:
         plans: Liste des plans de subdivision.
         video_file_repo: Repository des fichiers video.
+        movie_link_repo: Index des symlinks de films (optionnel).
 
     Returns:
         CleanupResult avec les compteurs de subdivision.
@@ -175,6 +200,8 @@ def subdivide_oversized_dirs(
                 try:
                     source.rename(dest)
                     video_file_repo.update_symlink_path(source, dest)
+                    if movie_link_repo is not None:
+                        movie_link_repo.move(source, dest)
                     result.symlinks_redistributed += 1
                 except Exception as e:
                     result.errors.append(f"Deplacement echoue {source}: {e}")
@@ -185,12 +212,19 @@ def subdivide_oversized_dirs(
             result.errors.append(f"Subdivision echouee {plan.parent_dir}: {e}")
 
     # Phase 2 : deplacer les items hors-plage
+    # (listings des cibles lus une fois, invalides a chaque deplacement)
+    cache = DirectoryCache(ttl=None)
     for source, planned_dest in all_out_of_range:
-        actual_dest = _refine_out_of_range_dest(planned_dest)
+        actual_dest = _refine_out_of_range_dest(planned_dest, cache)
         try:
             actual_dest.parent.mkdir(parents=True, exist_ok=True)
+            cache.invalidate(actual_dest.parent)
             source.rename(actual_dest)
+            cache.invalidate(actual_dest)
+            cache.invalidate(source)
             video_file_repo.update_symlink_path(source, actual_dest)
+            if movie_link_repo is not None:
+                movie_link_repo.move(source, actual_dest)
             result.symlinks_redistributed += 1
         except Exception as e:
             result.errors.append(f"Deplacement hors-plage echoue {source}: {e}")
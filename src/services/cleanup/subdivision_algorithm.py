@@ -7,7 +7,9 @@ repertoires freres, et affinement des destinations hors-plage.
 
 import re
 from pathlib import Path
+from typing import Optional
 
+from src.services.directory_cache import DirectoryCache, list_entries, list_subdirs
 from src.utils.helpers import normalize_accents, strip_article as _strip_article
 
 from .dataclasses import SubdivisionPlan
@@ -53,7 +55,9 @@ def _parse_parent_range(dir_name: str) -> tuple[str, str]:
     return "AA", "ZZ"
 
 
-def _find_sibling_for_key(parent_dir: Path, sort_key: str) -> Path:
+def _find_sibling_for_key(
+    parent_dir: Path, sort_key: str, cache: Optional[DirectoryCache] = None
+) -> Path:
     """
     Trouve le repertoire frere (sibling) qui correspond a une cle de tri.
 
@@ -64,16 +68,15 @@ def _find_sibling_for_key(parent_dir: Path, sort_key: str) -> Path:
     Args:
         parent_dir: Repertoire contenant l'item hors plage.
         sort_key: Cle de tri 2 lettres (ex: "JA", "BO", "CH").
+        cache: Cache des listings partage (optionnel).
 
     Returns:
         Path du repertoire destination.
     """
     grandparent = parent_dir.parent
-    if not grandparent.exists():
-        return grandparent
 
-    for sibling in sorted(grandparent.iterdir()):
-        if not sibling.is_dir() or sibling == parent_dir:
+    for sibling in list_subdirs(grandparent, cache):
+        if sibling == parent_dir:
             continue
         # Ignorer les repertoires non-alphabetiques (ex: '#') dont la plage
         # fallback ("AA","ZZ") capturerait toutes les cles alphabetiques
@@ -87,7 +90,9 @@ def _find_sibling_for_key(parent_dir: Path, sort_key: str) -> Path:
     return grandparent
 
 
-def _refine_out_of_range_dest(planned_dest: Path) -> Path:
+def _refine_out_of_range_dest(
+    planned_dest: Path, cache: Optional[DirectoryCache] = None
+) -> Path:
     """
     Affine la destination d'un item hors-plage apres subdivision.
 
@@ -96,6 +101,7 @@ def _refine_out_of_range_dest(planned_dest: Path) -> Path:
 
     Args:
         planned_dest: Destination initialement planifiee (sibling/item_name).
+        cache: Cache des listings partage (optionnel).
 
     Returns:
         Destination affinee (dans une subdivision si elle existe).
@@ -103,15 +109,12 @@ def _refine_out_of_range_dest(planned_dest: Path) -> Path:
     target_dir = planned_dest.parent
     item_name = planned_dest.name
 
-    if not target_dir.exists():
-        return planned_dest
-
     # Chercher des sous-repertoires de subdivision (format "Xx-Yy" uniquement)
     # Ignore les repertoires de contenu (series, films) qui ne sont pas des subdivisions
     subdirs = [
-        d for d in sorted(target_dir.iterdir())
-        if d.is_dir() and not d.is_symlink()
-        and _parse_parent_range(d.name) != ("AA", "ZZ")
+        e.path for e in list_entries(target_dir, cache)
+        if e.is_dir and not e.is_symlink
+        and _parse_parent_range(e.path.name) != ("AA", "ZZ")
     ]
     if not subdirs:
         return planned_dest
@@ -175,7 +178,9 @@ def _refine_plans_destinations(plans: list[SubdivisionPlan]) -> None:
 
 
 def calculate_subdivision_ranges(
-    parent_dir: Path, max_per_subdir: int
+    parent_dir: Path,
+    max_per_subdir: int,
+    cache: Optional[DirectoryCache] = None,
 ) -> SubdivisionPlan:
     """
     Calcule les plages de subdivision pour un repertoire surcharge.
@@ -192,15 +197,22 @@ def calculate_subdivision_ranges(
     Args:
         parent_dir: Repertoire a subdiviser.
         max_per_subdir: Nombre max d'elements par sous-repertoire.
+        cache: Cache des listings partage (optionnel), evite de relire
+            le grand-parent pour chaque item hors plage.
 
     Returns:
         SubdivisionPlan avec les plages, mouvements et items hors plage.
     """
     import math
 
+    if cache is None:
+        # Cache local : le grand-parent n'est lu qu'une fois pour tous les hors-plage
+        cache = DirectoryCache(ttl=None)
+
     # 1. Lister les elements directs (symlinks ou dossiers)
-    items = sorted(parent_dir.iterdir())
-    items = [i for i in items if i.is_symlink() or i.is_dir()]
+    items = [
+        e.path for e in list_entries(parent_dir, cache) if e.is_symlink or e.is_dir
+    ]
 
     # 2. Pour chaque item : strip article, normaliser accents, extraire cle 2 lettres
     keyed: list[tuple[str, Path]] = []
@@ -226,7 +238,7 @@ def calculate_subdivision_ranges(
         if parent_start <= sort_key <= parent_end:
             in_range.append((sort_key, item))
         else:
-            dest_dir = _find_sibling_for_key(parent_dir, sort_key)
+            dest_dir = _find_sibling_for_key(parent_dir, sort_key, cache)
             out_of_range.append((item, dest_dir / item.name))
 
     # 5. Trier les in-range par cle normalisee
@@ -3,20 +3,51 @@ Service d'analyse du generique de fin pour identification automatique.
 
 Utilise ffmpeg pour extraire les frames du generique, puis OCR (Tesseract
 ou Claude Vision) pour lire le texte et comparer avec les candidats TMDB.
+
+Les frames quasi identiques consecutives (generique fixe ou lent) sont
+ecartees par hash perceptuel avant l'OCR. Le pretraitement (seuil d'Otsu,
+binarisation) travaille sur des tableaux NumPy et l'OCR Tesseract des
+frames est reparti sur un pool de threads (chaque appel lance le binaire
+tesseract) : l'event loop n'est jamais bloquee.
+
+Avec Tesseract, les frames sont decodees par ffmpeg en niveaux de gris
+brutes sur stdout (rawvideo) et passees a l'OCR au fil de l'eau, sans
+fichiers JPEG : decodage et OCR se recouvrent. Les frames JPEG restent
+utilisees pour EasyOCR et Claude Vision. Les resultats sont mis en cache
+par hash de fichier : reanalyser un fichier deja vu est immediat.
 """
 
 import asyncio
 import json
+import os
 import re
 import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
 from loguru import logger
 
+from src.infrastructure.persistence.hash_service import compute_file_hash
+
+
+# Distance de Hamming (sur 64 bits) sous laquelle deux frames sont identiques
+DUPLICATE_FRAME_DISTANCE = 4
+
+# Threads d'OCR Tesseract (un processus tesseract par thread)
+DEFAULT_OCR_WORKERS = min(8, os.cpu_count() or 1)
+
+# Cache des resultats d'analyse (cle : hash du fichier video)
+DEFAULT_CACHE_DIR = ".cache/credits"
+
+# Echantillonnage du generique : 1 frame toutes les 8 secondes (duree d'un
+# defilement) sur 5 minutes
+FRAME_INTERVAL = 8
+CREDITS_DURATION = 300
+
 
 @dataclass
 class CreditsAnalysisResult:
@@ -59,6 +90,7 @@ class CreditsAnalyzer:
         self,
         anthropic_api_key: Optional[str] = None,
         prefer_claude: bool = False,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
     ):
         """
         Initialise l'analyseur.
@@ -66,9 +98,13 @@ class CreditsAnalyzer:
         Args:
             anthropic_api_key: Cle API pour Claude Vision (optionnel)
             prefer_claude: Si True, utilise Claude en priorite au lieu de Tesseract
+            cache_dir: Repertoire du cache des resultats par hash de fichier
+                (None = pas de cache)
         """
         self._api_key = anthropic_api_key
         self._prefer_claude = prefer_claude
+        self._cache_dir = cache_dir
+        self._cache = None  # diskcache.Cache, ouvert a la demande
         self._easyocr_available = self._check_easyocr()
         self._tesseract_available = self._check_tesseract()
         self._ffmpeg_available = self._check_ffmpeg()
@@ -124,6 +160,42 @@ class CreditsAnalyzer:
             logger.warning(f"Fichier non trouve: {video_path}")
             return CreditsAnalysisResult()
 
+        cache_key = await asyncio.to_thread(self._cache_key, video_path)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug(f"Analyse du generique en cache: {video_path.name}")
+            return cached
+
+        result = await self._analyze(video_path)
+        # Pas de cache pour un echec (extraction impossible, erreur d'API,
+        # OCR sans texte) : le fichier sera reanalyse
+        if result.raw_text.strip() and result.confidence > 0:
+            self._cache_set(cache_key, result)
+        return result
+
+    async def _analyze(self, video_path: Path) -> CreditsAnalysisResult:
+        """Extraction et OCR : flux en memoire pour Tesseract, frames JPEG sinon."""
+        if self._stream_available():
+            result = await self._ocr_stream_tesseract(video_path)
+            if result is not None:
+                # Si confiance faible, essayer EasyOCR ou Claude (frames JPEG)
+                if result.confidence >= 50 or not (self._easyocr_available or self._api_key):
+                    return result
+                logger.info("Confiance Tesseract faible, essai avec un autre OCR")
+                return await self._analyze_files(video_path, fallback_only=True)
+        return await self._analyze_files(video_path)
+
+    async def _analyze_files(
+        self, video_path: Path, fallback_only: bool = False
+    ) -> CreditsAnalysisResult:
+        """
+        Analyse via des frames JPEG extraites dans un repertoire temporaire.
+
+        Args:
+            video_path: Chemin du fichier video
+            fallback_only: Tesseract deja tente (flux) : EasyOCR ou Claude
+                seulement
+        """
         # Extraire les frames du generique
         with tempfile.TemporaryDirectory() as tmpdir:
             frames_dir = Path(tmpdir)
@@ -133,6 +205,11 @@ class CreditsAnalyzer:
                 logger.warning("Aucune frame extraite du generique")
                 return CreditsAnalysisResult()
 
+            if fallback_only:
+                if self._easyocr_available:
+                    return await self._ocr_with_easyocr(frames)
+                return await self._ocr_with_claude(frames)
+
             # OCR sur les frames (priorite: Tesseract > EasyOCR > Claude)
             # Tesseract est rapide, EasyOCR plus precis mais lent
             if self._prefer_claude and self._api_key:
@@ -156,6 +233,55 @@ class CreditsAnalyzer:
 
             return result
 
+    def _stream_available(self) -> bool:
+        """Vrai si le mode flux (ffmpeg rawvideo -> Tesseract) est utilisable."""
+        if self._prefer_claude and self._api_key:
+            return False
+        if not (self._ffmpeg_available and self._tesseract_available):
+            return False
+        try:
+            import numpy  # noqa: F401
+            import pytesseract  # noqa: F401
+            from PIL import Image  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    # ------------------------------------------------------------------
+    # Cache des resultats par hash de fichier
+    # ------------------------------------------------------------------
+
+    def _cache_key(self, video_path: Path) -> Optional[str]:
+        """
+        Cle de cache : hash du fichier, preference et OCR disponibles.
+
+        Un resultat obtenu sans EasyOCR ni cle API (Tesseract seul) n'est
+        plus servi une fois l'un d'eux disponible.
+        """
+        if self._cache_dir is None:
+            return None
+        try:
+            file_hash = compute_file_hash(video_path)
+        except OSError:
+            return None
+        engine = "claude" if self._prefer_claude and self._api_key else "local"
+        easyocr = int(self._easyocr_available)
+        api = int(bool(self._api_key))
+        return f"credits:{file_hash}:{engine}:easyocr={easyocr}:api={api}"
+
+    def _cache_get(self, key: Optional[str]) -> Optional[CreditsAnalysisResult]:
+        if key is None:
+            return None
+        if self._cache is None:
+            from diskcache import Cache
+
+            self._cache = Cache(self._cache_dir)
+        return self._cache.get(key)
+
+    def _cache_set(self, key: Optional[str], result: CreditsAnalysisResult) -> None:
+        if key is not None and self._cache is not None:
+            self._cache.set(key, result)
+
     async def _get_last_chapter_start(self, video_path: Path) -> Optional[float]:
         """
         Recupere le timestamp de debut du dernier chapitre (generique).
@@ -209,8 +335,8 @@ class CreditsAnalyzer:
         self,
         video_path: Path,
         output_dir: Path,
-        frame_interval: int = 8,  # 1 frame toutes les 8 secondes (duree defilement)
-        credits_duration: int = 300,  # 5 minutes de generique
+        frame_interval: int = FRAME_INTERVAL,
+        credits_duration: int = CREDITS_DURATION,
     ) -> list[Path]:
         """
         Extrait les frames du generique de fin.
@@ -297,6 +423,136 @@ class CreditsAnalyzer:
             logger.warning(f"Erreur extraction frames: {e}")
             return []
 
+    async def _probe_frame_size(self, video_path: Path) -> Optional[tuple[int, int]]:
+        """Retourne (largeur, hauteur) du premier flux video, ou None."""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "ffprobe",
+                "-v", "quiet",
+                "-print_format", "json",
+                "-select_streams", "v:0",
+                "-show_entries", "stream=width,height",
+                str(video_path),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=30)
+            streams = json.loads(stdout).get("streams", [])
+            if streams and streams[0].get("width") and streams[0].get("height"):
+                return int(streams[0]["width"]), int(streams[0]["height"])
+        except Exception as e:
+            logger.debug(f"Impossible de lire la taille des frames: {e}")
+        return None
+
+    async def _stream_credits_frames(
+        self,
+        video_path: Path,
+        frame_interval: int = FRAME_INTERVAL,
+        credits_duration: int = CREDITS_DURATION,
+    ):
+        """
+        Decode les frames du generique en memoire, au fil de l'eau.
+
+        ffmpeg ecrit les frames en niveaux de gris brutes (rawvideo) sur
+        stdout ; chaque frame est lue dans un tampon de largeur x hauteur
+        octets et produite des qu'elle est decodee, sans fichier
+        intermediaire. Meme echantillonnage que _extract_credits_frames.
+
+        Yields:
+            Images PIL en niveaux de gris (mode "L")
+        """
+        from PIL import Image
+
+        size = await self._probe_frame_size(video_path)
+        if size is None:
+            return
+        width, height = size
+        frame_bytes = width * height
+
+        chapter_start = await self._get_last_chapter_start(video_path)
+        num_frames = credits_duration // frame_interval
+        if chapter_start is not None:
+            seek = ["-ss", str(chapter_start)]
+        else:
+            seek = ["-sseof", f"-{credits_duration}"]
+
+        cmd = [
+            "ffmpeg",
+            *seek,
+            "-i", str(video_path),
+            # scale force la taille sondee (pixels non carres, rotation)
+            "-vf", f"fps=1/{frame_interval},scale={width}:{height}",
+            "-frames:v", str(num_frames),
+            "-f", "rawvideo",
+            "-pix_fmt", "gray",
+            "-loglevel", "error",
+            "-",
+        ]
+
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        try:
+            for _ in range(num_frames):
+                try:
+                    buffer = await asyncio.wait_for(
+                        process.stdout.readexactly(frame_bytes), timeout=120
+                    )
+                except asyncio.IncompleteReadError:
+                    break  # fin du flux (fichier plus court que le generique)
+                yield Image.frombytes("L", (width, height), buffer)
+        finally:
+            if process.returncode is None:
+                process.kill()
+            await process.wait()
+
+    async def _ocr_stream_tesseract(self, video_path: Path) -> Optional[CreditsAnalysisResult]:
+        """
+        OCR Tesseract sur le flux de frames decodees en memoire.
+
+        Chaque frame distincte est soumise au pool d'OCR des qu'elle est
+        decodee : le decodage ffmpeg et l'OCR se recouvrent.
+
+        Returns:
+            CreditsAnalysisResult, ou None si aucune frame n'a ete decodee
+        """
+        loop = asyncio.get_running_loop()
+        pending = []
+        last_hash = None
+        try:
+            with ThreadPoolExecutor(max_workers=DEFAULT_OCR_WORKERS) as pool:
+                async for image in self._stream_credits_frames(video_path):
+                    frame_hash = await asyncio.to_thread(_average_hash, image)
+                    if _is_duplicate(frame_hash, last_hash):
+                        continue
+                    last_hash = frame_hash
+                    pending.append(loop.run_in_executor(pool, _ocr_image_tesseract, image))
+                texts = await asyncio.gather(*pending)
+        except asyncio.TimeoutError:
+            logger.warning("Timeout decodage ffmpeg")
+            return None
+        except Exception as e:
+            logger.warning(f"Erreur decodage frames: {e}")
+            return None
+
+        if not texts:
+            return None
+        logger.debug(f"OCR de {len(texts)} frames distinctes du generique")
+
+        combined_text = "\n".join(text for text in texts if text.strip())
+
+        # Estimer la confiance basee sur la quantite de texte lisible
+        word_count = len(combined_text.split())
+        confidence = min(100, word_count * 2)  # ~50 mots = 100% confiance
+
+        return CreditsAnalysisResult(
+            raw_text=combined_text,
+            confidence=confidence,
+            method="tesseract",
+        )
+
     async def _ocr_with_tesseract(self, frames: list[Path]) -> CreditsAnalysisResult:
         """
         OCR avec Tesseract (gratuit, local).
@@ -308,55 +564,21 @@ class CreditsAnalyzer:
             CreditsAnalysisResult
         """
         try:
-            import pytesseract
-            from PIL import Image, ImageEnhance, ImageFilter
+            import numpy  # noqa: F401
+            import pytesseract  # noqa: F401
+            from PIL import Image  # noqa: F401
         except ImportError:
-            logger.warning("pytesseract ou PIL non installe")
+            logger.warning("pytesseract, PIL ou numpy non installe")
             return CreditsAnalysisResult(method="tesseract")
 
-        all_text = []
-        for frame_path in frames:
-            try:
-                # Charger l'image
-                img = Image.open(frame_path)
-
-                # Upscaler si basse resolution (720p ou moins)
-                if img.height < 800:
-                    scale_factor = 2
-                    img = img.resize(
-                        (img.width * scale_factor, img.height * scale_factor),
-                        Image.Resampling.LANCZOS
-                    )
-
-                # Convertir en niveaux de gris
-                img = img.convert("L")
-
-                # Augmenter le contraste
-                enhancer = ImageEnhance.Contrast(img)
-                img = enhancer.enhance(2.0)
-
-                # Binarisation avec seuil adaptatif (Otsu-like)
-                pixels = list(img.getdata())
-                threshold = sum(pixels) // len(pixels)
-                img = img.point(lambda p: 255 if p > threshold else 0)
-
-                # Detecter si texte clair sur fond sombre (inverser si necessaire)
-                white_pixels = sum(1 for p in img.getdata() if p > 127)
-                if white_pixels < len(pixels) // 2:
-                    img = img.point(lambda p: 255 - p)
-
-                # OCR avec langues francais + anglais
-                # PSM 6 = bloc de texte uniforme (bon pour generiques)
-                text = pytesseract.image_to_string(
-                    img, lang="fra+eng",
-                    config="--psm 6"
-                )
-                if text.strip():
-                    all_text.append(text)
+        frames = await asyncio.to_thread(_distinct_frames, frames)
 
-            except Exception as e:
-                logger.debug(f"Erreur OCR frame {frame_path}: {e}")
-                continue
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=max(1, min(DEFAULT_OCR_WORKERS, len(frames)))) as pool:
+            texts = await asyncio.gather(
+                *(loop.run_in_executor(pool, _ocr_frame_tesseract, frame) for frame in frames)
+            )
+        all_text = [text for text in texts if text.strip()]
 
         combined_text = "\n".join(all_text)
 
@@ -389,12 +611,30 @@ class CreditsAnalyzer:
         # Initialiser le reader une seule fois (lent au premier appel)
         if self._easyocr_reader is None:
             logger.debug("Initialisation EasyOCR (peut prendre quelques secondes)...")
-            self._easyocr_reader = easyocr.Reader(
+            self._easyocr_reader = await asyncio.to_thread(
+                easyocr.Reader,
                 ["fr", "en"],
                 gpu=False,  # CPU par defaut, plus compatible
-                verbose=False
+                verbose=False,
             )
 
+        frames = await asyncio.to_thread(_distinct_frames, frames)
+        all_text = await asyncio.to_thread(self._read_frames_easyocr, frames)
+
+        combined_text = "\n".join(all_text)
+
+        # Estimer la confiance basee sur la quantite de texte lisible
+        word_count = len(combined_text.split())
+        confidence = min(100, word_count * 2)  # ~50 mots = 100% confiance
+
+        return CreditsAnalysisResult(
+            raw_text=combined_text,
+            confidence=confidence,
+            method="easyocr",
+        )
+
+    def _read_frames_easyocr(self, frames: list[Path]) -> list[str]:
+        """Lit les frames avec EasyOCR (bloquant, execute hors event loop)."""
         all_text = []
         for frame_path in frames:
             try:
@@ -409,18 +649,7 @@ class CreditsAnalyzer:
             except Exception as e:
                 logger.debug(f"Erreur EasyOCR frame {frame_path}: {e}")
                 continue
-
-        combined_text = "\n".join(all_text)
-
-        # Estimer la confiance basee sur la quantite de texte lisible
-        word_count = len(combined_text.split())
-        confidence = min(100, word_count * 2)  # ~50 mots = 100% confiance
-
-        return CreditsAnalysisResult(
-            raw_text=combined_text,
-            confidence=confidence,
-            method="easyocr",
-        )
+        return all_text
 
     async def _ocr_with_claude(self, frames: list[Path]) -> CreditsAnalysisResult:
         """
@@ -477,7 +706,8 @@ Si tu ne trouves pas d'information, indique "Non trouve"."""
 
         try:
             client = anthropic.Anthropic(api_key=self._api_key)
-            response = client.messages.create(
+            response = await asyncio.to_thread(
+                client.messages.create,
                 model="claude-sonnet-4-20250514",
                 max_tokens=500,
                 messages=[{
@@ -598,3 +828,139 @@ Si tu ne trouves pas d'information, indique "Non trouve"."""
                 return True
 
         return False
+
+
+# ----------------------------------------------------------------------
+# Pretraitement et OCR d'une frame (fonctions executees dans les workers)
+# ----------------------------------------------------------------------
+
+
+def _average_hash(image) -> int:
+    """
+    Hash perceptuel moyen (aHash 8x8) d'une image PIL.
+
+    Chaque bit vaut 1 si le pixel de la miniature 8x8 en niveaux de gris
+    est plus clair que la moyenne.
+    """
+    from PIL import Image
+
+    thumb = image.convert("L").resize((8, 8), Image.Resampling.BILINEAR)
+    pixels = list(thumb.getdata())  # 64 valeurs
+    mean = sum(pixels) / len(pixels)
+    bits = 0
+    for pixel in pixels:
+        bits = (bits << 1) | (pixel > mean)
+    return bits
+
+
+def _file_average_hash(frame_path: Path) -> Optional[int]:
+    """aHash d'une frame sur disque, None si l'image est illisible."""
+    from PIL import Image
+
+    try:
+        with Image.open(frame_path) as img:
+            return _average_hash(img)
+    except Exception:
+        return None
+
+
+def _is_duplicate(frame_hash: Optional[int], last_hash: Optional[int]) -> bool:
+    """Vrai si deux hash de frames designent des images quasi identiques."""
+    return (
+        frame_hash is not None
+        and last_hash is not None
+        and (frame_hash ^ last_hash).bit_count() <= DUPLICATE_FRAME_DISTANCE
+    )
+
+
+def _distinct_frames(frames: list[Path]) -> list[Path]:
+    """
+    Ecarte les frames quasi identiques a la precedente frame retenue.
+
+    Un generique fixe ou qui defile lentement produit des frames
+    successives identiques : les OCR une seule fois.
+    """
+    kept: list[Path] = []
+    last_hash: Optional[int] = None
+    for frame in frames:
+        frame_hash = _file_average_hash(frame)
+        if _is_duplicate(frame_hash, last_hash):
+            continue
+        kept.append(frame)
+        last_hash = frame_hash
+    if len(kept) < len(frames):
+        logger.debug(f"{len(frames) - len(kept)} frames quasi identiques ignorees")
+    return kept
+
+
+def _otsu_threshold(histogram) -> int:
+    """
+    Seuil d'Otsu d'un histogramme 256 niveaux (tableau NumPy).
+
+    Maximise la variance inter-classes entre pixels sombres (<= seuil)
+    et clairs (> seuil).
+    """
+    import numpy as np
+
+    hist = np.asarray(histogram, dtype=np.float64)
+    levels = np.arange(hist.size, dtype=np.float64)
+    weight_dark = np.cumsum(hist)
+    weight_light = weight_dark[-1] - weight_dark
+    sum_dark = np.cumsum(hist * levels)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_dark = sum_dark / weight_dark
+        mean_light = (sum_dark[-1] - sum_dark) / weight_light
+        between = weight_dark * weight_light * (mean_dark - mean_light) ** 2
+    return int(np.argmax(np.nan_to_num(between)))
+
+
+def _preprocess_frame(image):
+    """
+    Prepare une frame (image PIL) pour Tesseract : texte noir sur fond blanc.
+
+    Upscale x2 des basses resolutions, niveaux de gris, contraste,
+    binarisation au seuil d'Otsu et inversion si le fond est sombre.
+    """
+    import numpy as np
+    from PIL import Image, ImageEnhance
+
+    # Upscaler si basse resolution (720p ou moins)
+    if image.height < 800:
+        image = image.resize((image.width * 2, image.height * 2), Image.Resampling.LANCZOS)
+    image = ImageEnhance.Contrast(image.convert("L")).enhance(2.0)
+
+    pixels = np.asarray(image)
+    threshold = _otsu_threshold(np.bincount(pixels.ravel(), minlength=256))
+    binary = np.where(pixels > threshold, 255, 0).astype(np.uint8)
+
+    # Texte clair sur fond sombre (majorite de noir) : inverser
+    if np.count_nonzero(binary) < binary.size // 2:
+        binary = 255 - binary
+    return Image.fromarray(binary)
+
+
+def _ocr_image_tesseract(image) -> str:
+    """OCR Tesseract d'une image PIL (francais + anglais), chaine vide si echec."""
+    import pytesseract
+
+    try:
+        # PSM 6 = bloc de texte uniforme (bon pour generiques)
+        return pytesseract.image_to_string(
+            _preprocess_frame(image), lang="fra+eng", config="--psm 6"
+        )
+    except Exception as e:
+        logger.debug(f"Erreur OCR frame: {e}")
+        return ""
+
+
+def _ocr_frame_tesseract(frame_path: Path) -> str:
+    """OCR Tesseract d'une frame sur disque, chaine vide si echec."""
+    from PIL import Image
+
+    try:
+        with Image.open(frame_path) as img:
+            img.load()
+    except Exception as e:
+        logger.debug(f"Erreur OCR frame {frame_path}: {e}")
+        return ""
+    return _ocr_image_tesseract(img)
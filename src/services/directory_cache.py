@@ -0,0 +1,149 @@
+"""
+Cache des listings de repertoires pour la resolution des destinations.
+
+Le calcul des destinations (organizer, planificateur de subdivision) descend
+l'arborescence video/ en relisant les memes repertoires (Films/Genre,
+subdivisions lettres) pour chaque fichier d'un batch. Ce cache memorise le
+listing trie de chaque repertoire visite (un seul scandir par repertoire),
+et le transferer l'invalide apres chaque mkdir/deplacement/symlink.
+
+Une duree de vie (ttl) borne l'obsolescence face aux modifications externes
+lorsque le cache est partage par un processus long (serveur web).
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+DEFAULT_DIRECTORY_CACHE_TTL = 30.0
+
+
+class DirectoryEntry(NamedTuple):
+    """
+    Element d'un listing de repertoire.
+
+    Attributs :
+        path: Chemin complet de l'element.
+        is_dir: True si repertoire (symlinks suivis, comme Path.is_dir).
+        is_symlink: True si l'element est un lien symbolique.
+    """
+
+    path: Path
+    is_dir: bool
+    is_symlink: bool
+
+
+def _scan_directory(directory: Path) -> Optional[list[DirectoryEntry]]:
+    """
+    Liste un repertoire via scandir, trie par nom.
+
+    Returns:
+        Liste des elements, ou None si le repertoire n'existe pas.
+    """
+    entries: list[DirectoryEntry] = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                entries.append(
+                    DirectoryEntry(directory / entry.name, is_dir, entry.is_symlink())
+                )
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    entries.sort(key=lambda e: e.path.name)
+    return entries
+
+
+class DirectoryCache:
+    """
+    Cache thread-safe des listings de repertoires.
+
+    Exemple:
+        cache = DirectoryCache()
+        for subdir in cache.subdirs(genre_dir):
+            ...
+        cache.invalidate(new_dir)  # apres un mkdir
+    """
+
+    def __init__(self, ttl: Optional[float] = DEFAULT_DIRECTORY_CACHE_TTL) -> None:
+        """
+        Initialise le cache.
+
+        Args:
+            ttl: Duree de validite d'un listing en secondes (None = illimitee).
+        """
+        self._ttl = ttl
+        self._listings: dict[Path, tuple[float, Optional[list[DirectoryEntry]]]] = {}
+        self._lock = threading.Lock()
+
+    def entries(self, directory: Path) -> list[DirectoryEntry]:
+        """Retourne les elements du repertoire (liste vide s'il n'existe pas)."""
+        return self._listing(Path(directory)) or []
+
+    def subdirs(self, directory: Path) -> list[Path]:
+        """Retourne les sous-repertoires tries par nom."""
+        return [e.path for e in self.entries(directory) if e.is_dir]
+
+    def is_dir(self, directory: Path) -> bool:
+        """Indique si le chemin est un repertoire listable."""
+        return self._listing(Path(directory)) is not None
+
+    def invalidate(self, path: Path) -> None:
+        """
+        Invalide les listings affectes par une modification de path.
+
+        Supprime le listing de path, ceux de ses ancetres (mkdir parents=True,
+        nouvel element) et ceux de ses descendants (repertoire deplace).
+        """
+        path = Path(path)
+        with self._lock:
+            stale = [
+                cached
+                for cached in self._listings
+                if cached == path or cached in path.parents or path in cached.parents
+            ]
+            for cached in stale:
+                del self._listings[cached]
+
+    def clear(self) -> None:
+        """Vide le cache."""
+        with self._lock:
+            self._listings.clear()
+
+    def _listing(self, directory: Path) -> Optional[list[DirectoryEntry]]:
+        """Retourne le listing depuis le cache, en le (re)lisant si necessaire."""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._listings.get(directory)
+        if cached is not None and (self._ttl is None or now - cached[0] < self._ttl):
+            return cached[1]
+
+        listing = _scan_directory(directory)
+        with self._lock:
+            self._listings[directory] = (now, listing)
+        return listing
+
+
+def list_subdirs(directory: Path, cache: Optional[DirectoryCache] = None) -> list[Path]:
+    """
+    Liste les sous-repertoires tries, via le cache si fourni.
+
+    Sans cache, le repertoire est lu une seule fois (scandir).
+    """
+    if cache is not None:
+        return cache.subdirs(directory)
+    return [e.path for e in _scan_directory(Path(directory)) or [] if e.is_dir]
+
+
+def list_entries(
+    directory: Path, cache: Optional[DirectoryCache] = None
+) -> list[DirectoryEntry]:
+    """Liste les elements tries d'un repertoire, via le cache si fourni."""
+    if cache is not None:
+        return cache.entries(directory)
+    return _scan_directory(Path(directory)) or []
@@ -5,15 +5,20 @@ Orchestre l'import de fichiers video existants dans la base de donnees,
 avec detection des doublons par hash et creation des entrees PendingValidation.
 """
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Generator, Optional
+from typing import Callable, Generator, Iterable, Iterator, Optional
+
+from loguru import logger
 
 from src.core.entities.video import PendingValidation, VideoFile
 from src.core.ports.file_system import IFileSystem
 from src.core.ports.parser import IFilenameParser, IMediaInfoExtractor
 from src.core.ports.repositories import IVideoFileRepository
+from src.core.value_objects import MediaInfo
 
 
 class ImportDecision(Enum):
@@ -41,6 +46,35 @@ class ImportResult:
     error_message: Optional[str] = None
 
 
+# Parametres par defaut du mode bulk
+DEFAULT_BULK_WORKERS = 4
+DEFAULT_BULK_BATCH_SIZE = 500
+
+
+@dataclass
+class _HashedFile:
+    """
+    Fichier prepare par un worker du mode bulk.
+
+    Attributs:
+        source: Fichier ou symlink scanne (nom affiche dans le resultat)
+        path: Fichier physique
+        symlink_path: Symlink d'origine (mode --from-symlinks)
+        file_hash: Hash calcule (None si erreur)
+        size_bytes: Taille du fichier physique
+        media_info: Metadonnees techniques (uniquement si hash inconnu)
+        error: Message d'erreur si la preparation a echoue
+    """
+
+    source: Path
+    path: Path
+    symlink_path: Optional[Path] = None
+    file_hash: Optional[str] = None
+    size_bytes: int = 0
+    media_info: Optional[MediaInfo] = None
+    error: Optional[str] = None
+
+
 class ImporterService:
     """
     Service d'import de videotheque existante.
@@ -103,6 +137,11 @@ class ImporterService:
         Yields:
             ImportResult pour chaque fichier traite
         """
+        for file_path in self._iter_library_files(storage_dir):
+            yield self._process_file(file_path)
+
+    def _iter_library_files(self, storage_dir: Path) -> Iterator[Path]:
+        """Liste les fichiers video physiques (hors symlinks et extras)."""
         from src.adapters.file_system import IGNORED_PATTERNS, VIDEO_EXTENSIONS
 
         # Parcourir recursivement le repertoire
@@ -120,8 +159,7 @@ class ImporterService:
             if any(pattern in filename_lower for pattern in IGNORED_PATTERNS):
                 continue
 
-            # Traiter le fichier
-            yield self._process_file(file_path)
+            yield file_path
 
     def _process_file(self, file_path: Path) -> ImportResult:
         """
@@ -281,6 +319,11 @@ class ImporterService:
         Yields:
             ImportResult pour chaque symlink traite
         """
+        for symlink_path in self._iter_symlinks(video_dir):
+            yield self._process_symlink(symlink_path)
+
+    def _iter_symlinks(self, video_dir: Path) -> Iterator[Path]:
+        """Liste les symlinks video (hors extras)."""
         from src.adapters.file_system import IGNORED_PATTERNS, VIDEO_EXTENSIONS
 
         # Parcourir recursivement le repertoire
@@ -302,8 +345,7 @@ class ImporterService:
             if any(pattern in filename_lower for pattern in IGNORED_PATTERNS):
                 continue
 
-            # Traiter le symlink
-            yield self._process_symlink(symlink_path)
+            yield symlink_path
 
     def _process_symlink(self, symlink_path: Path) -> ImportResult:
         """
@@ -425,3 +467,247 @@ class ImporterService:
             filename=symlink_path.name,
             decision=ImportDecision.IMPORT,
         )
+
+    # ------------------------------------------------------------------
+    # Mode bulk : hash en parallele et ecritures par lots
+    # ------------------------------------------------------------------
+
+    def bulk_scan_library(
+        self,
+        storage_dir: Path,
+        workers: int = DEFAULT_BULK_WORKERS,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+    ) -> Generator[ImportResult, None, None]:
+        """
+        Variante bulk de scan_library pour l'import initial d'une grosse videotheque.
+
+        Les fichiers sont hashes dans un pool de threads, les index
+        hash -> fichier et path -> id sont charges une seule fois, et les
+        lignes VideoFile/PendingValidation sont ecrites par lots de
+        batch_size dans une seule transaction (executemany).
+
+        Les decisions sont identiques a scan_library. Un resultat est yield
+        des que la decision est prise ; l'ecriture du lot suit.
+
+        Args:
+            storage_dir: Repertoire de stockage a scanner
+            workers: Nombre de threads de hash/extraction
+            batch_size: Nombre de lignes par transaction
+
+        Yields:
+            ImportResult pour chaque fichier traite
+        """
+        yield from self._bulk_run(
+            (
+                (file_path, file_path, None)
+                for file_path in self._iter_library_files(storage_dir)
+            ),
+            workers,
+            batch_size,
+        )
+
+    def bulk_scan_from_symlinks(
+        self,
+        video_dir: Path,
+        workers: int = DEFAULT_BULK_WORKERS,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+    ) -> Generator[ImportResult, None, None]:
+        """
+        Variante bulk de scan_from_symlinks (meme semantique, ecritures par lots).
+
+        Args:
+            video_dir: Repertoire des symlinks a scanner
+            workers: Nombre de threads de resolution/hash/extraction
+            batch_size: Nombre de lignes par transaction
+
+        Yields:
+            ImportResult pour chaque symlink traite
+        """
+        yield from self._bulk_run(
+            (
+                (symlink_path, None, symlink_path)
+                for symlink_path in self._iter_symlinks(video_dir)
+            ),
+            workers,
+            batch_size,
+        )
+
+    def _bulk_run(
+        self,
+        items: Iterable[tuple[Path, Optional[Path], Optional[Path]]],
+        workers: int,
+        batch_size: int,
+    ) -> Generator[ImportResult, None, None]:
+        """Boucle commune du mode bulk : prepare, decide et ecrit par lots."""
+        by_hash, by_path = self._video_file_repo.load_import_index()
+        batch = _BulkBatch()
+
+        def prepare(item: tuple[Path, Optional[Path], Optional[Path]]) -> _HashedFile:
+            source, path, symlink_path = item
+            return self._prepare_bulk_file(source, path, symlink_path, by_hash)
+
+        workers = max(1, workers)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Fenetre bornee de taches en vol (pool.map consommerait tout le
+            # generateur de fichiers avant le premier resultat)
+            in_flight: deque = deque()
+            for item in items:
+                in_flight.append(pool.submit(prepare, item))
+                if len(in_flight) < workers * 2:
+                    continue
+                yield self._bulk_decide(in_flight.popleft().result(), by_hash, by_path, batch)
+                if len(batch) >= batch_size:
+                    self._flush_bulk_batch(batch)
+            while in_flight:
+                yield self._bulk_decide(in_flight.popleft().result(), by_hash, by_path, batch)
+                if len(batch) >= batch_size:
+                    self._flush_bulk_batch(batch)
+
+        self._flush_bulk_batch(batch)
+
+    def _prepare_bulk_file(
+        self,
+        source: Path,
+        path: Optional[Path],
+        symlink_path: Optional[Path],
+        known_hashes: dict[str, VideoFile],
+    ) -> _HashedFile:
+        """
+        Travail d'un worker : resolution, hash, taille et mediainfo.
+
+        L'extraction mediainfo (couteuse) est sautee pour les hash deja connus,
+        qui ne menent jamais a un import.
+        """
+        try:
+            if path is None:
+                try:
+                    path = source.resolve()
+                except OSError as e:
+                    return _HashedFile(source, source, error=f"Symlink casse: {e}")
+                if not path.exists():
+                    return _HashedFile(
+                        source, path, error=f"Cible introuvable: {path}"
+                    )
+                if path.is_symlink():
+                    return _HashedFile(
+                        source, path, error="Cible est aussi un symlink"
+                    )
+
+            prepared = _HashedFile(
+                source=source,
+                path=path,
+                symlink_path=symlink_path,
+                file_hash=self._compute_hash_fn(path),
+                size_bytes=self._file_system.get_size(path),
+            )
+            if prepared.file_hash not in known_hashes:
+                prepared.media_info = self._media_info_extractor.extract(path)
+            return prepared
+        except Exception as e:
+            return _HashedFile(source, source, error=str(e))
+
+    def _bulk_decide(
+        self,
+        prepared: _HashedFile,
+        by_hash: dict[str, VideoFile],
+        by_path: dict[str, int],
+        batch: "_BulkBatch",
+    ) -> ImportResult:
+        """
+        Applique les regles de _should_import sur les index en memoire.
+
+        Les index sont mis a jour au fil de l'eau pour que les doublons
+        d'un meme lot soient traites comme en mode unitaire.
+        """
+        filename = prepared.source.name
+        if prepared.error:
+            return ImportResult(
+                filename=filename,
+                decision=ImportDecision.ERROR,
+                error_message=prepared.error,
+            )
+
+        existing = by_hash.get(prepared.file_hash)
+        if existing is not None:
+            if existing.path != prepared.path:
+                existing.path = prepared.path
+                if prepared.symlink_path:
+                    existing.symlink_path = prepared.symlink_path
+                batch.move(existing)
+                return ImportResult(
+                    filename=filename, decision=ImportDecision.UPDATE_PATH
+                )
+            if prepared.symlink_path and not existing.symlink_path:
+                existing.symlink_path = prepared.symlink_path
+                batch.move(existing)
+                return ImportResult(
+                    filename=filename, decision=ImportDecision.UPDATE_PATH
+                )
+            return ImportResult(
+                filename=filename, decision=ImportDecision.SKIP_KNOWN
+            )
+
+        media_info = prepared.media_info
+        if media_info is None:
+            # Hash apparu dans le lot apres la preparation du worker
+            media_info = self._media_info_extractor.extract(prepared.path)
+
+        video_file = VideoFile(
+            path=prepared.path,
+            symlink_path=prepared.symlink_path,
+            filename=prepared.path.name,
+            size_bytes=prepared.size_bytes,
+            file_hash=prepared.file_hash,
+            media_info=media_info,
+        )
+        known_id = by_path.get(str(prepared.path))
+        if known_id is not None:
+            # Meme path mais hash different -> fichier modifie, re-importer
+            video_file.id = str(known_id)
+            batch.modified.append(video_file)
+        else:
+            batch.new.append(video_file)
+        by_hash[prepared.file_hash] = video_file
+        return ImportResult(filename=filename, decision=ImportDecision.IMPORT)
+
+    def _flush_bulk_batch(self, batch: "_BulkBatch") -> None:
+        """Ecrit le lot courant en une transaction (sauf dry-run) puis le vide."""
+        if not len(batch):
+            return
+        if not self._dry_run:
+            moved = list(batch.moved.values())
+            # bulk_import renseigne l'ID des nouveaux fichiers (SELECT borne aux
+            # paths du lot), ce qui permet les mises a jour depuis les lots suivants
+            self._video_file_repo.bulk_import(batch.new, moved, batch.modified)
+            logger.debug(
+                f"Import bulk: lot ecrit ({len(batch.new)} nouveaux, "
+                f"{len(moved)} deplaces, {len(batch.modified)} modifies)"
+            )
+        batch.clear()
+
+
+class _BulkBatch:
+    """Lignes accumulees entre deux ecritures du mode bulk."""
+
+    def __init__(self) -> None:
+        self.new: list[VideoFile] = []
+        self.modified: list[VideoFile] = []
+        self.moved: dict[str, VideoFile] = {}
+
+    def move(self, video_file: VideoFile) -> None:
+        """
+        Enregistre un changement de path/symlink d'un fichier deja en BDD.
+
+        Un fichier du lot courant (sans ID) est modifie en place avant insertion.
+        """
+        if video_file.id:
+            self.moved[video_file.id] = video_file
+
+    def __len__(self) -> int:
+        return len(self.new) + len(self.modified) + len(self.moved)
+
+    def clear(self) -> None:
+        """Vide le lot apres ecriture."""
+        self.new = []
+        self.modified = []
+        self.moved = {}
@@ -14,6 +14,8 @@ Il est reexporte ici pour compatibilite des imports existants.
 """
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -23,6 +25,42 @@ from typing import Any, Optional
 from loguru import logger
 
 
+def walk_video_files(root: Path, extensions: frozenset[str]) -> set[str]:
+    """
+    Parcourt une arborescence une seule fois via os.scandir.
+
+    Les symlinks (fichiers et repertoires) sont ignores. Les types d'entree
+    sont lus depuis le resultat de readdir, sans stat supplementaire par
+    fichier, ce qui limite les allers-retours sur un montage reseau.
+
+    Args:
+        root: Repertoire racine a parcourir
+        extensions: Extensions video acceptees (en minuscules)
+
+    Returns:
+        Ensemble des chemins (str) des fichiers video trouves
+    """
+    found: set[str] = set()
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_symlink():
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif os.path.splitext(entry.name)[1].lower() in extensions:
+                            found.add(entry.path)
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.debug(f"Repertoire illisible ignore: {current} ({e})")
+    return found
+
+
 class IssueType(str, Enum):
     """Type d'incoherence detectee."""
 
@@ -224,6 +262,8 @@ class IntegrityChecker:
         video_file_repo: Any,
         storage_dir: Optional[Path] = None,
         video_dir: Optional[Path] = None,
+        stat_workers: int = 1,
+        symlink_index: Any = None,
     ) -> None:
         """
         Initialise le verificateur d'integrite.
@@ -233,11 +273,18 @@ class IntegrityChecker:
             video_file_repo: Repository des fichiers video
             storage_dir: Dossier de stockage physique (optionnel)
             video_dir: Dossier des symlinks video (optionnel)
+            stat_workers: Nombre de threads pour les stat de la passe fantomes
+                (>1 utile sur un montage reseau)
+            symlink_index: Index inverse des symlinks (ISymlinkIndexRepository,
+                optionnel) : les symlinks casses sont cherches dans l'index
+                reconcilie au lieu de resoudre toute l'arborescence video/
         """
         self._file_system = file_system
         self._video_file_repo = video_file_repo
         self._storage_dir = storage_dir
         self._video_dir = video_dir
+        self._stat_workers = max(1, stat_workers)
+        self._symlink_index = symlink_index
 
     def check(self, verify_hash: bool = False) -> IntegrityReport:
         """
@@ -251,16 +298,21 @@ class IntegrityChecker:
         """
         report = IntegrityReport()
 
+        # Chargement unique des chemins connus et parcours unique du stockage,
+        # partages par les passes fantomes et orphelins
+        known_paths = self._load_known_paths()
+        on_disk = self._scan_storage()
+
         # 1. Detecter les entrees fantomes
-        self._check_ghost_entries(report)
+        self._check_ghost_entries(report, known_paths, on_disk)
 
         # 2. Detecter les fichiers orphelins (si storage_dir configure)
         if self._storage_dir:
-            self._check_orphan_files(report)
+            self._check_orphan_files(report, known_paths, on_disk)
 
         # 3. Detecter les symlinks casses (si video_dir configure)
         if self._video_dir:
-            self._check_broken_symlinks(report)
+            self._check_broken_symlinks(report, on_disk)
 
         # 4. Verification hash optionnelle
         if verify_hash:
@@ -271,74 +323,137 @@ class IntegrityChecker:
 
         return report
 
-    def _check_ghost_entries(self, report: IntegrityReport) -> None:
-        """Detecte les entrees BDD sans fichier physique."""
+    def _load_known_paths(self) -> dict[str, int]:
+        """Charge en une requete tous les chemins connus en BDD (path -> id)."""
         try:
             from sqlmodel import select
             from src.infrastructure.persistence.models import VideoFileModel
 
             session = self._video_file_repo._session
-            statement = select(VideoFileModel)
-            models = session.exec(statement).all()
-
-            for model in models:
-                if model.path:
-                    path = Path(model.path)
-                    if not path.exists():
-                        report.issues.append(
-                            IntegrityIssue(
-                                type=IssueType.GHOST_ENTRY,
-                                path=path,
-                                details=f"ID BDD: {model.id}",
-                            )
-                        )
+            statement = select(VideoFileModel.id, VideoFileModel.path)
+            rows = session.exec(statement).all()
+            return {path: model_id for model_id, path in rows if path}
         except Exception as e:
-            logger.warning(f"Erreur lors de la verification des entrees fantomes: {e}")
+            logger.warning(f"Erreur lors du chargement des chemins connus: {e}")
+            return {}
 
-    def _check_orphan_files(self, report: IntegrityReport) -> None:
-        """Detecte les fichiers physiques sans entree BDD."""
+    def _scan_storage(self) -> Optional[set[str]]:
+        """Parcourt le stockage une seule fois. None si storage_dir absent."""
         if not self._storage_dir or not self._storage_dir.exists():
-            return
+            return None
+        return walk_video_files(self._storage_dir, self.VIDEO_EXTENSIONS)
+
+    def _missing_paths(self, paths: list[str]) -> list[str]:
+        """Retourne les chemins inexistants, stat en parallele si configure."""
+        if self._stat_workers <= 1 or len(paths) <= 1:
+            return [p for p in paths if not os.path.exists(p)]
+        with ThreadPoolExecutor(max_workers=self._stat_workers) as pool:
+            exists = pool.map(os.path.exists, paths)
+            return [p for p, ok in zip(paths, exists) if not ok]
+
+    def _check_ghost_entries(
+        self,
+        report: IntegrityReport,
+        known_paths: Optional[dict[str, int]] = None,
+        on_disk: Optional[set[str]] = None,
+    ) -> None:
+        """
+        Detecte les entrees BDD sans fichier physique.
 
-        # Lister tous les fichiers video dans storage
-        for video_file in self._storage_dir.rglob("*"):
-            if video_file.is_dir():
-                continue
-            if video_file.is_symlink():
-                continue
-            if video_file.suffix.lower() not in self.VIDEO_EXTENSIONS:
-                continue
-
-            # Verifier si le fichier existe en BDD
-            existing = self._video_file_repo.get_by_path(video_file)
-            if existing is None:
-                report.issues.append(
-                    IntegrityIssue(
-                        type=IssueType.ORPHAN_FILE,
-                        path=video_file,
-                    )
+        Les chemins vus lors du parcours du stockage sont ecartes par
+        difference d'ensembles ; seuls les chemins restants (hors stockage
+        ou absents du parcours) sont confirmes par un stat.
+        """
+        if known_paths is None:
+            known_paths = self._load_known_paths()
+
+        candidates = [p for p in known_paths if on_disk is None or p not in on_disk]
+        for path in sorted(self._missing_paths(candidates)):
+            report.issues.append(
+                IntegrityIssue(
+                    type=IssueType.GHOST_ENTRY,
+                    path=Path(path),
+                    details=f"ID BDD: {known_paths[path]}",
                 )
+            )
 
-    def _check_broken_symlinks(self, report: IntegrityReport) -> None:
+    def _check_orphan_files(
+        self,
+        report: IntegrityReport,
+        known_paths: Optional[dict[str, int]] = None,
+        on_disk: Optional[set[str]] = None,
+    ) -> None:
+        """Detecte les fichiers physiques sans entree BDD (difference d'ensembles)."""
+        if on_disk is None:
+            on_disk = self._scan_storage()
+            if on_disk is None:
+                return
+        if known_paths is None:
+            known_paths = self._load_known_paths()
+
+        for path in sorted(on_disk.difference(known_paths)):
+            report.issues.append(
+                IntegrityIssue(
+                    type=IssueType.ORPHAN_FILE,
+                    path=Path(path),
+                )
+            )
+
+    def _check_broken_symlinks(
+        self, report: IntegrityReport, on_disk: Optional[set[str]] = None
+    ) -> None:
         """Detecte les symlinks casses dans video/."""
         if not self._video_dir or not self._video_dir.exists():
             return
+        report.issues.extend(self.broken_symlink_issues(self._video_dir, on_disk))
 
-        broken_links = self._file_system.find_broken_links(self._video_dir)
-        for link in broken_links:
-            # Recuperer la cible originale (meme si cassee)
-            try:
-                original_target = link.readlink()
-            except OSError:
-                original_target = Path("<inconnu>")
+    def broken_symlink_issues(
+        self, directory: Path, on_disk: Optional[set[str]] = None
+    ) -> list[IntegrityIssue]:
+        """
+        Liste les symlinks casses sous un repertoire.
 
-            report.issues.append(
-                IntegrityIssue(
-                    type=IssueType.BROKEN_SYMLINK,
-                    path=link,
-                    details=str(original_target),
-                )
+        Avec l'index inverse, l'index est reconcilie (seuls les repertoires
+        modifies sont relus) puis chaque cible absente du parcours du
+        stockage (on_disk) est confirmee par un stat, en parallele si
+        configure. Sinon, l'arborescence est parcourue et chaque lien resolu.
+
+        Args:
+            directory: Repertoire de symlinks (video/ ou un sous-repertoire)
+            on_disk: Fichiers vus lors du parcours du stockage (optionnel)
+
+        Returns:
+            Une IntegrityIssue BROKEN_SYMLINK par lien casse
+        """
+        if self._symlink_index is None:
+            broken = []
+            for link in self._file_system.find_broken_links(directory):
+                # Recuperer la cible originale (meme si cassee)
+                try:
+                    broken.append((link, str(link.readlink())))
+                except OSError:
+                    broken.append((link, "<inconnu>"))
+        else:
+            from src.services.symlink_index import reconcile_symlink_index
+
+            reconcile_symlink_index(self._symlink_index, directory)
+            entries = self._symlink_index.entries(directory)
+            targets = {str(entry.target_path) for entry in entries}
+            missing = set(self._missing_paths(sorted(targets - (on_disk or set()))))
+            broken = [
+                (entry.symlink_path, str(entry.target_path))
+                for entry in entries
+                if str(entry.target_path) in missing
+            ]
+
+        return [
+            IntegrityIssue(
+                type=IssueType.BROKEN_SYMLINK,
+                path=link,
+                details=target,
             )
+            for link, target in broken
+        ]
 
     def _verify_hashes(self, report: IntegrityReport) -> None:
         """Verifie les hash des fichiers (optionnel, lent)."""
@@ -371,6 +486,7 @@ class IntegrityChecker:
 
 
 __all__ = [
+    "walk_video_files",
     "IssueType",
     "RepairActionType",
     "IntegrityIssue",
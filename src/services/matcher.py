@@ -9,16 +9,33 @@ Formules de scoring:
 - Series: 100% titre
 
 Le scoring est deterministe pour des resultats reproductibles.
+
+Le score de titre d'une liste de candidats (score_results) est calcule en
+un seul appel rapidfuzz.process.extract : le titre recherche n'est
+normalise qu'une fois pour tous les titres localises et originaux.
 """
 
+from collections.abc import Sequence
 from dataclasses import replace
+from functools import lru_cache
 
-from rapidfuzz import fuzz, utils
+from rapidfuzz import fuzz, process, utils
 
 from src.core.ports.api_clients import SearchResult
 from src.utils.helpers import normalize_accents as _normalize_accents
 
 
+@lru_cache(maxsize=4096)
+def _normalize_title(title: str) -> str:
+    """
+    Normalise un titre pour le scoring.
+
+    Accents supprimes puis default_process (minuscules, ponctuation et
+    espaces superflus retires) : "Les Évadés" -> "les evades".
+    """
+    return utils.default_process(_normalize_accents(title))
+
+
 def _calculate_title_score(query_title: str, candidate_title: str) -> float:
     """
     Calculate title similarity score (0-100).
@@ -28,15 +45,35 @@ def _calculate_title_score(query_title: str, candidate_title: str) -> float:
     Les accents sont normalises pour une comparaison insensible aux diacritiques
     (ex: "Les Evades" vs "Les Évadés" = 100%).
     """
-    # Normaliser les accents avant comparaison
-    query_normalized = _normalize_accents(query_title)
-    candidate_normalized = _normalize_accents(candidate_title)
-
     return fuzz.token_sort_ratio(
-        query_normalized, candidate_normalized, processor=utils.default_process
+        _normalize_title(query_title), _normalize_title(candidate_title)
     )
 
 
+def _calculate_title_scores(
+    query_title: str, candidate_titles: Sequence[str]
+) -> list[float]:
+    """
+    Score un titre contre plusieurs candidats en un seul appel rapidfuzz.
+
+    Memes scores que _calculate_title_score pour chaque candidat, mais le
+    titre recherche n'est normalise et prepare qu'une fois.
+
+    Returns:
+        Scores (0-100) dans l'ordre des candidats
+    """
+    scores = [0.0] * len(candidate_titles)
+    matches = process.extract(
+        _normalize_title(query_title),
+        [_normalize_title(title) for title in candidate_titles],
+        scorer=fuzz.token_sort_ratio,
+        limit=None,
+    )
+    for _, score, index in matches:
+        scores[index] = score
+    return scores
+
+
 def _calculate_year_score(
     query_year: int | None, candidate_year: int | None
 ) -> float:
@@ -125,6 +162,19 @@ def calculate_movie_score(
         original_title_score = _calculate_title_score(query_title, candidate_original_title)
         title_score = max(title_score, original_title_score)
 
+    return _combine_movie_score(
+        title_score, query_year, query_duration, candidate_year, candidate_duration
+    )
+
+
+def _combine_movie_score(
+    title_score: float,
+    query_year: int | None,
+    query_duration: int | None,
+    candidate_year: int | None,
+    candidate_duration: int | None,
+) -> float:
+    """Combine le score de titre avec l'annee et la duree (voir calculate_movie_score)."""
     year_score = _calculate_year_score(query_year, candidate_year)
 
     # Verifier si la duree est disponible des deux cotes
@@ -209,21 +259,30 @@ class MatcherService:
         if not results:
             return []
 
+        # Tous les titres (localises puis originaux) scores en un appel
+        originals = [
+            (i, result.original_title)
+            for i, result in enumerate(results)
+            if result.original_title
+        ]
+        title_scores = _calculate_title_scores(
+            query_title,
+            [result.title for result in results] + [title for _, title in originals],
+        )
+        for offset, (i, _) in enumerate(originals, start=len(results)):
+            title_scores[i] = max(title_scores[i], title_scores[offset])
+
         scored_results = []
-        for result in results:
+        for result, title_score in zip(results, title_scores):
             if is_series:
-                score = calculate_series_score(
-                    query_title, result.title, result.original_title
-                )
+                score = round(title_score, 2)
             else:
-                score = calculate_movie_score(
-                    query_title=query_title,
+                score = _combine_movie_score(
+                    title_score,
                     query_year=query_year,
                     query_duration=query_duration,
-                    candidate_title=result.title,
                     candidate_year=result.year,
                     candidate_duration=None,  # API results don't have duration
-                    candidate_original_title=result.original_title,
                 )
 
             # Create new SearchResult with updated score
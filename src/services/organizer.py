@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Optional
 
 from src.core.entities.media import Movie, Series
+from src.services.directory_cache import DirectoryCache, list_subdirs
 from src.utils.constants import GENRE_HIERARCHY, GENRE_FOLDER_MAPPING
 from src.utils.helpers import strip_article as _strip_article  # noqa: F401
 from src.utils.helpers import strip_invisible_chars as _strip_invisible_chars_helper
@@ -292,7 +293,16 @@ def _title_matches_range(title: str, range_name: str) -> bool:
     return _letter_matches_range(first_letter, range_name)
 
 
-def _find_matching_subdir(parent: Path, title: str) -> Optional[Path]:
+def _dir_exists(path: Path, cache: Optional[DirectoryCache] = None) -> bool:
+    """Vérifie l'existence d'un répertoire, via le cache si fourni."""
+    if cache is not None:
+        return cache.is_dir(path)
+    return path.exists()
+
+
+def _find_matching_subdir(
+    parent: Path, title: str, cache: Optional[DirectoryCache] = None
+) -> Optional[Path]:
     """
     Trouve le sous-répertoire correspondant à un titre.
 
@@ -304,37 +314,31 @@ def _find_matching_subdir(parent: Path, title: str) -> Optional[Path]:
     Args:
         parent: Répertoire parent à explorer.
         title: Titre pour le matching.
+        cache: Cache des listings partagé (optionnel). Sans cache,
+            le parent est lu une seule fois pour les trois passages.
 
     Returns:
         Chemin du sous-répertoire correspondant, ou None si non trouvé.
     """
-    if not parent.exists() or not parent.is_dir():
+    subdirs = list_subdirs(parent, cache)
+    if not subdirs:
         return None
 
     letter = get_sort_letter(title)
 
     # Premier passage : chercher les plages (plus spécifiques)
-    for subdir in sorted(parent.iterdir()):
-        if not subdir.is_dir():
-            continue
-
+    for subdir in subdirs:
         # Préférer les plages de préfixes (Sa-So, Di-Dz, etc.)
         if _title_matches_range(title, subdir.name):
             return subdir
 
     # Deuxième passage : chercher les répertoires de préfixe de titre
-    for subdir in sorted(parent.iterdir()):
-        if not subdir.is_dir():
-            continue
-
+    for subdir in subdirs:
         if _title_matches_prefix_dir(title, subdir.name):
             return subdir
 
     # Troisième passage : chercher les lettres simples (fallback)
-    for subdir in sorted(parent.iterdir()):
-        if not subdir.is_dir():
-            continue
-
+    for subdir in subdirs:
         # Lettre simple exacte (S, D, etc.)
         if _letter_matches_range(letter, subdir.name):
             return subdir
@@ -342,7 +346,9 @@ def _find_matching_subdir(parent: Path, title: str) -> Optional[Path]:
     return None
 
 
-def _navigate_to_leaf(start_dir: Path, title: str) -> Path:
+def _navigate_to_leaf(
+    start_dir: Path, title: str, cache: Optional[DirectoryCache] = None
+) -> Path:
     """
     Navigue dans l'arborescence jusqu'au répertoire feuille.
 
@@ -353,6 +359,7 @@ def _navigate_to_leaf(start_dir: Path, title: str) -> Path:
     Args:
         start_dir: Répertoire de départ.
         title: Titre pour guider la navigation.
+        cache: Cache des listings partagé (optionnel).
 
     Returns:
         Chemin du répertoire feuille approprié.
@@ -361,7 +368,7 @@ def _navigate_to_leaf(start_dir: Path, title: str) -> Path:
 
     while True:
         # Chercher un sous-répertoire correspondant
-        matching = _find_matching_subdir(current, title)
+        matching = _find_matching_subdir(current, title, cache)
 
         if matching is None:
             # Aucun sous-répertoire ne correspond, on est à la feuille
@@ -372,7 +379,12 @@ def _navigate_to_leaf(start_dir: Path, title: str) -> Path:
     return current
 
 
-def get_movie_destination(movie: Movie, storage_dir: Path, video_dir: Path) -> Path:
+def get_movie_destination(
+    movie: Movie,
+    storage_dir: Path,
+    video_dir: Path,
+    cache: Optional[DirectoryCache] = None,
+) -> Path:
     """
     Calcule le chemin de destination pour un film dans storage.
 
@@ -386,12 +398,13 @@ def get_movie_destination(movie: Movie, storage_dir: Path, video_dir: Path) -> P
         movie: Métadonnées du film.
         storage_dir: Répertoire racine de stockage.
         video_dir: Répertoire racine des symlinks (structure maître).
+        cache: Cache des listings partagé (optionnel).
 
     Returns:
         Chemin de destination (répertoire, pas le fichier).
     """
     # Naviguer dans video_dir pour déterminer le chemin
-    video_path = get_movie_video_destination(movie, video_dir)
+    video_path = get_movie_video_destination(movie, video_dir, cache)
 
     # Convertir le chemin video en chemin storage
     # video_path est relatif à video_dir, on le transpose vers storage_dir
@@ -399,7 +412,9 @@ def get_movie_destination(movie: Movie, storage_dir: Path, video_dir: Path) -> P
     return storage_dir / relative_path
 
 
-def get_movie_video_destination(movie: Movie, video_dir: Path) -> Path:
+def get_movie_video_destination(
+    movie: Movie, video_dir: Path, cache: Optional[DirectoryCache] = None
+) -> Path:
     """
     Calcule le chemin de symlink pour un film.
 
@@ -409,6 +424,7 @@ def get_movie_video_destination(movie: Movie, video_dir: Path) -> Path:
     Args:
         movie: Métadonnées du film (avec genres).
         video_dir: Répertoire racine des symlinks.
+        cache: Cache des listings partagé (optionnel).
 
     Returns:
         Chemin de destination pour le symlink.
@@ -421,12 +437,12 @@ def get_movie_video_destination(movie: Movie, video_dir: Path) -> Path:
     genre_dir = video_dir / "Films" / genre_folder
 
     # Si le répertoire genre n'existe pas, le créer avec la lettre
-    if not genre_dir.exists():
+    if not _dir_exists(genre_dir, cache):
         letter = get_sort_letter(movie.title)
         return genre_dir / letter
 
     # Naviguer dans les subdivisions jusqu'à la feuille
-    return _navigate_to_leaf(genre_dir, movie.title)
+    return _navigate_to_leaf(genre_dir, movie.title, cache)
 
 
 def get_series_type(genres: tuple[str, ...]) -> str:
@@ -467,6 +483,7 @@ def get_series_destination(
     season_number: int,
     storage_dir: Path,
     video_dir: Path,
+    cache: Optional[DirectoryCache] = None,
 ) -> Path:
     """
     Calcule le chemin de destination pour un épisode de série dans storage.
@@ -482,12 +499,13 @@ def get_series_destination(
         season_number: Numéro de saison.
         storage_dir: Répertoire racine de stockage.
         video_dir: Répertoire racine des symlinks (structure maître).
+        cache: Cache des listings partagé (optionnel).
 
     Returns:
         Chemin de destination (répertoire, pas le fichier).
     """
     # Naviguer dans video_dir pour déterminer le chemin
-    video_path = get_series_video_destination(series, season_number, video_dir)
+    video_path = get_series_video_destination(series, season_number, video_dir, cache)
 
     # Convertir le chemin video en chemin storage
     relative_path = video_path.relative_to(video_dir)
@@ -498,6 +516,7 @@ def get_series_video_destination(
     series: Series,
     season_number: int,
     video_dir: Path,
+    cache: Optional[DirectoryCache] = None,
 ) -> Path:
     """
     Calcule le chemin de symlink pour un épisode de série.
@@ -509,6 +528,7 @@ def get_series_video_destination(
         series: Métadonnées de la série (avec genres).
         season_number: Numéro de saison.
         video_dir: Répertoire racine des symlinks.
+        cache: Cache des listings partagé (optionnel).
 
     Returns:
         Chemin de destination pour le symlink.
@@ -529,12 +549,12 @@ def get_series_video_destination(
     type_dir = video_dir / "Séries" / series_type
 
     # Si le répertoire type n'existe pas, utiliser la lettre simple
-    if not type_dir.exists():
+    if not _dir_exists(type_dir, cache):
         letter = get_sort_letter(series.title)
         return type_dir / letter / series_folder / season_folder
 
     # Naviguer récursivement jusqu'à la bonne subdivision
-    letter_dir = _navigate_to_leaf(type_dir, series.title)
+    letter_dir = _navigate_to_leaf(type_dir, series.title, cache)
 
     # Retourner le chemin complet
     return letter_dir / series_folder / season_folder
@@ -547,16 +567,32 @@ class OrganizerService:
     Fournit les méthodes de haut niveau pour calculer les chemins
     de destination des films et séries.
 
-    Ce service est sans état et peut être utilisé comme singleton.
+    Ce service peut être utilisé comme singleton : son seul état est le
+    cache des listings de répertoires, partagé avec le transferer qui
+    l'invalide après chaque création de répertoire ou déplacement.
     """
 
+    def __init__(self, cache: Optional[DirectoryCache] = None) -> None:
+        """
+        Initialise le service.
+
+        Args:
+            cache: Cache des listings de répertoires (optionnel).
+        """
+        self._cache = cache
+
+    @property
+    def cache(self) -> Optional[DirectoryCache]:
+        """Cache des listings de répertoires utilisé par le service."""
+        return self._cache
+
     def get_movie_destination(self, movie: Movie, storage_dir: Path, video_dir: Path) -> Path:
         """
         Calcule le chemin de destination pour un film dans storage.
 
         Voir get_movie_destination() pour les détails.
         """
-        return get_movie_destination(movie, storage_dir, video_dir)
+        return get_movie_destination(movie, storage_dir, video_dir, self._cache)
 
     def get_movie_video_destination(self, movie: Movie, video_dir: Path) -> Path:
         """
@@ -564,7 +600,7 @@ class OrganizerService:
 
         Voir get_movie_video_destination() pour les détails.
         """
-        return get_movie_video_destination(movie, video_dir)
+        return get_movie_video_destination(movie, video_dir, self._cache)
 
     def get_series_destination(
         self,
@@ -578,7 +614,9 @@ class OrganizerService:
 
         Voir get_series_destination() pour les détails.
         """
-        return get_series_destination(series, season_number, storage_dir, video_dir)
+        return get_series_destination(
+            series, season_number, storage_dir, video_dir, self._cache
+        )
 
     def get_series_video_destination(
         self,
@@ -591,7 +629,9 @@ class OrganizerService:
 
         Voir get_series_video_destination() pour les détails.
         """
-        return get_series_video_destination(series, season_number, video_dir)
+        return get_series_video_destination(
+            series, season_number, video_dir, self._cache
+        )
 
     def get_series_type(self, genres: tuple[str, ...]) -> str:
         """
@@ -9,6 +9,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterator, Optional
 
+from loguru import logger
+
 from src.config import Settings
 from src.core.entities.video import VideoFile
 from src.core.ports.file_system import IFileSystem
@@ -100,6 +102,46 @@ class ScannerService:
                     yield from self._scan_directory(source_dir, subdir_name, type_hint)
                     break  # Ne scanner qu'une seule variante
 
+    def scan_file(self, file_path: Path) -> Optional[ScanResult]:
+        """
+        Scanne un seul fichier des telechargements (surveillance continue).
+
+        Applique les memes filtres que scan_downloads (extension, symlink,
+        patterns ignores, taille minimale) ; le type attendu est deduit du
+        sous-repertoire (Films ou Series) qui contient le fichier.
+
+        Args:
+            file_path: Chemin du fichier sous downloads_dir
+
+        Returns:
+            ScanResult, ou None si le fichier n'est pas a traiter
+        """
+        from src.adapters.file_system import IGNORED_PATTERNS, VIDEO_EXTENSIONS
+
+        # Chemins resolus des deux cotes : downloads_dir relatif ou atteint
+        # par un symlink (montage NAS) ; le fichier lui-meme n'est pas resolu
+        downloads_dir = self._settings.downloads_dir.resolve()
+        try:
+            relative = (file_path.parent.resolve() / file_path.name).relative_to(downloads_dir)
+        except (OSError, ValueError):
+            logger.debug(f"Hors de {downloads_dir}, ignore: {file_path}")
+            return None
+        hints = {"Films": MediaType.MOVIE, "Séries": MediaType.SERIES, "Series": MediaType.SERIES}
+        if len(relative.parts) < 2 or relative.parts[0] not in hints:
+            return None
+        if file_path.suffix.lower() not in VIDEO_EXTENSIONS:
+            return None
+        if any(pattern in file_path.name.lower() for pattern in IGNORED_PATTERNS):
+            return None
+        if file_path.is_symlink() or not file_path.is_file():
+            return None
+        min_size_bytes = self._settings.min_file_size_mb * 1024 * 1024
+        if self._file_system.get_size(file_path) < min_size_bytes:
+            return None
+
+        source_name = relative.parts[0]
+        return self._process_file(file_path, source_name, hints[source_name])
+
     def _scan_directory(
         self,
         directory: Path,
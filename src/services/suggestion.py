@@ -0,0 +1,201 @@
+"""
+Moteur de suggestion aleatoire ("Surprends-moi").
+
+Les criteres (type, genre, duree max, note min, eligibilite "non vu ou vu
+et bien note") sont evalues en SQL : seule la liste des identifiants
+eligibles est chargee, puis mise en cache par combinaison de filtres.
+Un tirage pioche un identifiant hors historique et ne charge qu'une ligne.
+
+Le cache est invalide a chaque ecriture ORM d'un film ou d'une serie dans
+le processus (vu/note depuis le web, re-association...). Une duree de vie
+borne l'obsolescence face aux ecritures d'autres processus (import CLI).
+"""
+
+import random
+import threading
+import time
+import weakref
+from typing import NamedTuple, Optional
+
+from sqlalchemy import event, func, or_
+from sqlmodel import Session, select
+
+from src.infrastructure.persistence.models import (
+    MovieGenreModel,
+    MovieModel,
+    SeriesGenreModel,
+    SeriesModel,
+)
+
+DEFAULT_SUGGESTION_CACHE_TTL = 60.0
+
+
+class SuggestionFilters(NamedTuple):
+    """
+    Combinaison de filtres (cle du cache).
+
+    Attributs:
+        type: "all", "movie" ou "series".
+        genre: Genre exact (table de facettes) ou None.
+        max_duration_min: Duree maximale des films en minutes ou None.
+        min_rating: Note minimale (IMDb sinon TMDB) ou None.
+    """
+
+    type: str = "all"
+    genre: Optional[str] = None
+    max_duration_min: Optional[int] = None
+    min_rating: Optional[float] = None
+
+
+SuggestionKey = tuple[str, int]  # ("movie" | "series", id)
+
+# Moteurs vivants, invalides par les listeners ORM (fin du module)
+_live_engines: "weakref.WeakSet[SuggestionEngine]" = weakref.WeakSet()
+
+
+def _eligible_filter(model_class):
+    """Filtre d'eligibilite : non-vus OU deja vus avec note >= 4."""
+    return or_(
+        model_class.watched == False,  # noqa: E712
+        (model_class.watched == True) & (model_class.personal_rating >= 4),  # noqa: E712
+    )
+
+
+def _eligible_movie_ids(session: Session, filters: SuggestionFilters) -> list[int]:
+    stmt = select(MovieModel.id).where(_eligible_filter(MovieModel))
+    if filters.genre:
+        stmt = stmt.where(
+            MovieModel.id.in_(
+                select(MovieGenreModel.movie_id).where(MovieGenreModel.genre == filters.genre)
+            )
+        )
+    if filters.max_duration_min:
+        stmt = stmt.where(MovieModel.duration_seconds <= filters.max_duration_min * 60)
+    if filters.min_rating:
+        stmt = stmt.where(
+            func.coalesce(MovieModel.imdb_rating, MovieModel.vote_average)
+            >= filters.min_rating
+        )
+    return list(session.exec(stmt.order_by(MovieModel.id)).all())
+
+
+def _eligible_series_ids(session: Session, filters: SuggestionFilters) -> list[int]:
+    stmt = select(SeriesModel.id).where(_eligible_filter(SeriesModel))
+    if filters.genre:
+        stmt = stmt.where(
+            SeriesModel.id.in_(
+                select(SeriesGenreModel.series_id).where(
+                    SeriesGenreModel.genre == filters.genre
+                )
+            )
+        )
+    if filters.min_rating:
+        stmt = stmt.where(
+            func.coalesce(SeriesModel.imdb_rating, SeriesModel.vote_average)
+            >= filters.min_rating
+        )
+    return list(session.exec(stmt.order_by(SeriesModel.id)).all())
+
+
+class SuggestionEngine:
+    """
+    Tirage aleatoire indexe avec cache des identifiants eligibles.
+
+    Exemple:
+        engine = SuggestionEngine()
+        filters = SuggestionFilters(type="movie", genre="Drame")
+        key = engine.pick(session, filters, exclude={("movie", 12)})
+        total = engine.count(session, filters)
+    """
+
+    def __init__(self, ttl: Optional[float] = DEFAULT_SUGGESTION_CACHE_TTL) -> None:
+        """
+        Initialise le moteur.
+
+        Args:
+            ttl: Duree de validite d'une liste en secondes (None = illimitee).
+        """
+        self._ttl = ttl
+        self._cache: dict[
+            SuggestionFilters, tuple[float, list[SuggestionKey], frozenset[SuggestionKey]]
+        ] = {}
+        self._lock = threading.Lock()
+        _live_engines.add(self)
+
+    def eligible(self, session: Session, filters: SuggestionFilters) -> list[SuggestionKey]:
+        """Retourne les cles eligibles (depuis le cache si valide)."""
+        return self._eligible(session, filters)[0]
+
+    def _eligible(
+        self, session: Session, filters: SuggestionFilters
+    ) -> tuple[list[SuggestionKey], frozenset[SuggestionKey]]:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._cache.get(filters)
+        if cached is not None and (self._ttl is None or now - cached[0] < self._ttl):
+            return cached[1], cached[2]
+
+        keys: list[SuggestionKey] = []
+        if filters.type in ("all", "movie"):
+            keys.extend(("movie", i) for i in _eligible_movie_ids(session, filters))
+        if filters.type in ("all", "series"):
+            keys.extend(("series", i) for i in _eligible_series_ids(session, filters))
+        keyset = frozenset(keys)
+        with self._lock:
+            self._cache[filters] = (now, keys, keyset)
+        return keys, keyset
+
+    def count(self, session: Session, filters: SuggestionFilters) -> int:
+        """Nombre de candidats eligibles."""
+        return len(self.eligible(session, filters))
+
+    def pick(
+        self,
+        session: Session,
+        filters: SuggestionFilters,
+        exclude: Optional[set[SuggestionKey]] = None,
+        rng: Optional[random.Random] = None,
+    ) -> Optional[SuggestionKey]:
+        """
+        Tire un candidat au hasard, hors exclusions si possible.
+
+        Args:
+            session: Session SQLModel.
+            filters: Combinaison de filtres.
+            exclude: Cles deja proposees (historique).
+            rng: Generateur aleatoire (tests).
+
+        Returns:
+            La cle tiree, ou None si aucun candidat.
+        """
+        keys, keyset = self._eligible(session, filters)
+        if not keys:
+            return None
+        rng = rng or random
+        if exclude:
+            remaining = len(keys) - len(keyset & exclude)
+            if remaining > 0:
+                # Tirage par rang parmi les non-exclus (sans copier la liste)
+                target = rng.randrange(remaining)
+                for key in keys:
+                    if key in exclude:
+                        continue
+                    if target == 0:
+                        return key
+                    target -= 1
+        return keys[rng.randrange(len(keys))]
+
+    def invalidate(self) -> None:
+        """Vide le cache (la videotheque a change)."""
+        with self._lock:
+            self._cache.clear()
+
+
+def _invalidate_all(_mapper, _connection, _target) -> None:
+    for engine in list(_live_engines):
+        engine.invalidate()
+
+
+for _model in (MovieModel, SeriesModel):
+    for _event in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event, _invalidate_all)
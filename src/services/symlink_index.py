@@ -0,0 +1,151 @@
+"""
+Reconciliation de l'index inverse des symlinks avec le disque.
+
+L'index (ISymlinkIndexRepository) est tenu a jour par FileSystemAdapter,
+mais des symlinks sont aussi crees ou supprimes hors de l'application. La
+reconciliation le remet en accord avec video/ sans relire chaque symlink :
+
+- creer, supprimer ou remplacer un symlink modifie le mtime de son
+  repertoire ; un repertoire dont le mtime n'a pas change depuis la
+  derniere passe n'est pas relu (un stat par repertoire) ;
+- seuls les repertoires modifies sont listes (scandir) et leurs symlinks
+  relus (readlink + stat de la cible), en parallele ;
+- un mtime trop proche de la passe precedente (granularite des montages
+  reseau) est considere comme modifie.
+
+Les requetes "quels symlinks pointent vers ce fichier", "cibles partagees"
+ou "liens casses" deviennent alors des lectures de l'index.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from src.adapters.file_system import read_symlink_entry
+from src.core.entities.video import SymlinkTarget
+
+# Threads de lecture des symlinks (readlink + stat, I/O sur le NAS)
+DEFAULT_RECONCILE_WORKERS = 8
+
+# Un mtime plus recent que la passe precedente moins cette marge est douteux
+# (mtime a la seconde sur certains montages) : le repertoire est relu
+RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass
+class SymlinkIndexStats:
+    """
+    Bilan d'une reconciliation.
+
+    Attributes:
+        directories: Repertoires parcourus
+        rescanned: Repertoires modifies, relus
+        links: Symlinks relus dans les repertoires modifies
+        removed_dirs: Repertoires disparus (symlinks oublies)
+    """
+
+    directories: int = 0
+    rescanned: int = 0
+    links: int = 0
+    removed_dirs: int = 0
+
+
+def _is_unchanged(state: Optional[tuple[int, int]], mtime_ns: int) -> bool:
+    """Repertoire inchange depuis la passe precedente (hors fenetre douteuse)."""
+    if state is None:
+        return False
+    known_mtime, scanned_at_ns = state
+    return known_mtime == mtime_ns and mtime_ns < scanned_at_ns - RACY_WINDOW_NS
+
+
+def reconcile_symlink_index(
+    index,  # ISymlinkIndexRepository
+    root: Path,
+    workers: int = DEFAULT_RECONCILE_WORKERS,
+    full: bool = False,
+) -> SymlinkIndexStats:
+    """
+    Met l'index en accord avec les symlinks presents sous root.
+
+    Args:
+        index: Index inverse des symlinks
+        root: Repertoire a reconcilier (video/ ou un sous-repertoire)
+        workers: Threads de lecture des symlinks
+        full: Si True, relit tous les repertoires et reconstruit l'index
+            sous root (entrees orphelines comprises)
+
+    Returns:
+        SymlinkIndexStats
+    """
+    scanned_at_ns = time.time_ns()
+    known = index.directory_states(root)
+    # Sous-repertoires connus : un repertoire inchange n'est pas liste
+    children: dict[str, list[str]] = {}
+    for directory in known:
+        children.setdefault(os.path.dirname(directory), []).append(directory)
+
+    stats = SymlinkIndexStats()
+    seen: set[str] = set()
+    dirty: dict[str, tuple[int, list[str]]] = {}
+    stack = [str(root).rstrip("/")]
+    while stack:
+        current = stack.pop()
+        try:
+            mtime_ns = os.stat(current).st_mtime_ns
+        except OSError:
+            continue
+        seen.add(current)
+
+        if not full and _is_unchanged(known.get(current), mtime_ns):
+            stack.extend(children.get(current, ()))
+            continue
+
+        links: list[str] = []
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_symlink():
+                            links.append(entry.path)
+                        elif entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            seen.discard(current)
+            continue
+        dirty[current] = (mtime_ns, links)
+
+    stats.directories = len(seen)
+    stats.rescanned = len(dirty)
+    paths = [link for _, links in dirty.values() for link in links]
+    stats.links = len(paths)
+    if workers <= 1 or len(paths) <= 1:
+        entries_read = list(map(read_symlink_entry, paths))
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            entries_read = list(pool.map(read_symlink_entry, paths))
+
+    by_directory: dict[str, list[SymlinkTarget]] = {}
+    for entry in entries_read:
+        if entry is not None:
+            by_directory.setdefault(str(entry.symlink_path.parent), []).append(entry)
+    scanned = {
+        directory: (mtime_ns, by_directory.get(directory, []))
+        for directory, (mtime_ns, _) in dirty.items()
+    }
+
+    removed_dirs = [directory for directory in known if directory not in seen]
+    stats.removed_dirs = len(removed_dirs)
+    index.apply_scan(scanned, removed_dirs, scanned_at_ns, root if full else None)
+    return stats
+
+
+__all__ = [
+    "DEFAULT_RECONCILE_WORKERS",
+    "SymlinkIndexStats",
+    "reconcile_symlink_index",
+]
@@ -8,16 +8,30 @@ destination finale avec:
 - Creation de symlinks absolus dans video/ vers storage/
 """
 
+import asyncio
 import re
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Protocol
+from typing import Iterable, Optional, Protocol
 
-from src.infrastructure.persistence.hash_service import compute_file_hash
+from rapidfuzz import fuzz, process
+
+from src.infrastructure.persistence.hash_service import (
+    BatchHashService,
+    StatSignature,
+    compute_file_hash,
+    stat_signature,
+)
+from src.services.directory_cache import DirectoryCache, list_subdirs
 from src.utils.constants import VIDEO_EXTENSIONS
 
 
+def _hash_file(path: Path) -> str:
+    """Indirection vers compute_file_hash (resolue a l'appel)."""
+    return compute_file_hash(path)
+
+
 class ConflictType(Enum):
     """
     Type de conflit detecte lors du transfert.
@@ -117,6 +131,66 @@ class TransferResult:
     error: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class _IndexedDir:
+    """Sous-repertoire indexe : chemin, nom complet et annee extraite."""
+
+    path: Path
+    name: str
+    year: Optional[int]
+
+
+class _TitleIndex:
+    """
+    Index titre normalise -> sous-repertoires d'un repertoire de destination.
+
+    Construit une fois par batch, puis tenu a jour a chaque dossier cree
+    ou retire par le transferer. Les entrees d'un meme titre gardent
+    l'ordre du listing.
+    """
+
+    def __init__(self) -> None:
+        self._by_title: dict[str, list[_IndexedDir]] = {}
+        self._titles: list[str] = []
+
+    def add(self, normalized: str, entry: _IndexedDir) -> None:
+        """Ajoute un sous-repertoire (ignore s'il est deja indexe)."""
+        entries = self._by_title.get(normalized)
+        if entries is None:
+            self._by_title[normalized] = [entry]
+            self._titles.append(normalized)
+        elif all(e.path != entry.path for e in entries):
+            entries.append(entry)
+
+    def remove(self, path: Path) -> None:
+        """Retire un sous-repertoire de l'index."""
+        for normalized, entries in list(self._by_title.items()):
+            kept = [e for e in entries if e.path != path]
+            if len(kept) == len(entries):
+                continue
+            if kept:
+                self._by_title[normalized] = kept
+            else:
+                del self._by_title[normalized]
+                self._titles.remove(normalized)
+
+    def exact(self, normalized: str) -> list[_IndexedDir]:
+        """Sous-repertoires dont le titre normalise est identique."""
+        return self._by_title.get(normalized, [])
+
+    def closest(
+        self, normalized: str, threshold: float
+    ) -> Optional[tuple[list[_IndexedDir], float]]:
+        """Sous-repertoires du titre le plus proche (score >= threshold)."""
+        match = process.extractOne(
+            normalized, self._titles, scorer=fuzz.ratio, score_cutoff=threshold
+        )
+        if match is None:
+            return None
+        title, score, _ = match
+        return self._by_title[title], score
+
+
 class IAtomicFileSystem(Protocol):
     """
     Interface pour les operations atomiques sur les fichiers.
@@ -157,6 +231,9 @@ class TransfererService:
         symlink_manager,  # ISymlinkManager
         storage_dir: Path,
         video_dir: Path,
+        hasher: Optional[BatchHashService] = None,
+        dir_cache: Optional[DirectoryCache] = None,
+        movie_links=None,  # IMovieLinkRepository
     ):
         """
         Initialise le service de transfert.
@@ -166,11 +243,35 @@ class TransfererService:
             symlink_manager: Gestionnaire de symlinks
             storage_dir: Repertoire racine de stockage physique
             video_dir: Repertoire racine des symlinks (miroir de storage)
+            hasher: Service de hash par lot (partage entre les etapes d'un
+                meme batch). Un service dedie est cree si None.
+            dir_cache: Cache des listings partage avec l'organizer, invalide
+                apres chaque creation de repertoire, deplacement ou symlink.
+            movie_links: Index des symlinks de films (titre, annee), mis a
+                jour pour chaque symlink cree ou retire sous video/Films.
         """
         self._fs = file_system
         self._symlinks = symlink_manager
         self._storage_dir = Path(storage_dir)
         self._video_dir = Path(video_dir)
+        self._hasher = hasher or BatchHashService(hash_fn=_hash_file)
+        self._file_info_cache: dict[tuple[str, StatSignature], ExistingFileInfo] = {}
+        self._dir_cache = dir_cache
+        self._title_indexes: dict[Path, _TitleIndex] = {}
+        self._movie_links = movie_links
+
+    def _is_movie_link(self, path: Path) -> bool:
+        """Indique si le chemin est un symlink de film (sous video/Films)."""
+        return self._movie_links is not None and path.is_relative_to(
+            self._video_dir / "Films"
+        )
+
+    def _invalidate_dirs(self, *paths: Path) -> None:
+        """Invalide les listings du cache affectes par les chemins modifies."""
+        if self._dir_cache is None:
+            return
+        for path in paths:
+            self._dir_cache.invalidate(path)
 
     def check_conflict(
         self, source: Path, destination: Path
@@ -192,10 +293,47 @@ class TransfererService:
         if not self._fs.exists(destination):
             return None
 
-        # Calculer les hash
-        source_hash = compute_file_hash(source)
-        dest_hash = compute_file_hash(destination)
+        # Calculer les hash (en parallele, depuis le cache du batch si possible)
+        source_hash, dest_hash = self._hasher.hash_many([source, destination])
+        return self._build_conflict(destination, source_hash, dest_hash)
+
+    async def acheck_conflict(
+        self, source: Path, destination: Path
+    ) -> Optional[ConflictInfo]:
+        """Variante async de check_conflict (I/O hors de l'event loop)."""
+        if not await asyncio.to_thread(self._fs.exists, destination):
+            return None
+        source_hash, dest_hash = await self._hasher.ahash_many([source, destination])
+        return self._build_conflict(destination, source_hash, dest_hash)
+
+    async def acheck_conflicts(
+        self, pairs: Iterable[tuple[Path, Path]]
+    ) -> list[Optional[ConflictInfo]]:
+        """
+        Verifie les conflits d'un batch entier, hash repartis sur le pool.
+
+        Un fichier illisible donne None (le transfert le signalera lui-meme).
+        """
+        results = await asyncio.gather(
+            *(self.acheck_conflict(source, dest) for source, dest in pairs),
+            return_exceptions=True,
+        )
+        return [None if isinstance(r, Exception) else r for r in results]
+
+    def prefetch_conflicts(self, pairs: Iterable[tuple[Path, Path]]) -> None:
+        """
+        Lance en arriere-plan le hash des paires dont la destination existe.
 
+        Les appels suivants a check_conflict sont alors servis par le cache.
+        """
+        for source, destination in pairs:
+            if self._fs.exists(destination):
+                self._hasher.prefetch([source, destination])
+
+    def _build_conflict(
+        self, destination: Path, source_hash: str, dest_hash: str
+    ) -> ConflictInfo:
+        """Construit le ConflictInfo a partir des deux hash."""
         # Determiner le type de conflit
         if source_hash == dest_hash:
             conflict_type = ConflictType.DUPLICATE
@@ -244,7 +382,9 @@ class TransfererService:
             return TransferResult(success=False, conflict=conflict)
 
         # Etape 2: Deplacement atomique
-        if not self._fs.atomic_move(source, destination):
+        moved = self._fs.atomic_move(source, destination)
+        self._invalidate_dirs(source, destination)
+        if not moved:
             return TransferResult(
                 success=False, error="Deplacement atomique echoue"
             )
@@ -265,8 +405,15 @@ class TransfererService:
                     self._fs.atomic_move(destination, source)
                 except Exception:
                     pass  # Le rollback peut echouer, on log l'erreur principale
+                self._invalidate_dirs(source, destination)
                 return TransferResult(success=False, error=str(e))
 
+        self._index_created(destination)
+        if symlink_path is not None:
+            self._index_created(symlink_path)
+            if self._is_movie_link(symlink_path):
+                self._movie_links.record(symlink_path, destination)
+
         return TransferResult(
             success=True,
             final_path=destination,
@@ -344,6 +491,7 @@ class TransfererService:
 
         # Creer le symlink avec un chemin absolu vers la cible
         symlink_path.symlink_to(target_path.resolve())
+        self._invalidate_dirs(symlink_path)
 
         return symlink_path
 
@@ -353,6 +501,7 @@ class TransfererService:
         year: Optional[int],
         destination_dir: Path,
         is_series: bool = False,
+        fuzzy_threshold: Optional[float] = None,
     ) -> Optional[SimilarContentInfo]:
         """
         Recherche un contenu similaire dans le repertoire de destination.
@@ -361,64 +510,107 @@ class TransfererService:
         - "Station Eleven" vs "Station Eleven (2021)"
         - "Matrix" vs "The Matrix (1999)"
 
+        La recherche passe par un index des titres normalises du repertoire,
+        construit au premier appel puis maintenu par les transferts.
+
         Args:
             title: Titre du nouveau contenu
             year: Annee du nouveau contenu (peut etre None)
             destination_dir: Repertoire de destination (parent du dossier cible)
             is_series: True si c'est une serie, False pour un film
+            fuzzy_threshold: Score rapidfuzz minimal (0-100) pour signaler un
+                titre proche quand aucun titre identique n'existe.
+                None = correspondance exacte uniquement.
 
         Returns:
             SimilarContentInfo si un contenu similaire existe, None sinon.
         """
-        if not destination_dir.exists():
+        index = self._get_title_index(Path(destination_dir))
+        if index is None:
             return None
 
         # Normaliser le titre pour comparaison
         normalized_title = self._normalize_title(title)
+        new_name = f"{title} ({year})" if year else title
+
+        for entry in index.exact(normalized_title):
+            if entry.name != new_name:
+                # Conflit detecte: meme titre mais noms differents
+                files_info = self._collect_files_info(entry.path, is_series)
+                reason = self._get_similarity_reason(
+                    entry.name, new_name, entry.year, year
+                )
+                return SimilarContentInfo(
+                    existing_dir=entry.path,
+                    existing_files=files_info,
+                    new_title=new_name,
+                    existing_title=entry.name,
+                    similarity_reason=reason,
+                )
+
+            # Nom identique: contenu existant avec le meme nom
+            # Signaler pour eviter les doublons d'episodes/fichiers
+            files_info = self._collect_files_info(entry.path, is_series)
+            if files_info:  # Seulement si des fichiers existent deja
+                return SimilarContentInfo(
+                    existing_dir=entry.path,
+                    existing_files=files_info,
+                    new_title=new_name,
+                    existing_title=entry.name,
+                    similarity_reason="Contenu existant avec le meme nom",
+                )
+
+        if fuzzy_threshold is None or index.exact(normalized_title):
+            return None
 
-        # Chercher dans les sous-repertoires
-        for subdir in destination_dir.iterdir():
-            if not subdir.is_dir():
-                continue
+        closest = index.closest(normalized_title, fuzzy_threshold)
+        if closest is None:
+            return None
+        entries, score = closest
+        entry = entries[0]
+        return SimilarContentInfo(
+            existing_dir=entry.path,
+            existing_files=self._collect_files_info(entry.path, is_series),
+            new_title=new_name,
+            existing_title=entry.name,
+            similarity_reason=f"Titre proche ({score:.0f}% de similarite)",
+        )
 
-            # Extraire le titre existant (sans annee)
-            existing_name = subdir.name
-            existing_title, existing_year = self._extract_title_year(existing_name)
-            normalized_existing = self._normalize_title(existing_title)
-
-            # Verifier la similarite
-            if normalized_title == normalized_existing:
-                # Meme titre, verifier si c'est vraiment different
-                new_name = f"{title} ({year})" if year else title
-
-                if existing_name != new_name:
-                    # Conflit detecte: meme titre mais noms differents
-                    files_info = self._collect_files_info(subdir, is_series)
-                    reason = self._get_similarity_reason(
-                        existing_name, new_name, existing_year, year
-                    )
+    def _get_title_index(self, destination_dir: Path) -> Optional[_TitleIndex]:
+        """Retourne l'index des titres du repertoire (construit au besoin)."""
+        index = self._title_indexes.get(destination_dir)
+        if index is not None:
+            return index
+        if not destination_dir.exists():
+            return None
 
-                    return SimilarContentInfo(
-                        existing_dir=subdir,
-                        existing_files=files_info,
-                        new_title=new_name,
-                        existing_title=existing_name,
-                        similarity_reason=reason,
-                    )
-                else:
-                    # Nom identique: contenu existant avec le meme nom
-                    # Signaler pour eviter les doublons d'episodes/fichiers
-                    files_info = self._collect_files_info(subdir, is_series)
-                    if files_info:  # Seulement si des fichiers existent deja
-                        return SimilarContentInfo(
-                            existing_dir=subdir,
-                            existing_files=files_info,
-                            new_title=new_name,
-                            existing_title=existing_name,
-                            similarity_reason="Contenu existant avec le meme nom",
-                        )
-
-        return None
+        index = _TitleIndex()
+        for subdir in list_subdirs(destination_dir, self._dir_cache):
+            self._index_subdir(index, subdir)
+        self._title_indexes[destination_dir] = index
+        return index
+
+    def _index_subdir(self, index: _TitleIndex, subdir: Path) -> None:
+        """Ajoute un sous-repertoire a un index de titres."""
+        existing_title, existing_year = self._extract_title_year(subdir.name)
+        index.add(
+            self._normalize_title(existing_title),
+            _IndexedDir(subdir, subdir.name, existing_year),
+        )
+
+    def _index_created(self, path: Path) -> None:
+        """Indexe les dossiers crees par un transfert sous un repertoire indexe."""
+        for indexed_dir, index in self._title_indexes.items():
+            if indexed_dir in path.parents:
+                child = indexed_dir / path.relative_to(indexed_dir).parts[0]
+                if child != path or child.is_dir():
+                    self._index_subdir(index, child)
+
+    def _index_removed(self, path: Path) -> None:
+        """Retire un dossier deplace hors d'un repertoire indexe."""
+        index = self._title_indexes.get(path.parent)
+        if index is not None:
+            index.remove(path)
 
     def _normalize_title(self, title: str) -> str:
         """Normalise un titre pour comparaison (minuscules, sans articles)."""
@@ -467,26 +659,45 @@ class TransfererService:
         Returns:
             Liste des informations de fichiers.
         """
-        files_info = []
-
-        # Pour les series, parcourir les saisons
-        if is_series:
-            for item in directory.rglob("*"):
-                if item.is_file() and item.suffix.lower() in VIDEO_EXTENSIONS:
-                    files_info.append(self._get_file_info(item))
-        else:
-            # Pour les films, chercher dans le repertoire courant ou parent
-            for item in directory.iterdir():
-                if item.is_file() and item.suffix.lower() in VIDEO_EXTENSIONS:
-                    files_info.append(self._get_file_info(item))
-
-        return files_info
+        # Pour les series, parcourir les saisons ; pour les films, le
+        # repertoire courant
+        items = directory.rglob("*") if is_series else directory.iterdir()
+        video_files = [
+            item
+            for item in items
+            if item.is_file() and item.suffix.lower() in VIDEO_EXTENSIONS
+        ]
+        return self.get_files_info(video_files)
+
+    def get_files_info(self, paths: list[Path]) -> list[ExistingFileInfo]:
+        """Extrait les infos de plusieurs fichiers en parallele (ordre conserve)."""
+        if len(paths) <= 1:
+            return [self._get_file_info(p) for p in paths]
+        return self._hasher.map(self._get_file_info, paths)
+
+    async def aget_files_info(self, paths: list[Path]) -> list[ExistingFileInfo]:
+        """Variante async de get_files_info."""
+        return await asyncio.to_thread(self.get_files_info, paths)
 
     def _get_file_info(self, file_path: Path) -> ExistingFileInfo:
-        """Extrait les informations techniques d'un fichier video."""
-        from src.adapters.parsing.mediainfo_extractor import MediaInfoExtractor
+        """
+        Extrait les informations techniques d'un fichier video.
 
-        size = file_path.stat().st_size if file_path.exists() else 0
+        Le resultat est mis en cache par signature stat pour la duree du batch.
+        """
+        signature = stat_signature(file_path)
+        key = (str(file_path), signature) if signature else None
+        if key and key in self._file_info_cache:
+            return self._file_info_cache[key]
+
+        info = self._extract_file_info(file_path, signature[2] if signature else 0)
+        if key:
+            self._file_info_cache[key] = info
+        return info
+
+    def _extract_file_info(self, file_path: Path, size: int) -> ExistingFileInfo:
+        """Lit les metadonnees techniques d'un fichier via mediainfo."""
+        from src.adapters.parsing.mediainfo_extractor import MediaInfoExtractor
 
         # Extraire les infos media
         resolution = None
@@ -555,10 +766,16 @@ class TransfererService:
         # Creer les parents et deplacer
         dest.parent.mkdir(parents=True, exist_ok=True)
 
-        if path.is_dir():
-            import shutil
-            shutil.move(str(path), str(dest))
-        else:
-            self._fs.atomic_move(path, dest)
+        try:
+            if path.is_dir():
+                import shutil
+                shutil.move(str(path), str(dest))
+            else:
+                self._fs.atomic_move(path, dest)
+        finally:
+            self._invalidate_dirs(path, dest)
+        self._index_removed(path)
+        if self._is_movie_link(path) and not dest.is_dir():
+            self._movie_links.remove(path)
 
         return dest
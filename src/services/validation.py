@@ -109,11 +109,28 @@ class ValidationService:
         """
         Traite l'auto-validation d'une entite PendingValidation.
 
+        Variante async de auto_validate (meme traitement, sans appel API).
+
+        Args:
+            pending: L'entite PendingValidation a traiter
+
+        Returns:
+            L'entite mise a jour (ou inchangee si auto-validation impossible)
+        """
+        return self.auto_validate(pending)
+
+    def auto_validate(self, pending: PendingValidation) -> PendingValidation:
+        """
+        Auto-valide une entite PendingValidation (synchrone, acces base).
+
         Si les conditions d'auto-validation sont remplies:
         - Met auto_validated=True
         - Met validation_status=VALIDATED
         - Met selected_candidate_id=candidat[0].id
 
+        A executer hors de l'event loop (pool de threads) depuis le serveur
+        web : la sauvegarde est une ecriture en base.
+
         Args:
             pending: L'entite PendingValidation a traiter
 
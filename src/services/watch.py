@@ -0,0 +1,289 @@
+"""
+Surveillance continue de la videotheque (commande cineorg watch).
+
+Applique au fil de l'eau les evenements du systeme de fichiers
+(src.adapters.file_watcher) a la base et aux index, au lieu d'attendre
+la prochaine commande de maintenance :
+
+- video/ : symlinks crees, supprimes ou deplaces -> index inverse des
+  symlinks, index des films (video/Films) et video_files.symlink_path ;
+  un repertoire cree, supprime ou deplace est reconcilie
+- storage/ : fichier ou dossier deplace -> chemins physiques en base
+  (fichiers video, films, episodes) et symlinks repointes vers le nouvel
+  emplacement ; une suppression est seulement journalisee (les liens
+  casses restent du ressort de repair-links)
+- telechargements : les nouveaux fichiers sont accumules puis transmis au
+  traitement quand plus rien n'a bouge (ni evenement ni taille) pendant
+  le delai de calme
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from loguru import logger
+
+from src.adapters.file_system import read_symlink_entry
+from src.adapters.file_watcher import CREATED, DELETED, MOVED, FileEvent, WatcherOverflow
+from src.services.symlink_index import reconcile_symlink_index
+
+
+def _is_under(path: Path, root: Path) -> bool:
+    return path == root or root in path.parents
+
+
+def _list_files(directory: Path) -> list[Path]:
+    """Fichiers (hors symlinks) d'une arborescence."""
+    found = []
+    for current, _dirs, files in os.walk(directory):
+        for name in files:
+            path = Path(current) / name
+            if not path.is_symlink():
+                found.append(path)
+    return found
+
+
+class WatchService:
+    """
+    Service appliquant les evenements du systeme de fichiers.
+
+    Les evenements sont traites un par un ; une erreur est journalisee sans
+    interrompre la surveillance (la prochaine reconciliation rattrapera).
+    """
+
+    def __init__(
+        self,
+        video_dir: Path,
+        storage_dir: Path,
+        downloads_dir: Path,
+        symlink_index,  # ISymlinkIndexRepository
+        file_system,  # FileSystemAdapter (indexe les symlinks qu'il cree)
+        video_file_repo,  # IVideoFileRepository
+        movie_link_repo,  # IMovieLinkRepository
+        quiet_period: float = 120.0,
+        on_downloads_ready: Optional[Callable[[list[Path]], None]] = None,
+    ) -> None:
+        """
+        Initialise le service.
+
+        Args:
+            video_dir: Repertoire des symlinks
+            storage_dir: Repertoire des fichiers physiques
+            downloads_dir: Repertoire des telechargements
+            symlink_index: Index inverse des symlinks
+            file_system: Adaptateur filesystem (recreation des symlinks)
+            video_file_repo: Repository des fichiers video
+            movie_link_repo: Index des symlinks de films
+            quiet_period: Delai sans activite avant traitement (secondes)
+            on_downloads_ready: Traitement des nouveaux telechargements
+                (None : ils sont seulement journalises)
+        """
+        self._video_dir = video_dir
+        self._storage_dir = storage_dir
+        self._downloads_dir = downloads_dir
+        self._films_dir = video_dir / "Films"
+        self._index = symlink_index
+        self._file_system = file_system
+        self._video_file_repo = video_file_repo
+        self._movie_link_repo = movie_link_repo
+        self._quiet_period = quiet_period
+        self._on_downloads_ready = on_downloads_ready
+        # Telechargements en attente : chemin -> taille au dernier controle
+        self._pending: dict[Path, int] = {}
+        self._last_activity = 0.0
+
+    @property
+    def pending_downloads(self) -> list[Path]:
+        """Telechargements en attente du delai de calme."""
+        return sorted(self._pending)
+
+    def run(
+        self,
+        watcher,
+        should_stop: Callable[[], bool] = lambda: False,
+        timeout: float = 1.0,
+    ) -> None:
+        """
+        Boucle de surveillance jusqu'a should_stop().
+
+        Args:
+            watcher: InotifyWatcher ou PollingWatcher
+            should_stop: Condition d'arret, testee apres chaque attente
+            timeout: Attente maximale des evenements (secondes)
+        """
+        while not should_stop():
+            try:
+                events = watcher.read_events(timeout)
+            except WatcherOverflow as e:
+                logger.warning(f"Evenements perdus ({e}), reconciliation complete")
+                reconcile_symlink_index(self._index, self._video_dir)
+                continue
+            self.handle_events(events)
+            self.flush_downloads()
+
+    def handle_events(self, events: list[FileEvent], now: Optional[float] = None) -> None:
+        """Applique une serie d'evenements."""
+        now = time.monotonic() if now is None else now
+        for event in events:
+            try:
+                self._handle(event, now)
+            except Exception as e:
+                logger.warning(f"Evenement non applique ({event.kind} {event.path}): {e}")
+
+    def _handle(self, event: FileEvent, now: float) -> None:
+        if event.kind == MOVED and event.dest is not None:
+            if _is_under(event.dest, self._storage_dir):
+                self._storage_moved(event.path, event.dest)
+            if _is_under(event.path, self._video_dir) and _is_under(event.dest, self._video_dir):
+                self._video_moved(event.path, event.dest, event.is_dir)
+                return
+            # Deplacement entre deux arborescences : disparition + apparition
+            self._dispatch(FileEvent(DELETED, event.path, is_dir=event.is_dir), now)
+            self._dispatch(FileEvent(CREATED, event.dest, is_dir=event.is_dir), now)
+            return
+        self._dispatch(event, now)
+
+    def _dispatch(self, event: FileEvent, now: float) -> None:
+        if _is_under(event.path, self._video_dir):
+            self._video_event(event)
+        elif _is_under(event.path, self._downloads_dir):
+            self._download_event(event, now)
+        elif _is_under(event.path, self._storage_dir) and event.kind == DELETED:
+            links = self._index.links_under(event.path)
+            if links:
+                logger.warning(
+                    f"Supprime du storage: {event.path} ({len(links)} symlink(s) casse(s))"
+                )
+
+    # ── video/ ──
+
+    def _video_event(self, event: FileEvent) -> None:
+        if event.is_dir:
+            # Creation : contenu deja present ; suppression : liens oublies
+            reconcile_symlink_index(self._index, event.path)
+            return
+        if event.kind == CREATED:
+            entry = read_symlink_entry(event.path)
+            if entry is None:
+                return
+            self._index.record(entry)
+            if _is_under(event.path, self._films_dir):
+                self._movie_link_repo.record(event.path, entry.target_path)
+        elif event.kind == DELETED:
+            self._index.remove(event.path)
+            if _is_under(event.path, self._films_dir):
+                self._movie_link_repo.remove(event.path)
+
+    def _video_moved(self, src: Path, dest: Path, is_dir: bool) -> None:
+        if is_dir:
+            reconcile_symlink_index(self._index, src)
+            reconcile_symlink_index(self._index, dest)
+            moves = [
+                (src / entry.symlink_path.relative_to(dest), entry.symlink_path)
+                for entry in self._index.entries(dest)
+            ]
+        else:
+            entry = read_symlink_entry(dest)
+            if entry is None:
+                return
+            self._index.remove(src)
+            self._index.record(entry)
+            moves = [(src, dest)]
+
+        for old, new in moves:
+            self._video_file_repo.update_symlink_path(old, new)
+            old_film = _is_under(old, self._films_dir)
+            new_film = _is_under(new, self._films_dir)
+            if old_film and new_film:
+                self._movie_link_repo.move(old, new)
+            elif old_film:
+                self._movie_link_repo.remove(old)
+            elif new_film:
+                self._movie_link_repo.record(new, self._target_of(new))
+        logger.info(f"Symlinks deplaces: {src} -> {dest} ({len(moves)})")
+
+    @staticmethod
+    def _target_of(link: Path) -> Optional[Path]:
+        entry = read_symlink_entry(link)
+        return entry.target_path if entry else None
+
+    # ── storage/ ──
+
+    def _storage_moved(self, src: Path, dest: Path) -> None:
+        """Reporte en base et repointe les symlinks d'un element deplace du storage."""
+        updated = self._video_file_repo.relocate(src, dest)
+        retargeted = 0
+        for entry in self._index.links_under(src):
+            relative = entry.target_path.relative_to(src)
+            new_target = dest / relative if relative.parts else dest
+            link = entry.symlink_path
+            if not self._file_system.remove_symlink(link):
+                continue
+            if not self._file_system.create_symlink(new_target, link):
+                logger.warning(f"Symlink non recree: {link} -> {new_target}")
+                continue
+            retargeted += 1
+            if _is_under(link, self._films_dir):
+                self._movie_link_repo.record(link, new_target)
+        if updated or retargeted:
+            logger.info(
+                f"Deplace dans le storage: {src} -> {dest} "
+                f"({updated} chemin(s) en base, {retargeted} symlink(s) repointe(s))"
+            )
+
+    # ── telechargements ──
+
+    def _download_event(self, event: FileEvent, now: float) -> None:
+        self._last_activity = now
+        if event.kind == DELETED:
+            for path in [p for p in self._pending if _is_under(p, event.path)]:
+                del self._pending[path]
+            return
+        paths = _list_files(event.path) if event.is_dir else [event.path]
+        for path in paths:
+            self._pending[path] = self._size(path)
+
+    @staticmethod
+    def _size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return -1
+
+    def flush_downloads(self, now: Optional[float] = None) -> list[Path]:
+        """
+        Transmet les telechargements si le delai de calme est ecoule.
+
+        Un fichier dont la taille a change depuis le dernier controle (copie
+        en cours, sans evenement) relance le delai.
+
+        Returns:
+            Fichiers transmis (liste vide si delai non ecoule)
+        """
+        now = time.monotonic() if now is None else now
+        if not self._pending or now - self._last_activity < self._quiet_period:
+            return []
+
+        growing = False
+        for path, size in list(self._pending.items()):
+            current = self._size(path)
+            if current < 0:
+                del self._pending[path]
+            elif current != size:
+                self._pending[path] = current
+                growing = True
+        if growing:
+            self._last_activity = now
+            return []
+
+        ready = sorted(self._pending)
+        self._pending.clear()
+        if ready:
+            logger.info(f"{len(ready)} nouveau(x) telechargement(s)")
+            if self._on_downloads_ready is not None:
+                self._on_downloads_ready(ready)
+        return ready
+
+
+__all__ = ["WatchService"]
@@ -98,6 +98,8 @@ def normalize_accents(text: str) -> str:
     Utilise la decomposition NFD puis filtre les caracteres diacritiques (Mn).
     Ex: "Les Evades" -> "Les Evades"
     """
+    if text.isascii():
+        return text
     normalized = unicodedata.normalize("NFD", text)
     return "".join(char for char in normalized if unicodedata.category(char) != "Mn")
 
@@ -11,9 +11,14 @@ from pathlib import Path
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
+from ..config import Settings
 from ..container import Container
+from .cache import page_cache
+from .concurrency import LatencyMiddleware, LatencyMonitor, configure_worker_pool
+from .jobs import JobManager
 from .routes.config import router as config_router
 from .routes.home import router as home_router
+from .routes.jobs import router as jobs_router
 from .routes.maintenance import router as maintenance_router
 from .routes.library import router as library_router
 from .routes.quality import router as quality_router
@@ -23,18 +28,39 @@ from .routes.workflow import router as workflow_router
 
 _WEB_DIR = Path(__file__).parent
 
+latency_monitor = LatencyMonitor()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialise le Container DI au démarrage et le ferme à l'arrêt."""
+    settings = Settings()
+    executor = configure_worker_pool(settings.web_worker_threads)
+    latency_monitor.slow_request_ms = settings.web_slow_request_ms
+    latency_monitor.start()
+    page_cache.max_entries = settings.web_page_cache_size
+
     container = Container()
     container.database.init()
     app.state.container = container
-    yield
+
+    # Tâches de fond : celles d'un processus précédent sont interrompues
+    jobs = JobManager(max_workers=settings.web_job_workers)
+    jobs.recover()
+    app.state.jobs = jobs
+    try:
+        yield
+    finally:
+        jobs.shutdown()
+        await latency_monitor.stop()
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 app = FastAPI(title="CineOrg", lifespan=lifespan)
 
+# Mesure de latence (requêtes lentes, event loop bloquée)
+app.add_middleware(LatencyMiddleware, monitor=latency_monitor)
+
 # Fichiers statiques
 app.mount("/static", StaticFiles(directory=_WEB_DIR / "static"), name="static")
 
@@ -47,3 +73,4 @@ app.include_router(transfer_router)
 app.include_router(quality_router)
 app.include_router(config_router)
 app.include_router(maintenance_router)
+app.include_router(jobs_router)
@@ -0,0 +1,220 @@
+"""
+Cache des pages rendues et requêtes conditionnelles (ETag / Last-Modified).
+
+Les pages de la bibliothèque (grille paginée, fiches film et série) et le
+tableau de bord qualité ne changent qu'après un workflow, un enrichissement
+ou une modification. Chaque page rendue est gardée en mémoire avec :
+
+- la génération de la vidéothèque au moment du rendu (compteur
+  library.generation, incrémenté par trigger à chaque écriture, y compris
+  depuis la CLI) : une page d'une génération antérieure est périmée ;
+- ses dépendances (``("movie", 12)``, ``("series", 3)``, ...) : basculer
+  « vu » ou la note d'une œuvre n'incrémente pas la génération, la route
+  invalide seulement les pages qui l'affichent.
+
+Chaque réponse porte un ETag (empreinte du HTML) et un Last-Modified ; un
+client qui revalide une page inchangée reçoit un 304 sans rendu.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from ..infrastructure.persistence.database import get_session
+from ..infrastructure.persistence.library_stats import read_library_generation
+
+DEFAULT_PAGE_CACHE_SIZE = 256
+
+# Dépendance des listes filtrées sur « non vus » (appartenance à la liste)
+WATCHED_DEPENDENCY = "watched"
+
+PageRenderer = Callable[[], tuple[Response, Iterable[Hashable]]]
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    """
+    Page rendue gardée en cache.
+
+    Attributs :
+        body: HTML rendu.
+        etag: Empreinte du HTML (entre guillemets, format HTTP).
+        last_modified: Date du rendu (timestamp).
+        generation: Génération de la vidéothèque au moment du rendu.
+        dependencies: Entrées dont la modification périme la page.
+    """
+
+    body: bytes
+    etag: str
+    last_modified: float
+    generation: int
+    dependencies: frozenset
+
+
+def _etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _not_modified(request: Request, page: CachedPage) -> bool:
+    """Vrai si la copie du client est à jour (If-None-Match prioritaire)."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or page.etag in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(page.last_modified) <= since
+    return False
+
+
+def _page_key(request: Request) -> tuple:
+    """Clé d'une page : chemin, paramètres et requête HTMX (fragment)."""
+    return (
+        request.url.path,
+        tuple(sorted(request.query_params.multi_items())),
+        bool(request.headers.get("HX-Request")),
+    )
+
+
+class PageCache:
+    """
+    Cache LRU des pages rendues, invalidé par génération et par entrée.
+
+    Attributs :
+        max_entries: Nombre maximal de pages gardées (0 = pas de cache,
+            les ETag restent calculés).
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_PAGE_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self._pages: "OrderedDict[Hashable, CachedPage]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Incrémenté à chaque invalidation : un rendu commencé avant une
+        # invalidation n'est pas mis en cache (il peut être périmé)
+        self._invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def lookup(self, key: Hashable, generation: int) -> tuple[Optional[CachedPage], int]:
+        """
+        Cherche une page à jour.
+
+        Returns:
+            La page (ou None) et le jeton à passer à store().
+        """
+        with self._lock:
+            token = self._invalidations
+            page = self._pages.get(key)
+            if page is None:
+                return None, token
+            if page.generation != generation:
+                del self._pages[key]
+                return None, token
+            self._pages.move_to_end(key)
+            return page, token
+
+    def store(
+        self,
+        key: Hashable,
+        generation: int,
+        body: bytes,
+        dependencies: Iterable[Hashable],
+        token: int,
+    ) -> CachedPage:
+        """Enregistre une page rendue (sauf si une invalidation est survenue)."""
+        page = CachedPage(
+            body=body,
+            etag=_etag(body),
+            last_modified=time.time(),
+            generation=generation,
+            dependencies=frozenset(dependencies),
+        )
+        with self._lock:
+            if token == self._invalidations and self.max_entries > 0:
+                self._pages[key] = page
+                self._pages.move_to_end(key)
+                while len(self._pages) > self.max_entries:
+                    self._pages.popitem(last=False)
+        return page
+
+    def invalidate(self, *dependencies: Hashable) -> int:
+        """
+        Retire les pages dépendant d'une des entrées données.
+
+        Returns:
+            Nombre de pages retirées.
+        """
+        targets = set(dependencies)
+        with self._lock:
+            self._invalidations += 1
+            stale = [key for key, page in self._pages.items() if page.dependencies & targets]
+            for key in stale:
+                del self._pages[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Vide le cache."""
+        with self._lock:
+            self._invalidations += 1
+            self._pages.clear()
+
+    def serve(self, request: Request, render: PageRenderer, generation: int) -> Response:
+        """
+        Sert une page depuis le cache, ou la rend et la met en cache.
+
+        Args:
+            request: Requête (clé de cache et en-têtes conditionnels).
+            render: Rendu de la page, retournant la réponse et ses dépendances.
+                Une réponse autre que 200 est renvoyée telle quelle.
+            generation: Génération courante de la vidéothèque.
+
+        Returns:
+            La page (200) ou un 304 si la copie du client est à jour.
+        """
+        key = _page_key(request)
+        page, token = self.lookup(key, generation)
+        if page is None:
+            response, dependencies = render()
+            if response.status_code != 200:
+                return response
+            page = self.store(key, generation, response.body, dependencies, token)
+
+        headers = {
+            "ETag": page.etag,
+            "Last-Modified": formatdate(page.last_modified, usegmt=True),
+            "Cache-Control": "no-cache",
+            "Vary": "HX-Request",
+        }
+        if _not_modified(request, page):
+            return Response(status_code=304, headers=headers)
+        return Response(page.body, media_type="text/html", headers=headers)
+
+
+page_cache = PageCache()
+
+
+def current_generation() -> int:
+    """Lit la génération courante de la vidéothèque (une requête)."""
+    session = next(get_session())
+    try:
+        return read_library_generation(session)
+    finally:
+        session.close()
+
+
+def cached_page(request: Request, render: PageRenderer) -> Response:
+    """Sert une page via le cache partagé de l'application."""
+    return page_cache.serve(request, render, current_generation())
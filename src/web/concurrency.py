@@ -0,0 +1,137 @@
+"""
+Modèle de concurrence de l'application web.
+
+Les handlers synchrones (``def``) et les appels ``asyncio.to_thread`` des
+handlers asynchrones s'exécutent dans un pool de threads borné : chaque
+requête ouvre sa propre session SQLite dans le thread qui la traite, et
+l'event loop reste libre pour les flux SSE et les autres pages.
+
+Le moniteur de latence signale les requêtes lentes et les blocages de
+l'event loop (handler ``async`` faisant des I/O bloquantes), en nommant
+les requêtes en cours au moment du blocage.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import anyio.to_thread
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WEB_WORKERS = 16
+DEFAULT_SLOW_REQUEST_MS = 500
+_LOOP_CHECK_INTERVAL = 0.1
+
+
+def configure_worker_pool(max_workers: int = DEFAULT_WEB_WORKERS) -> ThreadPoolExecutor:
+    """
+    Borne le pool de threads utilisé par les handlers et asyncio.to_thread.
+
+    Doit être appelé depuis l'event loop (lifespan de l'application).
+
+    Args:
+        max_workers: Nombre maximal de threads simultanés.
+
+    Returns:
+        L'executor installé comme executor par défaut de la boucle
+        (à fermer à l'arrêt).
+    """
+    # Handlers sync et dépendances FastAPI (anyio)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = max_workers
+    # asyncio.to_thread / run_in_executor(None, ...)
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="cineorg-web"
+    )
+    asyncio.get_running_loop().set_default_executor(executor)
+    return executor
+
+
+class LatencyMonitor:
+    """
+    Suivi des requêtes en cours et détection des blocages de l'event loop.
+
+    Attributs :
+        slow_request_ms: Seuil au-delà duquel une requête est signalée.
+        inflight: Requêtes en cours (identifiant -> (méthode chemin, début)).
+    """
+
+    def __init__(self, slow_request_ms: int = DEFAULT_SLOW_REQUEST_MS) -> None:
+        self.slow_request_ms = slow_request_ms
+        self.inflight: dict[int, tuple[str, float]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def describe_inflight(self) -> str:
+        """Liste lisible des requêtes en cours (les plus anciennes d'abord)."""
+        entries = sorted(self.inflight.values(), key=lambda e: e[1])
+        return ", ".join(label for label, _ in entries) or "aucune"
+
+    def start(self) -> None:
+        """Démarre la surveillance de l'event loop (tâche de fond)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._watch_loop())
+
+    async def stop(self) -> None:
+        """Arrête la surveillance de l'event loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _watch_loop(self) -> None:
+        """Mesure le retard de réveil de la boucle : un retard = un blocage."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + _LOOP_CHECK_INTERVAL
+            await asyncio.sleep(_LOOP_CHECK_INTERVAL)
+            lag_ms = (loop.time() - expected) * 1000
+            if lag_ms >= self.slow_request_ms:
+                logger.warning(
+                    "Event loop bloquée %.0f ms (requêtes en cours : %s)",
+                    lag_ms,
+                    self.describe_inflight(),
+                )
+
+
+class LatencyMiddleware:
+    """
+    Middleware ASGI mesurant le temps jusqu'au début de la réponse.
+
+    Pour les flux SSE, seul le temps avant le premier octet est mesuré
+    (la durée du flux n'est pas une latence).
+    """
+
+    def __init__(self, app, monitor: LatencyMonitor) -> None:
+        self.app = app
+        self.monitor = monitor
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        label = f"{scope['method']} {scope['path']}"
+        key = id(scope)
+        start = time.perf_counter()
+        self.monitor.inflight[key] = (label, start)
+        reported = False
+
+        async def send_wrapper(message) -> None:
+            nonlocal reported
+            if message["type"] == "http.response.start" and not reported:
+                reported = True
+                self.monitor.inflight.pop(key, None)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                if elapsed_ms >= self.monitor.slow_request_ms:
+                    logger.warning("Requête lente : %s (%.0f ms)", label, elapsed_ms)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.monitor.inflight.pop(key, None)
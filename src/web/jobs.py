@@ -0,0 +1,473 @@
+"""
+Tâches de fond de l'application web (workflow, transferts, scans).
+
+Un ``JobManager`` unique (``app.state.jobs``) remplace les objets de
+progression propres à chaque module et les boucles SSE qui relisaient
+l'état toutes les 0,2 à 0,4 s :
+
+- chaque tâche a un identifiant et un type (« workflow », « transfer »…) ;
+- le travail bloquant (disque, CPU, mediainfo) passe par un pool de
+  threads dédié, distinct de celui des requêtes ;
+- la progression est poussée aux flux SSE via une file asyncio par
+  abonné, sans sondage ;
+- l'état, la dernière progression et le résultat sont enregistrés dans la
+  table ``jobs`` : un navigateur qui se reconnecte retrouve la tâche en
+  cours, et après un redémarrage le dernier résultat reste consultable
+  sans relancer un scan de dix minutes.
+
+Exemple :
+    async def scan(ctx: JobContext) -> dict:
+        ctx.progress(label="Analyse…")
+        issues = await ctx.run_blocking(find_issues)
+        return {"count": len(issues)}
+
+    job = jobs.start("scan", scan)
+    return sse_response(jobs.events(job))
+"""
+
+import asyncio
+import functools
+import json
+import logging
+import threading
+import time
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import Engine, delete, update
+from sqlmodel import Session, select
+from starlette.responses import StreamingResponse
+
+from ..infrastructure.persistence.models import JobModel
+
+logger = logging.getLogger(__name__)
+
+JOB_RUNNING = "running"
+JOB_COMPLETE = "complete"
+JOB_ERROR = "error"
+JOB_INTERRUPTED = "interrupted"
+
+DEFAULT_JOB_WORKERS = 4
+# Intervalle minimal entre deux enregistrements de la progression (s)
+_PERSIST_INTERVAL = 1.0
+# Tâches terminées conservées (en mémoire et en base) par type
+_KEEP_FINISHED = 20
+
+JobEvent = tuple[str, dict]
+
+
+@dataclass
+class Job:
+    """
+    Tâche de fond et son état courant.
+
+    Attributs :
+        id: Identifiant unique (hexadécimal).
+        kind: Type de tâche (« workflow », « transfer », « quality-scan »…).
+        status: running, complete, error ou interrupted.
+        params: Paramètres de lancement.
+        progress: Dernier état de progression publié.
+        result: Résultat final (tâche terminée avec succès).
+        error: Message d'erreur (échec ou interruption).
+        pending: Événement en attente d'une réponse (ex. conflit de transfert).
+    """
+
+    id: str
+    kind: str
+    status: str = JOB_RUNNING
+    params: dict = field(default_factory=dict)
+    progress: dict = field(default_factory=dict)
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    pending: Optional[JobEvent] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+    # État d'exécution (non persisté)
+    _subscribers: list[asyncio.Queue] = field(default_factory=list, repr=False)
+    _answer: Optional[asyncio.Future] = field(default=None, repr=False)
+    _task: Optional[asyncio.Task] = field(default=None, repr=False)
+    _saved_at: float = field(default=0.0, repr=False)
+    _save_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def done(self) -> bool:
+        """True si la tâche est terminée (succès, échec ou interruption)."""
+        return self.status != JOB_RUNNING
+
+    def final_event(self) -> JobEvent:
+        """Événement de fin : ``complete`` avec le résultat, sinon ``error``."""
+        if self.status == JOB_COMPLETE:
+            return "complete", self.result or {}
+        return "error", {"message": self.error or "Tâche interrompue"}
+
+    def snapshot(self) -> list[JobEvent]:
+        """Événements rejoués à un abonné qui (re)se connecte."""
+        events: list[JobEvent] = []
+        if self.progress:
+            events.append(("progress", dict(self.progress)))
+        if self.done:
+            events.append(self.final_event())
+        elif self.pending is not None:
+            events.append(self.pending)
+        return events
+
+    def to_dict(self) -> dict:
+        """Représentation JSON (route /jobs/{id})."""
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "params": self.params,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
+
+
+class JobContext:
+    """
+    Poignée passée à la fonction d'une tâche.
+
+    ``progress`` et ``emit`` peuvent être appelés depuis l'event loop ou
+    depuis un thread du pool (callbacks de progression des services).
+    """
+
+    def __init__(
+        self, manager: "JobManager", job: Job, loop: asyncio.AbstractEventLoop
+    ) -> None:
+        self._manager = manager
+        self._loop = loop
+        self._loop_thread = threading.get_ident()
+        self.job = job
+
+    @property
+    def params(self) -> dict:
+        """Paramètres de lancement de la tâche."""
+        return self.job.params
+
+    def _call_on_loop(self, fn: Callable, *args) -> None:
+        if threading.get_ident() == self._loop_thread:
+            fn(*args)
+        else:
+            self._loop.call_soon_threadsafe(fn, *args)
+
+    def progress(self, **fields: Any) -> None:
+        """Met à jour la progression (champs fusionnés) et la publie."""
+        self._call_on_loop(self._manager._update_progress, self.job, fields)
+
+    def emit(self, event: str, data: dict) -> None:
+        """Publie un événement ponctuel aux abonnés (non rejoué)."""
+        self._call_on_loop(self._manager._publish, self.job, event, data)
+
+    async def ask(self, event: str, data: dict) -> Any:
+        """
+        Publie un événement et attend la réponse de l'utilisateur.
+
+        L'événement est rejoué aux abonnés qui se connectent pendant
+        l'attente ; la réponse arrive par ``JobManager.answer``.
+        """
+        job = self.job
+        job._answer = self._loop.create_future()
+        job.pending = (event, data)
+        self._manager._publish(job, event, data)
+        try:
+            return await job._answer
+        finally:
+            job._answer = None
+            job.pending = None
+
+    async def run_blocking(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Exécute une fonction bloquante dans le pool des tâches."""
+        return await self._loop.run_in_executor(
+            self._manager.executor, functools.partial(fn, *args, **kwargs)
+        )
+
+
+JobFunction = Callable[[JobContext], Awaitable[Optional[dict]]]
+
+
+class JobManager:
+    """
+    Registre des tâches de fond, pool de threads et diffusion SSE.
+
+    Attributs :
+        executor: Pool de threads réservé au travail bloquant des tâches.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_JOB_WORKERS,
+        engine: Optional[Engine] = None,
+    ) -> None:
+        """
+        Initialise le gestionnaire.
+
+        Args:
+            max_workers: Threads du pool des tâches.
+            engine: Engine de persistance (engine global si None).
+        """
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="cineorg-job"
+        )
+        self._engine = engine
+        self._jobs: dict[str, Job] = {}
+
+    # --- Persistance ---
+
+    def _get_engine(self) -> Engine:
+        if self._engine is None:
+            from ..infrastructure.persistence.database import get_engine
+
+            self._engine = get_engine()
+        return self._engine
+
+    def _save(self, job: Job) -> None:
+        """Enregistre l'état de la tâche (appelé hors de l'event loop)."""
+        # Verrou : un enregistrement de progression ne peut pas écraser
+        # l'état final enregistré juste après
+        with job._save_lock, Session(self._get_engine()) as session:
+            session.merge(
+                JobModel(
+                    id=job.id,
+                    kind=job.kind,
+                    status=job.status,
+                    params_json=json.dumps(job.params, ensure_ascii=False),
+                    progress_json=json.dumps(job.progress, ensure_ascii=False),
+                    result_json=(
+                        json.dumps(job.result, ensure_ascii=False)
+                        if job.result is not None
+                        else None
+                    ),
+                    error=job.error,
+                    created_at=job.created_at,
+                    updated_at=job.updated_at,
+                )
+            )
+            session.commit()
+
+    def _save_in_background(self, job: Job) -> None:
+        """Enregistre la progression sans bloquer l'event loop (limité en fréquence)."""
+        now = time.monotonic()
+        if now - job._saved_at < _PERSIST_INTERVAL:
+            return
+        job._saved_at = now
+        self.executor.submit(self._save_quietly, job)
+
+    def _save_quietly(self, job: Job) -> None:
+        try:
+            self._save(job)
+        except Exception as e:  # la progression n'est qu'indicative
+            logger.warning("Enregistrement de la tâche %s impossible : %s", job.id, e)
+
+    @staticmethod
+    def _from_model(model: JobModel) -> Job:
+        return Job(
+            id=model.id,
+            kind=model.kind,
+            status=model.status,
+            params=json.loads(model.params_json) if model.params_json else {},
+            progress=json.loads(model.progress_json) if model.progress_json else {},
+            result=json.loads(model.result_json) if model.result_json else None,
+            error=model.error,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+        )
+
+    def recover(self) -> int:
+        """
+        Marque les tâches restées « running » comme interrompues.
+
+        À appeler au démarrage : elles appartenaient à un processus arrêté.
+        Purge aussi les anciennes tâches terminées.
+
+        Returns:
+            Nombre de tâches interrompues.
+        """
+        with Session(self._get_engine()) as session:
+            result = session.exec(
+                update(JobModel)
+                .where(JobModel.status == JOB_RUNNING)
+                .values(status=JOB_INTERRUPTED, error="Serveur redémarré")
+            )
+            for kind in session.exec(select(JobModel.kind).distinct()).all():
+                stale = select(JobModel.id).where(JobModel.kind == kind).order_by(
+                    JobModel.created_at.desc()
+                ).offset(_KEEP_FINISHED)
+                session.exec(delete(JobModel).where(JobModel.id.in_(stale)))
+            session.commit()
+        return result.rowcount
+
+    # --- Registre ---
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Retourne une tâche (en mémoire, sinon depuis la base)."""
+        job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+        with Session(self._get_engine()) as session:
+            model = session.get(JobModel, job_id)
+            return self._from_model(model) if model else None
+
+    def running(self, kind: str) -> Optional[Job]:
+        """Retourne la tâche en cours de ce type, s'il y en a une."""
+        for job in self._jobs.values():
+            if job.kind == kind and not job.done:
+                return job
+        return None
+
+    def latest(self, kind: str) -> Optional[Job]:
+        """Retourne la tâche la plus récente de ce type (en cours ou terminée)."""
+        in_memory = [job for job in self._jobs.values() if job.kind == kind]
+        if in_memory:
+            return max(in_memory, key=lambda job: job.created_at)
+        with Session(self._get_engine()) as session:
+            model = session.exec(
+                select(JobModel)
+                .where(JobModel.kind == kind)
+                .order_by(JobModel.created_at.desc())
+            ).first()
+            return self._from_model(model) if model else None
+
+    def start(self, kind: str, fn: JobFunction, params: Optional[dict] = None) -> Job:
+        """
+        Lance une tâche en arrière-plan (à appeler depuis l'event loop).
+
+        Args:
+            kind: Type de tâche.
+            fn: Coroutine recevant un JobContext et retournant le résultat.
+            params: Paramètres de lancement (persistés avec la tâche).
+
+        Returns:
+            La tâche créée.
+        """
+        job = Job(id=uuid.uuid4().hex, kind=kind, params=params or {})
+        self._jobs[job.id] = job
+        self._prune(kind)
+        ctx = JobContext(self, job, asyncio.get_running_loop())
+        job._task = asyncio.create_task(self._run(job, fn, ctx))
+        return job
+
+    def answer(self, job: Job, value: Any) -> bool:
+        """
+        Transmet la réponse à l'événement en attente d'une tâche.
+
+        Returns:
+            False si la tâche n'attendait aucune réponse.
+        """
+        if job._answer is None or job._answer.done():
+            return False
+        job._answer.set_result(value)
+        return True
+
+    def _prune(self, kind: str) -> None:
+        """Oublie (en mémoire) les plus anciennes tâches terminées d'un type."""
+        finished = sorted(
+            (j for j in self._jobs.values() if j.kind == kind and j.done),
+            key=lambda j: j.created_at,
+        )
+        for job in finished[: max(0, len(finished) - _KEEP_FINISHED)]:
+            del self._jobs[job.id]
+
+    async def _run(self, job: Job, fn: JobFunction, ctx: JobContext) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.executor, self._save_quietly, job)
+        try:
+            job.result = await fn(ctx) or {}
+            job.status = JOB_COMPLETE
+        except asyncio.CancelledError:
+            # Arrêt du serveur : shutdown() enregistre l'état
+            job.status = JOB_INTERRUPTED
+            job.error = "Tâche annulée"
+            self._finish(job)
+            raise
+        except Exception as e:
+            logger.exception("Erreur de la tâche %s (%s): %s", job.kind, job.id, e)
+            job.status = JOB_ERROR
+            job.error = str(e)
+        self._finish(job)
+        await loop.run_in_executor(self.executor, self._save_quietly, job)
+
+    def _finish(self, job: Job) -> None:
+        """Publie l'événement de fin aux abonnés."""
+        job.pending = None
+        job.updated_at = datetime.utcnow()
+        self._publish(job, *job.final_event())
+
+    # --- Diffusion ---
+
+    def _publish(self, job: Job, event: str, data: dict) -> None:
+        for queue in job._subscribers:
+            queue.put_nowait((event, data))
+
+    def _update_progress(self, job: Job, fields: dict) -> None:
+        job.progress.update(fields)
+        job.updated_at = datetime.utcnow()
+        self._publish(job, "progress", dict(job.progress))
+        self._save_in_background(job)
+
+    async def events(self, job: Optional[Job]) -> AsyncIterator[JobEvent]:
+        """
+        Flux des événements d'une tâche, jusqu'à sa fin.
+
+        L'état courant est rejoué d'abord (reconnexion), puis les
+        événements sont reçus par une file dédiée à cet abonné.
+        """
+        if job is None:
+            yield "error", {"message": "Aucun traitement en cours"}
+            return
+        if job.done:
+            for event in job.snapshot():
+                yield event
+            return
+
+        queue: asyncio.Queue[JobEvent] = asyncio.Queue()
+        job._subscribers.append(queue)
+        try:
+            for event in job.snapshot():
+                yield event
+            while True:
+                event, data = await queue.get()
+                yield event, data
+                if event in ("complete", "error"):
+                    return
+        finally:
+            job._subscribers.remove(queue)
+
+    def shutdown(self) -> None:
+        """Annule les tâches en cours et ferme le pool (arrêt du serveur)."""
+        for job in self._jobs.values():
+            if job._task is not None and not job._task.done():
+                job._task.cancel()
+                job.status = JOB_INTERRUPTED
+                job.error = "Serveur arrêté"
+                self._save_quietly(job)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def format_sse(event: str, data: dict) -> str:
+    """Construit un événement SSE."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def sse_response(events: AsyncIterator[JobEvent]) -> StreamingResponse:
+    """Réponse SSE à partir d'un flux d'événements de tâche."""
+
+    async def stream() -> AsyncIterator[str]:
+        async for event, data in events:
+            yield format_sse(event, data)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -184,7 +184,7 @@ def _validate_form(form_data: dict) -> dict[str, str]:
 
 
 @router.get("/config")
-async def config_page(request: Request, saved: int = 0):
+def config_page(request: Request, saved: int = 0):
     """Affiche la page de configuration."""
     settings = Settings()
     sections = _build_field_data(settings)
@@ -311,7 +311,7 @@ async def profile_edit(request: Request, name: str):
 
 
 @router.post("/config/player-profiles/{name}/delete")
-async def profile_delete(request: Request, name: str):
+def profile_delete(request: Request, name: str):
     """Supprime un profil (sauf 'Local')."""
     delete_profile(name)
     return _profiles_fragment(request)
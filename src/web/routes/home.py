@@ -2,43 +2,26 @@
 Route de la page d'accueil.
 
 Affiche les statistiques de la vidéothèque (films, séries, épisodes, en attente).
+Les compteurs sont lus dans la table library_stats (une requête), maintenue
+par des triggers : le coût ne dépend pas de la taille de la vidéothèque.
 """
 
 from fastapi import APIRouter, Request
-from sqlalchemy import func
-from sqlmodel import select
+from fastapi.responses import JSONResponse
 
 from ...infrastructure.persistence.database import get_session
-from ...infrastructure.persistence.models import (
-    EpisodeModel,
-    MovieModel,
-    PendingValidationModel,
-    SeriesModel,
-)
+from ...infrastructure.persistence.library_stats import read_library_stats
 from ..deps import templates
 
 router = APIRouter()
 
 
 @router.get("/")
-async def home(request: Request):
+def home(request: Request):
     """Page d'accueil avec statistiques de la vidéothèque."""
     session = next(get_session())
     try:
-        movie_count = session.exec(
-            select(func.count()).select_from(MovieModel)
-        ).one()
-        series_count = session.exec(
-            select(func.count()).select_from(SeriesModel)
-        ).one()
-        episode_count = session.exec(
-            select(func.count()).select_from(EpisodeModel)
-        ).one()
-        pending_count = session.exec(
-            select(func.count())
-            .select_from(PendingValidationModel)
-            .where(PendingValidationModel.validation_status == "pending")
-        ).one()
+        stats = read_library_stats(session)
     finally:
         session.close()
 
@@ -46,9 +29,20 @@ async def home(request: Request):
         request,
         "home.html",
         {
-            "movie_count": movie_count,
-            "series_count": series_count,
-            "episode_count": episode_count,
-            "pending_count": pending_count,
+            "movie_count": stats["movies.total"],
+            "series_count": stats["series.total"],
+            "episode_count": stats["episodes.total"],
+            "pending_count": stats["pending_validations.pending"],
         },
     )
+
+
+@router.get("/stats")
+def library_stats():
+    """Tous les compteurs des tableaux de bord (JSON)."""
+    session = next(get_session())
+    try:
+        stats = read_library_stats(session)
+    finally:
+        session.close()
+    return JSONResponse(stats)
@@ -0,0 +1,29 @@
+"""
+Routes des tâches de fond.
+
+Permettent de retrouver une tâche par son identifiant (état JSON) et de
+se rattacher à son flux SSE, y compris après une reconnexion.
+"""
+
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+
+from ..jobs import sse_response
+
+router = APIRouter(prefix="/jobs")
+
+
+@router.get("/{job_id}")
+def job_status(request: Request, job_id: str):
+    """État, progression et résultat d'une tâche."""
+    job = request.app.state.jobs.get(job_id)
+    if job is None:
+        return JSONResponse({"error": "Tâche introuvable"}, status_code=404)
+    return JSONResponse(job.to_dict())
+
+
+@router.get("/{job_id}/events")
+def job_events(request: Request, job_id: str):
+    """SSE : état courant rejoué puis événements de la tâche jusqu'à sa fin."""
+    jobs = request.app.state.jobs
+    return sse_response(jobs.events(jobs.get(job_id)))
@@ -1,33 +1,69 @@
 """
 Route de navigation de la bibliothèque — listing avec filtres et pagination.
+
+Les filtres genre, personne et résolution s'appuient sur les tables de
+facettes (movie_genre, series_genre, person, credit) et la colonne
+movies.resolution_label : recherches indexées, et comptes par facette
+affichés dans les filtres.
+
+Les pages rendues sont servies depuis le cache de pages (ETag / 304)
+tant que la vidéothèque n'a pas changé.
 """
 
 import math
 from typing import Optional
 
 from fastapi import APIRouter, Request
+from sqlalchemy import func
 from sqlmodel import select
 
 from ....infrastructure.persistence.database import get_session
-from ....infrastructure.persistence.models import MovieModel, SeriesModel
+from ....infrastructure.persistence.models import (
+    CreditModel,
+    MovieGenreModel,
+    MovieModel,
+    PersonModel,
+    SeriesGenreModel,
+    SeriesModel,
+)
 from ....utils.helpers import title_sort_key
+from ...cache import WATCHED_DEPENDENCY, cached_page
 from ...deps import templates
 from .helpers import (
     ITEMS_PER_PAGE,
     _best_rating,
-    _genre_json_escaped,
     _parse_genres,
     _poster_url,
-    _resolution_label,
     _resolution_pixels,
     _title_search_filter,
 )
 
 router = APIRouter()
 
+_RESOLUTION_ORDER = {"4K": 0, "1080p": 1, "720p": 2, "SD": 3}
 
-@router.get("/")
-async def library_index(
+
+def _credited_ids(entity_type: str, person: str, role: Optional[str]):
+    """Sous-requête des oeuvres auxquelles une personne a participé."""
+    stmt = (
+        select(CreditModel.entity_id)
+        .join(PersonModel, PersonModel.id == CreditModel.person_id)
+        .where(PersonModel.name == person, CreditModel.entity_type == entity_type)
+    )
+    if role in ("director", "actor"):
+        stmt = stmt.where(CreditModel.role == role)
+    return stmt
+
+
+def _genre_counts(session, genre_model, id_column) -> dict[str, int]:
+    """Nombre d'oeuvres par genre (une requête groupée sur l'index)."""
+    rows = session.exec(
+        select(genre_model.genre, func.count(id_column)).group_by(genre_model.genre)
+    ).all()
+    return dict(rows)
+
+
+def _render_library(
     request: Request,
     type: str = "all",
     genre: Optional[str] = None,
@@ -44,7 +80,7 @@ async def library_index(
     order: str = "desc",
     page: int = 1,
 ):
-    """Page principale de la bibliotheque avec filtres et pagination."""
+    """Rend la page de la bibliotheque et ses dependances (oeuvres affichees)."""
     # Convertir year en int (le formulaire envoie "" quand vide)
     year_int: int | None = None
     if year:
@@ -67,17 +103,17 @@ async def library_index(
             if year_int:
                 movie_stmt = movie_stmt.where(MovieModel.year == year_int)
             if genre:
-                movie_stmt = movie_stmt.where(MovieModel.genres_json.contains(_genre_json_escaped(genre)))
-            if person:
-                if person_role == "director":
-                    movie_stmt = movie_stmt.where(MovieModel.director.contains(person))
-                elif person_role == "actor":
-                    movie_stmt = movie_stmt.where(MovieModel.cast_json.contains(person))
-                else:
-                    movie_stmt = movie_stmt.where(
-                        MovieModel.director.contains(person)
-                        | MovieModel.cast_json.contains(person)
+                movie_stmt = movie_stmt.where(
+                    MovieModel.id.in_(
+                        select(MovieGenreModel.movie_id).where(MovieGenreModel.genre == genre)
                     )
+                )
+            if person:
+                movie_stmt = movie_stmt.where(
+                    MovieModel.id.in_(_credited_ids("movie", person, person_role))
+                )
+            if resolution:
+                movie_stmt = movie_stmt.where(MovieModel.resolution_label == resolution)
             if codec_video:
                 movie_stmt = movie_stmt.where(MovieModel.codec_video == codec_video)
             if codec_audio:
@@ -87,12 +123,6 @@ async def library_index(
 
             movies = session.exec(movie_stmt).all()
 
-            # Filtre resolution cote Python (label converti)
-            if resolution:
-                movies = [
-                    m for m in movies if _resolution_label(m.resolution) == resolution
-                ]
-
             for m in movies:
                 rating = _best_rating(m.vote_average, m.imdb_rating)
                 items.append(
@@ -108,7 +138,7 @@ async def library_index(
                         if m.imdb_rating is not None
                         else "TMDB",
                         "resolution": m.resolution,
-                        "resolution_label": _resolution_label(m.resolution),
+                        "resolution_label": m.resolution_label or "",
                         "codec_video": m.codec_video,
                         "codec_audio": m.codec_audio,
                         "watched": m.watched,
@@ -131,21 +161,15 @@ async def library_index(
             if year_int:
                 series_stmt = series_stmt.where(SeriesModel.year == year_int)
             if genre:
-                series_stmt = series_stmt.where(SeriesModel.genres_json.contains(_genre_json_escaped(genre)))
-            if person:
-                if person_role == "director":
-                    series_stmt = series_stmt.where(
-                        SeriesModel.director.contains(person)
-                    )
-                elif person_role == "actor":
-                    series_stmt = series_stmt.where(
-                        SeriesModel.cast_json.contains(person)
-                    )
-                else:
-                    series_stmt = series_stmt.where(
-                        SeriesModel.director.contains(person)
-                        | SeriesModel.cast_json.contains(person)
+                series_stmt = series_stmt.where(
+                    SeriesModel.id.in_(
+                        select(SeriesGenreModel.series_id).where(SeriesGenreModel.genre == genre)
                     )
+                )
+            if person:
+                series_stmt = series_stmt.where(
+                    SeriesModel.id.in_(_credited_ids("series", person, person_role))
+                )
 
             if unwatched == "1":
                 series_stmt = series_stmt.where(SeriesModel.watched == False)  # noqa: E712
@@ -217,18 +241,19 @@ async def library_index(
         start = (page - 1) * ITEMS_PER_PAGE
         page_items = items[start : start + ITEMS_PER_PAGE]
 
-        # --- Genres distincts pour le filtre ---
-        all_genres: set[str] = set()
-        all_movie_genres = session.exec(
-            select(MovieModel.genres_json).where(MovieModel.genres_json.is_not(None))
-        ).all()
-        for gj in all_movie_genres:
-            all_genres.update(_parse_genres(gj))
-        all_series_genres = session.exec(
-            select(SeriesModel.genres_json).where(SeriesModel.genres_json.is_not(None))
-        ).all()
-        for gj in all_series_genres:
-            all_genres.update(_parse_genres(gj))
+        # --- Genres (facettes) avec nombre d'oeuvres ---
+        movie_genre_counts = _genre_counts(session, MovieGenreModel, MovieGenreModel.movie_id)
+        series_genre_counts = _genre_counts(
+            session, SeriesGenreModel, SeriesGenreModel.series_id
+        )
+        genre_counts: dict[str, int] = {}
+        for counts, media_type in (
+            (movie_genre_counts, "movie"),
+            (series_genre_counts, "series"),
+        ):
+            for g, count in counts.items():
+                included = type in ("all", media_type)
+                genre_counts[g] = genre_counts.get(g, 0) + (count if included else 0)
 
         # --- Annees distinctes pour le filtre ---
         movie_years = session.exec(
@@ -240,20 +265,16 @@ async def library_index(
         all_years = sorted(set(movie_years + series_years), reverse=True)
 
         # --- Valeurs distinctes techniques (films uniquement) ---
-        raw_resolutions = session.exec(
-            select(MovieModel.resolution)
-            .where(MovieModel.resolution.is_not(None))
-            .distinct()
-        ).all()
-        # Convertir en labels et deduper
-        res_labels: set[str] = set()
-        for r in raw_resolutions:
-            label = _resolution_label(r)
-            if label:
-                res_labels.add(label)
+        resolution_counts = dict(
+            session.exec(
+                select(MovieModel.resolution_label, func.count(MovieModel.id))
+                .where(MovieModel.resolution_label.is_not(None))
+                .group_by(MovieModel.resolution_label)
+            ).all()
+        )
         all_resolutions = sorted(
-            res_labels,
-            key=lambda x: {"4K": 0, "1080p": 1, "720p": 2, "SD": 3}.get(x, 4),
+            (r for r in resolution_counts if r),
+            key=lambda x: _RESOLUTION_ORDER.get(x, 4),
         )
 
         all_codecs_video = sorted(
@@ -284,9 +305,11 @@ async def library_index(
         "total_items": total_items,
         "page": page,
         "total_pages": total_pages,
-        "genres": sorted(all_genres),
+        "genres": sorted(genre_counts),
+        "genre_counts": genre_counts,
         "years": all_years,
         "resolutions": all_resolutions,
+        "resolution_counts": resolution_counts,
         "codecs_video": all_codecs_video,
         "codecs_audio": all_codecs_audio,
         "current_type": type,
@@ -304,12 +327,42 @@ async def library_index(
         "current_order": order,
     }
 
+    # Badges « vu » des oeuvres affichees ; le filtre « non vus » depend de tous
+    dependencies = {(item["type"], item["id"]) for item in page_items}
+    if unwatched == "1":
+        dependencies.add(WATCHED_DEPENDENCY)
+
     # Si requete HTMX, retourner filtres + grille (le bloc #library-content)
     if request.headers.get("HX-Request"):
-        response = templates.TemplateResponse(request, "library/_content.html", context)
-        response.headers["Vary"] = "HX-Request"
-        return response
+        template = "library/_content.html"
+    else:
+        template = "library/index.html"
+    return templates.TemplateResponse(request, template, context), dependencies
+
 
-    response = templates.TemplateResponse(request, "library/index.html", context)
-    response.headers["Vary"] = "HX-Request"
-    return response
+@router.get("/")
+def library_index(
+    request: Request,
+    type: str = "all",
+    genre: Optional[str] = None,
+    year: Optional[str] = None,
+    q: Optional[str] = None,
+    person: Optional[str] = None,
+    person_role: Optional[str] = None,
+    resolution: Optional[str] = None,
+    codec_video: Optional[str] = None,
+    codec_audio: Optional[str] = None,
+    search_mode: str = "title",
+    unwatched: Optional[str] = None,
+    sort: str = "title",
+    order: str = "desc",
+    page: int = 1,
+):
+    """Page principale de la bibliotheque avec filtres et pagination (mise en cache)."""
+    return cached_page(
+        request,
+        lambda: _render_library(
+            request, type, genre, year, q, person, person_role, resolution,
+            codec_video, codec_audio, search_mode, unwatched, sort, order, page,
+        ),
+    )
@@ -1,5 +1,8 @@
 """
 Routes de détail — fiches film et série.
+
+Les fiches sont servies depuis le cache de pages ; basculer « vu » ou la
+note d'une œuvre invalide uniquement les pages qui l'affichent.
 """
 
 from fastapi import APIRouter, Form, Request
@@ -13,6 +16,7 @@ from ....infrastructure.persistence.models import (
     SeriesModel,
     VideoFileModel,
 )
+from ...cache import WATCHED_DEPENDENCY, cached_page, page_cache
 from ...deps import templates
 from .helpers import (
     _find_movie_file,
@@ -27,8 +31,16 @@ router = APIRouter()
 
 
 @router.get("/movies/{movie_id}")
-async def movie_detail(request: Request, movie_id: int):
-    """Page de detail d'un film."""
+def movie_detail(request: Request, movie_id: int):
+    """Page de detail d'un film (mise en cache)."""
+    return cached_page(
+        request,
+        lambda: (_render_movie_detail(request, movie_id), {("movie", movie_id)}),
+    )
+
+
+def _render_movie_detail(request: Request, movie_id: int):
+    """Rend la page de detail d'un film."""
     session = next(get_session())
     try:
         movie = session.get(MovieModel, movie_id)
@@ -91,7 +103,7 @@ async def movie_detail(request: Request, movie_id: int):
 
 
 @router.post("/movies/{movie_id}/toggle-watched")
-async def toggle_watched(request: Request, movie_id: int):
+def toggle_watched(request: Request, movie_id: int):
     """Toggle l'etat watched d'un film et retourne le fragment HTML mis a jour."""
     session = next(get_session())
     try:
@@ -105,6 +117,7 @@ async def toggle_watched(request: Request, movie_id: int):
         watched = movie.watched
     finally:
         session.close()
+    page_cache.invalidate(("movie", movie_id), WATCHED_DEPENDENCY)
     return templates.TemplateResponse(
         request,
         "library/_watched_btn.html",
@@ -113,7 +126,7 @@ async def toggle_watched(request: Request, movie_id: int):
 
 
 @router.post("/movies/{movie_id}/rate")
-async def rate_movie(request: Request, movie_id: int, rating: int = Form(...)):
+def rate_movie(request: Request, movie_id: int, rating: int = Form(...)):
     """Met a jour la note personnelle d'un film (toggle off si meme note)."""
     session = next(get_session())
     try:
@@ -131,6 +144,7 @@ async def rate_movie(request: Request, movie_id: int, rating: int = Form(...)):
         current_rating = movie.personal_rating
     finally:
         session.close()
+    page_cache.invalidate(("movie", movie_id))
     return templates.TemplateResponse(
         request,
         "library/_star_rating.html",
@@ -139,8 +153,16 @@ async def rate_movie(request: Request, movie_id: int, rating: int = Form(...)):
 
 
 @router.get("/series/{series_id}")
-async def series_detail(request: Request, series_id: int):
-    """Page de detail d'une serie avec episodes groupes par saison."""
+def series_detail(request: Request, series_id: int):
+    """Page de detail d'une serie avec episodes groupes par saison (mise en cache)."""
+    return cached_page(
+        request,
+        lambda: (_render_series_detail(request, series_id), {("series", series_id)}),
+    )
+
+
+def _render_series_detail(request: Request, series_id: int):
+    """Rend la page de detail d'une serie."""
     session = next(get_session())
     try:
         series = session.get(SeriesModel, series_id)
@@ -211,7 +233,7 @@ async def series_detail(request: Request, series_id: int):
 
 
 @router.post("/series/{series_id}/toggle-watched")
-async def toggle_series_watched(request: Request, series_id: int):
+def toggle_series_watched(request: Request, series_id: int):
     """Toggle l'etat watched d'une serie et retourne le fragment HTML mis a jour."""
     session = next(get_session())
     try:
@@ -225,6 +247,7 @@ async def toggle_series_watched(request: Request, series_id: int):
         watched = series.watched
     finally:
         session.close()
+    page_cache.invalidate(("series", series_id), WATCHED_DEPENDENCY)
     return templates.TemplateResponse(
         request,
         "library/_watched_btn_series.html",
@@ -233,7 +256,7 @@ async def toggle_series_watched(request: Request, series_id: int):
 
 
 @router.post("/series/{series_id}/rate")
-async def rate_series(request: Request, series_id: int, rating: int = Form(...)):
+def rate_series(request: Request, series_id: int, rating: int = Form(...)):
     """Met a jour la note personnelle d'une serie (toggle off si meme note)."""
     session = next(get_session())
     try:
@@ -250,6 +273,7 @@ async def rate_series(request: Request, series_id: int, rating: int = Form(...))
         current_rating = series.personal_rating
     finally:
         session.close()
+    page_cache.invalidate(("series", series_id))
     return templates.TemplateResponse(
         request,
         "library/_star_rating_series.html",
@@ -8,6 +8,7 @@ from pathlib import Path
 from sqlmodel import select
 
 from ....infrastructure.persistence.database import get_session
+from ....infrastructure.persistence.facets import resolution_label
 from ....infrastructure.persistence.models import EpisodeModel
 from ....utils.constants import GENRE_FOLDER_MAPPING
 from ....utils.helpers import search_variants
@@ -74,17 +75,6 @@ def _get_storage_genre_info(
     return best_genre, storage_folder
 
 
-def _genre_json_escaped(genre: str) -> str:
-    """Retourne la version JSON-escaped d'un genre pour LIKE SQL.
-
-    Les genres_json en DB utilisent json.dumps(ensure_ascii=True) par défaut,
-    donc "Comédie" est stocké comme "Com\\u00e9die". Ce helper génère
-    la version escaped pour que le LIKE SQL fonctionne.
-    """
-    # json.dumps produit '"Com\\u00e9die"', on retire les guillemets
-    return json.dumps(genre)[1:-1]
-
-
 def _format_duration(seconds: int | None) -> str:
     """Formate une duree en secondes en 'Xh XXmin'."""
     if not seconds:
@@ -98,15 +88,7 @@ def _format_duration(seconds: int | None) -> str:
 
 def _resolution_label(resolution: str | None) -> str:
     """Convertit '1920x1080' en '1080p' via Resolution.label."""
-    if not resolution or "x" not in resolution:
-        return resolution or ""
-    try:
-        w, h = resolution.split("x")
-        from ....core.value_objects.media_info import Resolution
-
-        return Resolution(width=int(w), height=int(h)).label
-    except (ValueError, TypeError):
-        return resolution
+    return resolution_label(resolution)
 
 
 def _resolution_pixels(resolution: str | None) -> int:
@@ -138,48 +120,24 @@ def _best_rating(vote_average: float | None, imdb_rating: float | None) -> float
 
 def _find_movie_file(title: str, year: int | None, original_title: str | None = None) -> dict | None:
     """
-    Recherche le fichier d'un film dans video/Films/ par titre et annee,
+    Recherche le fichier d'un film via l'index des symlinks de video/Films/,
     puis en fallback dans les VideoFiles en DB par titre approche.
 
-    Strategie : file_path en DB, sinon resolution du symlink via glob,
+    Strategie : index movie_links (titre normalise + annee, requete indexee),
     sinon recherche dans VideoFileModel par titre approche (LIKE SQL).
 
     Returns:
         Dict avec symlink_path et storage_path, ou None si non trouve
     """
-    from ....config import Settings
     from ....infrastructure.persistence.models import VideoFileModel
-
-    try:
-        settings = Settings()
-        video_dir = Path(settings.video_dir) / "Films"
-    except Exception:
-        video_dir = None
+    from ....infrastructure.persistence.repositories.movie_link_repository import (
+        SQLModelMovieLinkRepository,
+    )
 
     def _normalize(s: str) -> str:
         """Retire les caracteres speciaux pour comparaison."""
         return "".join(c.lower() for c in s if c.isalnum() or c == " ").strip()
 
-    # 1) Glob dans video/Films/ par titre + annee (exact)
-    if video_dir and video_dir.exists() and year:
-        norm_title = _normalize(title)
-        year_str = f"({year})"
-        for f in video_dir.rglob(f"*{year_str}*"):
-            if not f.is_file():
-                continue
-            fname = f.name
-            idx = fname.find(year_str)
-            if idx <= 0:
-                continue
-            file_title = fname[:idx].strip()
-            if _normalize(file_title) == norm_title:
-                try:
-                    storage_path = str(f.resolve()) if f.is_symlink() else None
-                except OSError:
-                    storage_path = None
-                return {"symlink_path": str(f), "storage_path": storage_path}
-
-    # 2) Recherche dans VideoFileModel par titre approche
     session = next(get_session())
     try:
         # Chercher avec le titre principal puis le titre original
@@ -187,6 +145,21 @@ def _find_movie_file(title: str, year: int | None, original_title: str | None =
         if original_title and original_title != title:
             search_titles.append(original_title)
 
+        # 1) Index des symlinks par titre + annee (exact)
+        if year:
+            links = SQLModelMovieLinkRepository(session)
+            for search_title in search_titles:
+                link = links.find(search_title, year)
+                # Entree perimee (symlink supprime hors CineOrg) : ignoree
+                if link and link.symlink_path.is_symlink():
+                    return {
+                        "symlink_path": str(link.symlink_path),
+                        "storage_path": (
+                            str(link.target_path) if link.target_path else None
+                        ),
+                    }
+
+        # 2) Recherche dans VideoFileModel par titre approche
         for search_title in search_titles:
             # Extraire les mots significatifs (>= 3 chars) pour la recherche
             words = [w for w in search_title.split() if len(w) >= 3]
@@ -221,7 +194,7 @@ def _get_file_duration(movie) -> int | None:
     """
     Extrait la duree reelle d'un fichier video via mediainfo.
 
-    Strategie : file_path en DB, sinon resolution du symlink via _find_movie_file.
+    Strategie : file_path en DB, sinon fichier indexe via _find_movie_file.
     """
     from ....adapters.parsing.mediainfo_extractor import MediaInfoExtractor
 
@@ -148,7 +148,7 @@ def _error_html(message: str, entity_type: str, entity_id: int) -> str:
 
 
 @router.get("/play-status/{pid}")
-async def play_status(
+def play_status(
     request: Request, pid: int, entity_type: str = "", entity_id: int = 0
 ):
     """Verifie si le lecteur tourne encore ; sinon retourne le bouton Visionner."""
@@ -187,7 +187,7 @@ async def play_status(
 
 
 @router.post("/movies/{movie_id}/play")
-async def movie_play(request: Request, movie_id: int):
+def movie_play(request: Request, movie_id: int):
     """Lance le lecteur pour visionner un film."""
     session = next(get_session())
     try:
@@ -219,7 +219,7 @@ async def movie_play(request: Request, movie_id: int):
 
 
 @router.post("/episodes/{episode_id}/play")
-async def episode_play(request: Request, episode_id: int):
+def episode_play(request: Request, episode_id: int):
     """Lance le lecteur pour visionner un episode."""
     session = next(get_session())
     try:
@@ -242,7 +242,7 @@ async def episode_play(request: Request, episode_id: int):
 
 
 @router.post("/series/{series_id}/play")
-async def series_play(request: Request, series_id: int):
+def series_play(request: Request, series_id: int):
     """Lance le lecteur pour le premier episode disponible d'une serie."""
     session = next(get_session())
     try:
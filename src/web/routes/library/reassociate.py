@@ -2,6 +2,7 @@
 Routes de ré-association TMDB — correction manuelle des associations films et séries.
 """
 
+import asyncio
 import json
 from datetime import datetime
 
@@ -30,8 +31,105 @@ from .helpers import (
 router = APIRouter()
 
 
+def _get_entity(model_class, entity_id: int):
+    """Charge un film ou une serie (session dediee, executee hors event loop)."""
+    session = next(get_session())
+    try:
+        return session.get(model_class, entity_id)
+    finally:
+        session.close()
+
+
+def _confirm_association(session, entity_type: str, entity_id: int) -> None:
+    """Marque une association comme confirmee (exclue des futurs scans qualite)."""
+    existing = session.exec(
+        select(ConfirmedAssociationModel).where(
+            ConfirmedAssociationModel.entity_type == entity_type,
+            ConfirmedAssociationModel.entity_id == entity_id,
+        )
+    ).first()
+    if not existing:
+        session.add(ConfirmedAssociationModel(
+            entity_type=entity_type, entity_id=entity_id,
+        ))
+
+
+def _apply_movie_details(movie_id: int, tmdb_id: str, details, imdb_id) -> bool:
+    """Met a jour un film depuis les details TMDB. Retourne False si introuvable."""
+    session = next(get_session())
+    try:
+        movie = session.get(MovieModel, movie_id)
+        if not movie:
+            return False
+
+        movie.tmdb_id = int(tmdb_id)
+        movie.imdb_id = imdb_id
+        movie.title = details.title
+        movie.original_title = details.original_title
+        movie.year = details.year
+        movie.genres_json = json.dumps(list(details.genres)) if details.genres else None
+        movie.duration_seconds = details.duration_seconds
+        movie.overview = details.overview
+        movie.poster_path = details.poster_url
+        movie.director = details.director
+        movie.cast_json = json.dumps(list(details.cast)) if details.cast else None
+        movie.vote_average = details.vote_average
+        movie.vote_count = details.vote_count
+        movie.updated_at = datetime.utcnow()
+
+        # Tenter de relier le fichier physique via le symlink video/
+        if not movie.file_path:
+            file_info = _find_movie_file(details.title, details.year)
+            if file_info:
+                movie.file_path = file_info.get("storage_path") or file_info.get(
+                    "symlink_path"
+                )
+
+        _confirm_association(session, "movie", movie_id)
+        session.add(movie)
+        session.commit()
+        return True
+    finally:
+        session.close()
+
+
+def _apply_series_details(series_id: int, tmdb_id: str, details, imdb_id) -> bool:
+    """Met a jour une serie depuis les details TMDB. Retourne False si introuvable."""
+    session = next(get_session())
+    try:
+        series = session.get(SeriesModel, series_id)
+        if not series:
+            return False
+
+        series.tmdb_id = int(tmdb_id)
+        series.imdb_id = imdb_id
+        series.tvdb_id = (
+            None  # L'association change, l'ancien tvdb_id n'est plus valide
+        )
+        series.title = details.title
+        series.original_title = details.original_title
+        series.year = details.year
+        series.genres_json = (
+            json.dumps(list(details.genres)) if details.genres else None
+        )
+        series.overview = details.overview
+        series.poster_path = details.poster_url
+        series.director = details.director
+        series.cast_json = json.dumps(list(details.cast)) if details.cast else None
+        series.vote_average = details.vote_average
+        series.vote_count = details.vote_count
+        series.updated_at = datetime.utcnow()
+
+        _confirm_association(session, "series", series_id)
+        session.add(series)
+        session.commit()
+        return True
+    finally:
+        session.close()
+
+
 @router.get("/movies/{movie_id}/reassociate")
-async def movie_reassociate_overlay(request: Request, movie_id: int):
+def movie_reassociate_overlay(request: Request, movie_id: int):
     """Retourne le fragment HTML de l'overlay de recherche pour un film."""
     session = next(get_session())
     try:
@@ -68,15 +166,13 @@ async def movie_reassociate_search(request: Request, movie_id: int, q: str = "")
     tmdb_client = container.tmdb_client()
 
     # Recuperer le film en DB
-    session = next(get_session())
-    try:
-        movie = session.get(MovieModel, movie_id)
-        current_tmdb_id = movie.tmdb_id if movie else None
-    finally:
-        session.close()
+    movie = await asyncio.to_thread(_get_entity, MovieModel, movie_id)
+    current_tmdb_id = movie.tmdb_id if movie else None
 
     # Duree reelle du fichier via mediainfo (seule source fiable)
-    local_duration = _get_file_duration(movie) if movie else None
+    local_duration = (
+        await asyncio.to_thread(_get_file_duration, movie) if movie else None
+    )
 
     # Recherche TMDB
     results = await tmdb_client.search(q)
@@ -150,52 +246,12 @@ async def movie_reassociate_apply(
     ext_ids = await tmdb_client.get_external_ids(tmdb_id)
     imdb_id = ext_ids.get("imdb_id") if ext_ids else None
 
-    # Mettre a jour le MovieModel
-    session = next(get_session())
-    try:
-        movie = session.get(MovieModel, movie_id)
-        if not movie:
-            return HTMLResponse("<p>Film non trouvé</p>", status_code=404)
-
-        movie.tmdb_id = int(tmdb_id)
-        movie.imdb_id = imdb_id
-        movie.title = details.title
-        movie.original_title = details.original_title
-        movie.year = details.year
-        movie.genres_json = json.dumps(list(details.genres)) if details.genres else None
-        movie.duration_seconds = details.duration_seconds
-        movie.overview = details.overview
-        movie.poster_path = details.poster_url
-        movie.director = details.director
-        movie.cast_json = json.dumps(list(details.cast)) if details.cast else None
-        movie.vote_average = details.vote_average
-        movie.vote_count = details.vote_count
-        movie.updated_at = datetime.utcnow()
-
-        # Tenter de relier le fichier physique via le symlink video/
-        if not movie.file_path:
-            file_info = _find_movie_file(details.title, details.year)
-            if file_info:
-                movie.file_path = file_info.get("storage_path") or file_info.get(
-                    "symlink_path"
-                )
-
-        # Marquer comme confirmé (exclure des futurs scans qualité)
-        existing = session.exec(
-            select(ConfirmedAssociationModel).where(
-                ConfirmedAssociationModel.entity_type == "movie",
-                ConfirmedAssociationModel.entity_id == movie_id,
-            )
-        ).first()
-        if not existing:
-            session.add(ConfirmedAssociationModel(
-                entity_type="movie", entity_id=movie_id,
-            ))
-
-        session.add(movie)
-        session.commit()
-    finally:
-        session.close()
+    # Mettre a jour le MovieModel (hors event loop : DB + recherche du fichier)
+    updated = await asyncio.to_thread(
+        _apply_movie_details, movie_id, tmdb_id, details, imdb_id
+    )
+    if not updated:
+        return HTMLResponse("<p>Film non trouvé</p>", status_code=404)
 
     _remove_from_quality_cache("movie", movie_id)
 
@@ -205,7 +261,7 @@ async def movie_reassociate_apply(
 
 
 @router.get("/series/{series_id}/reassociate")
-async def series_reassociate_overlay(request: Request, series_id: int):
+def series_reassociate_overlay(request: Request, series_id: int):
     """Retourne le fragment HTML de l'overlay de recherche pour une serie."""
     session = next(get_session())
     try:
@@ -243,15 +299,13 @@ async def series_reassociate_search(request: Request, series_id: int, q: str = "
     tmdb_client = container.tmdb_client()
 
     # Recuperer le tmdb_id actuel pour marquage
-    session = next(get_session())
-    try:
-        series = session.get(SeriesModel, series_id)
-        current_tmdb_id = series.tmdb_id if series else None
-    finally:
-        session.close()
+    series = await asyncio.to_thread(_get_entity, SeriesModel, series_id)
+    current_tmdb_id = series.tmdb_id if series else None
 
     # Compter saisons/episodes locaux
-    local_seasons, local_episodes = _get_local_series_counts(series_id)
+    local_seasons, local_episodes = await asyncio.to_thread(
+        _get_local_series_counts, series_id
+    )
 
     # Recherche TMDB TV
     results = await tmdb_client.search_tv(q)
@@ -342,51 +396,16 @@ async def series_reassociate_apply(
     ext_ids = await tmdb_client.get_tv_external_ids(tmdb_id)
     imdb_id = ext_ids.get("imdb_id") if ext_ids else None
 
-    # Mettre a jour le SeriesModel
-    session = next(get_session())
-    try:
-        series = session.get(SeriesModel, series_id)
-        if not series:
-            return HTMLResponse("<p>Série non trouvée</p>", status_code=404)
-
-        series.tmdb_id = int(tmdb_id)
-        series.imdb_id = imdb_id
-        series.tvdb_id = (
-            None  # L'association change, l'ancien tvdb_id n'est plus valide
-        )
-        series.title = details.title
-        series.original_title = details.original_title
-        series.year = details.year
-        series.genres_json = (
-            json.dumps(list(details.genres)) if details.genres else None
-        )
-        series.overview = details.overview
-        series.poster_path = details.poster_url
-        series.director = details.director
-        series.cast_json = json.dumps(list(details.cast)) if details.cast else None
-        series.vote_average = details.vote_average
-        series.vote_count = details.vote_count
-        series.updated_at = datetime.utcnow()
-
-        # Marquer comme confirmé (exclure des futurs scans qualité)
-        existing = session.exec(
-            select(ConfirmedAssociationModel).where(
-                ConfirmedAssociationModel.entity_type == "series",
-                ConfirmedAssociationModel.entity_id == series_id,
-            )
-        ).first()
-        if not existing:
-            session.add(ConfirmedAssociationModel(
-                entity_type="series", entity_id=series_id,
-            ))
-
-        session.add(series)
-        session.commit()
-    finally:
-        session.close()
+    # Mettre a jour le SeriesModel (hors event loop)
+    updated = await asyncio.to_thread(
+        _apply_series_details, series_id, tmdb_id, details, imdb_id
+    )
+    if not updated:
+        return HTMLResponse("<p>Série non trouvée</p>", status_code=404)
 
     _remove_from_quality_cache("series", series_id)
 
     response = Response(status_code=200)
     response.headers["HX-Redirect"] = f"/library/series/{series_id}"
     return response
+
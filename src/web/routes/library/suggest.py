@@ -6,35 +6,37 @@ Historique de navigation :
 - pos : position courante dans l'historique (0-indexé)
 - Flèche droite : avance (réutilise l'historique ou tire un nouveau)
 - Flèche gauche : recule dans l'historique
+
+Le tirage passe par le moteur de suggestion (services/suggestion.py) :
+filtres évalués en SQL, identifiants éligibles en cache, une seule ligne
+chargée par tirage.
 """
 
-import random
 from typing import Optional
 
 from fastapi import APIRouter, Request
-from sqlalchemy import or_
-from sqlmodel import select
+from sqlmodel import select, union
 
 from ....infrastructure.persistence.database import get_session
-from ....infrastructure.persistence.models import MovieModel, SeriesModel
+from ....infrastructure.persistence.models import (
+    MovieGenreModel,
+    MovieModel,
+    SeriesGenreModel,
+    SeriesModel,
+)
+from ....services.suggestion import SuggestionEngine, SuggestionFilters, SuggestionKey
 from ...deps import templates
 from .helpers import (
     _best_rating,
     _format_duration,
-    _genre_json_escaped,
     _parse_genres,
     _poster_url,
 )
 
 router = APIRouter()
 
-
-def _eligible_filter(model_class):
-    """Filtre d'éligibilité : non-vus OU déjà vus avec note >= 4."""
-    return or_(
-        model_class.watched == False,  # noqa: E712
-        (model_class.watched == True) & (model_class.personal_rating >= 4),  # noqa: E712
-    )
+# Moteur partagé par les requêtes (cache invalidé par les écritures ORM)
+_engine = SuggestionEngine()
 
 
 def _build_item(m, item_type: str) -> dict:
@@ -61,21 +63,18 @@ def _parse_history(history: str) -> list[str]:
     return [t.strip() for t in history.split(",") if t.strip() and ":" in t]
 
 
-def _history_ids(items: list[str]) -> tuple[set[int], set[int]]:
-    """Extrait les sets d'IDs films et séries depuis l'historique."""
-    movie_ids: set[int] = set()
-    series_ids: set[int] = set()
+def _history_keys(items: list[str]) -> set[SuggestionKey]:
+    """Extrait les clés (type, id) films et séries depuis l'historique."""
+    keys: set[SuggestionKey] = set()
     for token in items:
         kind, val = token.split(":", 1)
         try:
             item_id = int(val)
         except ValueError:
             continue
-        if kind == "movie":
-            movie_ids.add(item_id)
-        elif kind == "series":
-            series_ids.add(item_id)
-    return movie_ids, series_ids
+        if kind in ("movie", "series"):
+            keys.add((kind, item_id))
+    return keys
 
 
 def _fetch_item(session, key: str) -> dict | None:
@@ -97,7 +96,7 @@ def _fetch_item(session, key: str) -> dict | None:
 
 
 @router.get("/suggest")
-async def suggest(
+def suggest(
     request: Request,
     genre: Optional[str] = None,
     max_duration: Optional[str] = None,
@@ -141,60 +140,30 @@ async def suggest(
             result = _fetch_item(session, history_items[pos_int])
             navigating = True
 
-        # --- Construire la liste des candidats (pour tirage ou comptage) ---
-        candidates = []
-
-        if type in ("all", "movie"):
-            movie_stmt = select(MovieModel).where(_eligible_filter(MovieModel))
-            if genre:
-                movie_stmt = movie_stmt.where(
-                    MovieModel.genres_json.contains(_genre_json_escaped(genre))
-                )
-            if max_duration_int:
-                movie_stmt = movie_stmt.where(
-                    MovieModel.duration_seconds <= max_duration_int * 60
-                )
-            for m in session.exec(movie_stmt).all():
-                item = _build_item(m, "movie")
-                if min_rating_float and (item["rating"] is None or item["rating"] < min_rating_float):
-                    continue
-                candidates.append(item)
-
-        if type in ("all", "series"):
-            series_stmt = select(SeriesModel).where(_eligible_filter(SeriesModel))
-            if genre:
-                series_stmt = series_stmt.where(
-                    SeriesModel.genres_json.contains(_genre_json_escaped(genre))
-                )
-            for s in session.exec(series_stmt).all():
-                item = _build_item(s, "series")
-                if min_rating_float and (item["rating"] is None or item["rating"] < min_rating_float):
-                    continue
-                candidates.append(item)
+        # --- Candidats éligibles (SQL + cache) ---
+        filters = SuggestionFilters(
+            type=type,
+            genre=genre or None,
+            max_duration_min=max_duration_int,
+            min_rating=min_rating_float,
+        )
+        total_candidates = _engine.count(session, filters)
 
         # --- Tirage aléatoire (si pas en navigation) ---
         if not result:
-            excluded_movie_ids, excluded_series_ids = _history_ids(history_items)
-            filtered = [
-                c for c in candidates
-                if not (
-                    (c["type"] == "movie" and c["id"] in excluded_movie_ids)
-                    or (c["type"] == "series" and c["id"] in excluded_series_ids)
+            picked = _engine.pick(session, filters, exclude=_history_keys(history_items))
+            if picked:
+                result = _fetch_item(session, f"{picked[0]}:{picked[1]}")
+
+        # --- Genres distincts pour le filtre (tables de facettes) ---
+        all_genres = set(
+            session.exec(
+                union(
+                    select(MovieGenreModel.genre).distinct(),
+                    select(SeriesGenreModel.genre).distinct(),
                 )
-            ]
-            pool = filtered if filtered else candidates
-            result = random.choice(pool) if pool else None
-
-        # --- Genres distincts pour le filtre ---
-        all_genres: set[str] = set()
-        for gj in session.exec(
-            select(MovieModel.genres_json).where(MovieModel.genres_json.is_not(None))
-        ).all():
-            all_genres.update(_parse_genres(gj))
-        for gj in session.exec(
-            select(SeriesModel.genres_json).where(SeriesModel.genres_json.is_not(None))
-        ).all():
-            all_genres.update(_parse_genres(gj))
+            ).scalars().all()
+        )
 
     finally:
         session.close()
@@ -226,7 +195,7 @@ async def suggest(
             "current_max_duration": max_duration_int or "",
             "current_min_rating": min_rating or "",
             "current_type": type,
-            "total_candidates": len(candidates),
+            "total_candidates": total_candidates,
             "history": history_str,
             "pos": current_pos,
             "can_go_back": current_pos > 0,
@@ -2,26 +2,33 @@
 Routes de la page de maintenance.
 
 Affiche les diagnostics d'intégrité et de nettoyage de la vidéothèque
-en mode lecture seule avec progression SSE en temps réel.
+en mode lecture seule avec progression SSE en temps réel. Les analyses
+sont des tâches de fond : le dernier résultat reste affiché après un
+rechargement ou un redémarrage du serveur.
 Les actions correctives restent dans le CLI.
 
 Scope limité aux Films et Séries uniquement.
 """
 
-import asyncio
-import json
 from pathlib import Path
 
 from fastapi import APIRouter, Request
 from fastapi.responses import StreamingResponse
 
 from ..deps import templates
+from ..jobs import JobContext, sse_response
 
 router = APIRouter()
 
+# Analyses exécutées en tâches de fond (résultat persisté)
+_ANALYSIS_JOBS = {"check": "maintenance-check", "cleanup": "maintenance-cleanup"}
+
 # Sous-dossiers du storage à analyser (films et séries uniquement)
 _SCOPED_SUBDIRS = ("Films", "Séries")
 
+# Threads de stat pour la passe des entrées fantômes (NAS monté en réseau)
+_GHOST_STAT_WORKERS = 8
+
 
 def _truncate_path(path: Path | str, segments: int = 3) -> str:
     """Tronque un chemin en ne gardant que les N derniers segments."""
@@ -43,36 +50,27 @@ def _relative_from_root(path: Path | str) -> str:
     return str(path)
 
 
-def _escape_json(s: str) -> str:
-    """Échappe une chaîne pour inclusion dans du JSON SSE."""
-    return s.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
-
-
-def _sse_progress(phase: int, total: int, label: str) -> str:
-    """Construit un événement SSE de progression."""
-    data = json.dumps(
-        {"phase": phase, "total": total, "label": label},
-        ensure_ascii=False,
-    )
-    return f"event: progress\ndata: {data}\n\n"
-
-
-def _sse_complete(html: str) -> str:
-    """Construit un événement SSE de fin avec le HTML résultat."""
-    return (
-        f"event: complete\ndata: {json.dumps({'html': html}, ensure_ascii=False)}\n\n"
-    )
-
-
 # ---------------------------------------------------------------------------
 # Page principale
 # ---------------------------------------------------------------------------
 
 
 @router.get("/maintenance")
-async def maintenance_page(request: Request):
-    """Page principale de maintenance."""
-    return templates.TemplateResponse(request, "maintenance/index.html", {})
+def maintenance_page(request: Request):
+    """Page principale de maintenance (avec le résultat des dernières analyses)."""
+    jobs = request.app.state.jobs
+    analyses = {kind: jobs.latest(job_kind) for kind, job_kind in _ANALYSIS_JOBS.items()}
+    return templates.TemplateResponse(
+        request, "maintenance/index.html", {"analyses": analyses}
+    )
+
+
+def _attach_or_start(request: Request, analysis: str, fn) -> StreamingResponse:
+    """Flux SSE de l'analyse en cours, ou d'une nouvelle analyse."""
+    jobs = request.app.state.jobs
+    kind = _ANALYSIS_JOBS[analysis]
+    job = jobs.running(kind) or jobs.start(kind, fn)
+    return sse_response(jobs.events(job))
 
 
 # ---------------------------------------------------------------------------
@@ -95,7 +93,7 @@ def _check_orphan_files(storage_dir: Path):
 
     from ...infrastructure.persistence.database import get_engine
     from ...infrastructure.persistence.models import EpisodeModel, MovieModel
-    from ...services.integrity import IntegrityIssue, IssueType
+    from ...services.integrity import IntegrityIssue, IssueType, walk_video_files
     from ...utils.constants import VIDEO_EXTENSIONS
 
     session = Session(get_engine())
@@ -111,62 +109,43 @@ def _check_orphan_files(storage_dir: Path):
     ):  # type: ignore[union-attr]
         known_paths.add(fp)
 
-    issues: list[IntegrityIssue] = []
+    session.close()
+
+    # Un seul parcours os.scandir par sous-dossier, puis différence d'ensembles
+    on_disk: set[str] = set()
     for subdir_name in _SCOPED_SUBDIRS:
         subdir = storage_dir / subdir_name
-        if not subdir.exists():
-            continue
-        for video_file in subdir.rglob("*"):
-            if video_file.is_dir() or video_file.is_symlink():
-                continue
-            if video_file.suffix.lower() not in VIDEO_EXTENSIONS:
-                continue
-            if str(video_file) not in known_paths:
-                issues.append(
-                    IntegrityIssue(type=IssueType.ORPHAN_FILE, path=video_file)
-                )
-    session.close()
-    return issues
+        if subdir.exists():
+            on_disk |= walk_video_files(subdir, VIDEO_EXTENSIONS)
+
+    return [
+        IntegrityIssue(type=IssueType.ORPHAN_FILE, path=Path(path))
+        for path in sorted(on_disk - known_paths)
+    ]
 
 
 def _check_broken_symlinks(checker):
     """Détecte les symlinks cassés dans video/ (sync)."""
-    from ...services.integrity import IntegrityIssue, IssueType
-
-    issues: list[IntegrityIssue] = []
+    issues = []
     if not checker._video_dir or not checker._video_dir.exists():
         return issues
 
     # Limiter aux sous-dossiers Films/ et Séries/ du video_dir
     for subdir_name in _SCOPED_SUBDIRS:
         subdir = checker._video_dir / subdir_name
-        if not subdir.exists():
-            continue
-        broken_links = checker._file_system.find_broken_links(subdir)
-        for link in broken_links:
-            try:
-                original_target = link.readlink()
-            except OSError:
-                original_target = Path("<inconnu>")
-            issues.append(
-                IntegrityIssue(
-                    type=IssueType.BROKEN_SYMLINK,
-                    path=link,
-                    details=str(original_target),
-                )
-            )
+        if subdir.exists():
+            issues.extend(checker.broken_symlink_issues(subdir))
     return issues
 
 
-@router.get("/maintenance/check")
-async def run_check_sse(request: Request):
-    """SSE endpoint : diagnostic d'intégrité avec progression par phase."""
-    container = request.app.state.container
+async def _run_check(container, ctx: JobContext) -> dict:
+    """Diagnostic d'intégrité par phases (tâche de fond)."""
     settings = container.config()
 
     checker = container.integrity_checker(
         storage_dir=settings.storage_dir,
         video_dir=settings.video_dir,
+        stat_workers=_GHOST_STAT_WORKERS,
     )
 
     phases = [
@@ -175,104 +154,98 @@ async def run_check_sse(request: Request):
         ("symlinks", "Détection des symlinks cassés (Films + Séries)"),
     ]
 
-    async def event_stream():
-        all_issues = []
-
-        # Phase 1 — entrées fantômes
-        yield _sse_progress(1, len(phases), phases[0][1])
-        issues = await asyncio.to_thread(_check_ghost_entries, checker)
-        all_issues.extend(issues)
-
-        # Phase 2 — fichiers orphelins (compare storage vs MovieModel/EpisodeModel)
-        yield _sse_progress(2, len(phases), phases[1][1])
-        issues = await asyncio.to_thread(_check_orphan_files, settings.storage_dir)
-        all_issues.extend(issues)
-
-        # Phase 3 — symlinks cassés (scopé Films + Séries)
-        yield _sse_progress(3, len(phases), phases[2][1])
-        issues = await asyncio.to_thread(_check_broken_symlinks, checker)
-        all_issues.extend(issues)
-
-        # Construire les suggestions
-        ghost = [i for i in all_issues if i.type.value == "ghost_entry"]
-        orphans = [i for i in all_issues if i.type.value == "orphan_file"]
-        broken = [i for i in all_issues if i.type.value == "broken_symlink"]
-
-        suggestions = []
-        if ghost:
-            suggestions.append(
-                f"Pour {len(ghost)} entrée(s) fantôme(s) : "
-                "vérifier si les fichiers ont été déplacés ou supprimés"
-            )
-        if orphans:
-            suggestions.append(
-                f"Pour {len(orphans)} fichier(s) orphelin(s) : "
-                "<code>cineorg import</code> pour les ajouter à la BDD"
-            )
-        if broken:
-            suggestions.append(
-                f"Pour {len(broken)} symlink(s) cassé(s) : "
-                "<code>cineorg repair-links</code> pour les réparer"
-            )
-
-        # Préparer les données template (limiter à MAX_DISPLAY éléments)
-        max_display = 50
-        ghost_entries = [
-            {
-                "path": _relative_from_root(i.path),
-                "full_path": str(i.path),
-                "details": i.details,
-            }
-            for i in ghost[:max_display]
-        ]
-        orphan_files = [
-            {"path": _relative_from_root(i.path), "full_path": str(i.path)}
-            for i in orphans[:max_display]
-        ]
-        broken_symlinks = [
-            {
-                "path": _relative_from_root(i.path),
-                "full_path": str(i.path),
-                "details": i.details,
-            }
-            for i in broken[:max_display]
-        ]
-
-        html = templates.env.get_template("maintenance/_check_results.html").render(
-            has_issues=len(all_issues) > 0,
-            total_issues=len(all_issues),
-            ghost_entries=ghost_entries,
-            orphan_files=orphan_files,
-            broken_symlinks=broken_symlinks,
-            ghost_total=len(ghost),
-            orphan_total=len(orphans),
-            broken_total=len(broken),
-            max_display=max_display,
-            suggestions=suggestions if all_issues else [],
+    all_issues = []
+
+    # Phase 1 — entrées fantômes
+    ctx.progress(phase=1, total=len(phases), label=phases[0][1])
+    issues = await ctx.run_blocking(_check_ghost_entries, checker)
+    all_issues.extend(issues)
+
+    # Phase 2 — fichiers orphelins (compare storage vs MovieModel/EpisodeModel)
+    ctx.progress(phase=2, total=len(phases), label=phases[1][1])
+    issues = await ctx.run_blocking(_check_orphan_files, settings.storage_dir)
+    all_issues.extend(issues)
+
+    # Phase 3 — symlinks cassés (scopé Films + Séries)
+    ctx.progress(phase=3, total=len(phases), label=phases[2][1])
+    issues = await ctx.run_blocking(_check_broken_symlinks, checker)
+    all_issues.extend(issues)
+
+    # Construire les suggestions
+    ghost = [i for i in all_issues if i.type.value == "ghost_entry"]
+    orphans = [i for i in all_issues if i.type.value == "orphan_file"]
+    broken = [i for i in all_issues if i.type.value == "broken_symlink"]
+
+    suggestions = []
+    if ghost:
+        suggestions.append(
+            f"Pour {len(ghost)} entrée(s) fantôme(s) : "
+            "vérifier si les fichiers ont été déplacés ou supprimés"
+        )
+    if orphans:
+        suggestions.append(
+            f"Pour {len(orphans)} fichier(s) orphelin(s) : "
+            "<code>cineorg import</code> pour les ajouter à la BDD"
+        )
+    if broken:
+        suggestions.append(
+            f"Pour {len(broken)} symlink(s) cassé(s) : "
+            "<code>cineorg repair-links</code> pour les réparer"
         )
 
-        yield _sse_complete(html)
+    # Préparer les données template (limiter à MAX_DISPLAY éléments)
+    max_display = 50
+    ghost_entries = [
+        {
+            "path": _relative_from_root(i.path),
+            "full_path": str(i.path),
+            "details": i.details,
+        }
+        for i in ghost[:max_display]
+    ]
+    orphan_files = [
+        {"path": _relative_from_root(i.path), "full_path": str(i.path)}
+        for i in orphans[:max_display]
+    ]
+    broken_symlinks = [
+        {
+            "path": _relative_from_root(i.path),
+            "full_path": str(i.path),
+            "details": i.details,
+        }
+        for i in broken[:max_display]
+    ]
 
-    return StreamingResponse(
-        event_stream(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
+    html = templates.env.get_template("maintenance/_check_results.html").render(
+        has_issues=len(all_issues) > 0,
+        total_issues=len(all_issues),
+        ghost_entries=ghost_entries,
+        orphan_files=orphan_files,
+        broken_symlinks=broken_symlinks,
+        ghost_total=len(ghost),
+        orphan_total=len(orphans),
+        broken_total=len(broken),
+        max_display=max_display,
+        suggestions=suggestions if all_issues else [],
     )
 
+    return {"html": html}
+
+
+@router.get("/maintenance/check")
+async def run_check_sse(request: Request):
+    """SSE endpoint : diagnostic d'intégrité avec progression par phase."""
+    container = request.app.state.container
+    return _attach_or_start(request, "check", lambda ctx: _run_check(container, ctx))
+
 
 # ---------------------------------------------------------------------------
 # SSE — Analyse nettoyage
 # ---------------------------------------------------------------------------
 
 
-@router.get("/maintenance/cleanup")
-async def run_cleanup_sse(request: Request):
-    """SSE endpoint : analyse cleanup avec progression par phase."""
-    container = request.app.state.container
+async def _run_cleanup(container, ctx: JobContext) -> dict:
+    """Analyse cleanup par phases (tâche de fond)."""
     settings = container.config()
 
     phases_info = [
@@ -284,129 +257,127 @@ async def run_cleanup_sse(request: Request):
         "Recherche des répertoires vides",
     ]
 
-    async def event_stream():
-        # Phase 1 : construire l'index
-        yield _sse_progress(1, len(phases_info), phases_info[0])
+    # Phase 1 : construire l'index
+    ctx.progress(phase=1, total=len(phases_info), label=phases_info[0])
 
-        repair_svc = container.repair_service(
-            storage_dir=settings.storage_dir,
-            video_dir=settings.video_dir,
-            trash_dir=settings.storage_dir / ".trash",
-        )
-        await asyncio.to_thread(repair_svc.build_file_index)
+    repair_svc = container.repair_service(
+        storage_dir=settings.storage_dir,
+        video_dir=settings.video_dir,
+        trash_dir=settings.storage_dir / ".trash",
+    )
+    await ctx.run_blocking(repair_svc.build_file_index)
 
-        cleanup_svc = container.cleanup_service(repair_service=repair_svc)
-        video_dir = settings.video_dir
-        max_per_dir = settings.max_files_per_subdir
+    cleanup_svc = container.cleanup_service(repair_service=repair_svc)
+    video_dir = settings.video_dir
+    max_per_dir = settings.max_files_per_subdir
 
-        # Phase 2 : symlinks cassés
-        yield _sse_progress(2, len(phases_info), phases_info[1])
-        broken_raw = await asyncio.to_thread(
-            cleanup_svc._scan_broken_symlinks, video_dir
-        )
+    # Phase 2 : symlinks cassés
+    ctx.progress(phase=2, total=len(phases_info), label=phases_info[1])
+    broken_raw = await ctx.run_blocking(
+        cleanup_svc._scan_broken_symlinks, video_dir
+    )
 
-        # Phase 3 : symlinks mal placés
-        yield _sse_progress(3, len(phases_info), phases_info[2])
-        misplaced_result = await asyncio.to_thread(
-            cleanup_svc._scan_misplaced_symlinks, video_dir
-        )
-        if isinstance(misplaced_result, tuple):
-            misplaced_raw, _ = misplaced_result
-        else:
-            misplaced_raw = misplaced_result
-
-        # Phase 4 : doublons
-        yield _sse_progress(4, len(phases_info), phases_info[3])
-        duplicates_raw = await asyncio.to_thread(
-            cleanup_svc._scan_duplicate_symlinks, video_dir
-        )
+    # Phase 3 : symlinks mal placés
+    ctx.progress(phase=3, total=len(phases_info), label=phases_info[2])
+    misplaced_result = await ctx.run_blocking(
+        cleanup_svc._scan_misplaced_symlinks, video_dir
+    )
+    if isinstance(misplaced_result, tuple):
+        misplaced_raw, _ = misplaced_result
+    else:
+        misplaced_raw = misplaced_result
+
+    # Phase 4 : doublons
+    ctx.progress(phase=4, total=len(phases_info), label=phases_info[3])
+    duplicates_raw = await ctx.run_blocking(
+        cleanup_svc._scan_duplicate_symlinks, video_dir
+    )
 
-        # Phase 5 : surdimensionnés
-        yield _sse_progress(5, len(phases_info), phases_info[4])
-        oversized_raw = await asyncio.to_thread(
-            cleanup_svc._scan_oversized_dirs, video_dir, max_per_dir
-        )
+    # Phase 5 : surdimensionnés
+    ctx.progress(phase=5, total=len(phases_info), label=phases_info[4])
+    oversized_raw = await ctx.run_blocking(
+        cleanup_svc._scan_oversized_dirs, video_dir, max_per_dir
+    )
 
-        # Phase 6 : vides
-        yield _sse_progress(6, len(phases_info), phases_info[5])
-        empty_raw = await asyncio.to_thread(cleanup_svc._scan_empty_dirs, video_dir)
+    # Phase 6 : vides
+    ctx.progress(phase=6, total=len(phases_info), label=phases_info[5])
+    empty_raw = await ctx.run_blocking(cleanup_svc._scan_empty_dirs, video_dir)
 
-        # Construire les données template
-        has_issues = bool(
-            broken_raw or misplaced_raw or duplicates_raw or oversized_raw or empty_raw
-        )
-        total_issues = (
-            len(broken_raw)
-            + len(misplaced_raw)
-            + len(duplicates_raw)
-            + len(oversized_raw)
-            + len(empty_raw)
-        )
+    # Construire les données template
+    has_issues = bool(
+        broken_raw or misplaced_raw or duplicates_raw or oversized_raw or empty_raw
+    )
+    total_issues = (
+        len(broken_raw)
+        + len(misplaced_raw)
+        + len(duplicates_raw)
+        + len(oversized_raw)
+        + len(empty_raw)
+    )
 
-        max_display = 50
-        broken = [
-            {
-                "path": _relative_from_root(b.symlink_path),
-                "full_path": str(b.symlink_path),
-                "score": f"{b.candidate_score:.0f}" if b.best_candidate else None,
-                "candidate": _relative_from_root(b.best_candidate)
-                if b.best_candidate
-                else None,
-            }
-            for b in broken_raw[:max_display]
-        ]
-        misplaced = [
-            {
-                "path": _relative_from_root(m.symlink_path),
-                "title": m.media_title or _truncate_path(m.symlink_path, 1),
-                "current": _relative_from_root(m.current_dir),
-                "expected": _relative_from_root(m.expected_dir),
-            }
-            for m in misplaced_raw[:max_display]
-        ]
-        duplicates = [
-            {
-                "target": _relative_from_root(d.target_path),
-                "keep": _relative_from_root(d.keep),
-                "remove": [_relative_from_root(r) for r in d.remove],
-                "remove_count": len(d.remove),
-            }
-            for d in duplicates_raw[:max_display]
-        ]
-        oversized = [
-            {
-                "path": _relative_from_root(o.parent_dir),
-                "count": o.current_count,
-                "max": o.max_allowed,
-            }
-            for o in oversized_raw[:max_display]
-        ]
-        empty = [{"path": _relative_from_root(e)} for e in empty_raw[:max_display]]
-
-        html = templates.env.get_template("maintenance/_cleanup_results.html").render(
-            has_issues=has_issues,
-            total_issues=total_issues,
-            broken=broken,
-            misplaced=misplaced,
-            duplicates=duplicates,
-            oversized=oversized,
-            empty=empty,
-            broken_total=len(broken_raw),
-            misplaced_total=len(misplaced_raw),
-            duplicates_total=len(duplicates_raw),
-            oversized_total=len(oversized_raw),
-            empty_total=len(empty_raw),
-            max_display=max_display,
-        )
+    max_display = 50
+    broken = [
+        {
+            "path": _relative_from_root(b.symlink_path),
+            "full_path": str(b.symlink_path),
+            "score": f"{b.candidate_score:.0f}" if b.best_candidate else None,
+            "candidate": _relative_from_root(b.best_candidate)
+            if b.best_candidate
+            else None,
+        }
+        for b in broken_raw[:max_display]
+    ]
+    misplaced = [
+        {
+            "path": _relative_from_root(m.symlink_path),
+            "title": m.media_title or _truncate_path(m.symlink_path, 1),
+            "current": _relative_from_root(m.current_dir),
+            "expected": _relative_from_root(m.expected_dir),
+        }
+        for m in misplaced_raw[:max_display]
+    ]
+    duplicates = [
+        {
+            "target": _relative_from_root(d.target_path),
+            "keep": _relative_from_root(d.keep),
+            "remove": [_relative_from_root(r) for r in d.remove],
+            "remove_count": len(d.remove),
+        }
+        for d in duplicates_raw[:max_display]
+    ]
+    oversized = [
+        {
+            "path": _relative_from_root(o.parent_dir),
+            "count": o.current_count,
+            "max": o.max_allowed,
+        }
+        for o in oversized_raw[:max_display]
+    ]
+    empty = [{"path": _relative_from_root(e)} for e in empty_raw[:max_display]]
+
+    html = templates.env.get_template("maintenance/_cleanup_results.html").render(
+        has_issues=has_issues,
+        total_issues=total_issues,
+        broken=broken,
+        misplaced=misplaced,
+        duplicates=duplicates,
+        oversized=oversized,
+        empty=empty,
+        broken_total=len(broken_raw),
+        misplaced_total=len(misplaced_raw),
+        duplicates_total=len(duplicates_raw),
+        oversized_total=len(oversized_raw),
+        empty_total=len(empty_raw),
+        max_display=max_display,
+    )
+
+    return {"html": html}
 
-        yield _sse_complete(html)
 
-    return StreamingResponse(
-        event_stream(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
+@router.get("/maintenance/cleanup")
+async def run_cleanup_sse(request: Request):
+    """SSE endpoint : analyse cleanup avec progression par phase."""
+    container = request.app.state.container
+    return _attach_or_start(
+        request, "cleanup", lambda ctx: _run_cleanup(container, ctx)
     )
@@ -5,18 +5,19 @@ Dashboard qualité avec métriques de couverture enrichissement, résumé des
 associations suspectes (SSE avec cache), et historique des corrections.
 """
 
-import asyncio
 import json
 import time
 from collections.abc import AsyncGenerator
+from dataclasses import asdict
 from pathlib import Path
 
 from fastapi import APIRouter, Form, Query, Request
 from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 
-from sqlmodel import func, select
+from sqlmodel import select
 
 from ...infrastructure.persistence.database import get_session
+from ...infrastructure.persistence.library_stats import read_library_stats
 
 from ...infrastructure.persistence.models import (
     ConfirmedAssociationModel,
@@ -25,10 +26,17 @@ from ...infrastructure.persistence.models import (
     SeriesModel,
 )
 from ...services.association_checker import AssociationChecker, SuspiciousAssociation
+from ..cache import cached_page, page_cache
 from ..deps import templates
+from ..jobs import JobContext
 
 router = APIRouter(prefix="/quality", tags=["quality"])
 
+SCAN_JOB = "quality-scan"
+
+# Dépendance du tableau de bord sur le résumé des associations suspectes
+_SUSPECT_DEPENDENCY = "quality-suspects"
+
 # --- Cache fichier persistant des résultats de scan ---
 _CACHE_DIR = Path.home() / ".cineorg"
 _CACHE_FILE = _CACHE_DIR / "quality_scan_cache.json"
@@ -38,6 +46,7 @@ _CACHE_MAX_AGE = 24 * 60 * 60  # 24 heures
 def _invalidate_cache() -> None:
     """Invalide entièrement le cache."""
     _CACHE_FILE.unlink(missing_ok=True)
+    page_cache.invalidate(_SUSPECT_DEPENDENCY)
 
 
 def _remove_from_cache(entity_type: str, entity_id: int) -> None:
@@ -54,24 +63,9 @@ def _remove_from_cache(entity_type: str, entity_id: int) -> None:
 def _set_cache(results: list[SuspiciousAssociation]) -> None:
     """Sauvegarde les résultats du scan sur disque."""
     _CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    data = {
-        "time": time.time(),
-        "results": [
-            {
-                "entity_type": r.entity_type,
-                "entity_id": r.entity_id,
-                "title_tmdb": r.title_tmdb,
-                "title_parsed": r.title_parsed,
-                "year_tmdb": r.year_tmdb,
-                "year_parsed": r.year_parsed,
-                "confidence_score": r.confidence_score,
-                "reasons": r.reasons,
-                "poster_path": r.poster_path,
-            }
-            for r in results
-        ],
-    }
+    data = {"time": time.time(), "results": [asdict(r) for r in results]}
     _CACHE_FILE.write_text(json.dumps(data, ensure_ascii=False))
+    page_cache.invalidate(_SUSPECT_DEPENDENCY)
 
 
 def _get_cache() -> list[SuspiciousAssociation] | None:
@@ -117,20 +111,13 @@ def _render_results(
     )
 
 
-def _count_coverage(session, model, fields: list[tuple[str, str]]) -> dict:
-    """Calcule les métriques de couverture pour un modèle donné."""
-    total = session.exec(select(func.count(model.id))).one()
+def _count_coverage(stats: dict[str, int], model, fields: list[tuple[str, str]]) -> dict:
+    """Calcule les métriques de couverture d'un modèle depuis library_stats."""
+    table = model.__tablename__
+    total = stats[f"{table}.total"]
     metrics = []
     for label, field_name in fields:
-        col = getattr(model, field_name)
-        if field_name in ("vote_average", "imdb_rating"):
-            count = session.exec(
-                select(func.count(model.id)).where(col.is_not(None), col > 0)
-            ).one()
-        else:
-            count = session.exec(
-                select(func.count(model.id)).where(col.is_not(None), col != "")
-            ).one()
+        count = stats[f"{table}.{field_name}"]
         pct = round(count / total * 100, 1) if total > 0 else 0
         metrics.append({"label": label, "count": count, "total": total, "pct": pct})
     return {"total": total, "metrics": metrics}
@@ -138,12 +125,19 @@ def _count_coverage(session, model, fields: list[tuple[str, str]]) -> dict:
 
 @router.get("", response_class=HTMLResponse)
 @router.get("/", response_class=HTMLResponse)
-async def dashboard(request: Request):
-    """Tableau de bord qualité avec métriques de couverture et historique."""
+def dashboard(request: Request):
+    """Tableau de bord qualité avec métriques de couverture et historique (mis en cache)."""
+    return cached_page(request, lambda: (_render_dashboard(request), {_SUSPECT_DEPENDENCY}))
+
+
+def _render_dashboard(request: Request):
+    """Rend le tableau de bord qualité."""
     session = next(get_session())
     try:
+        stats = read_library_stats(session)
+
         # Couverture films
-        movie_coverage = _count_coverage(session, MovieModel, [
+        movie_coverage = _count_coverage(stats, MovieModel, [
             ("Poster", "poster_path"),
             ("IMDb ID", "imdb_id"),
             ("Réalisateur", "director"),
@@ -155,7 +149,7 @@ async def dashboard(request: Request):
         ])
 
         # Couverture séries
-        series_coverage = _count_coverage(session, SeriesModel, [
+        series_coverage = _count_coverage(stats, SeriesModel, [
             ("Poster", "poster_path"),
             ("TMDB ID", "tmdb_id"),
             ("TVDB ID", "tvdb_id"),
@@ -165,7 +159,7 @@ async def dashboard(request: Request):
         ])
 
         # Couverture épisodes
-        episode_coverage = _count_coverage(session, EpisodeModel, [
+        episode_coverage = _count_coverage(stats, EpisodeModel, [
             ("Fichier", "file_path"),
             ("Résolution", "resolution"),
         ])
@@ -187,23 +181,25 @@ async def dashboard(request: Request):
             .limit(50)
         ).all()
 
-        correction_history = []
-        for conf in confirmations:
-            entry = {
+        # Titres en deux requêtes (au lieu d'une par correction)
+        titles: dict[tuple[str, int], str] = {}
+        for entity_type, model in (("movie", MovieModel), ("series", SeriesModel)):
+            ids = {c.entity_id for c in confirmations if c.entity_type == entity_type}
+            if ids:
+                rows = session.exec(
+                    select(model.id, model.title).where(model.id.in_(ids))
+                ).all()
+                titles.update(((entity_type, row[0]), row[1]) for row in rows)
+
+        correction_history = [
+            {
                 "entity_type": conf.entity_type,
                 "entity_id": conf.entity_id,
                 "confirmed_at": conf.confirmed_at,
-                "title": None,
+                "title": titles.get((conf.entity_type, conf.entity_id)),
             }
-            if conf.entity_type == "movie":
-                movie = session.get(MovieModel, conf.entity_id)
-                if movie:
-                    entry["title"] = movie.title
-            elif conf.entity_type == "series":
-                series = session.get(SeriesModel, conf.entity_id)
-                if series:
-                    entry["title"] = series.title
-            correction_history.append(entry)
+            for conf in confirmations
+        ]
 
         return templates.TemplateResponse(request, "quality/dashboard.html", {
             "movie_coverage": movie_coverage,
@@ -242,54 +238,16 @@ async def suspicious_scan_sse(
             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
         )
 
-    async def generate() -> AsyncGenerator[str, None]:
-        session = next(get_session())
-        try:
-            checker = AssociationChecker(session)
-            progress_queue: asyncio.Queue[tuple[int, int, str]] = asyncio.Queue()
-
-            def on_progress(current: int, total: int, label: str) -> None:
-                progress_queue.put_nowait((current, total, label))
-
-            # Lancer le scan dans un thread (I/O bound — mediainfo)
-            loop = asyncio.get_event_loop()
-            scan_task = loop.run_in_executor(
-                None, lambda: checker.scan_suspicious(on_progress=on_progress)
-            )
-
-            # Émettre les événements de progression
-            while not scan_task.done():
-                try:
-                    current, total, label = await asyncio.wait_for(
-                        progress_queue.get(), timeout=0.3
-                    )
-                    pct = int(current / total * 100) if total > 0 else 0
-                    yield _sse_event(
-                        "progress",
-                        {"current": current, "total": total, "pct": pct, "label": label},
-                    )
-                except asyncio.TimeoutError:
-                    pass
-
-            results: list[SuspiciousAssociation] = scan_task.result()
-
-            # Vider les événements restants
-            while not progress_queue.empty():
-                current, total, label = progress_queue.get_nowait()
-                pct = int(current / total * 100) if total > 0 else 0
-                yield _sse_event(
-                    "progress",
-                    {"current": current, "total": total, "pct": pct, "label": label},
-                )
-
-            # Mettre en cache les résultats complets (avant filtrage)
-            _set_cache(results)
-
-            html = _render_results(results, filter)
-            yield _sse_event("complete", {"html": html})
+    jobs = request.app.state.jobs
+    job = jobs.running(SCAN_JOB) or jobs.start(SCAN_JOB, _run_scan)
 
-        finally:
-            session.close()
+    async def generate() -> AsyncGenerator[str, None]:
+        async for event, data in jobs.events(job):
+            if event == "complete":
+                # Résultats complets de la tâche, filtrés pour ce client
+                results = [SuspiciousAssociation(**item) for item in data["results"]]
+                data = {"html": _render_results(results, filter)}
+            yield _sse_event(event, data)
 
     return StreamingResponse(
         generate(),
@@ -298,8 +256,33 @@ async def suspicious_scan_sse(
     )
 
 
+def _scan_suspicious(ctx: JobContext) -> list[SuspiciousAssociation]:
+    """Scan des associations (sync, pool des tâches : guessit, mediainfo)."""
+    session = next(get_session())
+    try:
+        checker = AssociationChecker(session)
+
+        def on_progress(current: int, total: int, label: str) -> None:
+            pct = int(current / total * 100) if total > 0 else 0
+            ctx.progress(current=current, total=total, pct=pct, label=label)
+
+        results = checker.scan_suspicious(on_progress=on_progress)
+    finally:
+        session.close()
+
+    # Mettre en cache les résultats complets (avant filtrage)
+    _set_cache(results)
+    return results
+
+
+async def _run_scan(ctx: JobContext) -> dict:
+    """Tâche de fond du scan des associations suspectes."""
+    results = await ctx.run_blocking(_scan_suspicious, ctx)
+    return {"results": [asdict(r) for r in results]}
+
+
 @router.post("/suspicious/confirm")
-async def confirm_association(
+def confirm_association(
     entity_type: str = Form(...),
     entity_id: int = Form(...),
 ):
@@ -325,7 +308,7 @@ async def confirm_association(
 
 
 @router.get("/suspicious/check-confirmed")
-async def check_confirmed(ids: str = Query(...)):
+def check_confirmed(ids: str = Query(...)):
     """Vérifie quels entity_type:entity_id sont confirmés.
 
     Paramètre ids : chaîne "movie:1,series:5,movie:42"
@@ -7,7 +7,6 @@ et gère la résolution interactive des conflits.
 """
 
 import asyncio
-import json
 import logging
 from collections import defaultdict
 from pathlib import Path
@@ -15,53 +14,22 @@ from typing import Optional
 
 from fastapi import APIRouter, Form, Request
 from fastapi.responses import HTMLResponse
-from starlette.responses import StreamingResponse
 
 from ..deps import templates
+from ..jobs import JobContext, sse_response
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/transfer")
 
+TRANSFER_JOB = "transfer"
+
 
 # ═══════════════════════════════════════
 # Structures de données
 # ═══════════════════════════════════════
 
 
-class TransferProgress:
-    """État de progression partagé entre le transfert et le SSE."""
-
-    def __init__(self) -> None:
-        self.current: int = 0
-        self.total: int = 0
-        self.filename: str = ""
-        self.message: str = "Initialisation…"
-        self.complete: bool = False
-        self.error: Optional[str] = None
-
-        # Conflit en attente de résolution
-        self.conflict_pending: bool = False
-        self.conflict_data: Optional[dict] = None
-        self.conflict_choice: Optional[str] = None
-        self.conflict_event: asyncio.Event = asyncio.Event()
-
-        # Mode simulation
-        self.dry_run: bool = False
-
-        # Compteurs finaux
-        self.transferred: int = 0
-        self.duplicates_ignored: int = 0
-        self.conflicts_resolved: int = 0
-        self.errors: int = 0
-
-        # Détails par fichier
-        self.transferred_files: list[str] = []
-        self.transferred_details: list[dict] = []  # {name, storage, symlink}
-        self.duplicate_files: list[str] = []
-        self.error_files: list[str] = []
-
-
 def _format_size(size_bytes: int) -> str:
     """Formate une taille en octets en chaîne lisible."""
     if size_bytes >= 1_073_741_824:
@@ -71,17 +39,25 @@ def _format_size(size_bytes: int) -> str:
     return f"{size_bytes / 1024:.0f} Ko"
 
 
-def _build_tree_data(transfers: list[dict], storage_dir: Path, video_dir: Path) -> dict:
+def _build_tree_data(
+    transfers: list[dict],
+    storage_dir: Path,
+    video_dir: Path,
+    conflicts: Optional[list] = None,
+) -> dict:
     """
     Organise les transferts en arborescence pour le template.
 
+    Args:
+        conflicts: ConflictInfo (ou None) par transfert, dans le même ordre.
+
     Returns:
         Dict avec 'movies' et 'series', chacun organisé hiérarchiquement.
     """
     movies = []
     series = []
 
-    for t in transfers:
+    for i, t in enumerate(transfers):
         source = t.get("source")
         source_size = source.stat().st_size if source and source.exists() else 0
 
@@ -95,8 +71,13 @@ def _build_tree_data(transfers: list[dict], storage_dir: Path, video_dir: Path)
             "title": t.get("title", ""),
             "year": t.get("year"),
             "pending_id": pending.id if pending else None,
+            "conflict": None,
         }
 
+        conflict = conflicts[i] if conflicts else None
+        if conflict:
+            entry["conflict"] = conflict.conflict_type.value
+
         # Calculer les chemins relatifs pour l'affichage
         dest = t.get("destination")
         if dest and storage_dir:
@@ -129,6 +110,7 @@ def _build_tree_data(transfers: list[dict], storage_dir: Path, video_dir: Path)
         "total": len(transfers),
         "movie_count": len(movies),
         "series_count": len(series),
+        "conflict_count": sum(1 for c in conflicts or [] if c),
     }
 
 
@@ -168,245 +150,261 @@ def _group_by_path(entries: list[dict], key: str, prefix: str) -> list[dict]:
 async def _run_web_transfer(
     container,
     transfers: list[dict],
-    progress: TransferProgress,
+    ctx: JobContext,
     *,
-    dry_run: bool = False,
-) -> None:
+    hasher=None,
+) -> dict:
     """
     Exécute les transferts avec gestion des conflits et progression.
 
-    En mode dry_run, simule le transfert sans toucher au système de fichiers.
+    En mode dry_run (paramètre de la tâche), simule le transfert sans
+    toucher au système de fichiers. Le hasher du batch (préparé par la page
+    de résumé) évite de recalculer les hash déjà obtenus pour
+    l'arborescence des conflits.
 
     Pour chaque transfert :
     1. Vérifie les conflits (DUPLICATE / NAME_COLLISION)
     2. Si DUPLICATE → ignore automatiquement
     3. Si NAME_COLLISION ou SIMILAR_CONTENT → pause pour résolution
     4. Sinon → transfer_file()
+
+    Returns:
+        Les compteurs et détails par fichier affichés en fin de transfert.
     """
-    try:
-        settings = container.config()
-        transferer = container.transferer_service(
-            storage_dir=settings.storage_dir,
-            video_dir=settings.video_dir,
+    from src.services.transferer import ConflictType
+
+    dry_run = bool(ctx.params.get("dry_run"))
+    results: dict = {
+        "transferred": 0,
+        "duplicates_ignored": 0,
+        "conflicts_resolved": 0,
+        "errors": 0,
+        "transferred_files": [],
+        "transferred_details": [],  # {name, storage, symlink}
+        "duplicate_files": [],
+        "error_files": [],
+    }
+
+    def _progress(**fields) -> None:
+        ctx.progress(
+            transferred=results["transferred"],
+            duplicates=results["duplicates_ignored"],
+            **fields,
         )
 
-        storage_dir = settings.storage_dir
-        video_dir = settings.video_dir
-        mode_label = "Simulation" if dry_run else "Transfert"
-        progress.total = len(transfers)
-        progress.message = f"{mode_label} de {len(transfers)} fichier(s)…"
+    settings = container.config()
+    transferer = container.transferer_service(
+        storage_dir=settings.storage_dir,
+        video_dir=settings.video_dir,
+        hasher=hasher,
+    )
+    # Hash des conflits potentiels en arrière-plan (cache du batch)
+    await ctx.run_blocking(
+        transferer.prefetch_conflicts,
+        [(t["source"], t["destination"]) for t in transfers],
+    )
 
-        def _record_transfer(name: str, dest: Path, sym: Optional[Path]) -> None:
-            """Enregistre les détails d'un transfert réussi."""
-            progress.transferred_files.append(name)
+    storage_dir = settings.storage_dir
+    video_dir = settings.video_dir
+    mode_label = "Simulation" if dry_run else "Transfert"
+    _progress(
+        current=0,
+        total=len(transfers),
+        filename="",
+        message=f"{mode_label} de {len(transfers)} fichier(s)…",
+    )
+
+    def _record_transfer(name: str, dest: Path, sym: Optional[Path]) -> None:
+        """Enregistre les détails d'un transfert réussi."""
+        results["transferred"] += 1
+        results["transferred_files"].append(name)
+        try:
+            storage_rel = str(dest.relative_to(storage_dir))
+        except ValueError:
+            storage_rel = str(dest)
+        symlink_rel = ""
+        if sym:
             try:
-                storage_rel = str(dest.relative_to(storage_dir))
+                symlink_rel = str(sym.relative_to(video_dir))
             except ValueError:
-                storage_rel = str(dest)
-            symlink_rel = ""
-            if sym:
-                try:
-                    symlink_rel = str(sym.relative_to(video_dir))
-                except ValueError:
-                    symlink_rel = str(sym)
-            progress.transferred_details.append(
-                {
-                    "name": name,
-                    "storage": storage_rel,
-                    "symlink": symlink_rel,
-                }
-            )
-
-        for i, transfer in enumerate(transfers):
-            source = transfer["source"]
-            destination = transfer["destination"]
-            symlink_dest = transfer.get("symlink_destination")
-            new_filename = transfer.get("new_filename", "")
-            source_name = source.name if hasattr(source, "name") else str(source)
-            display_name = new_filename or source_name
-
-            progress.current = i + 1
-            progress.filename = source_name
-            progress.message = f"{mode_label} : {source_name}"
-
-            # Vérifier les conflits
-            conflict = transferer.check_conflict(source, destination)
-
-            if conflict:
-                from src.services.transferer import ConflictType
-
-                if conflict.conflict_type == ConflictType.DUPLICATE:
-                    progress.duplicates_ignored += 1
-                    progress.duplicate_files.append(display_name)
-                    progress.message = (
+                symlink_rel = str(sym)
+        results["transferred_details"].append(
+            {
+                "name": name,
+                "storage": storage_rel,
+                "symlink": symlink_rel,
+            }
+        )
+
+    def _record_error(name: str) -> None:
+        results["errors"] += 1
+        results["error_files"].append(name)
+
+    def _file_sizes(*paths: Path) -> tuple[int, ...]:
+        return tuple(p.stat().st_size if p.exists() else 0 for p in paths)
+
+    for i, transfer in enumerate(transfers):
+        source = transfer["source"]
+        destination = transfer["destination"]
+        symlink_dest = transfer.get("symlink_destination")
+        new_filename = transfer.get("new_filename", "")
+        source_name = source.name if hasattr(source, "name") else str(source)
+        display_name = new_filename or source_name
+
+        _progress(
+            current=i + 1,
+            filename=source_name,
+            message=f"{mode_label} : {source_name}",
+        )
+
+        # Vérifier les conflits (hash hors de l'event loop)
+        conflict = await transferer.acheck_conflict(source, destination)
+
+        if conflict:
+            if conflict.conflict_type == ConflictType.DUPLICATE:
+                results["duplicates_ignored"] += 1
+                results["duplicate_files"].append(display_name)
+                _progress(
+                    message=(
                         f"[Simulation] Doublon : {display_name}"
                         if dry_run
                         else f"Doublon ignoré : {display_name}"
                     )
-                    await asyncio.sleep(0.1)
-                    continue
+                )
+                continue
 
-                elif conflict.conflict_type in (
-                    ConflictType.NAME_COLLISION,
-                    ConflictType.SIMILAR_CONTENT,
-                ):
-                    existing_path = conflict.existing_path
-                    existing_size = (
-                        existing_path.stat().st_size if existing_path.exists() else 0
-                    )
-                    new_size = source.stat().st_size if source.exists() else 0
-
-                    progress.conflict_pending = True
-                    progress.conflict_data = {
-                        "type": conflict.conflict_type.value,
-                        "filename": display_name,
-                        "existing_path": str(existing_path),
-                        "existing_name": existing_path.name,
-                        "existing_size": _format_size(existing_size),
-                        "new_name": display_name,
-                        "new_size": _format_size(new_size),
-                        "transfer_index": i,
-                    }
-
-                    try:
-                        existing_info = transferer._get_file_info(existing_path)
-                        new_info = transferer._get_file_info(source)
-                        progress.conflict_data.update(
-                            {
-                                "existing_resolution": existing_info.resolution or "?",
-                                "existing_video_codec": existing_info.video_codec
-                                or "?",
-                                "existing_audio_codec": existing_info.audio_codec
-                                or "?",
-                                "new_resolution": new_info.resolution or "?",
-                                "new_video_codec": new_info.video_codec or "?",
-                                "new_audio_codec": new_info.audio_codec or "?",
-                            }
-                        )
-                    except Exception:
-                        progress.conflict_data.update(
-                            {
-                                "existing_resolution": "?",
-                                "existing_video_codec": "?",
-                                "existing_audio_codec": "?",
-                                "new_resolution": "?",
-                                "new_video_codec": "?",
-                                "new_audio_codec": "?",
-                            }
-                        )
+            elif conflict.conflict_type in (
+                ConflictType.NAME_COLLISION,
+                ConflictType.SIMILAR_CONTENT,
+            ):
+                existing_path = conflict.existing_path
+                existing_size, new_size = await ctx.run_blocking(
+                    _file_sizes, existing_path, source
+                )
+
+                conflict_data = {
+                    "type": conflict.conflict_type.value,
+                    "filename": display_name,
+                    "existing_path": str(existing_path),
+                    "existing_name": existing_path.name,
+                    "existing_size": _format_size(existing_size),
+                    "new_name": display_name,
+                    "new_size": _format_size(new_size),
+                    "transfer_index": i,
+                }
 
-                    progress.conflict_event.clear()
-                    progress.message = (
-                        f"Conflit : {display_name} — en attente de résolution"
+                try:
+                    existing_info, new_info = await transferer.aget_files_info(
+                        [existing_path, source]
+                    )
+                    conflict_data.update(
+                        {
+                            "existing_resolution": existing_info.resolution or "?",
+                            "existing_video_codec": existing_info.video_codec or "?",
+                            "existing_audio_codec": existing_info.audio_codec or "?",
+                            "new_resolution": new_info.resolution or "?",
+                            "new_video_codec": new_info.video_codec or "?",
+                            "new_audio_codec": new_info.audio_codec or "?",
+                        }
+                    )
+                except Exception:
+                    conflict_data.update(
+                        {
+                            "existing_resolution": "?",
+                            "existing_video_codec": "?",
+                            "existing_audio_codec": "?",
+                            "new_resolution": "?",
+                            "new_video_codec": "?",
+                            "new_audio_codec": "?",
+                        }
                     )
-                    await progress.conflict_event.wait()
-
-                    choice = progress.conflict_choice
-                    progress.conflict_pending = False
-                    progress.conflict_data = None
-                    progress.conflict_choice = None
 
-                    if choice == "keep_old":
-                        progress.conflicts_resolved += 1
-                        progress.message = (
-                            f"Conflit résolu : ancien conservé pour {display_name}"
-                        )
-                        await asyncio.sleep(0.1)
-                        continue
-
-                    elif choice == "keep_new":
-                        if dry_run:
-                            progress.transferred += 1
-                            _record_transfer(display_name, destination, symlink_dest)
-                            progress.message = (
-                                f"[Simulation] Remplacement : {display_name}"
-                            )
-                        else:
-                            try:
-                                trash_dir = getattr(
-                                    settings, "trash_dir", Path("/tmp/cineorg_trash")
-                                )
-                                transferer.move_to_staging(existing_path, trash_dir)
-                                result = transferer.transfer_file(
-                                    source,
-                                    destination,
-                                    create_symlink=True,
-                                    symlink_destination=symlink_dest,
-                                )
-                                if result.success:
-                                    progress.transferred += 1
-                                    _record_transfer(
-                                        display_name, destination, symlink_dest
-                                    )
-                                else:
-                                    progress.errors += 1
-                                    progress.error_files.append(display_name)
-                            except Exception as e:
-                                logger.warning(
-                                    "Erreur transfert %s: %s", source_name, e
-                                )
-                                progress.errors += 1
-                                progress.error_files.append(display_name)
-                        progress.conflicts_resolved += 1
-                        continue
-
-                    elif choice == "keep_both":
-                        stem = destination.stem
-                        suffix = destination.suffix
-                        destination = destination.with_name(f"{stem} (2){suffix}")
-                        if symlink_dest:
-                            sym_stem = symlink_dest.stem
-                            sym_suffix = symlink_dest.suffix
-                            symlink_dest = symlink_dest.with_name(
-                                f"{sym_stem} (2){sym_suffix}"
-                            )
-                        progress.conflicts_resolved += 1
+                _progress(message=f"Conflit : {display_name} — en attente de résolution")
+                # Suspendu jusqu'à POST /transfer/resolve-conflict
+                choice = await ctx.ask("conflict", conflict_data)
+                results["conflicts_resolved"] += 1
 
-                    else:
-                        progress.conflicts_resolved += 1
-                        progress.message = f"Conflit passé : {display_name}"
-                        await asyncio.sleep(0.1)
-                        continue
-
-            # Transfert normal (pas de conflit ou conflit résolu avec keep_both)
-            if dry_run:
-                progress.transferred += 1
-                _record_transfer(display_name, destination, symlink_dest)
-                progress.message = f"[Simulation] {display_name} → OK"
-                await asyncio.sleep(0.15)
-            else:
-                try:
-                    result = transferer.transfer_file(
-                        source,
-                        destination,
-                        create_symlink=True,
-                        symlink_destination=symlink_dest,
+                if choice == "keep_old":
+                    _progress(
+                        message=f"Conflit résolu : ancien conservé pour {display_name}"
                     )
-                    if result.success:
-                        progress.transferred += 1
+                    continue
+
+                elif choice == "keep_new":
+                    if dry_run:
                         _record_transfer(display_name, destination, symlink_dest)
-                        progress.message = f"Transféré : {display_name}"
+                        _progress(message=f"[Simulation] Remplacement : {display_name}")
                     else:
-                        error_msg = result.error or "Erreur inconnue"
-                        logger.warning("Échec transfert %s: %s", source_name, error_msg)
-                        progress.errors += 1
-                        progress.error_files.append(display_name)
-                except Exception as e:
-                    logger.exception("Erreur transfert %s: %s", source_name, e)
-                    progress.errors += 1
-                    progress.error_files.append(display_name)
+                        try:
+                            trash_dir = getattr(
+                                settings, "trash_dir", Path("/tmp/cineorg_trash")
+                            )
+                            await ctx.run_blocking(
+                                transferer.move_to_staging, existing_path, trash_dir
+                            )
+                            result = await ctx.run_blocking(
+                                transferer.transfer_file,
+                                source,
+                                destination,
+                                create_symlink=True,
+                                symlink_destination=symlink_dest,
+                            )
+                            if result.success:
+                                _record_transfer(display_name, destination, symlink_dest)
+                            else:
+                                _record_error(display_name)
+                        except Exception as e:
+                            logger.warning("Erreur transfert %s: %s", source_name, e)
+                            _record_error(display_name)
+                        _progress()
+                    continue
 
-            # Laisser respirer l'event loop
-            if i % 2 == 0:
-                await asyncio.sleep(0)
+                elif choice == "keep_both":
+                    stem = destination.stem
+                    suffix = destination.suffix
+                    destination = destination.with_name(f"{stem} (2){suffix}")
+                    if symlink_dest:
+                        sym_stem = symlink_dest.stem
+                        sym_suffix = symlink_dest.suffix
+                        symlink_dest = symlink_dest.with_name(
+                            f"{sym_stem} (2){sym_suffix}"
+                        )
 
-        progress.message = "Simulation terminée" if dry_run else "Transfert terminé"
-        progress.complete = True
+                else:
+                    _progress(message=f"Conflit passé : {display_name}")
+                    continue
 
-    except Exception as e:
-        logger.exception("Erreur lors du transfert web: %s", e)
-        progress.error = str(e)
-        progress.complete = True
+        # Transfert normal (pas de conflit ou conflit résolu avec keep_both)
+        if dry_run:
+            _record_transfer(display_name, destination, symlink_dest)
+            _progress(message=f"[Simulation] {display_name} → OK")
+        else:
+            try:
+                result = await ctx.run_blocking(
+                    transferer.transfer_file,
+                    source,
+                    destination,
+                    create_symlink=True,
+                    symlink_destination=symlink_dest,
+                )
+                if result.success:
+                    _record_transfer(display_name, destination, symlink_dest)
+                    _progress(message=f"Transféré : {display_name}")
+                else:
+                    error_msg = result.error or "Erreur inconnue"
+                    logger.warning("Échec transfert %s: %s", source_name, error_msg)
+                    _record_error(display_name)
+            except Exception as e:
+                logger.exception("Erreur transfert %s: %s", source_name, e)
+                _record_error(display_name)
+
+    # Dernier état de progression (compteur final)
+    _progress(
+        current=len(transfers),
+        filename="",
+        message="Simulation terminée" if dry_run else "Transfert terminé",
+    )
+    return results
 
 
 # ═══════════════════════════════════════
@@ -420,8 +418,8 @@ async def transfer_index(request: Request):
     container = request.app.state.container
     validation_service = container.validation_service()
 
-    validated_list = validation_service.list_validated()
-    pending_count = len(validation_service.list_pending())
+    validated_list = await asyncio.to_thread(validation_service.list_validated)
+    pending_count = len(await asyncio.to_thread(validation_service.list_pending))
 
     if not validated_list:
         return templates.TemplateResponse(
@@ -458,13 +456,33 @@ async def transfer_index(request: Request):
     finally:
         bb.console = original_console
 
+    # Hasher partagé pour la durée du batch : les hash calculés pour
+    # l'arborescence des conflits servent ensuite au transfert
+    from src.infrastructure.persistence.hash_service import BatchHashService
+
+    # Le hasher d'un transfert en cours appartient à la tâche, qui le
+    # ferme à la fin ; sinon celui du batch précédent est libéré ici
+    previous_hasher = getattr(request.app.state, "transfer_hasher", None)
+    if previous_hasher is not None and request.app.state.jobs.running(TRANSFER_JOB) is None:
+        previous_hasher.close()
+    hasher = BatchHashService()
+    transferer = container.transferer_service(
+        storage_dir=storage_dir, video_dir=video_dir, hasher=hasher
+    )
+    conflicts = await transferer.acheck_conflicts(
+        [(t["source"], t["destination"]) for t in transfers]
+    )
+
     # Stocker le batch pour POST /transfer/start
     request.app.state.transfer_batch = transfers
     request.app.state.transfer_storage_dir = storage_dir
     request.app.state.transfer_video_dir = video_dir
+    request.app.state.transfer_hasher = hasher
 
     # Construire les données d'arborescence pour le template
-    tree_data = _build_tree_data(transfers, storage_dir, video_dir)
+    tree_data = await asyncio.to_thread(
+        _build_tree_data, transfers, storage_dir, video_dir, conflicts
+    )
 
     return templates.TemplateResponse(
         request,
@@ -482,11 +500,11 @@ async def transfer_index(request: Request):
 async def transfer_start(request: Request):
     """Lance le transfert (ou simulation) en arrière-plan."""
     container = request.app.state.container
+    jobs = request.app.state.jobs
     dry_run = request.query_params.get("dry_run") == "1"
 
     # Vérifier qu'un transfert n'est pas déjà en cours
-    existing = getattr(request.app.state, "transfer_progress", None)
-    if existing and not existing.complete:
+    if jobs.running(TRANSFER_JOB) is not None:
         return HTMLResponse(
             '<div class="action-msg action-warning">'
             "Un transfert est déjà en cours."
@@ -502,113 +520,38 @@ async def transfer_start(request: Request):
             "</div>"
         )
 
-    # Créer l'état de progression
-    progress = TransferProgress()
-    progress.dry_run = dry_run
-    request.app.state.transfer_progress = progress
+    hasher = getattr(request.app.state, "transfer_hasher", None)
 
-    # Lancer en arrière-plan
-    task = asyncio.create_task(
-        _run_web_transfer(container, transfers, progress, dry_run=dry_run)
+    async def _run(ctx: JobContext) -> dict:
+        try:
+            return await _run_web_transfer(container, transfers, ctx, hasher=hasher)
+        finally:
+            # Pool de threads et cache libérés dès la fin de la tâche
+            if hasher is not None:
+                hasher.close()
+
+    jobs.start(
+        TRANSFER_JOB,
+        _run,
+        params={"dry_run": dry_run, "count": len(transfers)},
     )
-    request.app.state.transfer_task = task
 
     return templates.TemplateResponse(
         request,
         "transfer/_progress.html",
-        {"progress": progress},
+        {"progress": {"dry_run": dry_run}},
     )
 
 
 @router.get("/progress")
-async def transfer_progress_sse(request: Request):
-    """SSE endpoint pour le suivi de progression du transfert."""
-    progress = getattr(request.app.state, "transfer_progress", None)
-
-    async def event_stream():
-        if progress is None:
-            yield 'event: error\ndata: {"message": "Aucun transfert en cours"}\n\n'
-            return
-
-        last_sent = ""
-        while not progress.complete:
-            # Conflit en attente ?
-            if progress.conflict_pending and progress.conflict_data:
-                conflict_json = json.dumps(progress.conflict_data, ensure_ascii=False)
-                yield f"event: conflict\ndata: {conflict_json}\n\n"
-                # Attendre que le conflit soit résolu avant de continuer
-                await progress.conflict_event.wait()
-                # Petit délai pour laisser le temps au front de se mettre à jour
-                await asyncio.sleep(0.3)
-                continue
-
-            # Progression normale
-            data = json.dumps(
-                {
-                    "current": progress.current,
-                    "total": progress.total,
-                    "filename": progress.filename,
-                    "message": progress.message,
-                    "transferred": progress.transferred,
-                    "duplicates": progress.duplicates_ignored,
-                },
-                ensure_ascii=False,
-            )
-
-            if data != last_sent:
-                yield f"event: progress\ndata: {data}\n\n"
-                last_sent = data
-
-            await asyncio.sleep(0.4)
-
-        # Envoyer le dernier état de progression (compteur final)
-        final_progress = json.dumps(
-            {
-                "current": progress.total,
-                "total": progress.total,
-                "filename": "",
-                "message": progress.message,
-                "transferred": progress.transferred,
-                "duplicates": progress.duplicates_ignored,
-            },
-            ensure_ascii=False,
-        )
-        yield f"event: progress\ndata: {final_progress}\n\n"
-        await asyncio.sleep(0.2)
-
-        # Résultat final
-        if progress.error:
-            error_data = json.dumps({"message": progress.error}, ensure_ascii=False)
-            yield f"event: error\ndata: {error_data}\n\n"
-        else:
-            complete_data = json.dumps(
-                {
-                    "transferred": progress.transferred,
-                    "duplicates_ignored": progress.duplicates_ignored,
-                    "conflicts_resolved": progress.conflicts_resolved,
-                    "errors": progress.errors,
-                    "transferred_files": progress.transferred_files,
-                    "transferred_details": progress.transferred_details,
-                    "duplicate_files": progress.duplicate_files,
-                    "error_files": progress.error_files,
-                },
-                ensure_ascii=False,
-            )
-            yield f"event: complete\ndata: {complete_data}\n\n"
-
-    return StreamingResponse(
-        event_stream(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
-    )
+def transfer_progress_sse(request: Request):
+    """SSE endpoint pour le suivi du transfert (rejoue l'état et le conflit en attente)."""
+    jobs = request.app.state.jobs
+    return sse_response(jobs.events(jobs.latest(TRANSFER_JOB)))
 
 
 @router.post("/send-back/{pending_id}", response_class=HTMLResponse)
-async def send_back(request: Request, pending_id: str):
+def send_back(request: Request, pending_id: str):
     """Renvoie un fichier validé en statut pending pour re-validation.
 
     Pour les séries : renvoie aussi tous les épisodes de la même série
@@ -659,17 +602,15 @@ async def resolve_conflict(
     choice: str = Form(...),
 ):
     """Résout un conflit en attente."""
-    progress = getattr(request.app.state, "transfer_progress", None)
+    jobs = request.app.state.jobs
+    job = jobs.running(TRANSFER_JOB)
 
-    if progress is None or not progress.conflict_pending:
+    # Enregistrer le choix et débloquer le transfert
+    if job is None or not jobs.answer(job, choice):
         return HTMLResponse(
             '<div class="action-msg action-warning">Aucun conflit en attente.</div>'
         )
 
-    # Enregistrer le choix et débloquer le transfert
-    progress.conflict_choice = choice
-    progress.conflict_event.set()
-
     return HTMLResponse(
         '<div class="action-msg action-success">'
         '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" '
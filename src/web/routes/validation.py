@@ -6,6 +6,7 @@ Affiche la liste des fichiers en attente et le détail des candidats enrichis
 rejeter, recherche manuelle par titre et recherche par ID externe.
 """
 
+import asyncio
 import logging
 import re
 from typing import Optional
@@ -76,7 +77,7 @@ def _score_class(score: float) -> str:
 
 
 @router.get("/", response_class=HTMLResponse)
-async def validation_list(request: Request):
+def validation_list(request: Request):
     """Liste des fichiers en attente de validation."""
     container = request.app.state.container
     service = container.validation_service()
@@ -164,7 +165,7 @@ async def validation_detail(
     """Détail d'un fichier avec candidats enrichis (paginé)."""
     container = request.app.state.container
     service = container.validation_service()
-    pending = service.get_pending_by_id(pending_id)
+    pending = await asyncio.to_thread(service.get_pending_by_id, pending_id)
 
     if pending is None:
         return templates.TemplateResponse(
@@ -247,7 +248,7 @@ async def validate_candidate(
     """Valide un candidat sélectionné via HTMX."""
     container = request.app.state.container
     service = container.validation_service()
-    pending = service.get_pending_by_id(pending_id)
+    pending = await asyncio.to_thread(service.get_pending_by_id, pending_id)
 
     if pending is None:
         return HTMLResponse(
@@ -318,7 +319,7 @@ async def _auto_validate_series_episodes(service, pending, candidate) -> int:
 
     remaining = [
         p
-        for p in service.list_pending()
+        for p in await asyncio.to_thread(service.list_pending)
         if p.validation_status == ValidationStatus.PENDING
         and not p.auto_validated
         and p.id != pending.id
@@ -337,7 +338,7 @@ async def _auto_validate_series_episodes(service, pending, candidate) -> int:
 
 
 @router.post("/{pending_id}/reset", response_class=HTMLResponse)
-async def reset_to_pending(request: Request, pending_id: str):
+def reset_to_pending(request: Request, pending_id: str):
     """Remet un fichier auto-validé en statut pending pour re-validation."""
     container = request.app.state.container
     service = container.validation_service()
@@ -382,7 +383,7 @@ async def reset_to_pending(request: Request, pending_id: str):
 
 
 @router.post("/{pending_id}/reject", response_class=HTMLResponse)
-async def reject_pending(
+def reject_pending(
     request: Request,
     pending_id: str,
 ):
@@ -421,7 +422,7 @@ async def search_manual(
     """Recherche manuelle par titre via HTMX."""
     container = request.app.state.container
     service = container.validation_service()
-    pending = service.get_pending_by_id(pending_id)
+    pending = await asyncio.to_thread(service.get_pending_by_id, pending_id)
 
     if pending is None:
         return HTMLResponse(
@@ -493,7 +494,7 @@ async def search_by_id(
     """Recherche par ID externe (TMDB/TVDB/IMDB) via HTMX."""
     container = request.app.state.container
     service = container.validation_service()
-    pending = service.get_pending_by_id(pending_id)
+    pending = await asyncio.to_thread(service.get_pending_by_id, pending_id)
 
     if pending is None:
         return HTMLResponse(
@@ -5,207 +5,196 @@ Permet de lancer le workflow complet (scan → matching → auto-validation)
 depuis l'interface web avec suivi de progression en temps réel via SSE.
 """
 
-import asyncio
-import json
-import logging
-from typing import Optional
-
 from fastapi import APIRouter, Form, Request
 from fastapi.responses import HTMLResponse
-from starlette.responses import StreamingResponse
 
 from ...core.entities.video import ValidationStatus
 from ...core.value_objects.parsed_info import MediaType
 from ...services.workflow.pending_factory import create_pending_validation
 from ..deps import templates
-
-logger = logging.getLogger(__name__)
+from ..jobs import JOB_COMPLETE, JobContext, sse_response
 
 router = APIRouter(prefix="/workflow")
 
 
-class WorkflowProgress:
-    """État de progression partagé entre le workflow et le SSE."""
-
-    def __init__(self) -> None:
-        self.step: str = ""
-        self.step_number: int = 0
-        self.total_steps: int = 4
-        self.current: int = 0
-        self.total: int = 0
-        self.filename: str = ""
-        self.message: str = ""
-        self.complete: bool = False
-        self.error: Optional[str] = None
-        # Résultats finaux
-        self.scanned: int = 0
-        self.undersized_ignored: int = 0
-        self.orphans_cleaned: int = 0
-        self.auto_validated: int = 0
-        self.pending_remaining: int = 0
-        # Noms de fichiers par catégorie (pour tooltips)
-        self.scanned_files: list[str] = []
-        self.auto_validated_files: list[str] = []
-        self.pending_files: list[str] = []
-        self.undersized_files: list[str] = []
-
-
-async def _run_web_workflow(
-    container,
-    filter_type: str,
-    progress: WorkflowProgress,
-) -> None:
+WORKFLOW_JOB = "workflow"
+_TOTAL_STEPS = 4
+
+
+async def _run_web_workflow(container, ctx: JobContext) -> dict:
     """
     Exécute le workflow web (scan → matching → auto-validation).
 
     Réutilise les services individuels du container sans passer
     par WorkflowService.execute() qui est couplé à Rich/Confirm.
+    Le travail bloquant (base, guessit, mediainfo) passe par le pool
+    des tâches ; la progression est poussée via ctx.progress().
+
+    Returns:
+        Les compteurs et noms de fichiers affichés en fin de traitement.
     """
-    try:
-        # Initialiser les services
-        scanner = container.scanner_service()
-        validation_service = container.validation_service()
-        matcher = container.matcher_service()
-        tmdb_client = container.tmdb_client()
-        tvdb_client = container.tvdb_client()
-        pending_repo = container.pending_validation_repository()
-        video_file_repo = container.video_file_repository()
-
-        # ── Étape 1/4 : Réinitialisation de la base ──
-        progress.step = "Nettoyage"
-        progress.step_number = 1
-        progress.message = "Suppression des traitements précédents…"
-
-        # Supprimer toutes les entrées (pending + validated + rejected)
-        from sqlmodel import select
-        from ...infrastructure.persistence.models import PendingValidationModel
-        all_entries = pending_repo._session.exec(
-            select(PendingValidationModel)
-        ).all()
-        previous_entries = [pending_repo._to_entity(m) for m in all_entries]
-        for pv in previous_entries:
-            if pv.id:
-                pending_repo.delete(pv.id)
-            if pv.video_file and pv.video_file.id:
-                video_file_repo.delete(pv.video_file.id)
-            progress.orphans_cleaned += 1
-
-        if progress.orphans_cleaned > 0:
-            progress.message = f"{progress.orphans_cleaned} enregistrement(s) précédent(s) supprimé(s)"
-        await asyncio.sleep(0.1)
-
-        # ── Étape 2/4 : Scan des téléchargements ──
-        progress.step = "Scan"
-        progress.step_number = 2
-        progress.message = "Scan des téléchargements…"
-        await asyncio.sleep(0.1)
-
-        scan_results = []
-        for result in scanner.scan_downloads():
-            if _should_filter(result, filter_type):
-                continue
-            scan_results.append(result)
-            progress.current = len(scan_results)
-            progress.filename = result.video_file.filename
-            progress.message = f"Scan : {result.video_file.filename}"
-            progress.scanned_files.append(result.video_file.filename)
-
-        # Compter les undersized ignorés (pas de Confirm en web)
-        undersized = list(scanner.scan_undersized_files())
-        undersized_filtered = [
-            r for r in undersized if not _should_filter(r, filter_type)
-        ]
-        progress.undersized_ignored = len(undersized_filtered)
-        progress.undersized_files = [r.video_file.filename for r in undersized_filtered]
-
-        progress.scanned = len(scan_results)
-        progress.total = len(scan_results)
-
-        if not scan_results:
-            progress.message = "Aucun fichier à traiter."
-            progress.complete = True
-            return
-
-        progress.message = f"{len(scan_results)} fichier(s) trouvé(s)"
-        await asyncio.sleep(0.2)
-
-        # ── Étape 3/4 : Matching avec les APIs ──
-        progress.step = "Matching"
-        progress.step_number = 3
-        progress.current = 0
-        progress.total = len(scan_results)
-        progress.message = "Matching avec les APIs…"
-        await asyncio.sleep(0.1)
-
-        created_video_file_ids: list[str] = []
-
-        for i, result in enumerate(scan_results):
-            progress.current = i + 1
-            progress.filename = result.video_file.filename
-            progress.message = f"Matching : {result.video_file.filename}"
-
-            # Rechercher les candidats via API
-            video_file, pending = await create_pending_validation(
-                result, matcher, tmdb_client, tvdb_client
-            )
-
-            # Sauvegarder
-            saved_vf = video_file_repo.save(video_file)
-            if saved_vf.id:
-                created_video_file_ids.append(saved_vf.id)
-            pending.video_file = saved_vf
-            pending_repo.save(pending)
-
-            # Laisser respirer l'event loop
-            if i % 3 == 0:
-                await asyncio.sleep(0)
-
-        progress.message = f"{len(scan_results)} fichier(s) matchés"
-        await asyncio.sleep(0.2)
-
-        # ── Étape 4/4 : Auto-validation ──
-        progress.step = "Auto-validation"
-        progress.step_number = 4
-        progress.message = "Auto-validation en cours…"
-
-        pending_list = validation_service.list_pending()
-        progress.current = 0
-        progress.total = len(pending_list)
-
-        auto_count = 0
-        for i, pend in enumerate(pending_list):
-            progress.current = i + 1
-            progress.filename = pend.video_file.filename if pend.video_file else ""
-
-            fname = pend.video_file.filename if pend.video_file else "?"
-            result = await validation_service.process_auto_validation(pend)
-            if result.auto_validated:
-                auto_count += 1
-                progress.auto_validated_files.append(fname)
-            progress.message = f"Auto-validation : {auto_count} validé(s)"
-
-            if i % 5 == 0:
-                await asyncio.sleep(0)
-
-        progress.auto_validated = auto_count
-
-        # Compter les pending restants
-        remaining = [
-            p for p in validation_service.list_pending()
-            if p.validation_status == ValidationStatus.PENDING and not p.auto_validated
-        ]
-        progress.pending_remaining = len(remaining)
-        progress.pending_files = [
-            p.video_file.filename for p in remaining if p.video_file
-        ]
-
-        progress.message = "Traitement terminé"
-        progress.complete = True
-
-    except Exception as e:
-        logger.exception("Erreur lors du workflow web: %s", e)
-        progress.error = str(e)
-        progress.complete = True
+    filter_type = ctx.params.get("filter_type", "all")
+    results: dict = {
+        "scanned": 0,
+        "undersized_ignored": 0,
+        "orphans_cleaned": 0,
+        "auto_validated": 0,
+        "pending_remaining": 0,
+        "scanned_files": [],
+        "auto_validated_files": [],
+        "pending_files": [],
+        "undersized_files": [],
+    }
+
+    # Initialiser les services
+    scanner = container.scanner_service()
+    validation_service = container.validation_service()
+    matcher = container.matcher_service()
+    tmdb_client = container.tmdb_client()
+    tvdb_client = container.tvdb_client()
+    pending_repo = container.pending_validation_repository()
+    video_file_repo = container.video_file_repository()
+
+    # ── Étape 1/4 : Réinitialisation de la base ──
+    ctx.progress(
+        step="Nettoyage",
+        step_number=1,
+        total_steps=_TOTAL_STEPS,
+        current=0,
+        total=0,
+        filename="",
+        message="Suppression des traitements précédents…",
+    )
+
+    # Supprimer toutes les entrées (pending + validated + rejected)
+    orphans = await ctx.run_blocking(
+        _reset_previous_entries, pending_repo, video_file_repo
+    )
+    results["orphans_cleaned"] = orphans
+    if orphans > 0:
+        ctx.progress(message=f"{orphans} enregistrement(s) précédent(s) supprimé(s)")
+
+    # ── Étape 2/4 : Scan des téléchargements ──
+    ctx.progress(step="Scan", step_number=2, message="Scan des téléchargements…")
+
+    # Scan (guessit + mediainfo) dans le pool : l'event loop reste libre
+    scan_results, undersized = await ctx.run_blocking(
+        _scan_downloads, scanner, filter_type, ctx
+    )
+    results["scanned"] = len(scan_results)
+    results["scanned_files"] = [r.video_file.filename for r in scan_results]
+    results["undersized_ignored"] = len(undersized)
+    results["undersized_files"] = [r.video_file.filename for r in undersized]
+
+    if not scan_results:
+        ctx.progress(message="Aucun fichier à traiter.")
+        return results
+
+    ctx.progress(
+        total=len(scan_results), message=f"{len(scan_results)} fichier(s) trouvé(s)"
+    )
+
+    # ── Étape 3/4 : Matching avec les APIs ──
+    ctx.progress(
+        step="Matching",
+        step_number=3,
+        current=0,
+        total=len(scan_results),
+        message="Matching avec les APIs…",
+    )
+
+    for i, result in enumerate(scan_results):
+        ctx.progress(
+            current=i + 1,
+            filename=result.video_file.filename,
+            message=f"Matching : {result.video_file.filename}",
+        )
+
+        # Rechercher les candidats via API
+        video_file, pending = await create_pending_validation(
+            result, matcher, tmdb_client, tvdb_client
+        )
+
+        # Sauvegarder
+        saved_vf = await ctx.run_blocking(video_file_repo.save, video_file)
+        pending.video_file = saved_vf
+        await ctx.run_blocking(pending_repo.save, pending)
+
+    ctx.progress(message=f"{len(scan_results)} fichier(s) matchés")
+
+    # ── Étape 4/4 : Auto-validation ──
+    pending_list = await ctx.run_blocking(validation_service.list_pending)
+    ctx.progress(
+        step="Auto-validation",
+        step_number=4,
+        current=0,
+        total=len(pending_list),
+        message="Auto-validation en cours…",
+    )
+
+    auto_count = 0
+    for i, pend in enumerate(pending_list):
+        fname = pend.video_file.filename if pend.video_file else "?"
+        ctx.progress(
+            current=i + 1,
+            filename=pend.video_file.filename if pend.video_file else "",
+        )
+
+        # Aucun appel API : la sauvegarde en base passe par le pool
+        result = await ctx.run_blocking(validation_service.auto_validate, pend)
+        if result.auto_validated:
+            auto_count += 1
+            results["auto_validated_files"].append(fname)
+        ctx.progress(message=f"Auto-validation : {auto_count} validé(s)")
+
+    results["auto_validated"] = auto_count
+
+    # Compter les pending restants
+    remaining = [
+        p for p in await ctx.run_blocking(validation_service.list_pending)
+        if p.validation_status == ValidationStatus.PENDING and not p.auto_validated
+    ]
+    results["pending_remaining"] = len(remaining)
+    results["pending_files"] = [p.video_file.filename for p in remaining if p.video_file]
+
+    ctx.progress(message="Traitement terminé")
+    return results
+
+
+def _reset_previous_entries(pending_repo, video_file_repo) -> int:
+    """Supprime les traitements précédents (exécuté dans le pool de threads)."""
+    from sqlmodel import select
+    from ...infrastructure.persistence.models import PendingValidationModel
+    all_entries = pending_repo._session.exec(
+        select(PendingValidationModel)
+    ).all()
+    previous_entries = [pending_repo._to_entity(m) for m in all_entries]
+    for pv in previous_entries:
+        if pv.id:
+            pending_repo.delete(pv.id)
+        if pv.video_file and pv.video_file.id:
+            video_file_repo.delete(pv.video_file.id)
+    return len(previous_entries)
+
+
+def _scan_downloads(scanner, filter_type: str, ctx: JobContext) -> tuple[list, list]:
+    """Scanne les téléchargements et liste les fichiers trop petits (sync)."""
+    scan_results = []
+    for result in scanner.scan_downloads():
+        if _should_filter(result, filter_type):
+            continue
+        scan_results.append(result)
+        ctx.progress(
+            current=len(scan_results),
+            filename=result.video_file.filename,
+            message=f"Scan : {result.video_file.filename}",
+        )
+
+    # Undersized ignorés (pas de Confirm en web)
+    undersized = [
+        r for r in scanner.scan_undersized_files() if not _should_filter(r, filter_type)
+    ]
+    return scan_results, undersized
 
 
 def _should_filter(scan_result, filter_type: str) -> bool:
@@ -224,7 +213,7 @@ def _should_filter(scan_result, filter_type: str) -> bool:
 # ═══════════════════════════════════════
 
 @router.get("/", response_class=HTMLResponse)
-async def workflow_index(request: Request):
+def workflow_index(request: Request):
     """Page principale du workflow."""
     container = request.app.state.container
     validation_service = container.validation_service()
@@ -232,9 +221,9 @@ async def workflow_index(request: Request):
     pending_count = len(validation_service.list_pending())
     validated_count = len(validation_service.list_validated())
 
-    # Vérifier si un workflow est en cours
-    progress = getattr(request.app.state, "workflow_progress", None)
-    running = progress is not None and not progress.complete
+    # Traitement en cours, sinon résultat du dernier (persisté)
+    job = request.app.state.jobs.latest(WORKFLOW_JOB)
+    running = job is not None and not job.done
 
     return templates.TemplateResponse(
         request,
@@ -243,7 +232,7 @@ async def workflow_index(request: Request):
             "pending_count": pending_count,
             "validated_count": validated_count,
             "running": running,
-            "progress": progress,
+            "progress": job.result if job and job.status == JOB_COMPLETE else None,
         },
     )
 
@@ -255,95 +244,28 @@ async def workflow_start(
 ):
     """Lance le workflow en arrière-plan."""
     container = request.app.state.container
+    jobs = request.app.state.jobs
 
     # Vérifier qu'un workflow n'est pas déjà en cours
-    existing = getattr(request.app.state, "workflow_progress", None)
-    if existing and not existing.complete:
+    if jobs.running(WORKFLOW_JOB) is not None:
         return HTMLResponse(
             '<div class="action-msg action-warning">'
             "Un traitement est déjà en cours."
             "</div>"
         )
 
-    # Créer l'état de progression
-    progress = WorkflowProgress()
-    request.app.state.workflow_progress = progress
-
-    # Lancer le workflow en arrière-plan
-    task = asyncio.create_task(
-        _run_web_workflow(container, filter_type, progress)
+    jobs.start(
+        WORKFLOW_JOB,
+        lambda ctx: _run_web_workflow(container, ctx),
+        params={"filter_type": filter_type},
     )
-    request.app.state.workflow_task = task
 
     # Retourner le fragment qui active le suivi SSE
-    return templates.TemplateResponse(
-        request,
-        "workflow/_progress.html",
-        {"progress": progress},
-    )
+    return templates.TemplateResponse(request, "workflow/_progress.html", {})
 
 
 @router.get("/progress")
-async def workflow_progress_sse(request: Request):
-    """SSE endpoint pour le suivi de progression."""
-    progress = getattr(request.app.state, "workflow_progress", None)
-
-    async def event_stream():
-        if progress is None:
-            yield 'event: error\ndata: {"message": "Aucun traitement en cours"}\n\n'
-            return
-
-        last_sent = ""
-        while not progress.complete:
-            # Construire les données de progression
-            data = (
-                f'{{"step": "{progress.step}", '
-                f'"step_number": {progress.step_number}, '
-                f'"total_steps": {progress.total_steps}, '
-                f'"current": {progress.current}, '
-                f'"total": {progress.total}, '
-                f'"filename": "{_escape_json(progress.filename)}", '
-                f'"message": "{_escape_json(progress.message)}"}}'
-            )
-
-            # N'envoyer que si les données ont changé
-            if data != last_sent:
-                yield f"event: progress\ndata: {data}\n\n"
-                last_sent = data
-
-            await asyncio.sleep(0.4)
-
-        # Envoyer le résultat final
-        if progress.error:
-            yield (
-                f'event: error\n'
-                f'data: {{"message": "{_escape_json(progress.error)}"}}\n\n'
-            )
-        else:
-            complete_data = json.dumps({
-                "scanned": progress.scanned,
-                "auto_validated": progress.auto_validated,
-                "pending_remaining": progress.pending_remaining,
-                "undersized_ignored": progress.undersized_ignored,
-                "orphans_cleaned": progress.orphans_cleaned,
-                "scanned_files": progress.scanned_files,
-                "auto_validated_files": progress.auto_validated_files,
-                "pending_files": progress.pending_files,
-                "undersized_files": progress.undersized_files,
-            }, ensure_ascii=False)
-            yield f'event: complete\ndata: {complete_data}\n\n'
-
-    return StreamingResponse(
-        event_stream(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
-    )
-
-
-def _escape_json(s: str) -> str:
-    """Échappe une chaîne pour inclusion dans du JSON."""
-    return s.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+def workflow_progress_sse(request: Request):
+    """SSE endpoint pour le suivi de progression (rejoue l'état courant)."""
+    jobs = request.app.state.jobs
+    return sse_response(jobs.events(jobs.latest(WORKFLOW_JOB)))
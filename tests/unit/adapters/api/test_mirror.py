@@ -0,0 +1,143 @@
+"""
+Tests du miroir local des reponses API (MetadataMirror / MirrorTransport).
+
+Verifie:
+- L'enregistrement des reponses et leur rejeu hors ligne sans reseau
+- La politique de rafraichissement (max_age) en ligne
+- L'absence de la cle API dans les cles du miroir
+- Les recherches et 404 toujours redemandes en ligne, le JWT jamais stocke
+"""
+
+import time
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+import respx
+
+from src.adapters.api.cache import APICache
+from src.adapters.api.mirror import (
+    MetadataMirror,
+    MirrorMissError,
+    MirrorTransport,
+    request_key,
+)
+from src.adapters.api.tmdb_client import TMDBClient
+from tests.fixtures.tmdb_responses import TMDB_MOVIE_DETAILS_RESPONSE, TMDB_SEARCH_RESPONSE
+
+SEARCH_URL = "https://api.themoviedb.org/3/search/movie"
+
+
+@pytest.fixture
+def mirror(tmp_path) -> MetadataMirror:
+    mirror = MetadataMirror(tmp_path / "mirror.db")
+    yield mirror
+    mirror.close()
+
+
+def _client(mirror: MetadataMirror, **options) -> TMDBClient:
+    cache = AsyncMock(spec=APICache)
+    cache.get.return_value = None
+    return TMDBClient(
+        api_key="test_api_key", cache=cache, transport=MirrorTransport(mirror, **options)
+    )
+
+
+class TestMirrorTransport:
+    """Tests de l'enregistrement et du rejeu."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_reponses_rejouees_hors_ligne(self, mirror: MetadataMirror):
+        """Une reponse vue en ligne est servie hors ligne sans appel reseau."""
+        route = respx.get(SEARCH_URL).mock(
+            return_value=httpx.Response(200, json=TMDB_SEARCH_RESPONSE)
+        )
+        online = _client(mirror)
+        expected = await online.search("Avatar")
+        await online.close()
+
+        offline = _client(mirror, offline=True)
+        results = await offline.search("Avatar")
+
+        assert results == expected
+        assert route.call_count == 1
+        with pytest.raises(MirrorMissError):
+            await offline.get_details("19995")
+        await offline.close()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_reponse_perimee_redemandee(self, mirror: MetadataMirror):
+        """En ligne, seules les reponses plus recentes que max_age sont servies."""
+        route = respx.get("https://api.themoviedb.org/3/movie/19995").mock(
+            return_value=httpx.Response(200, json=TMDB_MOVIE_DETAILS_RESPONSE)
+        )
+        client = _client(mirror, max_age=3600)
+
+        await client.get_details("19995")
+        await client.get_details("19995")
+        assert route.call_count == 1
+
+        # Vieillir l'entree au-dela de max_age
+        (key,) = _keys(mirror)
+        entry = mirror.get(key)
+        mirror.put(key, entry.status, entry.body, entry.content_type, time.time() - 7200)
+        await client.get_details("19995")
+        assert route.call_count == 2
+
+        # Relecture forcee : jamais servie depuis le miroir
+        await client._client.get("/movie/19995", headers={"Cache-Control": "no-cache"})
+        assert route.call_count == 3
+        await client.close()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_recherches_et_404_redemandees_en_ligne(self, mirror: MetadataMirror):
+        """Un titre absent ou une recherche ne sont jamais servis depuis le miroir en ligne."""
+        search = respx.get(SEARCH_URL).mock(
+            return_value=httpx.Response(200, json=TMDB_SEARCH_RESPONSE)
+        )
+        missing = respx.get("https://api.themoviedb.org/3/movie/1").mock(
+            return_value=httpx.Response(404, json={"status_code": 34})
+        )
+        client = _client(mirror, max_age=3600)
+
+        for _ in range(2):
+            await client.search("Avatar")
+            assert await client.get_details("1") is None
+
+        assert (search.call_count, missing.call_count) == (2, 2)
+        await client.close()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_jeton_de_connexion_masque(self, mirror: MetadataMirror):
+        """Le JWT du login TVDB n'est pas ecrit dans le miroir."""
+        respx.post("https://api.thetvdb.com/login").mock(
+            return_value=httpx.Response(200, json={"token": "jwt-secret"})
+        )
+        async with httpx.AsyncClient(transport=MirrorTransport(mirror)) as client:
+            response = await client.post("https://api.thetvdb.com/login", json={})
+
+        assert response.json() == {"token": "jwt-secret"}
+        (key,) = _keys(mirror)
+        assert b"jwt-secret" not in mirror.get(key).body
+
+    def test_cle_sans_cle_api(self):
+        """La cle API n'apparait pas dans la cle du miroir."""
+        request = httpx.Request(
+            "GET",
+            SEARCH_URL,
+            params={"query": "Avatar", "api_key": "secret", "language": "fr-FR"},
+            headers={"Accept-Language": "fr"},
+        )
+
+        key = request_key(request)
+
+        assert "secret" not in key
+        assert key == "GET api.themoviedb.org/3/search/movie?language=fr-FR&query=Avatar#fr"
+
+
+def _keys(mirror: MetadataMirror) -> list[str]:
+    return [row[0] for row in mirror._conn.execute("SELECT key FROM responses")]
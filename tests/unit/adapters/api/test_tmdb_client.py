@@ -385,6 +385,51 @@ class TestTMDBGetExternalIds:
         # Verify
         assert result is None
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_external_ids_served_from_details_request(
+        self, tmdb_client: TMDBClient, mock_cache: AsyncMock
+    ):
+        """get_details() puis get_external_ids() ne font qu'une requete HTTP."""
+        details_route = respx.get("https://api.themoviedb.org/3/movie/19995").mock(
+            return_value=httpx.Response(
+                200,
+                json={**TMDB_MOVIE_DETAILS_RESPONSE, "external_ids": TMDB_EXTERNAL_IDS_RESPONSE},
+            )
+        )
+        external_route = respx.get(
+            "https://api.themoviedb.org/3/movie/19995/external_ids"
+        ).mock(return_value=httpx.Response(200, json=TMDB_EXTERNAL_IDS_RESPONSE))
+
+        details = await tmdb_client.get_details("19995")
+        result = await tmdb_client.get_external_ids("19995")
+
+        assert details is not None
+        assert result["imdb_id"] == "tt0499549"
+        assert details_route.call_count == 1
+        assert details_route.calls[0].request.url.params["append_to_response"] == (
+            "credits,external_ids"
+        )
+        assert not external_route.called
+        mock_cache.set.assert_called_once_with(
+            "tmdb:external_ids:19995", result, APICache.DETAILS_TTL
+        )
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_external_ids_read_from_cache(
+        self, tmdb_client: TMDBClient, mock_cache: AsyncMock
+    ):
+        """get_external_ids() sert les IDs deja en cache sans appel API."""
+        mock_cache.get.return_value = {"imdb_id": "tt0499549"}
+        route = respx.get("https://api.themoviedb.org/3/movie/19995/external_ids")
+
+        result = await tmdb_client.get_external_ids("19995")
+
+        assert result == {"imdb_id": "tt0499549"}
+        mock_cache.get.assert_called_once_with("tmdb:external_ids:19995")
+        assert not route.called
+
 
 class TestTMDBRetry:
     """Tests for retry behavior on rate limiting."""
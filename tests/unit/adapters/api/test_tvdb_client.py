@@ -733,3 +733,190 @@ class TestTVDBClientGetSeasonEpisodeCount:
             mock_cache.get.assert_called_once_with("tvdb:season_count:81189:S01")
         finally:
             await client.close()
+
+
+class TestTVDBClientSeasonEpisodes:
+    """Tests du chargement des episodes par saison et par serie."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_episode_lookups_share_one_season_fetch(
+        self, mock_cache: MagicMock, api_key: str
+    ) -> None:
+        """Les episodes d'une meme saison sont lus dans un seul parcours."""
+        from src.adapters.api.tvdb_client import TVDBClient
+
+        respx.post("https://api.thetvdb.com/login").mock(
+            return_value=httpx.Response(200, json=TVDB_LOGIN_RESPONSE)
+        )
+        season_route = respx.get("https://api.thetvdb.com/series/81189/episodes/query").mock(
+            return_value=httpx.Response(200, json=TVDB_SEASON_EPISODES_RESPONSE)
+        )
+
+        client = TVDBClient(api_key=api_key, cache=mock_cache)
+        try:
+            for number in range(1, 14):
+                details = await client.get_episode_details("81189", 1, number)
+                assert details.title == f"Episode {number}"
+            assert await client.get_episode_details("81189", 1, 99) is None
+            assert await client.get_season_episode_count("81189", 1) == 13
+
+            assert season_route.call_count == 1
+            assert season_route.calls[0].request.url.params["airedSeason"] == "1"
+            mock_cache.set.assert_called_once()
+            assert mock_cache.set.call_args[0][0] == "tvdb:season:81189:S01"
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cached_season_refetched_once_on_missing_episode(
+        self, mock_cache: MagicMock, api_key: str
+    ) -> None:
+        """Un episode absent d'une saison en cache relit la saison une seule fois."""
+        from src.adapters.api.tvdb_client import TVDBClient
+        from src.core.ports.api_clients import EpisodeDetails
+
+        mock_cache.get.return_value = [
+            EpisodeDetails(id="1", title="Pilote", season_number=1, episode_number=1)
+        ]
+        respx.post("https://api.thetvdb.com/login").mock(
+            return_value=httpx.Response(200, json=TVDB_LOGIN_RESPONSE)
+        )
+        season_route = respx.get("https://api.thetvdb.com/series/81189/episodes/query").mock(
+            return_value=httpx.Response(200, json=TVDB_SEASON_EPISODES_RESPONSE)
+        )
+
+        client = TVDBClient(api_key=api_key, cache=mock_cache)
+        try:
+            assert (await client.get_episode_details("81189", 1, 1)).title == "Pilote"
+            assert not season_route.called
+
+            details = await client.get_episode_details("81189", 1, 13)
+            assert details.title == "Episode 13"
+            assert season_route.call_count == 1
+            assert season_route.calls[0].request.headers["Cache-Control"] == "no-cache"
+
+            assert await client.get_episode_details("81189", 1, 99) is None
+            assert season_route.call_count == 1
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_missing_episode_refetched_after_interval(
+        self, mock_cache: MagicMock, api_key: str
+    ) -> None:
+        """Un episode absent relit la saison une fois le delai ecoule (diffusion)."""
+        from src.adapters.api.tvdb_client import TVDBClient
+
+        respx.post("https://api.thetvdb.com/login").mock(
+            return_value=httpx.Response(200, json=TVDB_LOGIN_RESPONSE)
+        )
+        season_route = respx.get("https://api.thetvdb.com/series/81189/episodes/query").mock(
+            return_value=httpx.Response(200, json=TVDB_SEASON_EPISODES_RESPONSE)
+        )
+
+        client = TVDBClient(api_key=api_key, cache=mock_cache)
+        try:
+            assert await client.get_episode_details("81189", 1, 14) is None
+            assert await client.get_episode_details("81189", 1, 14) is None
+            assert season_route.call_count == 1
+
+            # Episode diffuse depuis ; vieillir la lecture au-dela du delai
+            aired = list(TVDB_SEASON_EPISODES_RESPONSE["data"]) + [
+                {"id": 14, "airedSeason": 1, "airedEpisodeNumber": 14,
+                 "episodeName": "Episode 14"}
+            ]
+            season_route.mock(
+                return_value=httpx.Response(
+                    200, json={**TVDB_SEASON_EPISODES_RESPONSE, "data": aired}
+                )
+            )
+            client._season_fetched_at[("81189", 1)] -= TVDBClient.SEASON_REFETCH_INTERVAL
+
+            details = await client.get_episode_details("81189", 1, 14)
+            assert details.title == "Episode 14"
+            assert season_route.call_count == 2
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_missing_french_titles_completed_in_english(
+        self, mock_cache: MagicMock, api_key: str
+    ) -> None:
+        """Une seule relecture anglaise complete les titres francais manquants."""
+        from src.adapters.api.tvdb_client import TVDBClient
+
+        respx.post("https://api.thetvdb.com/login").mock(
+            return_value=httpx.Response(200, json=TVDB_LOGIN_RESPONSE)
+        )
+
+        def episodes(request: httpx.Request) -> httpx.Response:
+            english = request.headers.get("Accept-Language") == "en"
+            return httpx.Response(200, json={
+                "links": {"last": 1},
+                "data": [
+                    {"id": 1, "airedSeason": 1, "airedEpisodeNumber": 1,
+                     "episodeName": "Pilot" if english else "Pilote"},
+                    {"id": 2, "airedSeason": 1, "airedEpisodeNumber": 2,
+                     "episodeName": "Cat's in the Bag" if english else None},
+                ],
+            })
+
+        route = respx.get("https://api.thetvdb.com/series/81189/episodes/query").mock(
+            side_effect=episodes
+        )
+
+        client = TVDBClient(api_key=api_key, cache=mock_cache)
+        try:
+            episodes_s1 = await client.get_season_episodes("81189", 1)
+            assert [e.title for e in episodes_s1] == ["Pilote", "Cat's in the Bag"]
+            assert route.call_count == 2
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_series_sweep_fills_season_cache(
+        self, mock_cache: MagicMock, api_key: str
+    ) -> None:
+        """Un parcours de la serie sert ensuite toutes les saisons sans requete."""
+        from src.adapters.api.tvdb_client import TVDBClient
+
+        respx.post("https://api.thetvdb.com/login").mock(
+            return_value=httpx.Response(200, json=TVDB_LOGIN_RESPONSE)
+        )
+
+        def series_page(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params.get("page", "1"))
+            season = page  # une saison de 3 episodes par page
+            return httpx.Response(200, json={
+                "links": {"last": 10},
+                "data": [
+                    {"id": season * 100 + n, "airedSeason": season,
+                     "airedEpisodeNumber": n, "episodeName": f"S{season}E{n}"}
+                    for n in range(1, 4)
+                ],
+            })
+
+        series_route = respx.get("https://api.thetvdb.com/series/81189/episodes").mock(
+            side_effect=series_page
+        )
+        season_route = respx.get("https://api.thetvdb.com/series/81189/episodes/query")
+
+        client = TVDBClient(api_key=api_key, cache=mock_cache)
+        try:
+            seasons = await client.get_series_episodes("81189")
+            assert sorted(seasons) == list(range(1, 11))
+
+            for season in range(1, 11):
+                for number in range(1, 4):
+                    details = await client.get_episode_details("81189", season, number)
+                    assert details.title == f"S{season}E{number}"
+
+            assert series_route.call_count == 10
+            assert not season_route.called
+        finally:
+            await client.close()
@@ -0,0 +1,102 @@
+"""
+Tests unitaires pour les helpers de fix-bad-links.
+
+Verifie:
+- La detection des symlinks partageant la meme cible (resolution parallele)
+- L'index (saison, episode) -> fichier construit une fois par serie
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from src.adapters.cli.commands import fix_bad_links_command
+from src.adapters.cli.commands.fix_bad_links_command import (
+    _find_correct_target_in_storage,
+    _find_duplicate_targets,
+    _index_series_episodes,
+)
+
+
+def _make_series(storage: Path) -> Path:
+    series_dir = storage / "Séries" / "Mr Selfridge (2013)"
+    for season, episodes in ((1, (1, 2, 3)), (2, (1,))):
+        season_dir = series_dir / f"Saison {season:02d}"
+        season_dir.mkdir(parents=True, exist_ok=True)
+        for episode in episodes:
+            (season_dir / f"Mr Selfridge S{season:02d}E{episode:02d}.mkv").touch()
+    (series_dir / "Saison 01" / "notes.txt").touch()
+    return series_dir
+
+
+class TestFindDuplicateTargets:
+    """Tests de la detection des cibles partagees."""
+
+    def test_groupes_de_liens_partageant_une_cible(self, tmp_path):
+        series_dir = _make_series(tmp_path / "storage")
+        target = series_dir / "Saison 01" / "Mr Selfridge S01E01.mkv"
+        video_series = tmp_path / "video" / "Séries" / "Mr Selfridge (2013)"
+        video_series.mkdir(parents=True)
+        for episode in (1, 2, 3):
+            (video_series / f"Mr Selfridge S01E{episode:02d}.mkv").symlink_to(target)
+        # Lien unique et lien casse : ignores
+        (video_series / "Mr Selfridge S02E01.mkv").symlink_to(
+            series_dir / "Saison 02" / "Mr Selfridge S02E01.mkv"
+        )
+        (video_series / "Mr Selfridge S02E02.mkv").symlink_to(tmp_path / "absent.mkv")
+
+        duplicates = _find_duplicate_targets(tmp_path / "video", workers=4)
+
+        assert list(duplicates) == [str(target)]
+        assert [link.name for link in duplicates[str(target)]] == [
+            "Mr Selfridge S01E01.mkv",
+            "Mr Selfridge S01E02.mkv",
+            "Mr Selfridge S01E03.mkv",
+        ]
+        assert _find_duplicate_targets(tmp_path / "video", workers=1) == duplicates
+
+
+class TestEpisodeIndex:
+    """Tests de l'index (saison, episode) d'une serie du storage."""
+
+    def test_index_des_fichiers_video(self, tmp_path):
+        series_dir = _make_series(tmp_path)
+
+        index = _index_series_episodes(series_dir)
+
+        assert sorted(index) == [(1, 1), (1, 2), (1, 3), (2, 1)]
+        assert index[(1, 2)] == series_dir / "Saison 01" / "Mr Selfridge S01E02.mkv"
+
+    def test_fichiers_multi_episodes(self, tmp_path):
+        series_dir = _make_series(tmp_path)
+        season = series_dir / "Saison 02"
+        (season / "Mr Selfridge S02E02E03.mkv").touch()
+        (season / "Mr Selfridge S02E04-S02E05.mkv").touch()
+
+        index = _index_series_episodes(series_dir)
+
+        assert index[(2, 2)] == index[(2, 3)] == season / "Mr Selfridge S02E02E03.mkv"
+        assert index[(2, 4)] == index[(2, 5)] == season / "Mr Selfridge S02E04-S02E05.mkv"
+
+    def test_serie_parcourue_une_seule_fois(self, tmp_path):
+        series_dir = _make_series(tmp_path)
+        indexes: dict = {}
+
+        with patch.object(
+            fix_bad_links_command,
+            "walk_video_files",
+            wraps=fix_bad_links_command.walk_video_files,
+        ) as walk:
+            found = [
+                _find_correct_target_in_storage(
+                    Path(f"/video/Mr Selfridge S01E{e:02d}.mkv"), series_dir, indexes
+                )
+                for e in (1, 2, 3, 4)
+            ]
+
+        assert walk.call_count == 1
+        assert [p.name if p else None for p in found] == [
+            "Mr Selfridge S01E01.mkv",
+            "Mr Selfridge S01E02.mkv",
+            "Mr Selfridge S01E03.mkv",
+            None,
+        ]
@@ -0,0 +1,66 @@
+"""
+Tests unitaires pour le chargement paresseux des commandes CLI.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from src.adapters.cli.commands import COMMANDS
+from src.adapters.cli.lazy_commands import load_command
+
+_ROOT = Path(__file__).resolve().parents[4]
+
+
+def _run(code: str, **env) -> str:
+    """Execute du code dans un interpreteur neuf (sys.modules vierge)."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=_ROOT,
+        capture_output=True,
+        text=True,
+        env={**os.environ, **env},
+        check=True,
+    )
+    return result.stdout
+
+
+class TestRegistry:
+    """Tests du registre des commandes."""
+
+    def test_registry_matches_commands(self):
+        """Chaque entree se charge sous son nom, avec l'aide declaree."""
+        for entry in COMMANDS:
+            command = load_command(entry)
+            assert command.name == entry.name
+            assert command.help.strip().splitlines()[0] == entry.help
+
+
+class TestStartup:
+    """Tests du demarrage sans import des modules de commandes."""
+
+    def test_import_main_is_lightweight(self):
+        """Importer src.main ne charge ni les commandes, ni le container, ni guessit."""
+        output = _run(
+            "import sys, src.main; "
+            "print(sorted(m for m in sys.modules if m.startswith("
+            "('src.adapters.cli.commands.', 'src.container', 'guessit', 'sqlmodel'))))"
+        )
+        assert output.strip() == "[]"
+
+    def test_completion_without_import(self):
+        """La completion des noms de commandes n'importe aucun module de commandes."""
+        output = _run(
+            "import sys\n"
+            "from src.main import app\n"
+            "try:\n"
+            "    app(prog_name='cineorg')\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(any(m.startswith('src.adapters.cli.commands.') for m in sys.modules))",
+            _CINEORG_COMPLETE="complete_bash",
+            COMP_WORDS="cineorg fix",
+            COMP_CWORD="1",
+        )
+        assert output.split() == ["fix-bad-links", "fix-symlinks", "False"]
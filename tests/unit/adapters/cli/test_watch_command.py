@@ -0,0 +1,63 @@
+"""
+Tests du traitement des telechargements par cineorg watch.
+
+Verifie:
+- Les lots successifs s'executent dans la meme boucle (clients API singletons)
+"""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.adapters.cli.commands import watch_command
+
+
+class _LoopBoundClient:
+    """Client API factice lie a la boucle de son premier appel (comme httpx)."""
+
+    def __init__(self) -> None:
+        self.loop = None
+        self.calls = 0
+
+    async def get(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self.loop is None:
+            self.loop = loop
+        elif self.loop is not loop:
+            raise RuntimeError("Event loop is closed")
+        self.calls += 1
+
+
+def _container(client: _LoopBoundClient) -> MagicMock:
+    container = MagicMock()
+    container.tmdb_client.return_value = client
+    container.video_file_repository.return_value.get_by_path.return_value = None
+    validation = MagicMock(auto_validated=True)
+    container.validation_service.return_value.process_auto_validation = AsyncMock(
+        return_value=validation
+    )
+    return container
+
+
+class TestProcessDownloads:
+    """Tests des lots de telechargements."""
+
+    def test_deux_lots_successifs(self):
+        client = _LoopBoundClient()
+        container = _container(client)
+
+        async def create_pending(result, matcher, tmdb_client, tvdb_client):
+            await tmdb_client.get()
+            return MagicMock(), MagicMock()
+
+        with (
+            patch.object(watch_command, "create_pending_validation", create_pending),
+            patch.object(watch_command.logger, "error") as log_error,
+            asyncio.Runner() as runner,
+        ):
+            watch_command._process_downloads(runner, container, [Path("/dl/a.mkv")])
+            watch_command._process_downloads(runner, container, [Path("/dl/b.mkv")])
+
+        log_error.assert_not_called()
+        assert client.calls == 2
+        assert container.pending_validation_repository.return_value.save.call_count == 2
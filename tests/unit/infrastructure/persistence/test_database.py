@@ -0,0 +1,86 @@
+"""
+Tests pour la configuration de l'engine SQLite (profils PRAGMA + pool).
+"""
+
+import threading
+
+from sqlalchemy import text
+from sqlalchemy.pool import NullPool, QueuePool, StaticPool
+from sqlmodel import Session, SQLModel
+
+from src.infrastructure.persistence.database import (
+    ENGINE_PROFILES,
+    EngineProfile,
+    create_sqlite_engine,
+)
+from src.infrastructure.persistence.models import MovieModel
+
+
+def _pragma(engine, name: str):
+    with engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+class TestEngineProfile:
+    """Tests des profils de l'engine."""
+
+    def test_tuned_profile_pragmas(self, tmp_path):
+        """Le profil tuned active WAL et les PRAGMAs de performance."""
+        engine = create_sqlite_engine(
+            f"sqlite:///{tmp_path / 'tuned.db'}", ENGINE_PROFILES["tuned"]
+        )
+
+        assert isinstance(engine.pool, QueuePool)
+        assert _pragma(engine, "journal_mode") == "wal"
+        assert _pragma(engine, "synchronous") == 1  # NORMAL
+        assert _pragma(engine, "busy_timeout") == 5000
+        assert _pragma(engine, "cache_size") == -65536
+        assert _pragma(engine, "temp_store") == 2  # MEMORY
+
+    def test_legacy_profile_unchanged(self, tmp_path):
+        """Le profil legacy conserve NullPool et les PRAGMAs par defaut."""
+        engine = create_sqlite_engine(
+            f"sqlite:///{tmp_path / 'legacy.db'}", ENGINE_PROFILES["legacy"]
+        )
+
+        assert isinstance(engine.pool, NullPool)
+        assert _pragma(engine, "journal_mode") == "delete"
+
+    def test_pool_reuses_connections_across_threads(self, tmp_path):
+        """Les connexions du pool sont reutilisees depuis plusieurs threads."""
+        engine = create_sqlite_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}", EngineProfile(pool_size=2)
+        )
+        SQLModel.metadata.create_all(engine)
+        errors: list[Exception] = []
+
+        def worker(i: int) -> None:
+            try:
+                with Session(engine) as session:
+                    session.add(MovieModel(title=f"Film {i}", year=2000 + i))
+                    session.commit()
+            except Exception as exc:  # pragma: no cover - remonte par l'assert
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        with Session(engine) as session:
+            assert len(session.exec(text("SELECT id FROM movies")).all()) == 8
+        assert engine.pool.checkedin() <= 2
+
+    def test_memory_database_shared(self):
+        """Une base en memoire garde ses tables entre sessions."""
+        engine = create_sqlite_engine("sqlite:///:memory:", ENGINE_PROFILES["tuned"])
+        SQLModel.metadata.create_all(engine)
+
+        assert isinstance(engine.pool, StaticPool)
+        with Session(engine) as session:
+            session.add(MovieModel(title="Inception", year=2010))
+            session.commit()
+        with Session(engine) as session:
+            assert session.exec(text("SELECT count(*) FROM movies")).one()[0] == 1
@@ -0,0 +1,127 @@
+"""
+Tests pour les tables de facettes (genres, personnes, resolution).
+"""
+
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from src.core.entities.media import Movie
+from src.infrastructure.persistence.database import (
+    ENGINE_PROFILES,
+    create_sqlite_engine,
+)
+from src.infrastructure.persistence.facets import rebuild_facets
+from src.infrastructure.persistence.migrations import run_migrations
+from src.infrastructure.persistence.models import (
+    CreditModel,
+    MovieGenreModel,
+    MovieModel,
+    PersonModel,
+    SeriesGenreModel,
+    SeriesModel,
+)
+from src.infrastructure.persistence.repositories.movie_repository import (
+    SQLModelMovieRepository,
+)
+
+
+def _engine(tmp_path):
+    engine = create_sqlite_engine(
+        f"sqlite:///{tmp_path / 'cineorg.db'}", ENGINE_PROFILES["tuned"]
+    )
+    run_migrations(engine)
+    return engine
+
+
+def _genres(session, movie_id: int) -> set[str]:
+    return set(
+        session.exec(
+            select(MovieGenreModel.genre).where(MovieGenreModel.movie_id == movie_id)
+        ).all()
+    )
+
+
+def _credits(session, entity_type: str, entity_id: int) -> set[tuple[str, str]]:
+    rows = session.exec(
+        select(PersonModel.name, CreditModel.role)
+        .join(CreditModel, CreditModel.person_id == PersonModel.id)
+        .where(CreditModel.entity_type == entity_type, CreditModel.entity_id == entity_id)
+    ).all()
+    return set(rows)
+
+
+class TestFacetSync:
+    """Tests de la synchronisation des facettes a l'ecriture."""
+
+    def test_repository_save_populates_facets(self, tmp_path):
+        """Un film sauvegarde alimente genres, credits et resolution_label."""
+        engine = _engine(tmp_path)
+        with Session(engine) as session:
+            repo = SQLModelMovieRepository(session)
+            saved = repo.save(
+                Movie(
+                    title="Heat",
+                    year=1995,
+                    tmdb_id=949,
+                    genres=("Action", "Comédie"),
+                    director="Michael Mann",
+                    cast=("Al Pacino", "Robert De Niro"),
+                    resolution="1916x796",
+                )
+            )
+            movie_id = int(saved.id)
+
+            assert _genres(session, movie_id) == {"Action", "Comédie"}
+            assert _credits(session, "movie", movie_id) == {
+                ("Michael Mann", "director"),
+                ("Al Pacino", "actor"),
+                ("Robert De Niro", "actor"),
+            }
+            assert session.get(MovieModel, movie_id).resolution_label == "1080p"
+
+            # Mise a jour : les facettes suivent
+            saved.genres = ("Drame",)
+            saved.cast = ("Al Pacino",)
+            repo.save(saved)
+            assert _genres(session, movie_id) == {"Drame"}
+            assert ("Robert De Niro", "actor") not in _credits(session, "movie", movie_id)
+
+    def test_session_write_and_delete(self, tmp_path):
+        """Les ecritures directes via la session sont couvertes, y compris la suppression."""
+        engine = _engine(tmp_path)
+        with Session(engine) as session:
+            series = SeriesModel(
+                title="Lost", genres_json='["Drame", "Myst\\u00e8re"]',
+                director="J.J. Abrams, Damon Lindelof",
+            )
+            session.add(series)
+            session.commit()
+            series_id = series.id
+            assert _credits(session, "series", series_id) == {
+                ("J.J. Abrams, Damon Lindelof", "director")
+            }
+            assert len(session.exec(select(SeriesGenreModel)).all()) == 2
+
+            session.delete(series)
+            session.commit()
+            assert session.exec(select(SeriesGenreModel)).all() == []
+            assert session.exec(select(CreditModel)).all() == []
+
+    def test_rebuild_backfills_existing_rows(self, tmp_path):
+        """rebuild_facets recalcule tout depuis les colonnes sources."""
+        engine = _engine(tmp_path)
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO movies (title, genres_json, cast_json, resolution, watched) "
+                    "VALUES ('Alien', '[\"Horreur\"]', '[\"Sigourney Weaver\"]', '3840x2160', 0)"
+                )
+            )
+        with engine.begin() as conn:
+            assert rebuild_facets(conn) == 1
+
+        with Session(engine) as session:
+            movie = session.exec(select(MovieModel)).one()
+            assert movie.resolution_label == "4K"
+            assert _genres(session, movie.id) == {"Horreur"}
+            assert _credits(session, "movie", movie.id) == {("Sigourney Weaver", "actor")}
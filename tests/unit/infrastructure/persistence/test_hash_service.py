@@ -0,0 +1,76 @@
+"""
+Tests pour le service de hash par echantillons et le hash par lot.
+
+Verifie le cache par signature stat et le calcul parallele de BatchHashService.
+"""
+
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.persistence.hash_service import (
+    BatchHashService,
+    compute_file_hash,
+    stat_signature,
+)
+
+
+@pytest.fixture
+def video_files(tmp_path):
+    """Trois petits fichiers de contenus differents."""
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"episode{i}.mkv"
+        path.write_bytes(f"contenu {i}".encode() * 100)
+        paths.append(path)
+    return paths
+
+
+class TestBatchHashService:
+    """Tests pour BatchHashService."""
+
+    def test_hash_many_matches_compute_file_hash(self, video_files):
+        """Les hash paralleles sont identiques au calcul unitaire, dans l'ordre."""
+        with BatchHashService(max_workers=3) as hasher:
+            hashes = hasher.hash_many(video_files)
+
+        assert hashes == [compute_file_hash(p) for p in video_files]
+
+    def test_results_cached_by_stat_signature(self, video_files):
+        """Un fichier inchange n'est hashe qu'une fois par lot."""
+        hash_fn = MagicMock(side_effect=compute_file_hash)
+        with BatchHashService(hash_fn=hash_fn) as hasher:
+            hasher.prefetch(video_files)
+            hasher.hash_many(video_files)
+            hasher.hash(video_files[0])
+
+        assert hash_fn.call_count == 3
+
+    def test_rewritten_file_is_rehashed(self, video_files):
+        """Un fichier reecrit change de signature et est recalcule."""
+        path = video_files[0]
+        with BatchHashService() as hasher:
+            before = hasher.hash(path)
+            path.write_bytes(b"nouveau contenu plus long")
+            st = path.stat()
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            after = hasher.hash(path)
+
+        assert before != after
+        assert after == compute_file_hash(path)
+
+    def test_missing_file_raises(self, tmp_path):
+        """Un fichier absent n'est pas mis en cache et l'erreur remonte."""
+        assert stat_signature(tmp_path / "absent.mkv") is None
+        with BatchHashService() as hasher:
+            with pytest.raises(FileNotFoundError):
+                hasher.hash(tmp_path / "absent.mkv")
+
+    @pytest.mark.asyncio
+    async def test_ahash_many(self, video_files):
+        """La variante async retourne les memes hash."""
+        with BatchHashService(max_workers=2) as hasher:
+            hashes = await hasher.ahash_many(video_files)
+
+        assert hashes == [compute_file_hash(p) for p in video_files]
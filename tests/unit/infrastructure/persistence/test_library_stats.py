@@ -0,0 +1,147 @@
+"""
+Tests pour les statistiques materialisees (triggers library_stats).
+"""
+
+from sqlalchemy import delete, text, update
+from sqlmodel import Session, SQLModel
+
+from src.infrastructure.persistence.database import (
+    ENGINE_PROFILES,
+    create_sqlite_engine,
+)
+from src.infrastructure.persistence.library_stats import (
+    read_library_generation,
+    read_library_stats,
+    rebuild_library_stats,
+)
+from src.infrastructure.persistence.migrations import run_migrations
+from src.infrastructure.persistence.models import (
+    EpisodeModel,
+    MovieModel,
+    PendingValidationModel,
+    SeriesModel,
+    VideoFileModel,
+)
+
+
+def _engine(tmp_path):
+    engine = create_sqlite_engine(
+        f"sqlite:///{tmp_path / 'cineorg.db'}", ENGINE_PROFILES["tuned"]
+    )
+    run_migrations(engine)
+    return engine
+
+
+def _stats(engine) -> dict[str, int]:
+    with Session(engine) as session:
+        return read_library_stats(session)
+
+
+def _recomputed(engine) -> dict[str, int]:
+    """Recalcul complet, sans toucher aux compteurs maintenus."""
+    with engine.connect() as conn:
+        rebuild_library_stats(conn)
+        rows = conn.execute(text("SELECT key, value FROM library_stats")).all()
+        conn.rollback()
+    return dict(rows)
+
+
+class TestLibraryStats:
+    """Tests de la maintenance incrementale des compteurs."""
+
+    def test_insert_update_delete(self, tmp_path):
+        """Les compteurs suivent les ecritures ORM et les operations en masse."""
+        engine = _engine(tmp_path)
+        with Session(engine) as session:
+            session.add(MovieModel(title="Inception", year=2010, poster_path="/a.jpg"))
+            session.add(MovieModel(title="Heat", year=1995, vote_average=8.2))
+            session.add(MovieModel(title="Vide", year=2000, director=""))
+            series = SeriesModel(title="Lost", tvdb_id=4815)
+            session.add(series)
+            session.commit()
+            session.add(
+                EpisodeModel(
+                    series_id=series.id, season_number=1, episode_number=1,
+                    title="Pilot", file_path="/s/lost.mkv",
+                )
+            )
+            video = VideoFileModel(path="/a.mkv", filename="a.mkv")
+            session.add(video)
+            session.commit()
+            session.add(PendingValidationModel(video_file_id=video.id))
+            session.commit()
+
+        stats = _stats(engine)
+        assert stats["movies.total"] == 3
+        assert stats["movies.poster_path"] == 1
+        assert stats["movies.vote_average"] == 1
+        assert stats["movies.director"] == 0
+        assert stats["series.tvdb_id"] == 1
+        assert stats["episodes.file_path"] == 1
+        assert stats["pending_validations.pending"] == 1
+
+        with Session(engine) as session:
+            session.exec(update(MovieModel).values(poster_path="/p.jpg"))
+            session.exec(
+                update(PendingValidationModel).values(validation_status="validated")
+            )
+            session.exec(delete(MovieModel).where(MovieModel.title == "Heat"))
+            session.commit()
+
+        stats = _stats(engine)
+        assert stats["movies.total"] == 2
+        assert stats["movies.poster_path"] == 2
+        assert stats["movies.vote_average"] == 0
+        assert stats["pending_validations.pending"] == 0
+        assert stats == _recomputed(engine)
+
+    def test_existing_rows_backfilled(self, tmp_path):
+        """La migration calcule les compteurs des lignes existantes."""
+        engine = create_sqlite_engine(
+            f"sqlite:///{tmp_path / 'old.db'}", ENGINE_PROFILES["tuned"]
+        )
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(MovieModel(title="Alien", year=1979, overview="Nostromo"))
+            session.commit()
+
+        run_migrations(engine)
+
+        stats = _stats(engine)
+        assert stats["movies.total"] == 1
+        assert stats["movies.overview"] == 1
+
+
+class TestLibraryGeneration:
+    """Tests du compteur de generation (cache des pages web)."""
+
+    def test_bumped_on_content_writes_only(self, tmp_path):
+        """Les ecritures de contenu incrementent la generation, pas "vu" ni la note."""
+        engine = _engine(tmp_path)
+
+        def generation() -> int:
+            with Session(engine) as session:
+                return read_library_generation(session)
+
+        start = generation()
+        with Session(engine) as session:
+            movie = MovieModel(title="Heat", year=1995)
+            session.add(movie)
+            session.commit()
+            assert generation() == start + 1
+
+            movie.watched = True
+            movie.personal_rating = 5
+            session.add(movie)
+            session.commit()
+            assert generation() == start + 1
+
+            movie.overview = "Los Angeles"
+            session.add(movie)
+            session.commit()
+            assert generation() == start + 2
+
+            session.add(VideoFileModel(path="/a.mkv", filename="a.mkv"))
+            session.exec(delete(MovieModel))
+            session.commit()
+        assert generation() == start + 4
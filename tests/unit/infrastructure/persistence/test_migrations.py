@@ -0,0 +1,117 @@
+"""
+Tests pour les migrations versionnees du schema.
+"""
+
+from sqlalchemy import text
+
+from src.infrastructure.persistence import models  # noqa: F401
+from src.infrastructure.persistence.database import (
+    ENGINE_PROFILES,
+    create_sqlite_engine,
+)
+from src.infrastructure.persistence.migrations import (
+    LATEST_VERSION,
+    get_schema_version,
+    missing_indexes,
+    run_migrations,
+)
+
+
+def _engine(tmp_path):
+    return create_sqlite_engine(
+        f"sqlite:///{tmp_path / 'cineorg.db'}", ENGINE_PROFILES["tuned"]
+    )
+
+
+def _version(engine) -> int:
+    with engine.begin() as conn:
+        return get_schema_version(conn)
+
+
+class TestRunMigrations:
+    """Tests du runner de migrations."""
+
+    def test_new_database(self, tmp_path):
+        """Une base vierge est creee a la derniere version avec tous ses index."""
+        engine = _engine(tmp_path)
+
+        assert run_migrations(engine) == LATEST_VERSION
+        assert _version(engine) == LATEST_VERSION
+        with engine.connect() as conn:
+            assert missing_indexes(conn) == []
+
+    def test_up_to_date_is_noop(self, tmp_path):
+        """Une base a jour ne rejoue aucune etape."""
+        engine = _engine(tmp_path)
+        run_migrations(engine)
+
+        assert run_migrations(engine) == 0
+        assert _version(engine) == LATEST_VERSION
+
+    def test_unversioned_database_upgraded(self, tmp_path):
+        """Une base anterieure au versionnement recoit colonnes et index."""
+        engine = _engine(tmp_path)
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TABLE video_files ("
+                    "id INTEGER PRIMARY KEY, path VARCHAR NOT NULL, "
+                    "filename VARCHAR NOT NULL, file_hash VARCHAR, "
+                    "size_bytes INTEGER, codec_video VARCHAR, codec_audio VARCHAR, "
+                    "resolution_width INTEGER, resolution_height INTEGER, "
+                    "duration_seconds INTEGER, languages_json VARCHAR, "
+                    "created_at DATETIME, updated_at DATETIME)"
+                )
+            )
+            conn.execute(
+                text("INSERT INTO video_files (path, filename) VALUES ('/a.mkv', 'a.mkv')")
+            )
+
+        assert run_migrations(engine) == LATEST_VERSION
+
+        with engine.connect() as conn:
+            columns = {
+                row[1] for row in conn.execute(text("PRAGMA table_info(video_files)"))
+            }
+            assert "symlink_path" in columns
+            assert missing_indexes(conn) == []
+            assert conn.execute(text("SELECT count(*) FROM video_files")).scalar() == 1
+
+    def test_hot_query_indexes_used(self, tmp_path):
+        """Les requetes frequentes utilisent les index crees."""
+        engine = _engine(tmp_path)
+        run_migrations(engine)
+
+        with engine.connect() as conn:
+            plan = " ".join(
+                str(row[-1])
+                for row in conn.execute(
+                    text(
+                        "EXPLAIN QUERY PLAN SELECT * FROM pending_validations "
+                        "WHERE validation_status = 'validated' AND auto_validated = 1"
+                    )
+                )
+            )
+        assert "ix_pending_validations_status_auto" in plan
+
+    def test_movie_links_backfilled(self, tmp_path, monkeypatch):
+        """Les symlinks existants de video/Films sont indexes par la migration."""
+        storage = tmp_path / "storage"
+        storage.mkdir()
+        (storage / "Alien.mkv").touch()
+        films = tmp_path / "video" / "Films" / "Science-Fiction"
+        films.mkdir(parents=True)
+        (films / "Alien (1979) MULTi.mkv").symlink_to(storage / "Alien.mkv")
+        (films / "sans annee.mkv").symlink_to(storage / "Alien.mkv")
+        monkeypatch.setenv("CINEORG_VIDEO_DIR", str(tmp_path / "video"))
+        engine = _engine(tmp_path)
+
+        run_migrations(engine)
+
+        with engine.connect() as conn:
+            rows = conn.execute(
+                text("SELECT symlink_path, target_path, normalized_title, year FROM movie_links")
+            ).all()
+        assert rows == [
+            (str(films / "Alien (1979) MULTi.mkv"), str(storage / "Alien.mkv"), "alien", 1979)
+        ]
@@ -0,0 +1,60 @@
+"""
+Tests pour l'index des symlinks de films (movie_links).
+"""
+
+from pathlib import Path
+
+from sqlmodel import Session, SQLModel
+
+from src.infrastructure.persistence.database import (
+    ENGINE_PROFILES,
+    create_sqlite_engine,
+)
+from src.infrastructure.persistence.repositories.movie_link_repository import (
+    SQLModelMovieLinkRepository,
+)
+
+
+def _repo() -> SQLModelMovieLinkRepository:
+    engine = create_sqlite_engine("sqlite://", ENGINE_PROFILES["tuned"])
+    SQLModel.metadata.create_all(engine)
+    return SQLModelMovieLinkRepository(Session(engine))
+
+
+class TestMovieLinkRepository:
+    """Tests de l'indexation et de la recherche par titre et annee."""
+
+    def test_record_and_find(self):
+        """Le titre est normalise a l'indexation comme a la recherche."""
+        repo = _repo()
+        link = Path("/video/Films/Action/L/Léon : Version longue (1994) 1080p.mkv")
+        target = Path("/storage/Films/Action/L/Léon.mkv")
+
+        assert repo.record(link, target)
+        assert not repo.record(Path("/video/Films/sans-annee.mkv"))
+
+        found = repo.find("léon  version longue", 1994)
+        assert found.symlink_path == link
+        assert found.target_path == target
+        assert found.title == "Léon : Version longue"
+        assert repo.find("Léon : Version longue", 1995) is None
+
+        # Reindexation du meme symlink : pas de doublon
+        assert repo.record(link, None)
+        assert repo.find("Léon : Version longue", 1994).target_path is None
+
+    def test_move_and_remove(self):
+        """Les deplacements et suppressions du cleanup suivent l'index."""
+        repo = _repo()
+        old = Path("/video/Films/Drame/Heat (1995).mkv")
+        new = Path("/video/Films/Drame/H-L/Heat (1995).mkv")
+        repo.record(old, Path("/storage/Heat.mkv"))
+
+        assert repo.move(old, new)
+        found = repo.find("Heat", 1995)
+        assert found.symlink_path == new
+        assert found.target_path == Path("/storage/Heat.mkv")
+
+        assert repo.remove(new)
+        assert not repo.remove(new)
+        assert repo.find("Heat", 1995) is None
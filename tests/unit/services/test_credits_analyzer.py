@@ -0,0 +1,264 @@
+"""
+Tests de l'analyse du generique (CreditsAnalyzer).
+
+Verifie:
+- Le seuil d'Otsu et la binarisation des frames (texte noir sur fond blanc)
+- L'elimination des frames quasi identiques (distance de Hamming)
+- L'OCR Tesseract parallele, texte combine dans l'ordre des frames
+- Le decoupage du flux rawvideo de ffmpeg en frames
+- Le cache des resultats (cle, echecs non caches)
+- Le repli sur les frames JPEG quand la confiance du flux est faible
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services import credits_analyzer
+from src.services.credits_analyzer import (
+    DUPLICATE_FRAME_DISTANCE,
+    CreditsAnalysisResult,
+    CreditsAnalyzer,
+    _distinct_frames,
+    _is_duplicate,
+)
+
+
+class TestOtsuThreshold:
+    """Tests du seuil d'Otsu (NumPy)."""
+
+    def test_histogramme_bimodal(self):
+        np = pytest.importorskip("numpy")
+        histogram = np.zeros(256)
+        histogram[40:60] = 100
+        histogram[190:210] = 100
+
+        threshold = credits_analyzer._otsu_threshold(histogram)
+
+        assert 59 <= threshold < 190
+
+    def test_image_uniforme_et_histogramme_vide(self):
+        np = pytest.importorskip("numpy")
+        uniform = np.zeros(256)
+        uniform[128] = 1000
+
+        assert credits_analyzer._otsu_threshold(uniform) == 0
+        assert credits_analyzer._otsu_threshold(np.zeros(256)) == 0
+
+
+class TestPreprocessFrame:
+    """Tests de la binarisation d'une frame."""
+
+    def test_texte_clair_sur_fond_sombre_inverse(self):
+        pytest.importorskip("numpy")
+        Image = pytest.importorskip("PIL.Image")
+        frame = Image.new("L", (200, 100), color=10)
+        frame.paste(230, (80, 40, 120, 60))  # "texte" clair
+
+        result = credits_analyzer._preprocess_frame(frame)
+
+        assert result.size == (400, 200)  # upscale x2 sous 800 px
+        assert result.getpixel((5, 5)) == 255  # fond blanc
+        assert result.getpixel((200, 100)) == 0  # texte noir
+
+    def test_texte_sombre_sur_fond_clair_conserve(self):
+        pytest.importorskip("numpy")
+        Image = pytest.importorskip("PIL.Image")
+        frame = Image.new("L", (200, 100), color=235)
+        frame.paste(20, (80, 40, 120, 60))
+
+        result = credits_analyzer._preprocess_frame(frame)
+
+        assert result.getpixel((5, 5)) == 255
+        assert result.getpixel((200, 100)) == 0
+
+
+class TestDistinctFrames:
+    """Tests de l'elimination des frames quasi identiques."""
+
+    def test_distance_de_hamming(self):
+        close = (1 << DUPLICATE_FRAME_DISTANCE) - 1  # DUPLICATE_FRAME_DISTANCE bits
+        far = (1 << (DUPLICATE_FRAME_DISTANCE + 1)) - 1
+
+        assert _is_duplicate(0, close)
+        assert not _is_duplicate(0, far)
+        assert not _is_duplicate(None, 0)
+        assert not _is_duplicate(0, None)
+
+    def test_seules_les_frames_consecutives_sont_ecartees(self):
+        frames = [Path(f"frame_{i:03d}.jpg") for i in range(5)]
+        generique = 0
+        autre = (1 << 64) - 1
+        hashes = dict(zip(frames, [generique, generique | 0b1, autre, generique, None]))
+
+        with patch.object(credits_analyzer, "_file_average_hash", side_effect=hashes.get):
+            kept = _distinct_frames(frames)
+
+        # Doublon consecutif ecarte ; meme image apres une autre : conservee ;
+        # frame illisible (hash None) : conservee
+        assert kept == [frames[0], frames[2], frames[3], frames[4]]
+
+
+class TestOcrWithTesseract:
+    """Tests de l'OCR Tesseract sur les frames JPEG."""
+
+    @pytest.mark.asyncio
+    async def test_texte_combine_dans_l_ordre_des_frames(self, tmp_path):
+        pytest.importorskip("numpy")
+        Image = pytest.importorskip("PIL.Image")
+        frames = []
+        for i in range(4):
+            # Largeur propre a chaque frame : identifie l'image recue par l'OCR
+            frame = tmp_path / f"frame_{i:03d}.jpg"
+            Image.new("L", (100 + i, 32), color=200).save(frame)
+            frames.append(frame)
+        texts = {200: "Realise par", 202: "", 204: "Jean Dupont", 206: "Marie Curie"}
+
+        def image_to_string(image, **kwargs):
+            # Les premieres frames finissent en dernier
+            time.sleep((206 - image.width) / 500)
+            return texts[image.width]
+
+        fake_tesseract = MagicMock()
+        fake_tesseract.image_to_string.side_effect = image_to_string
+
+        analyzer = CreditsAnalyzer(cache_dir=None)
+        with (
+            patch.dict(sys.modules, {"pytesseract": fake_tesseract}),
+            patch.object(credits_analyzer, "_distinct_frames", side_effect=lambda f: f),
+        ):
+            result = await analyzer._ocr_with_tesseract(frames)
+
+        assert result.method == "tesseract"
+        assert result.raw_text == "Realise par\nJean Dupont\nMarie Curie"
+        assert fake_tesseract.image_to_string.call_count == 4
+
+
+class TestStreamCreditsFrames:
+    """Tests du decoupage du flux rawvideo (niveaux de gris) en frames."""
+
+    @pytest.mark.asyncio
+    async def test_frames_completes_et_derniere_frame_tronquee_ignoree(self, tmp_path):
+        pytest.importorskip("PIL.Image")
+        width, height = 4, 2
+        stdout = asyncio.StreamReader()
+        stdout.feed_data(bytes([10] * 8 + [200] * 8 + [50] * 5))  # 2 frames + 5 octets
+        stdout.feed_eof()
+        process = MagicMock(stdout=stdout, returncode=0)
+        process.wait = AsyncMock(return_value=0)
+
+        analyzer = CreditsAnalyzer(cache_dir=None)
+        with (
+            patch.object(analyzer, "_probe_frame_size", AsyncMock(return_value=(width, height))),
+            patch.object(analyzer, "_get_last_chapter_start", AsyncMock(return_value=None)),
+            patch.object(
+                asyncio, "create_subprocess_exec", AsyncMock(return_value=process)
+            ) as spawn,
+        ):
+            images = [image async for image in analyzer._stream_credits_frames(tmp_path / "f.mkv")]
+
+        assert [image.size for image in images] == [(width, height)] * 2
+        assert [image.getpixel((0, 0)) for image in images] == [10, 200]
+        assert [image.mode for image in images] == ["L", "L"]
+        cmd = spawn.call_args.args
+        assert cmd[cmd.index("-f") + 1] == "rawvideo"
+        assert cmd[cmd.index("-pix_fmt") + 1] == "gray"
+        process.kill.assert_not_called()
+        process.wait.assert_awaited_once()
+
+
+class TestCache:
+    """Tests du cache des resultats par hash de fichier."""
+
+    @pytest.fixture
+    def video(self, tmp_path) -> Path:
+        video = tmp_path / "film.mkv"
+        video.write_bytes(b"video")
+        return video
+
+    @pytest.mark.asyncio
+    async def test_resultat_cache_puis_servi(self, tmp_path, video):
+        result = CreditsAnalysisResult(raw_text="Realise par X", confidence=80, method="tesseract")
+        analyzer = CreditsAnalyzer(cache_dir=str(tmp_path / "cache"))
+        with patch.object(analyzer, "_analyze", AsyncMock(return_value=result)) as analyze:
+            first = await analyzer.analyze(video)
+            second = await analyzer.analyze(video)
+
+        assert first == second == result
+        analyze.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "failure",
+        [
+            CreditsAnalysisResult(),
+            CreditsAnalysisResult(raw_text="  \n", confidence=0, method="tesseract"),
+            CreditsAnalysisResult(raw_text="", confidence=0, method="claude"),
+        ],
+    )
+    async def test_echec_non_cache(self, tmp_path, video, failure):
+        analyzer = CreditsAnalyzer(cache_dir=str(tmp_path / "cache"))
+        with patch.object(analyzer, "_analyze", AsyncMock(return_value=failure)) as analyze:
+            await analyzer.analyze(video)
+            await analyzer.analyze(video)
+
+        assert analyze.await_count == 2
+
+    def test_cle_depend_des_ocr_disponibles(self, tmp_path, video):
+        analyzer = CreditsAnalyzer(cache_dir=str(tmp_path / "cache"))
+        analyzer._easyocr_available = False
+        tesseract_only = analyzer._cache_key(video)
+
+        analyzer._easyocr_available = True
+        with_easyocr = analyzer._cache_key(video)
+        analyzer._api_key = "sk-test"
+        with_api = analyzer._cache_key(video)
+
+        assert len({tesseract_only, with_easyocr, with_api}) == 3
+        assert CreditsAnalyzer(cache_dir=None)._cache_key(video) is None
+
+
+class TestStreamFallback:
+    """Tests du repli flux -> frames JPEG."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("confidence", "easyocr", "fallback"),
+        [(10, True, True), (10, False, False), (60, True, False)],
+    )
+    async def test_repli_si_confiance_faible(self, tmp_path, confidence, easyocr, fallback):
+        streamed = CreditsAnalysisResult(raw_text="x", confidence=confidence, method="tesseract")
+        from_files = CreditsAnalysisResult(raw_text="y", confidence=90, method="easyocr")
+        analyzer = CreditsAnalyzer(cache_dir=None)
+        analyzer._easyocr_available = easyocr
+        with (
+            patch.object(analyzer, "_stream_available", return_value=True),
+            patch.object(analyzer, "_ocr_stream_tesseract", AsyncMock(return_value=streamed)),
+            patch.object(
+                analyzer, "_analyze_files", AsyncMock(return_value=from_files)
+            ) as analyze_files,
+        ):
+            result = await analyzer._analyze(tmp_path / "film.mkv")
+
+        if fallback:
+            assert result is from_files
+            analyze_files.assert_awaited_once_with(tmp_path / "film.mkv", fallback_only=True)
+        else:
+            assert result is streamed
+            analyze_files.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_flux_vide_analyse_les_frames(self, tmp_path):
+        analyzer = CreditsAnalyzer(cache_dir=None)
+        with (
+            patch.object(analyzer, "_stream_available", return_value=True),
+            patch.object(analyzer, "_ocr_stream_tesseract", AsyncMock(return_value=None)),
+            patch.object(analyzer, "_analyze_files", AsyncMock()) as analyze_files,
+        ):
+            await analyzer._analyze(tmp_path / "film.mkv")
+
+        analyze_files.assert_awaited_once_with(tmp_path / "film.mkv")
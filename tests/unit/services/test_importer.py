@@ -505,3 +505,162 @@ class TestImportDecision:
         assert ImportDecision.SKIP_KNOWN.value == "skip_known"
         assert ImportDecision.UPDATE_PATH.value == "update_path"
         assert ImportDecision.ERROR.value == "error"
+
+
+# ============================================================================
+# Tests: mode bulk
+# ============================================================================
+
+
+class TestBulkImport:
+    """Tests pour l'import en masse (hash parallele + ecritures par lots)."""
+
+    @pytest.fixture
+    def session(self):
+        from sqlmodel import Session, SQLModel, create_engine
+
+        import src.infrastructure.persistence.models  # noqa: F401
+
+        engine = create_engine("sqlite:///:memory:")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            yield session
+
+    @pytest.fixture
+    def bulk_importer(self, session, mock_file_system, mock_media_info_extractor):
+        from src.infrastructure.persistence.hash_service import compute_file_hash
+        from src.infrastructure.persistence.repositories import (
+            SQLModelPendingValidationRepository,
+            SQLModelVideoFileRepository,
+        )
+
+        return ImporterService(
+            file_system=mock_file_system,
+            filename_parser=MagicMock(),
+            media_info_extractor=mock_media_info_extractor,
+            video_file_repo=SQLModelVideoFileRepository(session),
+            pending_repo=SQLModelPendingValidationRepository(session),
+            compute_hash_fn=compute_file_hash,
+        )
+
+    def _make_files(self, root: Path, count: int) -> list[Path]:
+        films = root / "Films"
+        films.mkdir(parents=True)
+        paths = []
+        for i in range(count):
+            path = films / f"Film {i:02d} (2000).mkv"
+            path.write_bytes(f"contenu {i}".encode())
+            paths.append(path)
+        return paths
+
+    def test_bulk_scan_library_writes_in_batches(
+        self, bulk_importer, session, tmp_path
+    ):
+        """Tous les fichiers sont ecrits avec une validation en attente."""
+        from sqlmodel import select
+
+        from src.infrastructure.persistence.models import (
+            PendingValidationModel,
+            VideoFileModel,
+        )
+
+        self._make_files(tmp_path, 7)
+
+        results = list(
+            bulk_importer.bulk_scan_library(tmp_path, workers=3, batch_size=3)
+        )
+
+        assert [r.decision for r in results] == [ImportDecision.IMPORT] * 7
+        files = session.exec(select(VideoFileModel)).all()
+        pendings = session.exec(select(PendingValidationModel)).all()
+        assert len(files) == 7
+        assert sorted(p.video_file_id for p in pendings) == sorted(
+            f.id for f in files
+        )
+        assert all(f.file_hash for f in files)
+
+    def test_bulk_rescan_skips_known_and_updates_moved(
+        self, bulk_importer, session, tmp_path
+    ):
+        """Un second passage ignore les fichiers connus et suit les deplacements."""
+        from sqlmodel import select
+
+        from src.infrastructure.persistence.models import VideoFileModel
+
+        paths = self._make_files(tmp_path, 3)
+        list(bulk_importer.bulk_scan_library(tmp_path, batch_size=2))
+
+        moved = tmp_path / "Films" / "Renomme (2000).mkv"
+        paths[0].rename(moved)
+
+        results = list(bulk_importer.bulk_scan_library(tmp_path, batch_size=2))
+
+        decisions = sorted(r.decision.value for r in results)
+        assert decisions == ["skip_known", "skip_known", "update_path"]
+        stored = {f.path for f in session.exec(select(VideoFileModel)).all()}
+        assert str(moved) in stored
+        assert str(paths[0]) not in stored
+
+    def test_bulk_dry_run_writes_nothing(
+        self, bulk_importer, session, tmp_path
+    ):
+        """En dry-run, aucune ligne n'est ecrite."""
+        from sqlmodel import select
+
+        from src.infrastructure.persistence.models import VideoFileModel
+
+        self._make_files(tmp_path, 2)
+        bulk_importer._dry_run = True
+
+        results = list(bulk_importer.bulk_scan_library(tmp_path))
+
+        assert len(results) == 2
+        assert session.exec(select(VideoFileModel)).all() == []
+
+    def test_bulk_scan_from_symlinks_records_both_paths(
+        self, bulk_importer, session, tmp_path
+    ):
+        """Le mode symlinks enregistre le symlink et la cible physique."""
+        from sqlmodel import select
+
+        from src.infrastructure.persistence.models import VideoFileModel
+
+        storage = tmp_path / "storage"
+        (target,) = self._make_files(storage, 1)
+        video = tmp_path / "video"
+        video.mkdir()
+        link = video / target.name
+        link.symlink_to(target)
+        (video / "casse.mkv").symlink_to(tmp_path / "absent.mkv")
+
+        results = list(bulk_importer.bulk_scan_from_symlinks(video))
+
+        decisions = sorted(r.decision.value for r in results)
+        assert decisions == ["error", "import"]
+        (stored,) = session.exec(select(VideoFileModel)).all()
+        assert stored.path == str(target)
+        assert stored.symlink_path == str(link)
+
+    def test_bulk_streams_with_bounded_in_flight(
+        self, bulk_importer, session, tmp_path
+    ):
+        """Le generateur de fichiers est consomme au fil des resultats."""
+        paths = self._make_files(tmp_path, 12)
+        pulled = []
+
+        def items():
+            for path in paths:
+                pulled.append(path)
+                yield (path, path, None)
+
+        results = bulk_importer._bulk_run(items(), workers=2, batch_size=5)
+        next(results)
+        assert len(pulled) <= 2 * 2
+
+        with patch.object(
+            bulk_importer._video_file_repo,
+            "load_import_index",
+            wraps=bulk_importer._video_file_repo.load_import_index,
+        ) as load_index:
+            assert len(list(results)) == 11
+        load_index.assert_not_called()
@@ -109,12 +109,11 @@ class TestIntegrityCheckerGhostEntries:
         self, mock_file_system, mock_video_file_repo, temp_dirs
     ):
         """Entree BDD sans fichier physique -> ghost_entry."""
-        # Setup: model en BDD avec path inexistant
-        mock_model = MagicMock()
-        mock_model.id = 1
-        mock_model.path = str(temp_dirs["storage"] / "fantome.mkv")
-
-        mock_video_file_repo._session.exec.return_value.all.return_value = [mock_model]
+        # Setup: ligne (id, path) en BDD avec path inexistant
+        ghost_path = str(temp_dirs["storage"] / "fantome.mkv")
+        mock_video_file_repo._session.exec.return_value.all.return_value = [
+            (1, ghost_path)
+        ]
 
         checker = IntegrityChecker(
             file_system=mock_file_system,
@@ -130,6 +129,35 @@ class TestIntegrityCheckerGhostEntries:
         assert report.ghost_entries[0].type == IssueType.GHOST_ENTRY
         assert "fantome.mkv" in str(report.ghost_entries[0].path)
 
+    def test_ghost_pass_with_parallel_stat(
+        self, mock_file_system, mock_video_file_repo, temp_dirs, tmp_path
+    ):
+        """Les chemins hors stockage sont verifies par stat parallele."""
+        present = tmp_path / "ailleurs.mkv"
+        present.write_text("x")
+        stored = temp_dirs["storage"] / "film.mkv"
+        stored.write_text("x")
+        mock_video_file_repo._session.exec.return_value.all.return_value = [
+            (1, str(present)),
+            (2, str(stored)),
+            (3, str(tmp_path / "disparu.mkv")),
+            (4, str(temp_dirs["storage"] / "supprime.mkv")),
+        ]
+
+        checker = IntegrityChecker(
+            file_system=mock_file_system,
+            video_file_repo=mock_video_file_repo,
+            storage_dir=temp_dirs["storage"],
+            video_dir=temp_dirs["video"],
+            stat_workers=4,
+        )
+
+        report = checker.check()
+
+        ghost_names = sorted(i.path.name for i in report.ghost_entries)
+        assert ghost_names == ["disparu.mkv", "supprime.mkv"]
+        assert report.orphan_files == []
+
 
 # ============================================================================
 # Tests: IntegrityChecker - Orphan Files
@@ -184,6 +212,34 @@ class TestIntegrityCheckerOrphanFiles:
         # Aucun orphelin video
         assert len(report.orphan_files) == 0
 
+    def test_known_files_are_not_orphans(
+        self, mock_file_system, mock_video_file_repo, temp_dirs
+    ):
+        """Un fichier reference en BDD n'est pas orphelin, sans get_by_path."""
+        season = temp_dirs["storage"] / "Séries" / "Show" / "Saison 01"
+        season.mkdir(parents=True)
+        known = season / "Show - S01E01.mkv"
+        known.write_text("x")
+        orphan = season / "Show - S01E02.mkv"
+        orphan.write_text("x")
+        (season / "lien.mkv").symlink_to(known)
+        mock_video_file_repo._session.exec.return_value.all.return_value = [
+            (1, str(known))
+        ]
+
+        checker = IntegrityChecker(
+            file_system=mock_file_system,
+            video_file_repo=mock_video_file_repo,
+            storage_dir=temp_dirs["storage"],
+            video_dir=temp_dirs["video"],
+        )
+
+        report = checker.check()
+
+        assert [i.path for i in report.orphan_files] == [orphan]
+        assert report.ghost_entries == []
+        mock_video_file_repo.get_by_path.assert_not_called()
+
 
 # ============================================================================
 # Tests: IntegrityChecker - Broken Symlinks
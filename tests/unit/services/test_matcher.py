@@ -437,6 +437,54 @@ class TestScoreResults:
         assert scored[0].score == 100.0
 
 
+# Candidats realistes (accents, ponctuation, titres originaux absents ou vides)
+REALISTIC_CANDIDATES = [
+    SearchResult(id=str(i), title=title, original_title=original, year=year, source="tmdb")
+    for i, (title, original, year) in enumerate(
+        [
+            ("Les Évadés", "The Shawshank Redemption", 1994),
+            (
+                "Le Seigneur des anneaux : La Communauté de l'anneau",
+                "The Lord of the Rings: The Fellowship of the Ring",
+                2001,
+            ),
+            ("Amélie Poulain", "Le Fabuleux Destin d'Amélie Poulain", 2001),
+            ("Star Wars, épisode IV : Un nouvel espoir", "Star Wars", 1977),
+            ("L'Évadé d'Alcatraz", "Escape from Alcatraz", 1979),
+            ("Évadés", None, None),
+            ("", "Untitled", 2020),
+            ("Shawshank", "", 1995),
+        ]
+    )
+]
+
+
+class TestBatchScoring:
+    """score_results (scoring groupe) donne exactement les scores unitaires."""
+
+    @pytest.mark.parametrize("query", ["Les Evades", "the shawshank redemption", "Amelie", ""])
+    def test_movie_scores_identiques(self, query):
+        scored = MatcherService().score_results(REALISTIC_CANDIDATES, query, 1994, 8520)
+
+        expected = {
+            c.id: calculate_movie_score(
+                query, 1994, 8520, c.title, c.year, None, c.original_title
+            )
+            for c in REALISTIC_CANDIDATES
+        }
+        assert {r.id: r.score for r in scored} == expected
+
+    @pytest.mark.parametrize("query", ["Les Evades", "Star Wars"])
+    def test_series_scores_identiques(self, query):
+        scored = MatcherService().score_results(REALISTIC_CANDIDATES, query, is_series=True)
+
+        expected = {
+            c.id: calculate_series_score(query, c.title, c.original_title)
+            for c in REALISTIC_CANDIDATES
+        }
+        assert {r.id: r.score for r in scored} == expected
+
+
 class TestDeterminism:
     """Tests for scoring determinism."""
 
@@ -828,3 +828,70 @@ class TestNavigateToLeafWithPrefix:
 
         result = get_movie_video_destination(movie, tmp_path)
         assert result == american_dir
+
+
+# ====================
+# Tests cache des listings
+# ====================
+
+class TestDirectoryCache:
+    """Tests pour le partage du cache des listings de répertoires."""
+
+    def _build_tree(self, tmp_path: Path) -> Path:
+        genre_dir = tmp_path / "Films" / "Action & Aventure"
+        (genre_dir / "A-L" / "A").mkdir(parents=True)
+        (genre_dir / "M-Z").mkdir(parents=True)
+        return genre_dir
+
+    def test_single_scan_per_directory(self, tmp_path: Path, monkeypatch) -> None:
+        """Plusieurs résolutions ne relisent pas les répertoires déjà listés."""
+        import os
+
+        from src.services import directory_cache as dc_module
+        from src.services.directory_cache import DirectoryCache
+
+        self._build_tree(tmp_path)
+        scanned: list[str] = []
+        original_scandir = os.scandir
+
+        def counting_scandir(path):
+            scanned.append(str(path))
+            return original_scandir(path)
+
+        monkeypatch.setattr(dc_module.os, "scandir", counting_scandir)
+
+        cache = DirectoryCache()
+        for title in ("Alien", "Avatar", "Aliens"):
+            movie = Movie(title=title, year=1986, genres=("Action",))
+            result = get_movie_video_destination(movie, tmp_path, cache)
+            assert result == tmp_path / "Films" / "Action & Aventure" / "A-L" / "A"
+
+        assert len(scanned) == len(set(scanned))
+
+    def test_invalidate_sees_new_subdir(self, tmp_path: Path) -> None:
+        """Après invalidation, un répertoire créé est pris en compte."""
+        from src.services.directory_cache import DirectoryCache
+
+        genre_dir = self._build_tree(tmp_path)
+        cache = DirectoryCache()
+        movie = Movie(title="Matrix", year=1999, genres=("Action",))
+
+        assert get_movie_video_destination(movie, tmp_path, cache) == genre_dir / "M-Z"
+
+        new_dir = genre_dir / "M-Z" / "M"
+        new_dir.mkdir()
+        # Listing encore en cache : la nouvelle subdivision est ignorée
+        assert get_movie_video_destination(movie, tmp_path, cache) == genre_dir / "M-Z"
+
+        cache.invalidate(new_dir)
+        assert get_movie_video_destination(movie, tmp_path, cache) == new_dir
+
+    def test_missing_genre_dir(self, tmp_path: Path) -> None:
+        """Un genre absent donne la lettre simple, avec ou sans cache."""
+        from src.services.directory_cache import DirectoryCache
+
+        movie = Movie(title="Matrix", year=1999, genres=("Action",))
+        expected = tmp_path / "Films" / "Action & Aventure" / "M"
+
+        assert get_movie_video_destination(movie, tmp_path) == expected
+        assert get_movie_video_destination(movie, tmp_path, DirectoryCache()) == expected
@@ -0,0 +1,85 @@
+"""
+Tests unitaires pour le moteur de suggestion aleatoire.
+"""
+
+import random
+
+import pytest
+from sqlmodel import Session, SQLModel
+
+from src.infrastructure.persistence.database import (
+    ENGINE_PROFILES,
+    create_sqlite_engine,
+)
+from src.infrastructure.persistence.models import MovieModel, SeriesModel
+from src.services.suggestion import SuggestionEngine, SuggestionFilters
+
+
+@pytest.fixture
+def session():
+    engine = create_sqlite_engine("sqlite://", ENGINE_PROFILES["tuned"])
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                MovieModel(id=1, title="Heat", genres_json='["Action"]',
+                           imdb_rating=8.3, vote_average=5.0, duration_seconds=10200),
+                MovieModel(id=2, title="Alien", genres_json='["Horreur"]',
+                           vote_average=8.0, duration_seconds=7020),
+                MovieModel(id=3, title="Vu", watched=True, personal_rating=2),
+                MovieModel(id=4, title="Revu", watched=True, personal_rating=5),
+                SeriesModel(id=1, title="Lost", genres_json='["Action"]', vote_average=6.0),
+            ]
+        )
+        session.commit()
+        yield session
+
+
+class TestSuggestionEngine:
+    """Tests du tirage et du cache des candidats."""
+
+    def test_filters_pushed_down(self, session):
+        """Eligibilite, genre, duree et note sont evalues en SQL."""
+        engine = SuggestionEngine()
+
+        assert set(engine.eligible(session, SuggestionFilters())) == {
+            ("movie", 1), ("movie", 2), ("movie", 4), ("series", 1),
+        }
+        assert engine.eligible(session, SuggestionFilters(genre="Action")) == [
+            ("movie", 1), ("series", 1),
+        ]
+        # IMDb prioritaire sur TMDB : Heat (8.3 IMDb) oui, Lost (6.0) non
+        assert engine.eligible(session, SuggestionFilters(min_rating=7.0)) == [
+            ("movie", 1), ("movie", 2),
+        ]
+        assert engine.eligible(
+            session, SuggestionFilters(type="movie", max_duration_min=150)
+        ) == [("movie", 2)]
+
+    def test_pick_excludes_history(self, session):
+        """Le tirage evite l'historique tant qu'il reste des candidats."""
+        engine = SuggestionEngine()
+        filters = SuggestionFilters(genre="Action")
+        rng = random.Random(0)
+
+        for _ in range(10):
+            assert engine.pick(session, filters, exclude={("movie", 1)}, rng=rng) == (
+                "series", 1,
+            )
+        # Tout l'historique epuise : retombe sur l'ensemble des candidats
+        all_seen = {("movie", 1), ("series", 1)}
+        assert engine.pick(session, filters, exclude=all_seen, rng=rng) in all_seen
+        assert engine.pick(session, SuggestionFilters(genre="Western")) is None
+
+    def test_cache_invalidated_on_write(self, session):
+        """Une ecriture ORM invalide les listes en cache."""
+        engine = SuggestionEngine(ttl=None)
+        filters = SuggestionFilters(type="movie")
+        assert engine.count(session, filters) == 3
+
+        heat = session.get(MovieModel, 1)
+        heat.watched = True
+        session.add(heat)
+        session.commit()
+
+        assert engine.count(session, filters) == 2
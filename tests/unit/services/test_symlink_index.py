@@ -0,0 +1,192 @@
+"""
+Tests de l'index inverse des symlinks (fichier physique -> symlinks).
+
+Verifie:
+- La mise a jour de l'index par FileSystemAdapter
+- La reconciliation incrementale (repertoires inchanges non relus)
+- Les requetes par cible, par inode et des cibles partagees
+- Les doublons (cleanup, fix-bad-links) regroupes par inode via l'index
+- La detection des symlinks casses par IntegrityChecker via l'index
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from sqlmodel import Session, SQLModel
+
+from src.adapters.cli.commands.fix_bad_links_command import _find_duplicate_targets
+from src.adapters.file_system import FileSystemAdapter
+from src.infrastructure.persistence.database import ENGINE_PROFILES, create_sqlite_engine
+from src.infrastructure.persistence.repositories.symlink_index_repository import (
+    SQLModelSymlinkIndexRepository,
+)
+from src.services.cleanup.analyzers import scan_duplicate_symlinks
+from src.services.integrity import IntegrityChecker
+from src.services.symlink_index import reconcile_symlink_index
+
+
+@pytest.fixture
+def index() -> SQLModelSymlinkIndexRepository:
+    engine = create_sqlite_engine("sqlite://", ENGINE_PROFILES["tuned"])
+    SQLModel.metadata.create_all(engine)
+    return SQLModelSymlinkIndexRepository(lambda: Session(engine))
+
+
+@pytest.fixture
+def library(tmp_path: Path) -> tuple[Path, Path]:
+    storage = tmp_path / "storage"
+    video = tmp_path / "video" / "Séries"
+    for name in ("Lost S01E01.mkv", "Lost S01E02.mkv"):
+        (storage / "Lost").mkdir(parents=True, exist_ok=True)
+        (storage / "Lost" / name).touch()
+    season = video / "Lost" / "Saison 01"
+    season.mkdir(parents=True)
+    (season / "Lost S01E01.mkv").symlink_to(storage / "Lost" / "Lost S01E01.mkv")
+    (season / "Lost S01E02.mkv").symlink_to(storage / "Lost" / "Lost S01E01.mkv")
+    return storage, video
+
+
+def _age(directory: Path) -> None:
+    """Recule le mtime d'un repertoire hors de la fenetre douteuse."""
+    st = directory.stat()
+    os.utime(directory, ns=(st.st_atime_ns, st.st_mtime_ns - 10_000_000_000))
+
+
+class TestReconcile:
+    """Tests de la reconciliation avec le disque."""
+
+    def test_cibles_partagees_et_inode(self, index, library):
+        """Apres reconciliation, les requetes ne touchent plus au disque."""
+        storage, video = library
+        target = storage / "Lost" / "Lost S01E01.mkv"
+
+        stats = reconcile_symlink_index(index, video, workers=2)
+
+        assert stats.links == 2
+        season = video / "Lost" / "Saison 01"
+        expected = [season / "Lost S01E01.mkv", season / "Lost S01E02.mkv"]
+        assert index.shared_targets(video) == {target: expected}
+        st = target.stat()
+        assert index.links_to(Path("/autre/chemin.mkv"), st.st_dev, st.st_ino) == expected
+
+    def test_repertoires_inchanges_non_relus(self, index, library):
+        """Seul le repertoire modifie est relu ; les disparus sont oublies."""
+        storage, video = library
+        season = video / "Lost" / "Saison 01"
+        for directory in (video, video / "Lost", season):
+            _age(directory)
+        reconcile_symlink_index(index, video)
+
+        stats = reconcile_symlink_index(index, video)
+        assert (stats.directories, stats.rescanned, stats.links) == (3, 0, 0)
+
+        (season / "Lost S01E02.mkv").unlink()
+        (season / "Lost S01E02.mkv").symlink_to(storage / "Lost" / "Lost S01E02.mkv")
+        stats = reconcile_symlink_index(index, video)
+        assert (stats.rescanned, stats.links) == (1, 2)
+        assert index.shared_targets(video) == {}
+
+        for link in season.iterdir():
+            link.unlink()
+        season.rmdir()
+        stats = reconcile_symlink_index(index, video)
+        assert stats.removed_dirs == 1
+        assert index.entries(video) == []
+
+
+class TestSharedTargets:
+    """Tests des doublons lus dans l'index, regroupes par fichier physique."""
+
+    @pytest.fixture
+    def aliased(self, tmp_path: Path) -> tuple[Path, Path, Path]:
+        """Deux symlinks d'un meme dossier vers un fichier, par deux chemins."""
+        target = tmp_path / "storage" / "Films" / "Film (2020).mkv"
+        target.parent.mkdir(parents=True)
+        target.touch()
+        alias = tmp_path / "storage" / "Alias"
+        alias.symlink_to(target.parent)
+        films = tmp_path / "video" / "Films" / "Action"
+        films.mkdir(parents=True)
+        (films / "Film (2020).mkv").symlink_to(target)
+        (films / "Film (2020) MULTi 1080p.mkv").symlink_to(alias / target.name)
+        # Cible retenue pour le groupe : le plus petit des deux chemins
+        return tmp_path / "video", min(target, alias / target.name), films
+
+    def test_chemins_differents_meme_inode(self, index, aliased):
+        video, target, films = aliased
+        reconcile_symlink_index(index, video / "Films")
+
+        assert index.shared_targets(video) == {
+            target: [films / "Film (2020) MULTi 1080p.mkv", films / "Film (2020).mkv"]
+        }
+
+    def test_doublons_du_nettoyage(self, index, aliased):
+        video, target, films = aliased
+
+        (duplicate,) = scan_duplicate_symlinks(video, index)
+
+        assert duplicate.directory == films
+        assert duplicate.keep == films / "Film (2020) MULTi 1080p.mkv"
+        assert duplicate.remove == [films / "Film (2020).mkv"]
+
+    def test_cibles_partagees_de_fix_bad_links(self, index, aliased):
+        video, target, films = aliased
+        (films / "notes.txt").symlink_to(target)  # extension non video : ignoree
+
+        assert _find_duplicate_targets(video, workers=1, symlink_index=index) == {
+            str(target): [films / "Film (2020) MULTi 1080p.mkv", films / "Film (2020).mkv"]
+        }
+
+
+class TestFileSystemAdapterIndex:
+    """Tests de la mise a jour de l'index par l'adaptateur."""
+
+    def test_creation_et_suppression(self, index, tmp_path):
+        target = tmp_path / "storage" / "Film (2020).mkv"
+        target.parent.mkdir()
+        target.touch()
+        link = tmp_path / "video" / "Films" / "Film (2020).mkv"
+        fs = FileSystemAdapter(symlink_index=index)
+
+        assert fs.create_symlink(target, link)
+        assert index.links_to(target.resolve()) == [link]
+
+        assert fs.remove_symlink(link)
+        assert index.links_to(target.resolve()) == []
+
+    def test_echec_de_l_index_sans_effet(self, tmp_path):
+        """Une erreur de l'index ne fait pas echouer la creation du symlink."""
+        target = tmp_path / "fichier.mkv"
+        target.touch()
+        broken_index = MagicMock()
+        broken_index.record.side_effect = RuntimeError("base indisponible")
+        fs = FileSystemAdapter(symlink_index=broken_index)
+
+        assert fs.create_symlink(target, tmp_path / "lien.mkv")
+        assert (tmp_path / "lien.mkv").is_symlink()
+
+
+class TestIntegrityWithIndex:
+    """Tests de la detection des liens casses via l'index."""
+
+    def test_liens_casses(self, index, library):
+        storage, video = library
+        (storage / "Lost" / "Lost S01E01.mkv").unlink()
+        checker = IntegrityChecker(
+            file_system=MagicMock(),
+            video_file_repo=MagicMock(),
+            video_dir=video,
+            symlink_index=index,
+        )
+
+        issues = checker.broken_symlink_issues(video)
+
+        season = video / "Lost" / "Saison 01"
+        assert [issue.path for issue in issues] == [
+            season / "Lost S01E01.mkv",
+            season / "Lost S01E02.mkv",
+        ]
+        assert issues[0].details == str(storage / "Lost" / "Lost S01E01.mkv")
+        checker._file_system.find_broken_links.assert_not_called()
@@ -99,6 +99,68 @@ class TestCheckConflict:
             assert result.new_hash == "abc123"
 
 
+class TestBatchConflicts:
+    """Tests pour la detection de conflits sur un batch entier."""
+
+    @pytest.mark.asyncio
+    async def test_acheck_conflicts_classifies_batch(self, tmp_path):
+        """Doublons, collisions et absences sont detectes en une passe."""
+        from src.adapters.file_system import FileSystemAdapter
+
+        storage = tmp_path / "storage"
+        storage.mkdir()
+        fs = FileSystemAdapter()
+        transferer = TransfererService(fs, fs, storage, tmp_path / "video")
+
+        same_src = tmp_path / "a.mkv"
+        same_src.write_bytes(b"identique")
+        same_dst = storage / "a.mkv"
+        same_dst.write_bytes(b"identique")
+        diff_src = tmp_path / "b.mkv"
+        diff_src.write_bytes(b"nouveau")
+        diff_dst = storage / "b.mkv"
+        diff_dst.write_bytes(b"ancien")
+        free_src = tmp_path / "c.mkv"
+        free_src.write_bytes(b"libre")
+
+        conflicts = await transferer.acheck_conflicts(
+            [
+                (same_src, same_dst),
+                (diff_src, diff_dst),
+                (free_src, storage / "c.mkv"),
+            ]
+        )
+
+        assert conflicts[0].conflict_type == ConflictType.DUPLICATE
+        assert conflicts[1].conflict_type == ConflictType.NAME_COLLISION
+        assert conflicts[2] is None
+
+    def test_prefetched_hashes_reused_by_check_conflict(self, tmp_path):
+        """Les hash prechauffes servent check_conflict sans relecture."""
+        from src.adapters.file_system import FileSystemAdapter
+        from src.infrastructure.persistence.hash_service import BatchHashService
+
+        src = tmp_path / "src.mkv"
+        src.write_bytes(b"source")
+        dst = tmp_path / "dst.mkv"
+        dst.write_bytes(b"destination")
+        fs = FileSystemAdapter()
+
+        with patch(
+            "src.services.transferer.compute_file_hash", side_effect=lambda p: p.name
+        ) as mock_hash:
+            from src.services.transferer import _hash_file
+
+            hasher = BatchHashService(hash_fn=_hash_file)
+            transferer = TransfererService(fs, fs, tmp_path, tmp_path, hasher=hasher)
+            transferer.prefetch_conflicts([(src, dst)])
+            conflict = transferer.check_conflict(src, dst)
+            hasher.close()
+
+        assert conflict.conflict_type == ConflictType.NAME_COLLISION
+        assert mock_hash.call_count == 2
+
+
 # ====================
 # Tests transfer_file avec fichiers reels
 # ====================
@@ -225,6 +287,58 @@ class TestTransferFileReal:
         assert result.conflict is not None
         assert result.conflict.conflict_type == ConflictType.DUPLICATE
 
+    def test_transfer_invalidates_directory_cache(self, tmp_path):
+        """Le transfert invalide les listings du cache partage."""
+        from src.adapters.file_system import FileSystemAdapter
+        from src.services.directory_cache import DirectoryCache
+
+        storage = tmp_path / "storage"
+        video = tmp_path / "video"
+        (video / "Films" / "Action").mkdir(parents=True)
+        storage.mkdir()
+
+        source = tmp_path / "downloads" / "movie.mkv"
+        source.parent.mkdir(parents=True)
+        source.write_bytes(b"content")
+
+        cache = DirectoryCache()
+        assert cache.subdirs(video / "Films" / "Action") == []
+
+        fs = FileSystemAdapter()
+        transferer = TransfererService(fs, fs, storage, video, dir_cache=cache)
+        dest = storage / "Films" / "Action" / "M" / "Matrix.mkv"
+        result = transferer.transfer_file(source, dest)
+
+        assert result.success
+        assert cache.subdirs(video / "Films" / "Action") == [
+            video / "Films" / "Action" / "M"
+        ]
+
+    def test_transfer_records_movie_link(self, tmp_path):
+        """Le symlink cree sous video/Films est indexe avec sa cible."""
+        from src.adapters.file_system import FileSystemAdapter
+
+        storage = tmp_path / "storage"
+        video = tmp_path / "video"
+        storage.mkdir()
+        video.mkdir()
+
+        source = tmp_path / "downloads" / "movie.mkv"
+        source.parent.mkdir(parents=True)
+        source.write_bytes(b"content")
+
+        links = Mock()
+        fs = FileSystemAdapter()
+        transferer = TransfererService(fs, fs, storage, video, movie_links=links)
+        dest = storage / "Films" / "Action" / "M" / "Matrix (1999) 1080p.mkv"
+        result = transferer.transfer_file(source, dest)
+
+        assert result.success
+        links.record.assert_called_once_with(result.symlink_path, dest)
+
+        transferer.move_to_staging(result.symlink_path, tmp_path / "staging")
+        links.remove.assert_called_once_with(result.symlink_path)
+
 
 # ====================
 # Tests transfer_file avec mocks
@@ -588,3 +702,56 @@ class TestFindSimilarContent:
 
         # Ne devrait pas detecter car le dossier est vide
         assert result is None
+
+    def test_index_updated_by_transfer(self, tmp_path):
+        """Un dossier cree par un transfert est visible sans relire le repertoire."""
+        storage = tmp_path / "storage"
+        video = tmp_path / "video"
+        dest_dir = storage / "Series" / "I-K"
+        dest_dir.mkdir(parents=True)
+        video.mkdir()
+
+        source = tmp_path / "downloads" / "S01E01.mkv"
+        source.parent.mkdir(parents=True)
+        source.write_bytes(b"content")
+
+        from src.adapters.file_system import FileSystemAdapter
+
+        fs = FileSystemAdapter()
+        transferer = TransfererService(fs, fs, storage, video)
+
+        # Premier appel : index construit sur un repertoire vide
+        assert transferer.find_similar_content("Industry", 2020, dest_dir, True) is None
+
+        destination = dest_dir / "Industry (2020)" / "Saison 01" / "S01E01.mkv"
+        assert transferer.transfer_file(source, destination).success
+
+        with patch.object(Path, "iterdir", side_effect=AssertionError("relecture")):
+            result = transferer.find_similar_content("Industry", 2021, dest_dir, True)
+
+        assert result is not None
+        assert result.existing_dir == dest_dir / "Industry (2020)"
+
+    def test_fuzzy_lookup(self, tmp_path):
+        """Un titre proche est signale si un seuil fuzzy est fourni."""
+        storage = tmp_path / "storage"
+        video = tmp_path / "video"
+        storage.mkdir()
+        existing_dir = video / "Films" / "M" / "The Matrix (1999)"
+        existing_dir.mkdir(parents=True)
+        (existing_dir / "The Matrix (1999).mkv").write_bytes(b"content")
+
+        from src.adapters.file_system import FileSystemAdapter
+
+        fs = FileSystemAdapter()
+        transferer = TransfererService(fs, fs, storage, video)
+        dest_dir = video / "Films" / "M"
+
+        assert transferer.find_similar_content("Matrixx", 1999, dest_dir) is None
+
+        result = transferer.find_similar_content(
+            "Matrixx", 1999, dest_dir, fuzzy_threshold=85
+        )
+        assert result is not None
+        assert result.existing_title == "The Matrix (1999)"
+        assert "proche" in result.similarity_reason
@@ -265,6 +265,27 @@ class TestProcessAutoValidation:
         mock_pending_repo.save.assert_not_called()
 
 
+    def test_auto_validate_synchrone(
+        self, validation_service, mock_pending_repo, sample_video_file
+    ):
+        """auto_validate : meme traitement, appelable hors event loop (pool web)."""
+        pending = PendingValidation(
+            id="1",
+            video_file=sample_video_file,
+            candidates=[
+                {"id": "19995", "title": "Avatar", "year": 2009, "score": 90.0, "source": "tmdb"}
+            ],
+            auto_validated=False,
+            validation_status=ValidationStatus.PENDING,
+        )
+
+        result = validation_service.auto_validate(pending)
+
+        assert result.auto_validated is True
+        assert result.selected_candidate_id == "19995"
+        mock_pending_repo.save.assert_called_once()
+
+
 # ============================================================================
 # Tests: validate_candidate
 # ============================================================================
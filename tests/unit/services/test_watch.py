@@ -0,0 +1,189 @@
+"""
+Tests de la surveillance continue (cineorg watch).
+
+Verifie:
+- La detection des creations, suppressions et deplacements (polling, inotify)
+- La mise a jour de l'index des symlinks et de la base (video/, storage/)
+- Le traitement des telechargements apres le delai de calme
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from sqlmodel import Session, SQLModel, select
+
+from src.adapters.file_system import FileSystemAdapter
+from src.adapters.file_watcher import (
+    CREATED,
+    DELETED,
+    MOVED,
+    FileEvent,
+    InotifyWatcher,
+    PollingWatcher,
+    inotify_available,
+)
+from src.core.entities.video import VideoFile
+from src.infrastructure.persistence.database import ENGINE_PROFILES, create_sqlite_engine
+from src.infrastructure.persistence.models import MovieModel
+from src.infrastructure.persistence.repositories.symlink_index_repository import (
+    SQLModelSymlinkIndexRepository,
+)
+from src.infrastructure.persistence.repositories.video_file_repository import (
+    SQLModelVideoFileRepository,
+)
+from src.services.watch import WatchService
+
+
+@pytest.fixture
+def engine():
+    engine = create_sqlite_engine("sqlite://", ENGINE_PROFILES["tuned"])
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def dirs(tmp_path: Path) -> dict[str, Path]:
+    dirs = {name: tmp_path / name for name in ("video", "storage", "downloads")}
+    for path in dirs.values():
+        path.mkdir()
+    return dirs
+
+
+def _service(engine, dirs, **kwargs) -> WatchService:
+    index = SQLModelSymlinkIndexRepository(lambda: Session(engine))
+    return WatchService(
+        video_dir=dirs["video"],
+        storage_dir=dirs["storage"],
+        downloads_dir=dirs["downloads"],
+        symlink_index=index,
+        file_system=FileSystemAdapter(symlink_index=index),
+        video_file_repo=SQLModelVideoFileRepository(Session(engine)),
+        movie_link_repo=MagicMock(),
+        **kwargs,
+    )
+
+
+class TestPollingWatcher:
+    """Tests de la comparaison d'instantanes."""
+
+    def test_creation_deplacement_suppression(self, tmp_path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "film.mkv").touch()
+        (tmp_path / "old.mkv").touch()
+        watcher = PollingWatcher([tmp_path], interval=0.01)
+
+        (tmp_path / "a").rename(tmp_path / "b")
+        (tmp_path / "new.mkv").touch()
+        (tmp_path / "old.mkv").unlink()
+        events = watcher.read_events(timeout=1.0)
+
+        assert sorted(events) == sorted([
+            FileEvent(MOVED, tmp_path / "a", tmp_path / "b", True),
+            FileEvent(DELETED, tmp_path / "old.mkv"),
+            FileEvent(CREATED, tmp_path / "new.mkv"),
+        ])
+        assert watcher.read_events(timeout=1.0) == []
+
+
+@pytest.mark.skipif(not inotify_available(), reason="inotify indisponible")
+class TestInotifyWatcher:
+    """Tests de la surveillance inotify."""
+
+    def test_deplacement_et_nouveau_dossier(self, tmp_path):
+        (tmp_path / "film.mkv").touch()
+        with InotifyWatcher([tmp_path]) as watcher:
+            (tmp_path / "film.mkv").rename(tmp_path / "renomme.mkv")
+            assert watcher.read_events(timeout=1.0) == [
+                FileEvent(MOVED, tmp_path / "film.mkv", tmp_path / "renomme.mkv")
+            ]
+
+            (tmp_path / "Saison 01").mkdir()
+            watcher.read_events(timeout=1.0)
+            (tmp_path / "Saison 01" / "S01E01.mkv").touch()
+            assert watcher.read_events(timeout=1.0) == [
+                FileEvent(CREATED, tmp_path / "Saison 01" / "S01E01.mkv")
+            ]
+
+
+class TestVideoEvents:
+    """Tests des evenements sur les symlinks de video/."""
+
+    def test_symlink_cree_deplace_supprime(self, engine, dirs):
+        target = dirs["storage"] / "Film (2020).mkv"
+        target.touch()
+        films = dirs["video"] / "Films"
+        films.mkdir()
+        link = films / "Film (2020).mkv"
+        link.symlink_to(target)
+        service = _service(engine, dirs)
+        index = service._index
+
+        service.handle_events([FileEvent(CREATED, link)])
+        assert index.links_to(target) == [link]
+        service._movie_link_repo.record.assert_called_once_with(link, target)
+
+        moved = dirs["video"] / "Autre.mkv"
+        link.rename(moved)
+        service.handle_events([FileEvent(MOVED, link, moved)])
+        assert index.links_to(target) == [moved]
+        service._movie_link_repo.remove.assert_called_once_with(link)
+
+        moved.unlink()
+        service.handle_events([FileEvent(DELETED, moved)])
+        assert index.links_to(target) == []
+
+
+class TestStorageEvents:
+    """Tests du deplacement de fichiers du storage."""
+
+    def test_dossier_deplace_reporte_et_repointe(self, engine, dirs):
+        old_dir = dirs["storage"] / "Films" / "Action"
+        old_dir.mkdir(parents=True)
+        (old_dir / "Film (2020).mkv").touch()
+        link = dirs["video"] / "Film (2020).mkv"
+        service = _service(engine, dirs)
+        service._file_system.create_symlink(old_dir / "Film (2020).mkv", link)
+        service._video_file_repo.save(
+            VideoFile(path=old_dir / "Film (2020).mkv", filename="Film (2020).mkv")
+        )
+        with Session(engine) as session:
+            session.add(MovieModel(title="Film", file_path=str(old_dir / "Film (2020).mkv")))
+            session.add(MovieModel(title="Autre", file_path=str(old_dir) + "_bis/x.mkv"))
+            session.commit()
+
+        new_dir = dirs["storage"] / "Films" / "Action & Aventure"
+        old_dir.rename(new_dir)
+        service.handle_events([FileEvent(MOVED, old_dir, new_dir, True)])
+
+        new_target = new_dir / "Film (2020).mkv"
+        assert os.readlink(link) == str(new_target)
+        assert service._index.links_to(new_target) == [link]
+        assert service._video_file_repo.get_by_path(new_target) is not None
+        with Session(engine) as session:
+            paths = sorted(session.exec(select(MovieModel.file_path)).all())
+        assert paths == [str(new_target), str(old_dir) + "_bis/x.mkv"]
+
+
+class TestDownloads:
+    """Tests du delai de calme des telechargements."""
+
+    def test_traitement_apres_delai_de_calme(self, engine, dirs):
+        ready = MagicMock()
+        service = _service(engine, dirs, quiet_period=60, on_downloads_ready=ready)
+        episode = dirs["downloads"] / "Séries" / "Lost S01E01.mkv"
+        episode.parent.mkdir()
+        episode.write_bytes(b"x")
+
+        service.handle_events([FileEvent(CREATED, episode)], now=100.0)
+        assert service.flush_downloads(now=130.0) == []
+
+        # Copie en cours : la taille a change, le delai repart
+        episode.write_bytes(b"xx")
+        assert service.flush_downloads(now=170.0) == []
+        assert service.flush_downloads(now=200.0) == []
+
+        assert service.flush_downloads(now=231.0) == [episode]
+        ready.assert_called_once_with([episode])
+        assert service.pending_downloads == []
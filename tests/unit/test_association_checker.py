@@ -1,9 +1,13 @@
 """Tests unitaires pour le service AssociationChecker."""
 
+from dataclasses import asdict
 from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlmodel import Session, SQLModel
 
+from src.infrastructure.persistence.database import ENGINE_PROFILES, create_sqlite_engine
+from src.infrastructure.persistence.models import EpisodeModel, MovieModel, SeriesModel
 from src.services.association_checker import AssociationChecker, SuspiciousAssociation
 
 
@@ -204,3 +208,66 @@ class TestSeriesHeuristics:
                 result = checker._check_series(series)
 
         assert result is None or result.confidence_score >= 60
+
+
+class TestScanIncremental:
+    """Tests du scan complet : premiers épisodes groupés, réévaluation incrémentale."""
+
+    @pytest.fixture
+    def session(self):
+        engine = create_sqlite_engine("sqlite://", ENGINE_PROFILES["tuned"])
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            yield session
+
+    def _scan(self, session):
+        checker = AssociationChecker(session)
+        with patch.object(checker, "_parse_filename") as mock_parse, patch.object(
+            checker, "_get_file_duration", return_value=None
+        ):
+            mock_parse.return_value = ("Something Completely Different", None)
+            results = checker.scan_suspicious(workers=2)
+        return results, [c.args[0] for c in mock_parse.call_args_list]
+
+    def test_seules_les_entites_modifiees_sont_reevaluees(self, session):
+        movie = MovieModel(
+            title="Inception", tmdb_id=27205, file_path="/storage/Films/Other.mkv"
+        )
+        series = SeriesModel(title="Breaking Bad", tmdb_id=1396)
+        session.add_all([movie, series])
+        session.commit()
+        session.add_all([
+            EpisodeModel(series_id=series.id, season_number=1, episode_number=1, title="a"),
+            EpisodeModel(
+                series_id=series.id, season_number=2, episode_number=1, title="b",
+                file_path="/storage/Séries/B/Other/Saison 2/S02E01.mkv",
+            ),
+            EpisodeModel(
+                series_id=series.id, season_number=1, episode_number=2, title="c",
+                file_path="/storage/Séries/B/Other/Saison 1/S01E02.mkv",
+            ),
+        ])
+        session.commit()
+
+        results, parsed = self._scan(session)
+        assert {(r.entity_type, r.entity_id) for r in results} == {
+            ("movie", movie.id),
+            ("series", series.id),
+        }
+        # Premier épisode avec fichier : S01E02
+        assert sorted(parsed) == [
+            "/storage/Films/Other.mkv",
+            "/storage/Séries/B/Other/Saison 1/S01E02.mkv",
+        ]
+
+        # Rien n'a changé : résultats relus sans parsing
+        cached, parsed = self._scan(session)
+        assert parsed == []
+        assert [asdict(r) for r in cached] == [asdict(r) for r in results]
+
+        # Changement d'ID TMDB : seul le film est réévalué
+        movie.tmdb_id = 1
+        session.add(movie)
+        session.commit()
+        _, parsed = self._scan(session)
+        assert parsed == ["/storage/Films/Other.mkv"]
@@ -527,3 +527,55 @@ class TestScanResult:
 
         # Assert
         assert len(results) == 0
+
+
+class TestScanFile:
+    """Tests du scan d'un fichier isole (cineorg watch)."""
+
+    @pytest.mark.parametrize("alias", ["symlink", "relatif"])
+    def test_downloads_dir_non_resolu(
+        self,
+        mock_file_system: MagicMock,
+        mock_filename_parser: MagicMock,
+        mock_media_info_extractor: MagicMock,
+        test_settings: Settings,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        alias: str,
+    ) -> None:
+        """Le fichier (chemin resolu) est accepte si downloads_dir ne l'est pas."""
+        downloads = test_settings.downloads_dir
+        if alias == "symlink":
+            configured = tmp_path / "nas"
+            configured.symlink_to(downloads)
+        else:
+            monkeypatch.chdir(tmp_path)
+            configured = Path("downloads")
+        settings = test_settings.model_copy(update={"downloads_dir": configured})
+        movie_file = downloads.resolve() / "Films" / "Inception.2010.1080p.mkv"
+        movie_file.touch()
+        scanner = ScannerService(
+            mock_file_system, mock_filename_parser, mock_media_info_extractor, settings
+        )
+
+        result = scanner.scan_file(movie_file)
+
+        assert result is not None
+        assert result.detected_type == MediaType.MOVIE
+
+    def test_fichier_hors_des_telechargements(
+        self,
+        mock_file_system: MagicMock,
+        mock_filename_parser: MagicMock,
+        mock_media_info_extractor: MagicMock,
+        test_settings: Settings,
+    ) -> None:
+        """Un fichier hors de downloads_dir est ignore."""
+        other = test_settings.storage_dir / "Films" / "Inception.2010.1080p.mkv"
+        other.parent.mkdir()
+        other.touch()
+        scanner = ScannerService(
+            mock_file_system, mock_filename_parser, mock_media_info_extractor, test_settings
+        )
+
+        assert scanner.scan_file(other) is None
@@ -0,0 +1,82 @@
+"""Tests pour le cache des pages rendues (ETag, 304, invalidation)."""
+
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse
+from fastapi.testclient import TestClient
+
+from src.web.cache import WATCHED_DEPENDENCY, PageCache
+
+
+def _app(cache: PageCache, state: dict) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/movies/{movie_id}")
+    def movie(request: Request, movie_id: int):
+        def render():
+            state["renders"] += 1
+            if movie_id == 404:
+                return HTMLResponse("absent", status_code=404), set()
+            return HTMLResponse(f"<p>{state['title']}</p>"), {("movie", movie_id)}
+
+        return cache.serve(request, render, state["generation"])
+
+    return app
+
+
+class TestPageCache:
+    """Tests du cache de pages."""
+
+    def test_revalidation_et_invalidation(self):
+        """304 tant que rien ne change ; seules les pages concernées sont invalidées."""
+        cache = PageCache()
+        state = {"renders": 0, "title": "Heat", "generation": 1}
+        client = TestClient(_app(cache, state))
+
+        first = client.get("/movies/1")
+        etag = first.headers["ETag"]
+        assert first.status_code == 200
+        assert first.text == "<p>Heat</p>"
+        assert first.headers["Cache-Control"] == "no-cache"
+
+        assert client.get("/movies/1", headers={"If-None-Match": etag}).status_code == 304
+        assert client.get(
+            "/movies/1", headers={"If-Modified-Since": first.headers["Last-Modified"]}
+        ).status_code == 304
+        assert client.get("/movies/1").text == "<p>Heat</p>"
+        assert state["renders"] == 1
+
+        # Basculer « vu » d'une autre œuvre ne touche pas la page
+        assert cache.invalidate(("movie", 2), WATCHED_DEPENDENCY) == 0
+        assert client.get("/movies/1", headers={"If-None-Match": etag}).status_code == 304
+        assert state["renders"] == 1
+
+        # Rendu identique après invalidation : toujours 304
+        assert cache.invalidate(("movie", 1)) == 1
+        assert client.get("/movies/1", headers={"If-None-Match": etag}).status_code == 304
+        assert state["renders"] == 2
+
+        # Nouvelle génération : nouveau rendu, nouvel ETag
+        state["title"], state["generation"] = "Heat (1995)", 2
+        response = client.get("/movies/1", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.text == "<p>Heat (1995)</p>"
+        assert response.headers["ETag"] != etag
+        assert state["renders"] == 3
+
+    def test_erreurs_et_taille_bornee(self):
+        """Les réponses en erreur ne sont pas gardées ; le cache est borné (LRU)."""
+        cache = PageCache(max_entries=2)
+        state = {"renders": 0, "title": "Heat", "generation": 1}
+        client = TestClient(_app(cache, state))
+
+        assert client.get("/movies/404").status_code == 404
+        assert client.get("/movies/404").status_code == 404
+        assert state["renders"] == 2
+        assert len(cache) == 0
+
+        for movie_id in (1, 2, 1, 3):
+            client.get(f"/movies/{movie_id}")
+        assert len(cache) == 2
+        # /movies/2, le moins récemment servi, a été évincé
+        client.get("/movies/2")
+        assert state["renders"] == 6
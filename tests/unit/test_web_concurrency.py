@@ -0,0 +1,99 @@
+"""Tests pour le modèle de concurrence web (pool borné, moniteur de latence)."""
+
+import asyncio
+import logging
+import threading
+import time
+
+import anyio.to_thread
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.web.concurrency import (
+    LatencyMiddleware,
+    LatencyMonitor,
+    configure_worker_pool,
+)
+
+
+def _app(monitor: LatencyMonitor) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(LatencyMiddleware, monitor=monitor)
+
+    @app.get("/slow")
+    def slow():
+        time.sleep(0.05)
+        return {"ok": True}
+
+    @app.get("/fast")
+    def fast():
+        return {"ok": True}
+
+    return app
+
+
+class TestLatencyMiddleware:
+    """Tests du middleware de mesure de latence."""
+
+    def test_requete_lente_signalee(self, caplog):
+        """Une requête au-delà du seuil est journalisée."""
+        monitor = LatencyMonitor(slow_request_ms=20)
+        client = TestClient(_app(monitor))
+
+        with caplog.at_level(logging.WARNING, logger="src.web.concurrency"):
+            assert client.get("/slow").status_code == 200
+            assert client.get("/fast").status_code == 200
+
+        messages = [r.getMessage() for r in caplog.records]
+        assert any("GET /slow" in m for m in messages)
+        assert not any("GET /fast" in m for m in messages)
+        assert monitor.inflight == {}
+
+
+class TestLoopWatchdog:
+    """Tests de la détection de blocage de l'event loop."""
+
+    def test_blocage_detecte_avec_requetes_en_cours(self, caplog):
+        """Un appel bloquant sur la boucle est signalé avec les requêtes en cours."""
+        monitor = LatencyMonitor(slow_request_ms=80)
+
+        async def scenario():
+            monitor.start()
+            monitor.inflight[1] = ("GET /library/movies/1", time.perf_counter())
+            await asyncio.sleep(0.05)
+            time.sleep(0.25)  # I/O bloquante sur l'event loop
+            await asyncio.sleep(0.15)
+            await monitor.stop()
+
+        with caplog.at_level(logging.WARNING, logger="src.web.concurrency"):
+            asyncio.run(scenario())
+
+        messages = [r.getMessage() for r in caplog.records]
+        assert any(
+            "Event loop bloquée" in m and "GET /library/movies/1" in m
+            for m in messages
+        )
+
+
+class TestWorkerPool:
+    """Tests de la configuration du pool de threads."""
+
+    def test_pool_borne(self):
+        """Le limiteur anyio et l'executor asyncio partagent la même borne."""
+
+        async def scenario():
+            executor = configure_worker_pool(3)
+            try:
+                tokens = anyio.to_thread.current_default_thread_limiter().total_tokens
+                names = await asyncio.gather(
+                    *(asyncio.to_thread(lambda: threading.current_thread().name)
+                      for _ in range(6))
+                )
+                return tokens, executor, names
+            finally:
+                executor.shutdown(wait=True)
+
+        tokens, executor, names = asyncio.run(scenario())
+        assert tokens == 3
+        assert executor._max_workers == 3
+        assert all(name.startswith("cineorg-web") for name in names)
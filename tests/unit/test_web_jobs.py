@@ -0,0 +1,115 @@
+"""Tests pour le gestionnaire de tâches de fond web (progression poussée, persistance)."""
+
+import asyncio
+import time
+
+from sqlmodel import Session
+
+from src.infrastructure.persistence.database import (
+    ENGINE_PROFILES,
+    create_sqlite_engine,
+)
+from src.infrastructure.persistence.migrations import run_migrations
+from src.infrastructure.persistence.models import JobModel
+from src.web.jobs import JOB_COMPLETE, JOB_INTERRUPTED, JobContext, JobManager
+
+
+def _engine(tmp_path):
+    engine = create_sqlite_engine(
+        f"sqlite:///{tmp_path / 'cineorg.db'}", ENGINE_PROFILES["tuned"]
+    )
+    run_migrations(engine)
+    return engine
+
+
+async def _collect(manager: JobManager, job) -> list[tuple[str, dict]]:
+    return [event async for event in manager.events(job)]
+
+
+class TestJobManager:
+    """Tests du cycle de vie d'une tâche."""
+
+    def test_progression_poussee_et_resultat_persiste(self, tmp_path):
+        """Les abonnés reçoivent la progression (y compris depuis le pool) puis le résultat."""
+        engine = _engine(tmp_path)
+
+        def blocking_step(ctx: JobContext) -> int:
+            ctx.progress(current=2, label="thread")
+            time.sleep(0.01)
+            return 42
+
+        async def scan(ctx: JobContext) -> dict:
+            ctx.progress(current=1, total=2)
+            value = await ctx.run_blocking(blocking_step, ctx)
+            return {"value": value}
+
+        async def scenario():
+            manager = JobManager(max_workers=2, engine=engine)
+            job = manager.start("scan", scan, params={"force": True})
+            events = await _collect(manager, job)
+            await job._task
+            # Reconnexion après la fin : état rejoué sans relancer
+            replay = await _collect(manager, manager.latest("scan"))
+            manager.shutdown()
+            return job, events, replay
+
+        job, events, replay = asyncio.run(scenario())
+
+        assert ("progress", {"current": 1, "total": 2}) in events
+        assert ("progress", {"current": 2, "total": 2, "label": "thread"}) in events
+        assert events[-1] == ("complete", {"value": 42})
+        assert replay == [
+            ("progress", {"current": 2, "total": 2, "label": "thread"}),
+            ("complete", {"value": 42}),
+        ]
+
+        # Redémarrage : le résultat est relu depuis la base
+        restarted = JobManager(engine=engine)
+        stored = restarted.latest("scan")
+        assert stored.id == job.id
+        assert stored.status == JOB_COMPLETE
+        assert stored.params == {"force": True}
+        assert stored.result == {"value": 42}
+        restarted.shutdown()
+
+    def test_question_en_attente_rejouee(self, tmp_path):
+        """Un abonné arrivant pendant une attente reçoit l'événement en attente."""
+        engine = _engine(tmp_path)
+
+        async def transfer(ctx: JobContext) -> dict:
+            choice = await ctx.ask("conflict", {"filename": "a.mkv"})
+            return {"choice": choice}
+
+        async def scenario():
+            manager = JobManager(engine=engine)
+            job = manager.start("transfer", transfer)
+            while job.pending is None:
+                await asyncio.sleep(0)
+            late = asyncio.create_task(_collect(manager, job))
+            await asyncio.sleep(0)
+            assert manager.answer(job, "keep_both")
+            assert not manager.answer(job, "skip")
+            events = await late
+            manager.shutdown()
+            return events
+
+        events = asyncio.run(scenario())
+
+        assert events == [
+            ("conflict", {"filename": "a.mkv"}),
+            ("complete", {"choice": "keep_both"}),
+        ]
+
+    def test_taches_orphelines_interrompues_au_demarrage(self, tmp_path):
+        """Une tâche « running » d'un processus arrêté est marquée interrompue."""
+        engine = _engine(tmp_path)
+        with Session(engine) as session:
+            session.add(JobModel(id="abc", kind="workflow", status="running"))
+            session.commit()
+
+        manager = JobManager(engine=engine)
+        assert manager.recover() == 1
+        job = manager.get("abc")
+        assert job.status == JOB_INTERRUPTED
+        assert job.final_event() == ("error", {"message": "Serveur redémarré"})
+        manager.shutdown()